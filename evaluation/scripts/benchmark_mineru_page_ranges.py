@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Compare single-process and page-range pooled MinerU conversion.
+
+Generates a multi-page text + figure PDF locally (PyMuPDF), converts it once
+with one MinerU process and once split into page ranges on a worker pool, and
+writes a JSON report under ``evaluation/runs/mineru_page_range_benchmark_<timestamp>/``.
+The range cache is disabled so both modes really convert.
+
+``--fake-mineru SECONDS_PER_PAGE`` swaps the MinerU CLI for a stub that sleeps
+per page and writes a MinerU-shaped output tree, which measures the pool's
+split/merge overhead and scaling without a GPU or VLM server.
+
+Usage:
+    mamba run -n FAIRiAgent python evaluation/scripts/benchmark_mineru_page_ranges.py
+    mamba run -n FAIRiAgent python evaluation/scripts/benchmark_mineru_page_ranges.py \\
+        --pages 200 --chunk-pages 20 --workers 4 --fake-mineru 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import stat
+import sys
+import textwrap
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from fairifier.config import config
+from fairifier.services.mineru_client import MinerUClient, MinerUConversionError
+
+
+_FAKE_MINERU = '''#!{python}
+"""Stub MinerU CLI: sleeps per page and writes {{out}}/{{stem}}/auto/{{stem}}.md."""
+import json, sys, time
+from pathlib import Path
+from pypdf import PdfReader
+
+args = sys.argv[1:]
+src = Path(args[args.index("-p") + 1])
+out = Path(args[args.index("-o") + 1])
+reader = PdfReader(str(src))
+time.sleep({seconds_per_page} * len(reader.pages))
+parse_dir = out / src.stem / "auto"
+(parse_dir / "images").mkdir(parents=True, exist_ok=True)
+blocks, sections = [], []
+for idx, page in enumerate(reader.pages):
+    text = (page.extract_text() or "").strip()
+    sections.append(text)
+    blocks.append({{"type": "text", "text": text, "page_idx": idx}})
+(parse_dir / f"{{src.stem}}.md").write_text("\\n\\n".join(sections), encoding="utf-8")
+(parse_dir / f"{{src.stem}}_content_list_v2.json").write_text(json.dumps(blocks), encoding="utf-8")
+'''
+
+
+def _generate_pdf(path: Path, pages: int) -> Path:
+    import fitz
+
+    doc = fitz.open()
+    body = textwrap.fill(
+        "Soil samples were collected along an elevation gradient and sequenced "
+        "for metagenomic analysis of microbial community composition. " * 6,
+        90,
+    )
+    for index in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Supplementary page {index + 1}", fontsize=16)
+        page.insert_text((72, 110), body, fontsize=9)
+        page.draw_rect(fitz.Rect(72, 500, 300, 700), color=(0, 0, 1), fill=(0.8, 0.9, 1))
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _write_fake_cli(path: Path, seconds_per_page: float) -> Path:
+    path.write_text(
+        _FAKE_MINERU.format(python=sys.executable, seconds_per_page=seconds_per_page),
+        encoding="utf-8",
+    )
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return path
+
+
+def _run(client: MinerUClient, pdf: Path, out_dir: Path) -> dict:
+    started = time.perf_counter()
+    try:
+        result = client.convert_document(pdf, output_dir=out_dir)
+    except MinerUConversionError as exc:
+        return {
+            "success": False,
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+            "error": str(exc),
+        }
+    return {
+        "success": True,
+        "elapsed_seconds": round(time.perf_counter() - started, 2),
+        "markdown_chars": len(result.markdown_text),
+        "structured_block_count": len(result.structured_blocks),
+        "markdown_path": str(result.markdown_path),
+        "error": None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark page-range pooled MinerU conversion")
+    parser.add_argument("--pages", type=int, default=120, help="Pages in the generated PDF.")
+    parser.add_argument("--chunk-pages", type=int, default=20, help="Pages per range.")
+    parser.add_argument("--workers", type=int, default=max(2, config.mineru_page_chunk_workers))
+    parser.add_argument(
+        "--fake-mineru",
+        type=float,
+        default=None,
+        metavar="SECONDS_PER_PAGE",
+        help="Use a stub MinerU CLI that sleeps this long per page.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="Directory for benchmark artifacts and report JSON.",
+    )
+    args = parser.parse_args()
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    run_dir = args.output_dir or (
+        PROJECT_ROOT / "evaluation/runs" / f"mineru_page_range_benchmark_{stamp}"
+    )
+    run_dir.mkdir(parents=True, exist_ok=True)
+    pdf = _generate_pdf(run_dir / f"generated_{args.pages}p.pdf", args.pages)
+
+    cli_path = config.mineru_cli_path
+    backend = config.mineru_backend
+    if args.fake_mineru is not None:
+        cli_path = str(_write_fake_cli(run_dir / "fake_mineru", args.fake_mineru))
+        backend = "pipeline"
+
+    def client(chunk_pages: int) -> MinerUClient:
+        return MinerUClient(
+            cli_path=cli_path,
+            server_url=config.mineru_server_url or "",
+            api_url=None if args.fake_mineru is not None else config.mineru_api_url,
+            backend=backend,
+            timeout_seconds=config.mineru_timeout_seconds,
+            effort=config.mineru_effort,
+            page_chunk_size=chunk_pages,
+            page_chunk_workers=args.workers,
+            page_chunk_min_pages=1,
+            chunk_cache_root=None,
+        )
+
+    print(f"Converting {pdf.name} ({args.pages} pages) with one MinerU process ...")
+    single = _run(client(0), pdf, run_dir / "single")
+    print(f"Converting in {args.chunk_pages}-page ranges on {args.workers} workers ...")
+    pooled = _run(client(args.chunk_pages), pdf, run_dir / "pooled")
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "pdf": str(pdf),
+        "pages": args.pages,
+        "chunk_pages": args.chunk_pages,
+        "workers": args.workers,
+        "cpu_count": os.cpu_count(),
+        "mineru": "fake" if args.fake_mineru is not None else cli_path,
+        "backend": backend,
+        "fake_seconds_per_page": args.fake_mineru,
+        "single": single,
+        "pooled": pooled,
+    }
+    if single["success"] and pooled["success"] and pooled["elapsed_seconds"]:
+        report["speedup"] = round(single["elapsed_seconds"] / pooled["elapsed_seconds"], 2)
+
+    report_path = run_dir / "benchmark_report.json"
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(json.dumps(report, indent=2))
+    print(f"\nReport: {report_path}")
+    return 0 if single["success"] and pooled["success"] else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,7 +20,9 @@ from ..services.retrieval_cache import get_cache_bucket
 from ..tools.science_tools import create_science_tools
 from ..tools.bio_tools import create_bio_tools
 from ..utils.llm_helper import get_llm_helper
+from ..utils.run_control import bind_run
 from ..services.mineru_client import (
+    MinerUCancelledError,
     MinerUClient,
     MinerUConversionError,
     mineru_client_from_config,
@@ -429,6 +431,7 @@ class DocumentParserAgent(ReactLoopMixin, BaseAgent):
                 text,
                 source_type=self._infer_document_source_type(is_mineru_content, document_path),
                 max_packets=max(config.react_loop_document_parser_target_packets * 2, 12),
+                structured_blocks=conversion_info.get("structured_blocks"),
             )
             state["evidence_packets"] = evidence_packets
             if config.enable_a2a:
@@ -513,10 +516,11 @@ class DocumentParserAgent(ReactLoopMixin, BaseAgent):
         if suffix in mineru_suffixes:
             if self.mineru_tool:
                 # Use MinerU tool for conversion
-                result = self.mineru_tool.invoke({
-                    "input_path": document_path,
-                    "output_dir": None
-                })
+                with bind_run(state.get("session_id")):
+                    result = self.mineru_tool.invoke({
+                        "input_path": document_path,
+                        "output_dir": None
+                    })
                 
                 if result["success"]:
                     # Conversion successful
@@ -542,6 +546,8 @@ class DocumentParserAgent(ReactLoopMixin, BaseAgent):
                         f"🪄 MinerU converted PDF to Markdown at {result['markdown_path']}"
                     )
                     return result["markdown_text"], conversion_info, "mineru"
+                elif result.get("cancelled"):
+                    raise MinerUCancelledError(result["error"])
                 else:
                     # Conversion failed, log and fallback
                     warning_msg = f"MinerU conversion failed: {result['error']}. Falling back to local PDF extraction."
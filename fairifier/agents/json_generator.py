@@ -91,14 +91,13 @@ class JSONGeneratorAgent(BaseAgent):
             return 1.0
         if self._compact_lookup_key(normalized_field) == self._compact_lookup_key(normalized_candidate):
             return 0.98
+        return self._score_token_overlap(
+            set(self._tokenize_lookup_key(normalized_field)),
+            set(self._tokenize_lookup_key(normalized_candidate)),
+        )
 
-        field_tokens = self._tokenize_lookup_key(normalized_field)
-        candidate_tokens = self._tokenize_lookup_key(normalized_candidate)
-        if not field_tokens or not candidate_tokens:
-            return 0.0
-
-        field_token_set = set(field_tokens)
-        candidate_token_set = set(candidate_tokens)
+    @staticmethod
+    def _score_token_overlap(field_token_set: set, candidate_token_set: set) -> float:
         overlap = field_token_set & candidate_token_set
         if not overlap:
             return 0.0
@@ -115,6 +114,13 @@ class JSONGeneratorAgent(BaseAgent):
 
         return 0.0
 
+    def _build_field_label_index(
+        self,
+        candidates: List[Dict[str, Any]],
+        label_keys: Tuple[str, ...] = ("name", "term", "label"),
+    ) -> "FieldLabelIndex":
+        return FieldLabelIndex(candidates, label_keys)
+
     def _select_best_field_definition(
         self,
         field_name: str,
@@ -122,24 +128,20 @@ class JSONGeneratorAgent(BaseAgent):
         *,
         label_keys: Tuple[str, ...] = ("name", "term", "label"),
         min_score: float = 0.66,
+        index: Optional["FieldLabelIndex"] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Return a unique fuzzy match or None when the label is too generic/ambiguous."""
-        scored: List[Tuple[float, Dict[str, Any]]] = []
-        for item in candidates:
-            label = ""
-            for key in label_keys:
-                raw = item.get(key)
-                if isinstance(raw, str) and raw.strip():
-                    label = raw
-                    break
-            score = self._score_field_name_match(field_name, label)
-            if score > 0:
-                scored.append((score, item))
+        """Return a unique fuzzy match or None when the label is too generic/ambiguous.
+
+        Pass a prebuilt ``index`` (over the same ``candidates`` and ``label_keys``)
+        when matching many field names against one candidate list.
+        """
+        if index is None:
+            index = self._build_field_label_index(candidates, label_keys)
+        scored = index.score(field_name)
 
         if not scored:
             return None
 
-        scored.sort(key=lambda pair: pair[0], reverse=True)
         best_score, best_item = scored[0]
         if best_score < min_score:
             return None
@@ -1006,6 +1008,9 @@ class JSONGeneratorAgent(BaseAgent):
             for f in selected_fields
             if self._normalize_lookup_key(f.get('name', ''))
         }
+        # Fuzzy fallbacks below run once per generated field; index the labels once.
+        selected_fields_index = self._build_field_label_index(selected_fields, ("name", "label"))
+        knowledge_index = self._build_field_label_index(knowledge_items_ordered, ("term", "label"))
         
         # Convert to MetadataField objects with REAL FAIR-DS metadata
         fields = []
@@ -1029,6 +1034,7 @@ class JSONGeneratorAgent(BaseAgent):
                     field_name,
                     selected_fields,
                     label_keys=("name", "label"),
+                    index=selected_fields_index,
                 )
 
             if not knowledge_item and original_field:
@@ -1044,6 +1050,7 @@ class JSONGeneratorAgent(BaseAgent):
                     field_name,
                     knowledge_items_ordered,
                     label_keys=("term", "label"),
+                    index=knowledge_index,
                 )
 
             # Extract metadata
@@ -2044,3 +2051,62 @@ class JSONGeneratorAgent(BaseAgent):
             return base_query
         else:
             return "FAIR metadata field mapping and value generation best practices"
+
+
+class FieldLabelIndex:
+    """Precomputed label keys for :meth:`JSONGeneratorAgent._select_best_field_definition`.
+
+    Exact and compact keys are hash lookups; token postings prune the fuzzy
+    candidates to those sharing at least one token (every other candidate
+    scores 0). Scores and their tie order match scoring each candidate in turn.
+    """
+
+    def __init__(self, candidates: List[Dict[str, Any]], label_keys: Tuple[str, ...]) -> None:
+        self._items = list(candidates)
+        self._exact: Dict[str, List[int]] = {}
+        self._compact: Dict[str, List[int]] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._token_sets: List[frozenset] = []
+        for position, item in enumerate(self._items):
+            label = ""
+            for key in label_keys:
+                raw = item.get(key)
+                if isinstance(raw, str) and raw.strip():
+                    label = raw
+                    break
+            normalized = JSONGeneratorAgent._normalize_lookup_key(label)
+            tokens = frozenset(JSONGeneratorAgent._tokenize_lookup_key(normalized))
+            self._token_sets.append(tokens)
+            if not normalized:
+                continue
+            self._exact.setdefault(normalized, []).append(position)
+            self._compact.setdefault(
+                JSONGeneratorAgent._compact_lookup_key(normalized), []
+            ).append(position)
+            for token in tokens:
+                self._postings.setdefault(token, []).append(position)
+
+    def score(self, field_name: str) -> List[Tuple[float, Dict[str, Any]]]:
+        """Positive-scoring ``(score, item)`` pairs, best first, ties in candidate order."""
+        normalized = JSONGeneratorAgent._normalize_lookup_key(field_name)
+        if not normalized:
+            return []
+        field_tokens = set(JSONGeneratorAgent._tokenize_lookup_key(normalized))
+        scores: Dict[int, float] = {}
+        for position in self._exact.get(normalized, ()):
+            scores[position] = 1.0
+        for position in self._compact.get(JSONGeneratorAgent._compact_lookup_key(normalized), ()):
+            scores.setdefault(position, 0.98)
+        for token in field_tokens:
+            for position in self._postings.get(token, ()):
+                if position in scores:
+                    continue
+                score = JSONGeneratorAgent._score_token_overlap(
+                    field_tokens, self._token_sets[position]
+                )
+                scores[position] = score
+        ranked = sorted(
+            ((score, position) for position, score in scores.items() if score > 0),
+            key=lambda pair: (-pair[0], pair[1]),
+        )
+        return [(score, self._items[position]) for score, position in ranked]
@@ -1,5 +1,6 @@
 """Knowledge retrieval agent using FAIR Data Station API."""
 
+import asyncio
 import logging
 import json
 import re
@@ -12,7 +13,7 @@ from .base import BaseAgent
 from .react_loop import ReactLoopMixin
 from .response_models import KnowledgeResponse
 from ..models import FAIRifierState, KnowledgeItem
-from ..config import config
+from ..config import config, refresh_local_package_paths
 from ..services.evidence_packets import build_evidence_context
 from ..skills import (
     fairds_remote_skill_catalog_row,
@@ -22,12 +23,16 @@ from ..skills import (
 )
 from ..services.fair_data_station import FAIRDataStationClient
 from ..services.fairds_api_parser import FAIRDSAPIParser
+from ..services.local_package_registry import (
+    LocalPackageRegistry,
+    get_local_package_registry,
+    peek_local_package_registry,
+)
 from ..utils.llm_helper import get_llm_helper
 from ..utils.isa_order import ISA_LEVEL_ORDER
 from ..utils.package_selection import (
     build_document_match_text,
-    rank_packages_by_document,
-    score_package_relevance,
+    score_packages_by_document,
     summary_to_package_record,
     top_relevant_package_names,
 )
@@ -47,7 +52,10 @@ class KnowledgeRetrieverAgent(ReactLoopMixin, BaseAgent):
         self._inner_kr_agent = None
         self._fairds_runtime_cache: Dict[str, Any] = {}
         self._science_runtime_cache: Dict[str, Any] = {}
+        # Packages injected here take precedence over the shared on-disk registry;
+        # their field indexes live in a LocalPackageRegistry built on first search.
         self._local_package_registry: Dict[str, Dict[str, Any]] = {}
+        self._injected_local_registry: Optional[LocalPackageRegistry] = None
         
         # Initialize FAIR-DS client if configured
         self.fair_ds_client = None
@@ -97,6 +105,27 @@ class KnowledgeRetrieverAgent(ReactLoopMixin, BaseAgent):
         )
         return {tool.name: tool for tool in tools_list}
 
+    def _prefetch_packages(
+        self,
+        package_names: List[str],
+        local_package_registry: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Warm the FAIR-DS client cache for API packages with one concurrent batch.
+
+        The per-package ``get_package`` tool calls that follow then resolve from
+        the client cache instead of paying one round-trip each.
+        """
+        bulk_fetch = getattr(self.fair_ds_client, "get_packages_bulk", None)
+        remote_names = [
+            name for name in package_names if name not in local_package_registry
+        ]
+        if not callable(bulk_fetch) or len(remote_names) < 2:
+            return
+        try:
+            bulk_fetch(remote_names)
+        except Exception as exc:
+            self.log_info(f"⚠️  Concurrent FAIR-DS package fetch failed: {exc}")
+
     def _normalize_metadata_label(self, value: Any) -> str:
         """Normalize label for robust lexical comparisons."""
         return " ".join(re.sub(r"[^a-z0-9]+", " ", str(value or "").lower()).strip().split())
@@ -653,13 +682,14 @@ class KnowledgeRetrieverAgent(ReactLoopMixin, BaseAgent):
                     for summary in package_summaries
                     if summary.get("name") in api_available_package_names
                 ]
-                all_packages = rank_packages_by_document(
+                scored_packages = score_packages_by_document(
                     all_packages, document_match_text
                 )
+                all_packages = [pkg for _, pkg in scored_packages]
                 top_ranked = [
                     pkg
-                    for pkg in all_packages[:5]
-                    if score_package_relevance(document_match_text, pkg) > 0
+                    for score, pkg in scored_packages[:5]
+                    if score > 0
                 ]
                 if top_ranked:
                     self.log_execution(
@@ -706,6 +736,7 @@ class KnowledgeRetrieverAgent(ReactLoopMixin, BaseAgent):
                     state,
                     f"   📦 Package summaries unavailable; fetching fields from {len(candidate_package_names)}/{len(available_package_names)} candidate packages..."
                 )
+                self._prefetch_packages(candidate_package_names, local_package_registry)
                 for pkg_name in candidate_package_names:
                     if pkg_name in local_package_registry:
                         fields = local_package_registry[pkg_name].get("metadata", []) or []
@@ -887,6 +918,7 @@ class KnowledgeRetrieverAgent(ReactLoopMixin, BaseAgent):
                     state,
                     f"📦 Fetching metadata for {len(missing_selected_packages)} selected package(s): {missing_selected_packages}"
                 )
+                self._prefetch_packages(missing_selected_packages, local_package_registry)
                 for pkg_name in missing_selected_packages:
                     if pkg_name in local_package_registry:
                         fields = local_package_registry[pkg_name].get("metadata", []) or []
@@ -1122,51 +1154,76 @@ class KnowledgeRetrieverAgent(ReactLoopMixin, BaseAgent):
                 if structured_knowledge else []
             )
 
-            # Use LLM/deepagents to select optional fields for each ISA sheet
+            # Use LLM/deepagents to select optional fields for each ISA sheet.
+            # Sheets without a structured selection are independent LLM calls: issue
+            # them together (bounded by the shared LLM limiter) and merge in sheet order.
+            llm_sheets: List[str] = []
             for sheet in isa_sheets:
                 optional_fields_for_sheet = fields_by_isa_sheet[sheet]["optional"]
-                if optional_fields_for_sheet:
-                    preferred_labels = structured_field_map.get(sheet, [])
-                    if preferred_labels:
-                        selected_optional = self._select_optional_fields_from_structured(
-                            optional_fields_for_sheet,
-                            preferred_labels,
-                        )
-                        terms_to_search = []
-                        final_selected_fields.extend(selected_optional)
-                        self.log_execution(
-                            state,
-                            f"   🧠 {sheet}: Deep ReAct selected {len(selected_optional)} optional fields"
-                        )
-                    else:
-                        self.log_execution(
-                            state,
-                            f"   LLM selecting optional fields for {sheet} ({len(optional_fields_for_sheet)} available)..."
-                        )
-                        llm_result = await llm_methods.llm_select_fields_from_package(
-                            self.llm_helper,
-                            doc_info,
-                            sheet,
-                            f"{sheet}_fields",
-                            fields_by_isa_sheet[sheet]["mandatory"],
-                            optional_fields_for_sheet,
-                            critic_feedback
-                        )
+                if optional_fields_for_sheet and not structured_field_map.get(sheet):
+                    llm_sheets.append(sheet)
+                    self.log_execution(
+                        state,
+                        f"   LLM selecting optional fields for {sheet} ({len(optional_fields_for_sheet)} available)..."
+                    )
+            llm_results = await asyncio.gather(
+                *(
+                    llm_methods.llm_select_fields_from_package(
+                        self.llm_helper,
+                        doc_info,
+                        sheet,
+                        f"{sheet}_fields",
+                        fields_by_isa_sheet[sheet]["mandatory"],
+                        fields_by_isa_sheet[sheet]["optional"],
+                        critic_feedback
+                    )
+                    for sheet in llm_sheets
+                ),
+                return_exceptions=True,
+            )
+            llm_results_by_sheet = dict(zip(llm_sheets, llm_results))
 
-                        selected_optional = llm_result.get("selected_fields", [])
-                        terms_to_search = llm_result.get("terms_to_search", [])
-                        final_selected_fields.extend(selected_optional)
-                        all_terms_to_search.extend(terms_to_search)
+            for sheet in isa_sheets:
+                optional_fields_for_sheet = fields_by_isa_sheet[sheet]["optional"]
+                if not optional_fields_for_sheet:
+                    continue
+                if sheet not in llm_results_by_sheet:
+                    selected_optional = self._select_optional_fields_from_structured(
+                        optional_fields_for_sheet,
+                        structured_field_map[sheet],
+                    )
+                    final_selected_fields.extend(selected_optional)
+                    self.log_execution(
+                        state,
+                        f"   🧠 {sheet}: Deep ReAct selected {len(selected_optional)} optional fields"
+                    )
+                    continue
 
-                        self.log_execution(
-                            state,
-                            f"   ✅ {sheet}: LLM selected {len(selected_optional)} optional fields"
-                        )
-                        if terms_to_search:
-                            self.log_execution(
-                                state,
-                                f"   🔍 {sheet}: LLM requested term search for: {terms_to_search}"
-                            )
+                llm_result = llm_results_by_sheet[sheet]
+                if isinstance(llm_result, BaseException):
+                    # One sheet's failure must not discard the others; the mandatory and
+                    # ISA-balance safety nets below still cover this sheet.
+                    logger.warning("Optional field selection failed for %s: %s", sheet, llm_result)
+                    self.log_execution(
+                        state,
+                        f"   ⚠️ {sheet}: LLM field selection failed ({llm_result}); keeping mandatory fields only"
+                    )
+                    continue
+
+                selected_optional = llm_result.get("selected_fields", [])
+                terms_to_search = llm_result.get("terms_to_search", [])
+                final_selected_fields.extend(selected_optional)
+                all_terms_to_search.extend(terms_to_search)
+
+                self.log_execution(
+                    state,
+                    f"   ✅ {sheet}: LLM selected {len(selected_optional)} optional fields"
+                )
+                if terms_to_search:
+                    self.log_execution(
+                        state,
+                        f"   🔍 {sheet}: LLM requested term search for: {terms_to_search}"
+                    )
 
             # Safety net: every MANDATORY field for the selected packages must be retained
             # (sheet name variants or earlier filtering can otherwise drop required fields).
@@ -1474,7 +1531,7 @@ class KnowledgeRetrieverAgent(ReactLoopMixin, BaseAgent):
     def _local_package_files(self) -> List[Path]:
         """Resolve built-in and environment-configured local package sources."""
         default_dir = Path(config.project_root) / "evaluation" / "config" / "packages"
-        sources = [default_dir, *config.local_package_paths]
+        sources = [default_dir, *refresh_local_package_paths(config)]
         files: List[Path] = []
         for source in sources:
             path = Path(source).expanduser()
@@ -1488,34 +1545,26 @@ class KnowledgeRetrieverAgent(ReactLoopMixin, BaseAgent):
 
     def _load_local_package_registry(self) -> Dict[str, Dict[str, Any]]:
         """Load local FAIR-DS extension packages from configured JSON sources."""
-        cached = getattr(self, "_local_package_registry", None)
-        if isinstance(cached, dict) and cached:
-            return cached
-
-        registry: Dict[str, Dict[str, Any]] = {}
+        injected = getattr(self, "_local_package_registry", None)
+        if isinstance(injected, dict) and injected:
+            return injected
         try:
-            for package_file in self._local_package_files():
-                try:
-                    payload = json.loads(package_file.read_text(encoding="utf-8"))
-                except Exception as exc:
-                    logger.warning("Failed reading local package file %s: %s", package_file, exc)
-                    continue
-                package = FAIRDSAPIParser.parse_package_response(payload)
-                package_name = str(package.get("packageName") or "").strip()
-                if not package_name:
-                    continue
-                if not isinstance(package.get("metadata"), list):
-                    continue
-                for field in package["metadata"]:
-                    if isinstance(field, dict):
-                        field["packageName"] = package_name
-                registry[package_name] = package
+            return get_local_package_registry(self._local_package_files()).packages
         except Exception as exc:
             logger.warning("Failed loading local package registry: %s", exc)
-            registry = {}
-
-        self._local_package_registry = registry
-        return registry
+            return {}
+
+    def _local_registry(self) -> LocalPackageRegistry:
+        """Indexed view of :meth:`_load_local_package_registry` (shared when possible)."""
+        packages = self._load_local_package_registry()
+        shared = peek_local_package_registry()
+        if shared is not None and shared.packages is packages:
+            return shared
+        wrapped = getattr(self, "_injected_local_registry", None)
+        if wrapped is None or wrapped.packages is not packages:
+            wrapped = LocalPackageRegistry(packages)
+            self._injected_local_registry = wrapped
+        return wrapped
 
     @staticmethod
     def _deduplicate_package_fields(fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -1552,22 +1601,11 @@ class KnowledgeRetrieverAgent(ReactLoopMixin, BaseAgent):
             if str(name).strip()
         }
         hits: List[Dict[str, Any]] = []
-        for package_name, package in self._load_local_package_registry().items():
+        registry = self._local_registry()
+        for package_name in registry.packages:
             if allowed and package_name.lower() not in allowed:
                 continue
-            for field in package.get("metadata", []) or []:
-                term = field.get("term") or {}
-                haystack = " ".join(
-                    str(value or "").lower()
-                    for value in (
-                        field.get("label"),
-                        field.get("definition"),
-                        term.get("label"),
-                        term.get("definition"),
-                    )
-                )
-                if normalized_query in haystack:
-                    hits.append(field)
+            hits.extend(registry.field_index(package_name).search(normalized_query))
         return self._deduplicate_package_fields(hits)
 
     def _infer_local_domain_package_hints(
@@ -66,6 +66,9 @@ def create_app(serve_frontend: bool | None = None) -> FastAPI:
         if serve_frontend:
             logger.info("Serving frontend from %s", FRONTEND_DIST)
         yield
+        from fairifier.services.mem0_ttl_sweeper import reset_memory_ttl_sweeper
+
+        reset_memory_ttl_sweeper()
         store.close()
         logger.info("FAIRifier API stopped")
 
@@ -182,3 +182,5 @@ class FAIRDSStatisticsResponse(BaseModel):
     package_leaderboard: List[FAIRDSPackageStatistics]
     top_terms: List[FAIRDSTermStatistics]
     term_quality: FAIRDSTermQuality
+    snapshot_age_seconds: Optional[float] = None
+    refreshing: bool = False
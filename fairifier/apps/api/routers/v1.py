@@ -49,6 +49,7 @@ from ..models import (
     SystemStatusResponse,
 )
 from ..services.event_bus import WorkflowEvent, event_bus
+from ..services.fairds_statistics import FAIRDSStatisticsCache
 from ..services.runner import run_workflow_task
 from ..storage.base import ProjectStore
 from ..system_metrics import collect_resource_metrics_with_gpu
@@ -350,6 +351,7 @@ def _build_system_status() -> SystemStatusResponse:
         _is_qdrant_available,
         _ollama_has_model,
     )
+    from fairifier.services.mem0_ttl_sweeper import memory_sweeper_stats
     from fairifier.services.mineru_client import mineru_client_from_config
     from fairifier.services.mineru_health import summarize_mineru_health
 
@@ -438,6 +440,7 @@ def _build_system_status() -> SystemStatusResponse:
     fair_ds_ok = False
     fair_ds_msg = "Not configured"
     fair_ds_error = None
+    fair_ds_breaker = None
     if fc.fair_ds_api_url:
         try:
             fair_ds_client = FAIRDataStationClient(
@@ -445,9 +448,13 @@ def _build_system_status() -> SystemStatusResponse:
                 timeout=5,
             )
             fair_ds_ok = fair_ds_client.is_available()
-            fair_ds_msg = (
-                "API reachable" if fair_ds_ok else "No response"
-            )
+            fair_ds_breaker = fair_ds_client.circuit_state
+            if fair_ds_ok:
+                fair_ds_msg = "API reachable"
+            elif fair_ds_breaker.get("state") == "open":
+                fair_ds_msg = "Circuit open; serving cached catalog"
+            else:
+                fair_ds_msg = "No response"
         except Exception as exc:
             fair_ds_msg = str(exc)
             fair_ds_error = str(exc)
@@ -463,6 +470,7 @@ def _build_system_status() -> SystemStatusResponse:
                 "api_root_reachable": fair_ds_ok,
                 "timeout_seconds": 5,
                 "last_error": fair_ds_error,
+                "circuit_breaker": fair_ds_breaker,
             },
         )
     )
@@ -563,6 +571,7 @@ def _build_system_status() -> SystemStatusResponse:
                 "qdrant_reachable": qdrant_ok,
                 "memory_llm_reachable": memory_llm_reachable,
                 "memory_model_available": memory_model_available,
+                "ttl_sweeper": memory_sweeper_stats(),
             },
         )
     )
@@ -746,10 +755,21 @@ def _build_fairds_statistics(
             if str(term_info.get("url") or "").strip():
                 term_quality["with_ontology_url"] += 1
 
-        for package_name in package_names:
-            package_data = client.get_package(
-                package_name, force_refresh=force_refresh
+        bulk_fetch = getattr(client, "get_packages_bulk", None)
+        if callable(bulk_fetch):
+            package_details = bulk_fetch(
+                package_names, force_refresh=force_refresh
             )
+        else:
+            package_details = {
+                name: client.get_package(
+                    name, force_refresh=force_refresh
+                )
+                for name in package_names
+            }
+
+        for package_name in package_names:
+            package_data = package_details.get(package_name)
             metadata = []
             if isinstance(package_data, dict):
                 raw_metadata = package_data.get("metadata")
@@ -1064,23 +1084,72 @@ async def ollama_models(
     )
 
 
+_FAIRDS_STATS_MAX_TOP = 30
+_FAIRDS_STATS_MAX_PACKAGES = 40
+
+
+def _build_fairds_statistics_snapshot(
+    force_refresh: bool,
+) -> FAIRDSStatisticsResponse:
+    # Built once at the widest limits; requests slice the sorted lists.
+    return _build_fairds_statistics(
+        force_refresh=force_refresh,
+        top_terms_limit=_FAIRDS_STATS_MAX_TOP,
+        package_limit=_FAIRDS_STATS_MAX_PACKAGES,
+    )
+
+
+def _make_fairds_statistics_cache() -> FAIRDSStatisticsCache:
+    from fairifier.config import config as fc
+
+    return FAIRDSStatisticsCache(
+        _build_fairds_statistics_snapshot,
+        max_age_seconds=fc.fair_ds_statistics_max_age_seconds,
+    )
+
+
+_fairds_statistics_cache = _make_fairds_statistics_cache()
+
+
 @router.get(
     "/fairds/statistics",
     response_model=FAIRDSStatisticsResponse,
 )
 async def fairds_statistics(
     refresh: bool = Query(default=False),
-    top: int = Query(default=12, ge=3, le=30),
-    packages: int = Query(default=15, ge=5, le=40),
+    top: int = Query(default=12, ge=3, le=_FAIRDS_STATS_MAX_TOP),
+    packages: int = Query(default=15, ge=5, le=_FAIRDS_STATS_MAX_PACKAGES),
 ) -> FAIRDSStatisticsResponse:
+    from fairifier.config import config as fc
+
     return await asyncio.to_thread(
-        _build_fairds_statistics,
-        force_refresh=refresh,
+        _fairds_statistics_cache.get,
         top_terms_limit=top,
         package_limit=packages,
+        force_refresh=refresh,
+        api_url=fc.fair_ds_api_url,
     )
 
 
+@router.post(
+    "/fairds/statistics/refresh",
+    status_code=202,
+)
+async def refresh_fairds_statistics() -> dict:
+    """Rebuild the statistics snapshot in the background."""
+    started = _fairds_statistics_cache.refresh_in_background(
+        force_refresh=True
+    )
+    age = _fairds_statistics_cache.age_seconds()
+    return {
+        "refreshing": True,
+        "started": started,
+        "snapshot_age_seconds": (
+            round(age, 1) if age is not None else None
+        ),
+    }
+
+
 # ------------------------------------------------------------------
 # Projects
 # ------------------------------------------------------------------
@@ -1439,37 +1508,16 @@ async def _sse_generator(
         event_bus.unsubscribe(project_id, queue)
 
 
-_STOP_WORDS = frozenset({
-    "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
-    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
-    "has", "have", "had", "do", "does", "did", "will", "would", "could",
-    "should", "may", "might", "that", "this", "these", "those", "it", "its",
-    "as", "if", "not", "no", "so", "up", "out", "more", "than", "then",
-    "also", "about", "into", "using", "used", "via", "based", "per",
-    "between", "identified", "selected", "requires", "required", "within",
-    "across", "during", "after", "before", "through", "all", "each",
-    "which", "when", "where", "how", "what", "well", "can", "use",
-})
-
-
 def _tokenize_memories(
     memories: list,
 ) -> list:
     """Extract (word, category) pairs from a list of mem0 memory dicts."""
-    import re
+    from fairifier.services.memory_aggregate_index import memory_category, memory_terms
+
     pairs: list[tuple[str, str]] = []
     for m in memories:
-        text = m.get("memory", "")
-        meta = m.get("metadata") or {}
-        category = (
-            meta.get("agent_id")
-            or meta.get("workflow_step")
-            or "unknown"
-        )
-        for word in re.findall(r"[a-zA-Z]{3,}", text):
-            w = word.lower()
-            if w not in _STOP_WORDS:
-                pairs.append((w, category))
+        category = memory_category(m)
+        pairs.extend((word, category) for word in memory_terms(m.get("memory", "")))
     return pairs
 
 
@@ -1506,6 +1554,51 @@ def _memory_dedupe_key(memory: dict) -> str:
     )
 
 
+def _memory_cloud_scope_ids(project_id: str, project_data: dict, store) -> list[str]:
+    """Mem0 scopes aggregated in the memory cloud "all runs" view."""
+    from fairifier.config import config as fc
+
+    user_scope_id = project_data.get("session_id")
+    if not user_scope_id:
+        return [
+            project_data.get("memory_scope_id")
+            or fc.memory_scope_id
+            or "fairifier-global"
+        ]
+    scope_ids = [
+        proj["project_id"]
+        for proj in store.list_projects()
+        if proj.get("session_id") == user_scope_id and proj.get("project_id")
+    ]
+    if user_scope_id != project_id:
+        scope_ids.append(user_scope_id)
+    return list(dict.fromkeys(scope_ids))
+
+
+async def _indexed_memory_cloud(index, mem0, project_id: str, project_data: dict, store) -> MemoryCloudResponse:
+    """Memory cloud from the aggregate index (sessions not yet indexed are synced once)."""
+    scope_ids = _memory_cloud_scope_ids(project_id, project_data, store)
+    await asyncio.to_thread(
+        index.ensure_synced,
+        [project_id, *scope_ids],
+        lambda session_id: mem0.get_all_memories(session_id),
+    )
+
+    def _entries(session_ids: list[str]) -> list[MemoryWordEntry]:
+        return [
+            MemoryWordEntry(text=term, value=count, category=category)
+            for term, count, category in index.word_frequencies(session_ids, limit=80)
+        ]
+
+    return MemoryCloudResponse(
+        session_words=_entries([project_id]),
+        scope_words=_entries(scope_ids),
+        session_total=index.memory_count([project_id]),
+        scope_total=index.memory_count(scope_ids),
+        memory_enabled=True,
+    )
+
+
 @router.get("/projects/{project_id}/memory-cloud", response_model=MemoryCloudResponse)
 async def memory_cloud(project_id: str, request: Request) -> MemoryCloudResponse:
     """Return word-frequency data extracted from this project's memories.
@@ -1537,6 +1630,12 @@ async def memory_cloud(project_id: str, request: Request) -> MemoryCloudResponse
     )
     store = _get_store(request)
 
+    from fairifier.services.memory_aggregate_index import get_memory_aggregate_index
+
+    index = get_memory_aggregate_index()
+    if index is not None:
+        return await _indexed_memory_cloud(index, mem0, project_id, project_data, store)
+
     # --- This run: memories scoped to this specific workflow execution ---
     session_mems = mem0.list_memories(session_id=project_id)
 
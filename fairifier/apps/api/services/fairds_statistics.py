@@ -0,0 +1,154 @@
+"""Precomputed FAIR-DS statistics snapshot for the dashboard endpoint.
+
+Aggregating the catalog touches every package detail and the full term list,
+so ``GET /fairds/statistics`` used to cost seconds per page view. The
+:class:`FAIRDSStatisticsCache` keeps one snapshot built at the widest
+leaderboard / top-terms limits the endpoint accepts and slices it per request:
+
+* the first request builds synchronously (concurrent callers share the build);
+* later requests are answered from memory with the snapshot age attached;
+* once the snapshot is older than ``max_age_seconds`` it is still served while
+  a background thread rebuilds it. Rebuilds read through the FAIR-DS catalog
+  cache, so an unchanged catalog costs only ETag revalidations;
+* an explicit refresh forces a rebuild that bypasses the catalog cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from ..models import FAIRDSStatisticsResponse
+
+logger = logging.getLogger(__name__)
+
+StatisticsBuilder = Callable[[bool], FAIRDSStatisticsResponse]
+
+# Snapshots of an unreachable FAIR-DS are retried sooner than healthy ones.
+_UNAVAILABLE_MAX_AGE_SECONDS = 30.0
+
+
+class FAIRDSStatisticsCache:
+    """Thread-safe holder for the latest FAIR-DS statistics snapshot."""
+
+    def __init__(self, build: StatisticsBuilder, *, max_age_seconds: float = 900.0) -> None:
+        self._build = build
+        self.max_age_seconds = float(max_age_seconds)
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._snapshot: Optional[FAIRDSStatisticsResponse] = None
+        self._built_at = 0.0
+        self._generation = 0
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def refreshing(self) -> bool:
+        with self._lock:
+            return self._refresh_thread is not None and self._refresh_thread.is_alive()
+
+    def age_seconds(self) -> Optional[float]:
+        with self._lock:
+            if self._snapshot is None:
+                return None
+            return time.monotonic() - self._built_at
+
+    def get(
+        self,
+        *,
+        top_terms_limit: int,
+        package_limit: int,
+        force_refresh: bool = False,
+        api_url: Optional[str] = None,
+    ) -> FAIRDSStatisticsResponse:
+        """Snapshot sliced to the requested limits, rebuilding only when needed.
+
+        A snapshot built for a different ``api_url`` is never served.
+        """
+        with self._lock:
+            if self._snapshot is not None and self._snapshot.api_url != api_url:
+                self._snapshot = None
+                self._generation += 1
+            snapshot = self._snapshot
+            generation = self._generation
+        if snapshot is None or force_refresh:
+            self._rebuild(force_refresh, seen_generation=generation)
+        elif self._is_stale(snapshot):
+            self.refresh_in_background()
+        return self._view(top_terms_limit, package_limit)
+
+    def refresh_in_background(self, force_refresh: bool = False) -> bool:
+        """Start a background rebuild; returns False if one is already running."""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+            generation = self._generation
+            thread = threading.Thread(
+                target=self._rebuild,
+                args=(force_refresh,),
+                kwargs={"seen_generation": generation},
+                name="fairds-statistics-refresh",
+                daemon=True,
+            )
+            self._refresh_thread = thread
+        thread.start()
+        return True
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._built_at = 0.0
+            self._generation += 1
+
+    def _is_stale(self, snapshot: FAIRDSStatisticsResponse) -> bool:
+        max_age = self.max_age_seconds
+        if not snapshot.available:
+            max_age = min(max_age, _UNAVAILABLE_MAX_AGE_SECONDS)
+        with self._lock:
+            return time.monotonic() - self._built_at >= max_age
+
+    def _rebuild(self, force_refresh: bool, *, seen_generation: int) -> None:
+        with self._build_lock:
+            with self._lock:
+                # Another caller finished a build while we waited: reuse it.
+                if (
+                    self._generation != seen_generation
+                    and self._snapshot is not None
+                    and not force_refresh
+                ):
+                    return
+            try:
+                snapshot = self._build(force_refresh)
+            except Exception as exc:
+                logger.warning("FAIR-DS statistics rebuild failed: %s", exc)
+                return
+            with self._lock:
+                self._snapshot = snapshot
+                self._built_at = time.monotonic()
+                self._generation += 1
+
+    def _view(self, top_terms_limit: int, package_limit: int) -> FAIRDSStatisticsResponse:
+        with self._lock:
+            snapshot = self._snapshot
+            age = time.monotonic() - self._built_at
+            refreshing = self._refresh_thread is not None and self._refresh_thread.is_alive()
+        if snapshot is None:
+            raise RuntimeError("FAIR-DS statistics snapshot could not be built")
+        return snapshot.model_copy(
+            update={
+                "package_leaderboard": snapshot.package_leaderboard[:package_limit],
+                "top_terms": snapshot.top_terms[:top_terms_limit],
+                "snapshot_age_seconds": round(age, 1),
+                "refreshing": refreshing,
+            }
+        )
+
+
+__all__ = ["FAIRDSStatisticsCache", "StatisticsBuilder"]
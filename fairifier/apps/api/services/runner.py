@@ -20,7 +20,10 @@ from fairifier.services.fairds_excel_export import (
 )
 from fairifier.utils.json_logger import JSONLogger
 from fairifier.utils.config_saver import save_runtime_config
-from fairifier.utils.run_control import reset_run_stop_requested
+from fairifier.utils.run_control import (
+    reset_run_stop_requested,
+    run_progress_listener,
+)
 
 logger = logging.getLogger(__name__)
 _CONFIG_OVERRIDE_LOCK = threading.Lock()
@@ -124,6 +127,25 @@ class _FullOutputLogHandler(logging.Handler):
             self.handleError(record)
 
 
+def _conversion_progress_publisher(project_id: str):
+    """Forward document-conversion progress (MinerU pages) to SSE."""
+
+    def publish(payload: Dict[str, Any]) -> None:
+        current = payload.get("current")
+        total = payload.get("total")
+        step = payload.get("step") or "Converting"
+        message = f"{payload.get('document', 'document')}: {step} {current}/{total}"
+        event_bus.publish_sync(
+            WorkflowEvent(
+                event_type="conversion_progress",
+                project_id=project_id,
+                data={**payload, "message": message},
+            )
+        )
+
+    return publish
+
+
 def _start_full_output_capture(
     output_dir: Optional[str],
     *,
@@ -250,14 +272,18 @@ def run_workflow_task(
                             },
                         )
                     )
-                    result = asyncio.run(
-                        app.run(
-                            file_path,
-                            project_id,
-                            output_dir,
-                            user_session_id=user_session_id,
+                    with run_progress_listener(
+                        project_id,
+                        _conversion_progress_publisher(project_id),
+                    ):
+                        result = asyncio.run(
+                            app.run(
+                                file_path,
+                                project_id,
+                                output_dir,
+                                user_session_id=user_session_id,
+                            )
                         )
-                    )
                     if config_overrides:
                         overridden_config = (
                             _snapshot_config_state()
@@ -3,6 +3,7 @@
 import asyncio
 import json
 import sys
+import time
 import logging
 import os
 from pathlib import Path
@@ -1380,6 +1381,160 @@ def check_mineru(verbose: bool):
         click.echo("   - Check configuration in .env file")
 
 
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+@cli.group()
+def mineru():
+    """MinerU conversion utilities."""
+    pass
+
+
+@mineru.group("cache")
+def mineru_cache():
+    """Inspect and prune the shared MinerU conversion cache."""
+    pass
+
+
+@mineru_cache.command("stats")
+def mineru_cache_stats():
+    """Show size and usage of the MinerU cache."""
+    from .services.mineru_cache import cache_stats
+
+    cache_root = Path(config.mineru_cache_dir).resolve()
+    stats = cache_stats(cache_root)
+    cap = config.mineru_cache_max_gb
+    click.echo(f"📦 MinerU cache: {cache_root}")
+    click.echo(f"   Enabled:  {config.mineru_cache_enabled} (materialize: {config.mineru_cache_materialize})")
+    click.echo(f"   Entries:  {stats['entries']}")
+    click.echo(
+        f"   Size:     {_format_bytes(stats['bytes'])}"
+        + (f" of {cap:g} GB cap" if cap else " (no cap)")
+    )
+    click.echo(f"   Hits:     {stats['hits']}")
+    if stats["oldest_access"]:
+        oldest = datetime.fromtimestamp(stats["oldest_access"]).isoformat(timespec="seconds")
+        newest = datetime.fromtimestamp(stats["newest_access"]).isoformat(timespec="seconds")
+        click.echo(f"   Accessed: {oldest} … {newest}")
+
+
+@mineru_cache.command("prune")
+@click.option(
+    "--max-gb",
+    type=float,
+    default=None,
+    help="Target size in GB (default: MINERU_CACHE_MAX_GB; 0 empties the cache).",
+)
+@click.option("--dry-run", is_flag=True, help="List entries that would be evicted.")
+def mineru_cache_prune(max_gb: Optional[float], dry_run: bool):
+    """Evict least recently used cache entries until the cache fits the cap."""
+    from .services.mineru_cache import prune_cache
+
+    target_gb = config.mineru_cache_max_gb if max_gb is None else max_gb
+    if max_gb is None and not target_gb:
+        click.echo("No cap configured (MINERU_CACHE_MAX_GB=0); pass --max-gb.")
+        return
+    cache_root = Path(config.mineru_cache_dir).resolve()
+    evicted = prune_cache(cache_root, int(target_gb * 1024**3), dry_run=dry_run)
+    verb = "Would evict" if dry_run else "Evicted"
+    for entry in evicted:
+        click.echo(f"   {entry['digest'][:16]}…  {_format_bytes(entry['bytes'])}")
+    click.echo(
+        f"✅ {verb} {len(evicted)} entries "
+        f"({_format_bytes(sum(e['bytes'] for e in evicted))}) to fit {target_gb:g} GB"
+    )
+
+
+@cli.group()
+def fairds():
+    """FAIR Data Station utilities."""
+    pass
+
+
+@fairds.group("snapshot")
+def fairds_snapshot():
+    """Export and serve offline FAIR-DS catalog snapshots."""
+    pass
+
+
+@fairds_snapshot.command("export")
+@click.argument("output_file", type=click.Path(dir_okay=False))
+@click.option(
+    "--api-url",
+    default=None,
+    help="FAIR-DS base URL to export from (default: FAIR_DS_API_URL).",
+)
+def fairds_snapshot_export(output_file: str, api_url: Optional[str]):
+    """Dump terms, packages, package details and the agent skill to OUTPUT_FILE.
+
+    The file is versioned, gzip-compressed JSON. Use it offline with
+    FAIR_DS_SNAPSHOT_PATH=OUTPUT_FILE or `fairifier fairds snapshot serve`.
+
+    Examples:
+
+        fairifier fairds snapshot export output/fairds_snapshot.json.gz
+    """
+    from .services.fair_data_station import FAIRDataStationClient
+    from .services.fairds_snapshot import export_snapshot
+
+    api_url = api_url or config.fair_ds_api_url
+    if not api_url:
+        click.echo("❌ FAIR-DS API URL is not configured (set FAIR_DS_API_URL or --api-url).", err=True)
+        sys.exit(1)
+
+    # Always export from the live API, even when FAIR_DS_SNAPSHOT_PATH is set.
+    client = FAIRDataStationClient(api_url, timeout=30, catalog_cache=None, snapshot_path="")
+    if not client.is_available():
+        click.echo(f"❌ FAIR-DS API not reachable at {api_url}", err=True)
+        sys.exit(1)
+
+    click.echo(f"📥 Exporting FAIR-DS catalog from {api_url} ...")
+    try:
+        snapshot = export_snapshot(client, Path(output_file))
+    except Exception as exc:
+        click.echo(f"❌ Snapshot export failed: {exc}", err=True)
+        sys.exit(1)
+
+    size_kb = Path(output_file).stat().st_size / 1024
+    click.echo(f"   Terms:    {len(snapshot.terms)}")
+    click.echo(f"   Packages: {len(snapshot.package_details)}/{len(snapshot.packages)}")
+    click.echo(f"   Skill:    {'yes' if snapshot.skill_markdown else 'no'}")
+    click.echo(f"✅ Wrote {output_file} ({size_kb:.1f} KB)")
+
+
+@fairds_snapshot.command("serve")
+@click.argument("snapshot_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--host", default="127.0.0.1", show_default=True, help="Bind address.")
+@click.option("--port", default=8083, show_default=True, type=int, help="Bind port.")
+def fairds_snapshot_serve(snapshot_file: str, host: str, port: int):
+    """Serve SNAPSHOT_FILE over HTTP with the FAIR-DS GET endpoints.
+
+    Point FAIR_DS_API_URL at http://HOST:PORT to use it as a stand-in server.
+    """
+    from .services.fairds_snapshot import load_snapshot, serve_snapshot
+
+    try:
+        snapshot = load_snapshot(Path(snapshot_file))
+    except ValueError as exc:
+        click.echo(f"❌ {exc}", err=True)
+        sys.exit(1)
+
+    click.echo(
+        f"🌐 Serving FAIR-DS snapshot ({len(snapshot.terms)} terms, "
+        f"{len(snapshot.package_details)} packages, created {snapshot.created_at}) "
+        f"at http://{host}:{port}/api — Ctrl+C to stop"
+    )
+    try:
+        serve_snapshot(snapshot, host, port)
+    except KeyboardInterrupt:
+        click.echo("\n👋 Snapshot server stopped")
+
+
 @cli.group()
 def memory():
     """Manage mem0 persistent memory for workflow sessions."""
@@ -1661,6 +1816,114 @@ def memory_clear(session_id: str, force: bool):
         click.echo(f"⚠️  No memories were deleted (may have been already cleared)")
 
 
+@memory.command("reindex")
+@click.argument("session_ids", nargs=-1)
+def memory_reindex(session_ids: tuple):
+    """Resync the memory aggregate index from mem0.
+
+    Rebuilds the per-session counts, term frequencies and themes behind the
+    memory cloud and overview. Without SESSION_IDS, every session already in
+    the index is resynced.
+
+    Example:
+
+        fairifier memory reindex
+        fairifier memory reindex fairifier_20260129_120000
+    """
+    from .services.memory_aggregate_index import get_memory_aggregate_index
+
+    index = get_memory_aggregate_index()
+    if index is None:
+        click.echo("❌ Memory aggregate index is disabled (FAIRIFIER_MEMORY_INDEX_ENABLED=false).")
+        return
+    if not config.mem0_enabled:
+        click.echo("❌ Mem0 is disabled in configuration.")
+        return
+    try:
+        from .services.mem0_service import get_mem0_service
+        mem0_service = get_mem0_service()
+    except ImportError:
+        click.echo("❌ mem0ai package not installed.")
+        return
+    if not mem0_service or not mem0_service.is_available():
+        click.echo("❌ Mem0 service not available.")
+        return
+
+    targets = list(session_ids) or index.synced_sessions()
+    if not targets:
+        click.echo("Nothing to reindex: no sessions indexed yet (pass SESSION_IDS).")
+        return
+    total = 0
+    failed = 0
+    for session_id in targets:
+        try:
+            memories = mem0_service.get_all_memories(session_id)
+        except Exception as exc:
+            failed += 1
+            click.echo(f"   {session_id}: ❌ could not list memories ({exc}); index left unchanged")
+            continue
+        count = index.resync_session(session_id, memories)
+        total += count
+        click.echo(f"   {session_id}: {count} memories")
+    click.echo(f"✅ Reindexed {len(targets) - failed} session(s), {total} memories")
+
+
+@memory.command("sweep")
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep sweeping every MEM0_TTL_SWEEP_INTERVAL_SECONDS until interrupted.",
+)
+def memory_sweep(watch: bool):
+    """Purge expired memories (past their TTL) from mem0.
+
+    With Qdrant, expired points are deleted in batches by filtering on their
+    expires_at payload; otherwise each known memory scope is scanned.
+
+    Example:
+
+        fairifier memory sweep
+        fairifier memory sweep --watch
+    """
+    if not config.mem0_enabled:
+        click.echo("❌ Mem0 is disabled in configuration.")
+        return
+    try:
+        from .services.mem0_service import get_mem0_service
+        from .services.mem0_ttl_sweeper import get_memory_ttl_sweeper
+        mem0_service = get_mem0_service()
+    except ImportError:
+        click.echo("❌ mem0ai package not installed.")
+        return
+    if not mem0_service or not mem0_service.is_available():
+        click.echo("❌ Mem0 service not available.")
+        return
+
+    sweeper = get_memory_ttl_sweeper(mem0_service)
+    if not watch:
+        purged = sweeper.sweep_all()
+        stats = sweeper.stats()
+        click.echo(
+            f"✅ Purged {purged} expired memories "
+            f"({stats['mode']}, {stats['batches']} batch(es), {stats['errors']} error(s))"
+        )
+        return
+
+    interval = max(config.mem0_ttl_sweep_interval_seconds, 1.0)
+    click.echo(f"Sweeping expired memories every {interval:g}s (Ctrl+C to stop)")
+    try:
+        while True:
+            tick = sweeper.sweep_once()
+            stats = sweeper.stats()
+            click.echo(
+                f"   purged {tick['purged']} ({stats['purged']} total, "
+                f"{stats['passes']} pass(es), {stats['last_tick_ms']:.0f} ms)"
+            )
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        click.echo("Stopped.")
+
+
 @memory.command("status")
 def memory_status():
     """Show mem0 memory service status and configuration."""
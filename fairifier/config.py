@@ -83,6 +83,7 @@ class FAIRifierConfig:
     llm_max_tokens: int = 16384  # Conservative default for test/dev cost control
     llm_enable_thinking: bool = True  # Thinking enabled by default — models that support it benefit from reasoning traces
     llm_thinking_budget: int = 2048  # Token budget for thinking/reasoning (Gemini, Anthropic). 0 = model default
+    llm_max_concurrency: int = 4  # Concurrent LLMHelper calls per event loop (shared limiter)
     enable_deep_agents: bool = True  # Use deepagents inner loops when dependency is available
     enable_a2a: bool = True  # Structured in-process agent-to-agent handoff (AgentMailbox)
     
@@ -91,6 +92,9 @@ class FAIRifierConfig:
     max_doc_context_markdown: int = 200000  # Conservative default to cap input-token cost in test/dev
     max_doc_context_text: int = 120000      # Conservative default to cap input-token cost in test/dev
     multi_file_max_inputs: int = 8  # Cap number of files aggregated from directory/zip input
+    bundle_read_workers: int = 4  # Process-pool size for directory/zip bundle reads (<=1 = sequential)
+    bundle_read_pool_min_files: int = 6  # Pool bundle reads only from this many poolable files ...
+    bundle_read_pool_min_bytes: int = 16 * 1024 * 1024  # ... or this many bytes in total
     table_preview_max_rows: int = 120  # Cap tabular rows rendered into text context
     table_preview_max_cols: int = 24  # Cap tabular columns rendered into text context
 
@@ -101,6 +105,7 @@ class FAIRifierConfig:
     source_max_selected_inputs: int = 8
     source_inventory_max_chars_per_source: int = 4000
     source_read_max_chars: int = 8000
+    source_offset_index_stride: int = 4096  # Chars between byte-offset checkpoints for span reads
     source_grep_context_chars: int = 600
     source_max_search_results: int = 20
     source_role_detection_enabled: bool = True
@@ -157,6 +162,38 @@ class FAIRifierConfig:
     # FAIR Data Station API URL (default: local)
     fair_ds_api_url: Optional[str] = "http://localhost:8083"
     fetch_fairds_agent_skill: bool = True
+    # Shared FAIR-DS catalog cache (terms / packages), reused across clients and processes
+    fair_ds_catalog_cache_enabled: bool = True
+    fair_ds_catalog_cache_ttl_seconds: int = 21600  # revalidate (ETag/Last-Modified) after 6h
+    fair_ds_catalog_cache_path: Path = project_root / "output" / ".fairds_cache" / "catalog.sqlite3"
+    fair_ds_max_concurrency: int = 8  # parallel package-detail requests (get_packages_bulk)
+    # Transport resilience: jittered GET retries and a per-URL circuit breaker
+    fair_ds_retries: int = 2
+    fair_ds_retry_backoff_seconds: float = 0.25
+    fair_ds_breaker_failure_threshold: int = 5
+    fair_ds_breaker_reset_seconds: float = 30.0
+    # Answer term searches from an index over the cached /api/terms catalog
+    fair_ds_local_search_enabled: bool = True
+    # Serve FAIR-DS from an exported snapshot file (offline / reproducible runs)
+    fair_ds_snapshot_path: Optional[Path] = None
+    # Dashboard statistics snapshot is rebuilt in the background once older than this
+    fair_ds_statistics_max_age_seconds: float = 900.0
+    # Process-level retrieval tool cache shared across runs (see services/retrieval_cache.py)
+    retrieval_cache_max_mb: int = 64
+    retrieval_cache_ttl_seconds: Optional[float] = 3600.0
+    # Shared on-disk cache for science API responses (see services/science_http_cache.py)
+    science_http_cache_enabled: bool = True
+    science_http_cache_path: Path = project_root / "output" / ".science_cache" / "http.sqlite3"
+    science_http_cache_ttl_seconds: float = 604800.0  # hosts without a rule below
+    science_http_cache_host_ttls: str = (
+        "www.ebi.ac.uk/ols4=2592000,api.crossref.org=2592000,"
+        "www.ebi.ac.uk/europepmc=86400,api.openalex.org=86400"
+    )
+    science_http_cache_negative_ttl_seconds: float = 300.0
+    science_http_cache_max_rows: int = 50000  # oldest responses are evicted beyond this
+    science_http_offline: bool = False  # serve science APIs from cache/fixtures only
+    science_http_fixtures_dir: Optional[Path] = None
+    science_http_record_fixtures: bool = False
     qdrant_url: Optional[str] = None  # Vector database (optional)
     crossref_mailto: Optional[str] = None  # Contact email for polite Crossref API usage
     
@@ -169,11 +206,23 @@ class FAIRifierConfig:
     mineru_effort: str = "medium"  # hybrid backend: medium|high
     mineru_image_analysis: Optional[bool] = None  # None = MinerU default for effort level
     mineru_timeout_seconds: int = 1800
+    mineru_idle_timeout_seconds: int = 600  # kill MinerU after this long without output (0 = off)
+    # Split PDFs of >= min pages into ranges converted by a pool of MinerU processes (0 = off)
+    mineru_page_chunk_size: int = 0
+    mineru_page_chunk_workers: int = 2
+    mineru_page_chunk_min_pages: int = 60
     mineru_structured_output_enabled: bool = True  # load content_list_v2 for grounding
+    # Skip MinerU for born-digital PDFs whose sampled pypdf text layer scores >= min confidence
+    pdf_fast_path_enabled: bool = False
+    pdf_fast_path_min_confidence: float = 0.9
+    pdf_fast_path_sample_pages: int = 8
+    pdf_fast_path_workers: int = 4  # Process-pool size for page-parallel extraction (<=1 = sequential)
     # Reuse MinerU GPU output for identical uploads (SHA-256 of file bytes)
     mineru_cache_enabled: bool = True
     # Shared across runs; keep next to default ``output`` so permissions match project outputs
     mineru_cache_dir: Path = project_root / "output" / ".mineru_cache"
+    mineru_cache_max_gb: float = 20.0  # LRU-evict entries beyond this size; 0 = unlimited
+    mineru_cache_materialize: str = "auto"  # hits: auto (reflink > hardlink > copy) | reflink | hardlink | copy
     # Optional MinerU-Popo post-processing (external repo / Docker)
     mineru_popo_enabled: bool = False
     mineru_popo_root: Optional[Path] = None
@@ -239,6 +288,21 @@ class FAIRifierConfig:
     mem0_qdrant_port: int = 6333  # Qdrant server port
     mem0_collection_name: str = "fairifier_memories"  # Qdrant collection name
     memory_scope_id: Optional[str] = None  # Override mem0 scope independently from project_id/thread_id
+    # Memory I/O off the critical path (see services/mem0_write_queue.py)
+    mem0_async_writes: bool = True  # queue mem0 adds on a background writer
+    mem0_write_queue_size: int = 256  # writes beyond this are dropped
+    mem0_write_batch_size: int = 8
+    mem0_write_max_retries: int = 2
+    mem0_search_budget_seconds: float = 2.0  # per retrieval; 0 = wait for every search
+    mem0_flush_timeout_seconds: float = 30.0  # FinalizeNode waits this long for queued writes
+    mem0_exit_flush_timeout_seconds: float = 5.0
+    mem0_local_index_enabled: bool = True  # prefetch memories per run and search them in-process
+    mem0_ttl_sweep_interval_seconds: float = 900.0  # background purge of expired memories; 0 = off
+    mem0_ttl_sweep_batch_size: int = 256
+    mem0_ttl_sweep_max_batches: int = 4  # batches (or scopes, without Qdrant) per sweep tick
+    # SQLite aggregates behind the memory cloud / overview (see services/memory_aggregate_index.py)
+    memory_index_enabled: bool = True
+    memory_index_path: Path = project_root / "output" / ".memory_index" / "aggregates.sqlite3"
     
     @property
     def skill_roots(self) -> List[Path]:
@@ -284,6 +348,28 @@ def _parse_path_list_from_env(key: str) -> List[Path]:
     return out
 
 
+# FAIRIFIER_LOCAL_PACKAGE_PATHS as last applied to a config instance.
+_applied_local_package_paths_env: Optional[str] = None
+
+
+def refresh_local_package_paths(
+    config_instance: FAIRifierConfig, force: bool = False
+) -> Tuple[Path, ...]:
+    """Re-read FAIRIFIER_LOCAL_PACKAGE_PATHS if it changed since it was applied.
+
+    Local package lookups call this so an edited path list takes effect
+    without a restart; an unchanged variable keeps any value set in code.
+    """
+    global _applied_local_package_paths_env
+    raw = os.getenv("FAIRIFIER_LOCAL_PACKAGE_PATHS")
+    if force or raw != _applied_local_package_paths_env:
+        config_instance.local_package_paths = tuple(
+            _parse_path_list_from_env("FAIRIFIER_LOCAL_PACKAGE_PATHS")
+        )
+        _applied_local_package_paths_env = raw
+    return config_instance.local_package_paths
+
+
 def apply_env_overrides(config_instance: FAIRifierConfig):
     """Apply environment variable overrides to a config instance."""
     def _normalize_provider(raw: Optional[str]) -> str:
@@ -319,9 +405,7 @@ def apply_env_overrides(config_instance: FAIRifierConfig):
     extra_skill_roots.extend(_parse_path_list_from_env("CLAUDE_SKILLS_PATH"))
     config_instance.skills_extra_dirs = tuple(extra_skill_roots)
 
-    config_instance.local_package_paths = tuple(
-        _parse_path_list_from_env("FAIRIFIER_LOCAL_PACKAGE_PATHS")
-    )
+    refresh_local_package_paths(config_instance, force=True)
     if os.getenv("FAIRIFIER_LOCAL_PACKAGE_INCLUDE_RECOMMENDED"):
         value = os.getenv(
             "FAIRIFIER_LOCAL_PACKAGE_INCLUDE_RECOMMENDED", ""
@@ -349,6 +433,12 @@ def apply_env_overrides(config_instance: FAIRifierConfig):
         config_instance.react_loop_max_tool_calls = int(os.getenv("REACT_LOOP_MAX_TOOL_CALLS"))
     if os.getenv("FAIRIFIER_MULTI_FILE_MAX_INPUTS"):
         config_instance.multi_file_max_inputs = int(os.getenv("FAIRIFIER_MULTI_FILE_MAX_INPUTS"))
+    if os.getenv("FAIRIFIER_BUNDLE_READ_WORKERS"):
+        config_instance.bundle_read_workers = int(os.getenv("FAIRIFIER_BUNDLE_READ_WORKERS"))
+    if os.getenv("FAIRIFIER_BUNDLE_READ_POOL_MIN_FILES"):
+        config_instance.bundle_read_pool_min_files = int(os.getenv("FAIRIFIER_BUNDLE_READ_POOL_MIN_FILES"))
+    if os.getenv("FAIRIFIER_BUNDLE_READ_POOL_MIN_BYTES"):
+        config_instance.bundle_read_pool_min_bytes = int(os.getenv("FAIRIFIER_BUNDLE_READ_POOL_MIN_BYTES"))
     if os.getenv("FAIRIFIER_TABLE_PREVIEW_MAX_ROWS"):
         config_instance.table_preview_max_rows = int(os.getenv("FAIRIFIER_TABLE_PREVIEW_MAX_ROWS"))
     if os.getenv("FAIRIFIER_TABLE_PREVIEW_MAX_COLS"):
@@ -366,6 +456,8 @@ def apply_env_overrides(config_instance: FAIRifierConfig):
         )
     if os.getenv("FAIRIFIER_SOURCE_READ_MAX_CHARS"):
         config_instance.source_read_max_chars = int(os.getenv("FAIRIFIER_SOURCE_READ_MAX_CHARS"))
+    if os.getenv("FAIRIFIER_SOURCE_OFFSET_INDEX_STRIDE"):
+        config_instance.source_offset_index_stride = int(os.getenv("FAIRIFIER_SOURCE_OFFSET_INDEX_STRIDE"))
     if os.getenv("FAIRIFIER_SOURCE_GREP_CONTEXT_CHARS"):
         config_instance.source_grep_context_chars = int(os.getenv("FAIRIFIER_SOURCE_GREP_CONTEXT_CHARS"))
     if os.getenv("FAIRIFIER_SOURCE_MAX_SEARCH_RESULTS"):
@@ -551,6 +643,8 @@ def apply_env_overrides(config_instance: FAIRifierConfig):
 
     if os.getenv("LLM_MAX_TOKENS"):
         config_instance.llm_max_tokens = int(os.getenv("LLM_MAX_TOKENS"))
+    if os.getenv("LLM_MAX_CONCURRENCY"):
+        config_instance.llm_max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY"))
     
     # Thinking mode configuration
     if os.getenv("LLM_ENABLE_THINKING"):
@@ -571,6 +665,70 @@ def apply_env_overrides(config_instance: FAIRifierConfig):
         config_instance.fetch_fairds_agent_skill = os.getenv(
             "FAIRIFIER_FETCH_FAIRDS_AGENT_SKILL"
         ).lower() in ("true", "1", "yes")
+    if os.getenv("FAIR_DS_CATALOG_CACHE_ENABLED"):
+        v = os.getenv("FAIR_DS_CATALOG_CACHE_ENABLED", "").strip().lower()
+        config_instance.fair_ds_catalog_cache_enabled = v not in ("0", "false", "no", "off")
+    if os.getenv("FAIR_DS_CATALOG_CACHE_TTL_SECONDS"):
+        config_instance.fair_ds_catalog_cache_ttl_seconds = int(
+            os.getenv("FAIR_DS_CATALOG_CACHE_TTL_SECONDS")
+        )
+    if os.getenv("FAIR_DS_CATALOG_CACHE_PATH"):
+        config_instance.fair_ds_catalog_cache_path = Path(os.getenv("FAIR_DS_CATALOG_CACHE_PATH"))
+    if os.getenv("FAIR_DS_MAX_CONCURRENCY"):
+        config_instance.fair_ds_max_concurrency = int(os.getenv("FAIR_DS_MAX_CONCURRENCY"))
+    if os.getenv("FAIR_DS_RETRIES"):
+        config_instance.fair_ds_retries = int(os.getenv("FAIR_DS_RETRIES"))
+    if os.getenv("FAIR_DS_RETRY_BACKOFF_SECONDS"):
+        config_instance.fair_ds_retry_backoff_seconds = float(
+            os.getenv("FAIR_DS_RETRY_BACKOFF_SECONDS")
+        )
+    if os.getenv("FAIR_DS_BREAKER_FAILURE_THRESHOLD"):
+        config_instance.fair_ds_breaker_failure_threshold = int(
+            os.getenv("FAIR_DS_BREAKER_FAILURE_THRESHOLD")
+        )
+    if os.getenv("FAIR_DS_BREAKER_RESET_SECONDS"):
+        config_instance.fair_ds_breaker_reset_seconds = float(
+            os.getenv("FAIR_DS_BREAKER_RESET_SECONDS")
+        )
+    if os.getenv("FAIR_DS_LOCAL_SEARCH_ENABLED"):
+        v = os.getenv("FAIR_DS_LOCAL_SEARCH_ENABLED", "").strip().lower()
+        config_instance.fair_ds_local_search_enabled = v not in ("0", "false", "no", "off")
+    if os.getenv("FAIR_DS_SNAPSHOT_PATH"):
+        config_instance.fair_ds_snapshot_path = Path(os.getenv("FAIR_DS_SNAPSHOT_PATH"))
+    if os.getenv("FAIR_DS_STATISTICS_MAX_AGE_SECONDS"):
+        config_instance.fair_ds_statistics_max_age_seconds = float(
+            os.getenv("FAIR_DS_STATISTICS_MAX_AGE_SECONDS")
+        )
+    if os.getenv("FAIRIFIER_RETRIEVAL_CACHE_MAX_MB"):
+        config_instance.retrieval_cache_max_mb = int(os.getenv("FAIRIFIER_RETRIEVAL_CACHE_MAX_MB"))
+    if os.getenv("FAIRIFIER_RETRIEVAL_CACHE_TTL_SECONDS"):
+        ttl = float(os.getenv("FAIRIFIER_RETRIEVAL_CACHE_TTL_SECONDS"))
+        config_instance.retrieval_cache_ttl_seconds = ttl if ttl > 0 else None
+    if os.getenv("FAIRIFIER_SCIENCE_CACHE_ENABLED"):
+        v = os.getenv("FAIRIFIER_SCIENCE_CACHE_ENABLED", "").strip().lower()
+        config_instance.science_http_cache_enabled = v not in ("0", "false", "no", "off")
+    if os.getenv("FAIRIFIER_SCIENCE_CACHE_PATH"):
+        config_instance.science_http_cache_path = Path(os.getenv("FAIRIFIER_SCIENCE_CACHE_PATH"))
+    if os.getenv("FAIRIFIER_SCIENCE_CACHE_TTL_SECONDS"):
+        config_instance.science_http_cache_ttl_seconds = float(
+            os.getenv("FAIRIFIER_SCIENCE_CACHE_TTL_SECONDS")
+        )
+    if os.getenv("FAIRIFIER_SCIENCE_CACHE_HOST_TTLS"):
+        config_instance.science_http_cache_host_ttls = os.getenv("FAIRIFIER_SCIENCE_CACHE_HOST_TTLS")
+    if os.getenv("FAIRIFIER_SCIENCE_CACHE_NEGATIVE_TTL_SECONDS"):
+        config_instance.science_http_cache_negative_ttl_seconds = float(
+            os.getenv("FAIRIFIER_SCIENCE_CACHE_NEGATIVE_TTL_SECONDS")
+        )
+    if os.getenv("FAIRIFIER_SCIENCE_CACHE_MAX_ROWS"):
+        config_instance.science_http_cache_max_rows = int(os.getenv("FAIRIFIER_SCIENCE_CACHE_MAX_ROWS"))
+    if os.getenv("FAIRIFIER_SCIENCE_OFFLINE"):
+        v = os.getenv("FAIRIFIER_SCIENCE_OFFLINE", "").strip().lower()
+        config_instance.science_http_offline = v not in ("0", "false", "no", "off")
+    if os.getenv("FAIRIFIER_SCIENCE_FIXTURES_DIR"):
+        config_instance.science_http_fixtures_dir = Path(os.getenv("FAIRIFIER_SCIENCE_FIXTURES_DIR"))
+    if os.getenv("FAIRIFIER_SCIENCE_RECORD_FIXTURES"):
+        v = os.getenv("FAIRIFIER_SCIENCE_RECORD_FIXTURES", "").strip().lower()
+        config_instance.science_http_record_fixtures = v not in ("0", "false", "no", "off")
     
     # Processing limits
     if os.getenv("FAIRIFIER_MAX_DOCUMENT_SIZE_MB"):
@@ -664,6 +822,14 @@ def apply_env_overrides(config_instance: FAIRifierConfig):
     if os.getenv("MINERU_TIMEOUT_SECONDS"):
         timeout_value = os.getenv("MINERU_TIMEOUT_SECONDS")
         config_instance.mineru_timeout_seconds = int(timeout_value)
+    if os.getenv("MINERU_IDLE_TIMEOUT_SECONDS"):
+        config_instance.mineru_idle_timeout_seconds = int(os.getenv("MINERU_IDLE_TIMEOUT_SECONDS"))
+    if os.getenv("MINERU_PAGE_CHUNK_SIZE"):
+        config_instance.mineru_page_chunk_size = int(os.getenv("MINERU_PAGE_CHUNK_SIZE"))
+    if os.getenv("MINERU_PAGE_CHUNK_WORKERS"):
+        config_instance.mineru_page_chunk_workers = int(os.getenv("MINERU_PAGE_CHUNK_WORKERS"))
+    if os.getenv("MINERU_PAGE_CHUNK_MIN_PAGES"):
+        config_instance.mineru_page_chunk_min_pages = int(os.getenv("MINERU_PAGE_CHUNK_MIN_PAGES"))
     if os.getenv("MINERU_STRUCTURED_OUTPUT_ENABLED"):
         v = os.getenv("MINERU_STRUCTURED_OUTPUT_ENABLED", "").strip().lower()
         config_instance.mineru_structured_output_enabled = v not in (
@@ -672,6 +838,17 @@ def apply_env_overrides(config_instance: FAIRifierConfig):
             "no",
             "off",
         )
+    if os.getenv("FAIRIFIER_PDF_FAST_PATH_ENABLED"):
+        v = os.getenv("FAIRIFIER_PDF_FAST_PATH_ENABLED", "").strip().lower()
+        config_instance.pdf_fast_path_enabled = v not in ("0", "false", "no", "off")
+    if os.getenv("FAIRIFIER_PDF_FAST_PATH_MIN_CONFIDENCE"):
+        config_instance.pdf_fast_path_min_confidence = float(
+            os.getenv("FAIRIFIER_PDF_FAST_PATH_MIN_CONFIDENCE")
+        )
+    if os.getenv("FAIRIFIER_PDF_FAST_PATH_SAMPLE_PAGES"):
+        config_instance.pdf_fast_path_sample_pages = int(os.getenv("FAIRIFIER_PDF_FAST_PATH_SAMPLE_PAGES"))
+    if os.getenv("FAIRIFIER_PDF_FAST_PATH_WORKERS"):
+        config_instance.pdf_fast_path_workers = int(os.getenv("FAIRIFIER_PDF_FAST_PATH_WORKERS"))
     if os.getenv("MINERU_POPO_ENABLED"):
         v = os.getenv("MINERU_POPO_ENABLED", "").strip().lower()
         config_instance.mineru_popo_enabled = v in ("1", "true", "yes", "on")
@@ -684,6 +861,10 @@ def apply_env_overrides(config_instance: FAIRifierConfig):
         config_instance.mineru_cache_enabled = v not in ("0", "false", "no", "off")
     if os.getenv("MINERU_CACHE_DIR"):
         config_instance.mineru_cache_dir = Path(os.getenv("MINERU_CACHE_DIR"))
+    if os.getenv("MINERU_CACHE_MAX_GB"):
+        config_instance.mineru_cache_max_gb = float(os.getenv("MINERU_CACHE_MAX_GB"))
+    if os.getenv("MINERU_CACHE_MATERIALIZE"):
+        config_instance.mineru_cache_materialize = os.getenv("MINERU_CACHE_MATERIALIZE").strip().lower()
     
     # Checkpointer configuration
     if os.getenv("CHECKPOINTER_BACKEND"):
@@ -784,6 +965,33 @@ def apply_env_overrides(config_instance: FAIRifierConfig):
         config_instance.mem0_collection_name = os.getenv("MEM0_COLLECTION_NAME")
     if os.getenv("FAIRIFIER_MEMORY_SCOPE_ID"):
         config_instance.memory_scope_id = os.getenv("FAIRIFIER_MEMORY_SCOPE_ID")
+    if os.getenv("MEM0_ASYNC_WRITES"):
+        v = os.getenv("MEM0_ASYNC_WRITES", "").strip().lower()
+        config_instance.mem0_async_writes = v not in ("0", "false", "no", "off")
+    if os.getenv("MEM0_WRITE_QUEUE_SIZE"):
+        config_instance.mem0_write_queue_size = int(os.getenv("MEM0_WRITE_QUEUE_SIZE"))
+    if os.getenv("MEM0_WRITE_BATCH_SIZE"):
+        config_instance.mem0_write_batch_size = int(os.getenv("MEM0_WRITE_BATCH_SIZE"))
+    if os.getenv("MEM0_WRITE_MAX_RETRIES"):
+        config_instance.mem0_write_max_retries = int(os.getenv("MEM0_WRITE_MAX_RETRIES"))
+    if os.getenv("MEM0_SEARCH_BUDGET_SECONDS"):
+        config_instance.mem0_search_budget_seconds = float(os.getenv("MEM0_SEARCH_BUDGET_SECONDS"))
+    if os.getenv("MEM0_FLUSH_TIMEOUT_SECONDS"):
+        config_instance.mem0_flush_timeout_seconds = float(os.getenv("MEM0_FLUSH_TIMEOUT_SECONDS"))
+    if os.getenv("MEM0_LOCAL_INDEX_ENABLED"):
+        v = os.getenv("MEM0_LOCAL_INDEX_ENABLED", "").strip().lower()
+        config_instance.mem0_local_index_enabled = v not in ("0", "false", "no", "off")
+    if os.getenv("MEM0_TTL_SWEEP_INTERVAL_SECONDS"):
+        config_instance.mem0_ttl_sweep_interval_seconds = float(os.getenv("MEM0_TTL_SWEEP_INTERVAL_SECONDS"))
+    if os.getenv("MEM0_TTL_SWEEP_BATCH_SIZE"):
+        config_instance.mem0_ttl_sweep_batch_size = int(os.getenv("MEM0_TTL_SWEEP_BATCH_SIZE"))
+    if os.getenv("MEM0_TTL_SWEEP_MAX_BATCHES"):
+        config_instance.mem0_ttl_sweep_max_batches = int(os.getenv("MEM0_TTL_SWEEP_MAX_BATCHES"))
+    if os.getenv("FAIRIFIER_MEMORY_INDEX_ENABLED"):
+        v = os.getenv("FAIRIFIER_MEMORY_INDEX_ENABLED", "").strip().lower()
+        config_instance.memory_index_enabled = v not in ("0", "false", "no", "off")
+    if os.getenv("FAIRIFIER_MEMORY_INDEX_PATH"):
+        config_instance.memory_index_path = Path(os.getenv("FAIRIFIER_MEMORY_INDEX_PATH"))
 
 
 def apply_budget_guardrails(config_instance: FAIRifierConfig):
@@ -229,6 +229,8 @@ class FAIRifierLangGraphApp:
             service = get_mem0_service()
             if service and service.is_available():
                 logger.info("✅ Mem0 service enabled for persistent memory")
+                from ..services.mem0_ttl_sweeper import start_memory_ttl_sweeper
+                start_memory_ttl_sweeper(service)
                 return service
             else:
                 logger.info(
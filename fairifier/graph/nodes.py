@@ -16,12 +16,13 @@ import logging
 import json
 import os
 import re
-import csv
 import gzip
-import shutil
 import tarfile
 import zipfile
 import tempfile
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, Any, Literal, Optional, Tuple, List, Callable
 from datetime import datetime
@@ -41,15 +42,25 @@ from ..config import config
 from ..output_paths import resolve_metadata_output_read_path, METADATA_OUTPUT_FILENAME
 from ..utils.llm_helper import get_llm_helper, normalize_llm_response_content
 from ..utils.report_generator import WorkflowReportGenerator
-from ..utils.run_control import run_stop_requested, reset_run_stop_requested
+from ..utils.run_control import bind_run, run_stop_requested, reset_run_stop_requested
 from ..services.mineru_client import (
+    MinerUCancelledError,
     MinerUClient,
     MinerUConversionError,
     mineru_client_from_config,
 )
 from ..services.mineru_paths import find_markdown_in_tree
 from ..services import mineru_cache as mineru_cache_service
+from ..services.pdf_fast_path import route_pdf
+from ..services.process_pool import process_pool
 from ..services.confidence_aggregator import aggregate_confidence
+from ..services.mem0_local_index import get_run_memory_index
+from ..services.mem0_write_queue import (
+    flush_memory_writes,
+    get_memory_write_queue,
+    memory_run_metrics,
+    search_memories,
+)
 from ..services.fairds_api_parser import FAIRDSAPIParser
 from ..utils.context_observability import log_context_usage
 from ..utils.document_text import read_document_text
@@ -58,7 +69,18 @@ from ..utils.planner_tasks import (
     parse_plan_tasks_from_llm_output,
     planner_task_to_dict,
 )
-from ..services.source_workspace import SourceRecord, build_source_workspace
+from ..services.source_workspace import (
+    SourceRecord,
+    build_source_workspace,
+    table_spool_dir,
+)
+from ..services.tabular_ingest import (
+    GZIP_TABULAR_SUFFIXES,
+    TABULAR_SUFFIXES,
+    render_tabular_file,
+    scan_tabular_file,
+    tabular_kind,
+)
 from ..tools.mineru_tools import create_mineru_convert_tool
 
 # Mem0 service (optional)
@@ -101,6 +123,32 @@ def _filesystem_document_path(document_path: str):
     return Path(head)
 
 
+# Suffixes whose reader may hand off to MinerU; those stay in the parent process
+# because the MinerU tool (and its client) is bound to the hosting app.
+_MINERU_BUNDLE_SUFFIXES = {".pdf", ".docx", ".pptx"}
+
+# Tar archives: how many member names to list, and which members are small
+# enough (text-like) to read inline without extracting anything to disk.
+_TAR_LISTING_LIMIT = 100
+_TAR_TEXT_SUFFIXES = (
+    ".txt", ".md", ".markdown", ".rst", ".csv", ".tsv", ".json", ".jsonl", ".yaml", ".yml",
+)
+
+
+def _init_bundle_read_worker(config_values: Dict[str, Any]) -> None:
+    """Mirror the parent's runtime config in a bundle-read worker process."""
+    for key, value in config_values.items():
+        setattr(config, key, value)
+
+
+def _read_bundle_file_in_worker(
+    document_path: str,
+    output_dir: Optional[str],
+) -> Tuple[str, Dict[str, Any]]:
+    """Process-pool entry point: read one bundle file without MinerU."""
+    return ReadFileNode()._read_single_document_content(document_path, output_dir)
+
+
 
 
 class ReadFileNode:
@@ -142,7 +190,9 @@ class ReadFileNode:
             document_path = state.get("document_path", "")
             output_dir = state.get("output_dir")  # Get output dir from state
             
-            text, conversion_info = self._read_document_content(document_path, output_dir)
+            # Bound so MinerU can poll the stop flag and report page progress.
+            with bind_run(state.get("session_id")):
+                text, conversion_info = self._read_document_content(document_path, output_dir)
             logger.info(f"✅ Loaded {len(text)} characters from document")
             
             # Save to file if not already persisted (e.g. by MinerU)
@@ -314,6 +364,7 @@ class ReadFileNode:
                     content=text,
                     content_type=conversion_info.get("content_type", "text"),
                     tables=conversion_info.get("tables", []),
+                    extraction=conversion_info.get("pdf_route") or {},
                 )
             ],
         )
@@ -382,74 +433,50 @@ class ReadFileNode:
                 f"(This file will be analyzed by BioMetadataAgent with bioinformatics tools.)"
             ), conversion_info
 
-        # --- GZIPPED_TEXT: compressed text files that need decompression ---
-        _GZ_TEXT_PATTERNS = (".tsv.gz", ".bed.gz", ".tagalign.gz", ".csv.gz",
-                             ".txt.gz", ".gff.gz", ".gtf.gz", ".tab.gz")
-        if fname_lower.endswith(_GZ_TEXT_PATTERNS):
+        # --- ARCHIVE: tar archives (checked before generic .gz) ---
+        if suffix == ".tar" or fname_lower.endswith((".tar.gz", ".tgz")):
             try:
-                dest = fs_path.with_suffix("")  # remove .gz
-                with gzip.open(fs_str, "rb") as f_in:
-                    with open(dest, "wb") as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-                logger.info("Decompressed %s → %s", fs_path.name, dest.name)
-                conversion_info["method"] = "decompressed_gzip"
-                conversion_info["original_path"] = fs_str
-                # Re-read the decompressed file
-                text = dest.read_text(encoding="utf-8", errors="replace")
-                conversion_info["content_type"] = "text"
-                conversion_info["chars"] = len(text)
-                return text, conversion_info
-            except Exception as exc:
+                return self._read_tar_archive(fs_path)
+            except (tarfile.TarError, OSError, EOFError) as exc:
+                logger.warning("Failed to read archive %s: %s", fs_str, exc)
+                conversion_info["method"] = "archive_read_failed"
+                return f"[Failed to read archive: {fs_path.name}]", conversion_info
+
+        # --- Gzipped CSV/TSV: stream rows straight into the tabular reader ---
+        if fname_lower.endswith(GZIP_TABULAR_SUFFIXES):
+            try:
+                table_text, tables = self._scan_tabular_file(fs_str, output_dir)
+            except (OSError, EOFError, UnicodeDecodeError) as exc:
                 logger.warning("Failed to decompress %s: %s", fs_str, exc)
                 conversion_info["method"] = "gzip_decompress_failed"
                 return f"[Failed to decompress: {fs_path.name}]", conversion_info
+            conversion_info["method"] = f"tabular_{tabular_kind(fs_path).lstrip('.')}_gz"
+            conversion_info["content_type"] = "table"
+            conversion_info["original_path"] = fs_str
+            conversion_info["tables"] = tables
+            return table_text, conversion_info
 
-        # --- Other .gz files: try decompress, fall through to text if it works ---
+        # --- GZIPPED_TEXT / other .gz: decompress as a capped text stream ---
         if suffix == ".gz":
             try:
-                dest = fs_path.with_suffix("")
-                with gzip.open(fs_str, "rb") as f_in:
-                    with open(dest, "wb") as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-                logger.info("Decompressed %s → %s", fs_path.name, dest.name)
-                conversion_info["method"] = "decompressed_gzip"
-                conversion_info["original_path"] = fs_str
-                text = dest.read_text(encoding="utf-8", errors="replace")
-                conversion_info["content_type"] = "text"
-                conversion_info["chars"] = len(text)
-                return text, conversion_info
-            except Exception as exc:
+                text, truncated = self._read_gzip_text(fs_path, int(config.max_doc_context_text))
+            except (OSError, EOFError) as exc:
                 logger.warning("Failed to decompress %s: %s", fs_str, exc)
                 conversion_info["method"] = "gzip_decompress_failed"
                 return f"[Failed to decompress: {fs_path.name}]", conversion_info
-
-        # --- ARCHIVE: tar archives ---
-        if suffix == ".tar" or fname_lower.endswith(".tar.gz"):
-            try:
-                dest_dir = Path(tempfile.mkdtemp(prefix="fairifier_archive_"))
-                mode = "r:gz" if fname_lower.endswith(".tar.gz") else "r"
-                with tarfile.open(fs_str, mode) as tf:
-                    tf.extractall(path=dest_dir)
-                files = sorted(str(p) for p in dest_dir.rglob("*") if p.is_file())
-                listing = f"[Archive: {fs_path.name}]\nExtracted {len(files)} files to {dest_dir}:\n"
-                listing += "\n".join(f"  {f}" for f in files[:100])
-                conversion_info["method"] = "archive_extracted"
-                conversion_info["content_type"] = "archive_listing"
-                conversion_info["extract_dir"] = str(dest_dir)
-                conversion_info["extracted_files"] = [str(p) for p in dest_dir.rglob("*") if p.is_file()]
-                conversion_info["chars"] = len(listing)
-                return listing, conversion_info
-            except Exception as exc:
-                logger.warning("Failed to extract archive %s: %s", fs_str, exc)
-                conversion_info["method"] = "archive_extract_failed"
-                return f"[Failed to extract archive: {fs_path.name}]", conversion_info
+            conversion_info["method"] = "decompressed_gzip"
+            conversion_info["original_path"] = fs_str
+            conversion_info["content_type"] = "text"
+            conversion_info["chars"] = len(text)
+            conversion_info["truncated"] = truncated
+            return text, conversion_info
 
         # --- Tabular formats ---
-        if suffix in {".csv", ".tsv", ".xlsx", ".xls"}:
-            table_text = self._read_tabular_content(fs_str)
+        if suffix in TABULAR_SUFFIXES:
+            table_text, tables = self._scan_tabular_file(fs_str, output_dir)
             conversion_info["method"] = f"tabular_{suffix.lstrip('.')}"
             conversion_info["content_type"] = "table"
-            conversion_info["tables"] = self._read_tabular_tables(fs_str)
+            conversion_info["tables"] = tables
             return table_text, conversion_info
 
         if suffix == ".json":
@@ -506,6 +533,7 @@ class ReadFileNode:
                             file_digest,
                             Path(output_dir),
                             doc_name,
+                            materialize=config.mineru_cache_materialize,
                         )
                         is not None
                     ):
@@ -548,6 +576,35 @@ class ReadFileNode:
                 except Exception as e:
                     logger.warning("⚠️ Failed to read MinerU reuse result: %s", e)
 
+            # Born-digital PDFs: use the embedded text layer instead of MinerU
+            pdf_route: Optional[Dict[str, Any]] = None
+            if suffix == ".pdf" and self.mineru_tool and config.pdf_fast_path_enabled:
+                fast_text, pdf_route = route_pdf(
+                    doc_path,
+                    min_confidence=config.pdf_fast_path_min_confidence,
+                    sample_pages=config.pdf_fast_path_sample_pages,
+                    workers=config.pdf_fast_path_workers,
+                )
+                if fast_text is not None:
+                    logger.info(
+                        "⚡ PDF fast path: %s (%s pages, confidence %.2f, %.1fs)",
+                        doc_path.name,
+                        pdf_route["page_count"],
+                        pdf_route["confidence"],
+                        pdf_route["elapsed_seconds"],
+                    )
+                    conversion_info["method"] = "pdf_fast_path"
+                    conversion_info["content_type"] = "markdown"
+                    conversion_info["pdf_route"] = pdf_route
+                    return fast_text, conversion_info
+                logger.info(
+                    "PDF text layer confidence %.2f < %.2f for %s; using MinerU",
+                    pdf_route["confidence"],
+                    config.pdf_fast_path_min_confidence,
+                    doc_path.name,
+                )
+                conversion_info["pdf_route"] = pdf_route
+
             # No pre-converted / cache results: run MinerU tool if available
             if self.mineru_tool:
                 mineru_output = None
@@ -592,6 +649,8 @@ class ReadFileNode:
                     )
                     if file_digest:
                         conversion_info["source_sha256"] = file_digest
+                    if pdf_route:
+                        conversion_info["pdf_route"] = pdf_route
                     logger.info("MinerU conversion successful: %s", result["markdown_path"])
                     logger.info("MinerU artifacts: %s", result["output_dir"])
                     if result["images_dir"]:
@@ -609,10 +668,14 @@ class ReadFileNode:
                                 Path(config.mineru_cache_dir).resolve(),
                                 file_digest,
                                 Path(result["output_dir"]),
+                                max_bytes=int(config.mineru_cache_max_gb * 1024**3) or None,
                             )
                         except OSError as exc:
                             logger.warning("MinerU cache store failed: %s", exc)
                     return result["markdown_text"], conversion_info
+                if result.get("cancelled"):
+                    # The run is stopping; do not start a fallback conversion.
+                    raise MinerUCancelledError(result["error"])
                 logger.warning(
                     "MinerU conversion failed (%s). Falling back to PyMuPDF.",
                     result["error"],
@@ -662,6 +725,74 @@ class ReadFileNode:
         conversion_info["content_type"] = "markdown" if suffix in {".md", ".markdown"} else "text"
         return text, conversion_info
 
+    def _read_gzip_text(self, path: "Path", max_chars: int) -> Tuple[str, bool]:
+        """Decompress a gzip text stream, stopping after ``max_chars`` characters.
+
+        Nothing is written next to the input and the remainder of the stream is
+        never inflated once the context budget is reached.
+        """
+        with gzip.open(path, "rt", encoding="utf-8", errors="replace") as fh:
+            text = fh.read(max_chars + 1)
+        if len(text) <= max_chars:
+            return text, False
+        notice = f"\n[... decompressed text truncated at {max_chars} chars ...]"
+        return text[:max_chars] + notice, True
+
+    def _read_tar_archive(self, path: "Path") -> Tuple[str, Dict[str, Any]]:
+        """List a tar archive from its headers, parsing only small text members.
+
+        The archive is walked once in stream mode. Members are never extracted
+        to disk; text-like members (see ``_TAR_TEXT_SUFFIXES``) are read into
+        memory up to the shared ``max_doc_context_text`` budget.
+        """
+        budget = max(0, int(config.max_doc_context_text))
+        max_parsed = max(1, int(config.multi_file_max_inputs))
+        members: List[Dict[str, Any]] = []
+        member_count = 0
+        parsed_blocks: List[str] = []
+        parsed_members: List[str] = []
+        with tarfile.open(str(path), "r|*") as tf:
+            for member in tf:
+                if not member.isfile():
+                    continue
+                member_count += 1
+                if len(members) < _TAR_LISTING_LIMIT:
+                    members.append({"name": member.name, "size": member.size})
+                name_lower = member.name.lower()
+                if (
+                    budget <= 0
+                    or len(parsed_members) >= max_parsed
+                    or not name_lower.endswith(_TAR_TEXT_SUFFIXES)
+                    or any(part.startswith(".") for part in Path(member.name).parts)
+                ):
+                    continue
+                fh = tf.extractfile(member)
+                if fh is None:
+                    continue
+                raw = fh.read(budget * 4 + 4)
+                text = raw.decode("utf-8", errors="replace")
+                if len(text) > budget:
+                    text = text[:budget] + "\n[... member truncated ...]"
+                budget -= len(text)
+                parsed_members.append(member.name)
+                parsed_blocks.append(f"--- {member.name} ---\n{text}")
+
+        listing = f"[Archive: {path.name}]\nContains {member_count} files:\n"
+        listing += "\n".join(f"  {m['name']} ({m['size']} bytes)" for m in members)
+        if member_count > len(members):
+            listing += f"\n  ... ({member_count - len(members)} more files)"
+        if parsed_blocks:
+            listing += "\n\n" + "\n\n".join(parsed_blocks)
+        conversion_info: Dict[str, Any] = {
+            "method": "archive_listed",
+            "content_type": "archive_listing",
+            "member_count": member_count,
+            "members": members,
+            "parsed_members": parsed_members,
+            "chars": len(listing),
+        }
+        return listing, conversion_info
+
     def _is_supported_bundle_file(self, path: "Path") -> bool:
         """Return True when a file extension is supported for bundle ingestion."""
         return path.suffix.lower() in {
@@ -745,19 +876,19 @@ class ReadFileNode:
         input_documents: List[Dict[str, Any]] = []
         failed_sources: List[Dict[str, str]] = []
         bio_file_paths: List[str] = []
-        for idx, file_path in enumerate(selected_files, start=1):
-            try:
-                text, info = self._read_single_document_content(str(file_path), output_dir)
-            except Exception as exc:
-                logger.warning("Skipping bundle file %s due to read error: %s", file_path, exc)
+        read_results = self._read_bundle_files(selected_files, output_dir)
+        for idx, (file_path, outcome) in enumerate(zip(selected_files, read_results), start=1):
+            if isinstance(outcome, BaseException):
+                logger.warning("Skipping bundle file %s due to read error: %s", file_path, outcome)
                 rel_name = str(file_path.relative_to(root_dir))
                 failed_sources.append(
                     {
                         "path": rel_name,
-                        "error": str(exc),
+                        "error": str(outcome),
                     }
                 )
                 continue
+            text, info = outcome
             rel_name = str(file_path.relative_to(root_dir))
             if info.get("content_type") == "bio_binary":
                 hp = info.get("host_path")
@@ -783,6 +914,8 @@ class ReadFileNode:
             }
             if info.get("host_path"):
                 doc_entry["host_path"] = info.get("host_path")
+            if info.get("pdf_route"):
+                doc_entry["pdf_route"] = info["pdf_route"]
             input_documents.append(doc_entry)
 
         if not sections:
@@ -816,97 +949,121 @@ class ReadFileNode:
                     content=str(input_doc.get("content") or ""),
                     content_type=str(input_doc.get("content_type") or "text"),
                     tables=input_doc.get("tables", []) or [],
+                    extraction=input_doc.get("pdf_route") or {},
                 )
                 for idx, input_doc in enumerate(input_documents, start=1)
             ],
         )
         return "".join(sections).strip(), conversion_info
 
+    def _bundle_read_worker_count(self, files: List["Path"]) -> int:
+        """Return the process-pool size for ``files`` (``<= 1`` means sequential)."""
+        workers = int(config.bundle_read_workers or 0)
+        if workers <= 1:
+            return 0
+        # A reader injected by the hosting app (e.g. tests, custom apps) cannot be
+        # shipped to worker processes; keep those reads in-process.
+        reader = getattr(self._read_single_document_content, "__func__", None)
+        if reader is not ReadFileNode._read_single_document_content:
+            return 0
+        pooled = [p for p in files if not self._bundle_file_needs_parent(p)]
+        if len(pooled) < 2:
+            return 0
+        # Workers start from a fresh interpreter (see process_pool), which costs
+        # far more than reading a handful of small files in-process.
+        if len(pooled) < int(config.bundle_read_pool_min_files or 0):
+            total_bytes = 0
+            for path in pooled:
+                try:
+                    total_bytes += path.stat().st_size
+                except OSError:
+                    continue
+            if total_bytes < int(config.bundle_read_pool_min_bytes or 0):
+                return 0
+        return min(workers, len(pooled))
+
+    def _bundle_file_needs_parent(self, path: "Path") -> bool:
+        """True when a bundle file must be read in this process (MinerU conversion)."""
+        return path.suffix.lower() in _MINERU_BUNDLE_SUFFIXES and bool(self.mineru_tool)
+
+    def _read_bundle_files(
+        self,
+        files: List["Path"],
+        output_dir: Optional[str],
+    ) -> List[Any]:
+        """Read bundle files, returning ``(text, info)`` or the raised exception per file.
+
+        Results keep the order of ``files`` (already prioritized). CPU-bound
+        readers (PDF text, Excel, gzip, JSON) fan out to a process pool of
+        ``config.bundle_read_workers`` once the bundle reaches
+        ``bundle_read_pool_min_files`` or ``bundle_read_pool_min_bytes``;
+        MinerU conversions run here meanwhile.
+        """
+        def read_here(path: "Path") -> Any:
+            try:
+                return self._read_single_document_content(str(path), output_dir)
+            except Exception as exc:
+                return exc
+
+        workers = self._bundle_read_worker_count(files)
+        if not workers:
+            return [read_here(path) for path in files]
+
+        results: List[Any] = [None] * len(files)
+        futures: Dict[int, Future] = {}
+        try:
+            with process_pool(
+                workers,
+                initializer=_init_bundle_read_worker,
+                initargs=(dict(vars(config)),),
+            ) as pool:
+                for index, path in enumerate(files):
+                    if not self._bundle_file_needs_parent(path):
+                        futures[index] = pool.submit(
+                            _read_bundle_file_in_worker, str(path), output_dir
+                        )
+                for index, path in enumerate(files):
+                    if index not in futures:
+                        results[index] = read_here(path)
+                for index, future in futures.items():
+                    try:
+                        results[index] = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as exc:
+                        results[index] = exc
+        except (BrokenProcessPool, OSError) as exc:
+            logger.warning("Bundle read pool unavailable (%s); reading sequentially.", exc)
+            for index, path in enumerate(files):
+                if results[index] is None or isinstance(results[index], BrokenProcessPool):
+                    results[index] = read_here(path)
+        logger.info("📚 Read %s bundle files with %s worker processes", len(files), workers)
+        return results
+
     def _read_tabular_content(self, document_path: str) -> str:
         """Render tabular files into a concise text view for LLM parsing."""
-        from pathlib import Path
+        text, _ = self._scan_tabular_file(document_path, output_dir=None)
+        return text
 
+    def _scan_tabular_file(
+        self,
+        document_path: str,
+        output_dir: Optional[str],
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Stream a tabular file once into a text preview plus spooled table rows.
+
+        Full rows are only spooled when a source workspace will be built for
+        ``output_dir``; otherwise just the bounded preview is collected.
+        """
         path = Path(document_path)
-        suffix = path.suffix.lower()
         max_rows = max(1, int(config.table_preview_max_rows))
         max_cols = max(1, int(config.table_preview_max_cols))
-
-        def render_rows(headers: List[str], rows: List[List[Any]], total_rows: int) -> str:
-            clipped_headers = headers[:max_cols]
-            clipped_rows = [row[:max_cols] for row in rows[:max_rows]]
-            lines = [
-                f"Table file: {path.name}",
-                f"Columns ({len(headers)}): {', '.join(clipped_headers)}",
-                f"Preview rows: {min(len(rows), max_rows)} / {total_rows}",
-                "Rows (tab-separated):",
-                "\t".join(clipped_headers),
-            ]
-            for row in clipped_rows:
-                lines.append("\t".join(str(cell) for cell in row))
-            if len(rows) > max_rows:
-                lines.append(f"... ({len(rows) - max_rows} more rows omitted)")
-            if len(headers) > max_cols:
-                lines.append(f"... ({len(headers) - max_cols} more columns omitted)")
-            return "\n".join(lines)
-
-        if suffix in {".csv", ".tsv"}:
-            delimiter = "," if suffix == ".csv" else "\t"
-            with open(path, "r", encoding="utf-8", newline="") as f:
-                reader = csv.reader(f, delimiter=delimiter)
-                all_rows = list(reader)
-            if not all_rows:
-                return f"Table file: {path.name}\n(empty)"
-            headers = [str(h) for h in all_rows[0]]
-            rows = all_rows[1:]
-            return render_rows(headers, rows, total_rows=len(rows))
-
-        # Excel parsing (xlsx/xls) uses pandas/openpyxl from requirements.
-        import pandas as pd
-        try:
-            workbook = pd.ExcelFile(path)
-        except Exception as exc:
-            raise ValueError(
-                f"Failed to parse Excel file '{path.name}'. "
-                "Ensure openpyxl (for .xlsx) / xlrd (for .xls) is installed."
-            ) from exc
-        sheet_text_blocks: List[str] = []
-        for sheet_name in workbook.sheet_names[:6]:
-            df = pd.read_excel(path, sheet_name=sheet_name)
-            headers = [str(col) for col in df.columns]
-            rows = df.fillna("").values.tolist()
-            block = render_rows(headers, rows, total_rows=len(rows))
-            sheet_text_blocks.append(f"[Sheet: {sheet_name}]\n{block}")
-        if len(workbook.sheet_names) > 6:
-            sheet_text_blocks.append(
-                f"... ({len(workbook.sheet_names) - 6} more sheets omitted)"
-            )
-        return "\n\n".join(sheet_text_blocks)
-
-    def _read_tabular_tables(self, document_path: str) -> List[Dict[str, Any]]:
-        """Read full tabular rows for source-workspace search tools."""
-        path = Path(document_path)
-        suffix = path.suffix.lower()
-
-        if suffix in {".csv", ".tsv"}:
-            delimiter = "," if suffix == ".csv" else "\t"
-            with open(path, "r", encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f, delimiter=delimiter)
-                rows = [dict(row) for row in reader]
-            return [{"name": path.stem, "rows": rows}]
-
-        import pandas as pd
-
-        workbook = pd.ExcelFile(path)
-        tables: List[Dict[str, Any]] = []
-        for sheet_name in workbook.sheet_names:
-            df = pd.read_excel(path, sheet_name=sheet_name)
-            for col in df.select_dtypes(include=["datetime64", "datetime64[ns]", "datetimetz"]).columns:
-                ser = df[col]
-                df[col] = ser.dt.strftime("%Y-%m-%dT%H:%M:%S").where(ser.notna(), "")
-            # Table rows are written with source_workspace._json_safe_value (numpy/datetime-safe).
-            rows = df.fillna("").to_dict(orient="records")
-            tables.append({"name": str(sheet_name), "rows": rows})
-        return tables
+        spool_dir = None
+        if config.source_workspace_enabled and output_dir:
+            spool_dir = table_spool_dir(Path(output_dir))
+        scans = scan_tabular_file(path, preview_rows=max_rows, spool_dir=spool_dir)
+        text = render_tabular_file(path, scans, max_rows=max_rows, max_cols=max_cols)
+        return text, [scan.to_table_entry() for scan in scans]
 
 
 class OrchestrateNode:
@@ -1696,7 +1853,7 @@ class OrchestrateNode:
                 )
                 continue
 
-            self.mem0_service.add(
+            write = dict(
                 messages=[{
                     "role": "assistant",
                     "content": insight,
@@ -1709,6 +1866,29 @@ class OrchestrateNode:
                     "memory_scope_type": scope_type,
                 },
             )
+            run_index = self._run_memory_index(state)
+            if config.mem0_async_writes:
+                # Embedding + upsert run on the write-behind queue, off the step's critical path.
+                get_memory_write_queue(self.mem0_service).submit(
+                    **write,
+                    run_id=state.get("session_id"),
+                    on_complete=(
+                        (lambda _result, scope=memory_scope_id: run_index.mark_dirty(scope))
+                        if run_index is not None
+                        else None
+                    ),
+                )
+            else:
+                self.mem0_service.add(**write)
+                if run_index is not None:
+                    run_index.mark_dirty(memory_scope_id)
+
+    def _run_memory_index(self, state: FAIRifierState):
+        """Per-run local memory index, or None when disabled / outside a run."""
+        run_id = state.get("session_id")
+        if not config.mem0_local_index_enabled or not self.mem0_service or not run_id:
+            return None
+        return get_run_memory_index(self.mem0_service, run_id)
 
     def _retrieve_relevant_memories(
         self,
@@ -1793,14 +1973,30 @@ class OrchestrateNode:
             # Search both scopes:
             # - session_id/project_id: current run, enabling agent-to-agent handoff
             # - memory_scope_id: cross-run user/global memory
+            # Both scopes share one latency budget; past it the agent runs without memories.
+            budget = config.mem0_search_budget_seconds
+            deadline = time.monotonic() + budget if budget and budget > 0 else None
             memories = []
             seen_memory_ids = set()
             seen_memory_texts = set()
+            # Searches are served from the run's prefetched index when enabled.
+            searcher = self._run_memory_index(state) or self.mem0_service
+            run_id = state.get("session_id")
             for memory_scope_id in self._memory_scope_ids(state, session_id):
-                scope_memories = self.mem0_service.search(
+                if memory_scope_id == session_id and run_id and config.mem0_async_writes:
+                    # Earlier steps' insights may still be queued; wait for this
+                    # run's writes (within the budget) so the search sees them.
+                    flush_memory_writes(
+                        timeout=None if deadline is None else max(0.0, deadline - time.monotonic()),
+                        run_id=run_id,
+                    )
+                scope_memories = search_memories(
+                    searcher,
                     query=query,
                     session_id=memory_scope_id,
                     limit=top_k,
+                    timeout=None if deadline is None else deadline - time.monotonic(),
+                    run_id=run_id,
                 )
                 for memory in scope_memories:
                     memory_id = memory.get("id") if isinstance(memory, dict) else None
@@ -2637,6 +2833,10 @@ class OrchestrateNode:
         
         # [R] Retrieve planning memories before execution
         session_id = state.get("session_id")
+        run_index = self._run_memory_index(state)
+        if run_index is not None:
+            # Load the run's memory scopes once; the run's searches are then local.
+            run_index.prefetch(self._memory_scope_ids(state, session_id))
         if self.mem0_service and session_id:
             relevant_memories = self._retrieve_relevant_memories(
                 agent_name="Planner",
@@ -3525,6 +3725,15 @@ class FinalizeNode:
         from fairifier.services.agent_mailbox import AgentMailbox
         summary["agent_handoff"] = AgentMailbox.handoff_summary(state)
 
+        # ── Memory I/O: drain queued mem0 writes, record latency/drops ──
+        if not flush_memory_writes(
+            timeout=config.mem0_flush_timeout_seconds, run_id=state.get("session_id")
+        ):
+            logger.warning("⚠️ Memory write queue not drained within %.0fs", config.mem0_flush_timeout_seconds)
+        memory_metrics = memory_run_metrics(state.get("session_id"))
+        if memory_metrics["search"]["calls"] or memory_metrics["writes"]["enqueued"] or memory_metrics["writes"]["dropped"]:
+            summary["memory"] = memory_metrics
+
         state["execution_summary"] = summary
         
         # Set final status based on whether we have the critical output
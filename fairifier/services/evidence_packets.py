@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from typing import Any, Dict, List, Optional
 
 
@@ -26,36 +27,180 @@ def _normalize_items(value: Any) -> List[str]:
     return [text] if text else []
 
 
+def _heading_from_line(raw_line: str) -> Optional[str]:
+    """Return the heading text when a line looks like a Markdown/uppercase heading."""
+    line = raw_line.strip()
+    if not line:
+        return None
+    if line.startswith("#"):
+        return line.lstrip("# ").strip()
+    if len(line) < 120 and line.isupper():
+        return line
+    return None
+
+
+class DocumentOutline:
+    """One-time heading index over a document for section lookups by offset.
+
+    Headings come from Markdown ``#`` lines, short uppercase lines and, when
+    available, MinerU ``content_list_v2`` title blocks. Lookups use bisect, so
+    resolving the section of N matches costs O(N log H) instead of re-splitting
+    the document prefix for every match.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        structured_blocks: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        self._text = text
+        self._line_starts: List[int] = []
+        self._line_ends: List[int] = []
+        # Heading visible from a position after line i (last heading in lines <= i).
+        self._heading_through: List[Optional[str]] = []
+        current: Optional[str] = None
+        offset = 0
+        for raw_line in text.splitlines(keepends=True):
+            stripped_lines = raw_line.splitlines()
+            body = stripped_lines[0] if stripped_lines else ""
+            self._line_starts.append(offset)
+            self._line_ends.append(offset + len(body))
+            heading = _heading_from_line(body)
+            if heading is not None:
+                current = heading
+            self._heading_through.append(current)
+            offset += len(raw_line)
+        self._title_offsets: List[int] = []
+        self._title_texts: List[str] = []
+        self._index_block_titles(structured_blocks or [])
+
+    def _index_block_titles(self, blocks: List[Dict[str, Any]]) -> None:
+        """Anchor MinerU title blocks to their first occurrence in reading order."""
+        cursor = 0
+        lowered: Optional[str] = None
+        for block in blocks:
+            if not isinstance(block, dict) or block.get("type") != "title":
+                continue
+            title = " ".join(str(block.get("text") or "").split())
+            if not title:
+                continue
+            if lowered is None:
+                lowered = self._text.lower()
+            position = lowered.find(title.lower(), cursor)
+            if position < 0:
+                continue
+            self._title_offsets.append(position)
+            self._title_texts.append(title)
+            cursor = position + len(title)
+
+    def heading_at(self, match_pos: int) -> Optional[str]:
+        """Nearest heading above ``match_pos`` (same rules as the prefix scan)."""
+        heading: Optional[str] = None
+        heading_pos = -1
+        line_index = bisect_right(self._line_starts, match_pos) - 1
+        if line_index >= 0:
+            line_start = self._line_starts[line_index]
+            if match_pos <= line_start:
+                # Match at the very start of a line: only earlier lines count.
+                line_index -= 1
+                if line_index >= 0:
+                    heading = self._heading_through[line_index]
+            else:
+                # Earlier full lines, then the partial line before the match.
+                if line_index > 0:
+                    heading = self._heading_through[line_index - 1]
+                partial_end = min(match_pos, self._line_ends[line_index])
+                partial = _heading_from_line(self._text[line_start:partial_end])
+                if partial is not None:
+                    heading = partial
+            if heading is not None:
+                heading_pos = self._heading_offset(line_index, heading)
+        title_index = bisect_right(self._title_offsets, match_pos - 1) - 1
+        if title_index >= 0 and self._title_offsets[title_index] > heading_pos:
+            heading = self._title_texts[title_index]
+        return heading
+
+    def _heading_offset(self, line_index: int, heading: str) -> int:
+        """Approximate offset of the line that produced ``heading`` (for title merging)."""
+        while line_index > 0 and self._heading_through[line_index - 1] == heading:
+            line_index -= 1
+        return self._line_starts[line_index] if line_index >= 0 else -1
+
+
 def _find_section_heading(text: str, match_pos: int) -> Optional[str]:
     """Find the nearest Markdown or uppercase heading above a match position."""
-    prefix = text[:match_pos]
-    heading = None
-    for raw_line in prefix.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-        if line.startswith("#"):
-            heading = line.lstrip("# ").strip()
-        elif len(line) < 120 and line.isupper():
-            heading = line
-    return heading
+    return DocumentOutline(text).heading_at(match_pos)
+
+
+def _find_first_occurrences(text: str, needles: List[str]) -> Dict[str, int]:
+    """Case-insensitive first-occurrence offsets for many literals.
+
+    Equivalent to ``re.search(re.escape(needle), text, re.I)`` per needle. A
+    zero-width lookahead alternation (longest needles first) finds the next
+    position where any missing needle starts; shorter needles starting there
+    are credited via a prefix check, so none are shadowed by a longer
+    alternative. Found needles are dropped from the alternation before the
+    scan resumes, so each position is only tried against needles that are
+    still missing. The worst case stays O(len(text) * len(needles)).
+    """
+    remaining = sorted({needle for needle in needles if needle}, key=len, reverse=True)
+    if not remaining or not text:
+        return {}
+    folded = {needle: re.compile(re.escape(needle), re.IGNORECASE) for needle in remaining}
+    found: Dict[str, int] = {}
+    position = 0
+    while remaining:
+        pattern = re.compile(
+            "(?=(" + "|".join(re.escape(needle) for needle in remaining) + "))",
+            re.IGNORECASE,
+        )
+        match = pattern.search(text, position)
+        if match is None:
+            break
+        matched = match.group(1)
+        for needle in remaining:
+            if len(needle) <= len(matched) and folded[needle].fullmatch(matched[: len(needle)]):
+                found[needle] = match.start()
+        remaining = [needle for needle in remaining if needle not in found]
+        position = match.start() + 1
+    return found
+
+
+def _excerpt_candidates(snippet: str, field_name: str) -> List[str]:
+    candidates = [snippet.strip(), field_name.replace("_", " ").strip()]
+    return [candidate[:120] for candidate in candidates if candidate]
 
 
-def _evidence_excerpt(text: str, snippet: str, field_name: str) -> tuple[str, Optional[str]]:
-    """Extract a short excerpt around a value or field hint."""
+def _evidence_excerpt(
+    text: str,
+    snippet: str,
+    field_name: str,
+    *,
+    outline: Optional[DocumentOutline] = None,
+    positions: Optional[Dict[str, int]] = None,
+) -> tuple[str, Optional[str]]:
+    """Extract a short excerpt around a value or field hint.
+
+    ``outline`` and ``positions`` let callers share one heading index and one
+    batched candidate scan across many packets.
+    """
     if not text:
         return "", None
 
-    candidates = [snippet.strip(), field_name.replace("_", " ").strip()]
+    candidates = _excerpt_candidates(snippet, field_name)
+    if positions is None:
+        positions = _find_first_occurrences(text, candidates)
     for candidate in candidates:
-        if not candidate:
+        match_start = positions.get(candidate)
+        if match_start is None:
             continue
-        match = re.search(re.escape(candidate[:120]), text, re.IGNORECASE)
-        if match:
-            start = max(0, match.start() - 140)
-            end = min(len(text), match.end() + 180)
-            excerpt = " ".join(text[start:end].split())
-            return excerpt[:360], _find_section_heading(text, match.start())
+        match_end = match_start + len(candidate)
+        start = max(0, match_start - 140)
+        end = min(len(text), match_end + 180)
+        excerpt = " ".join(text[start:end].split())
+        if outline is None:
+            outline = DocumentOutline(text)
+        return excerpt[:360], outline.heading_at(match_start)
 
     excerpt = " ".join(text[:320].split())
     return excerpt, None
@@ -67,34 +212,57 @@ def build_evidence_packets(
     *,
     source_type: str,
     max_packets: int = 24,
+    structured_blocks: Optional[List[Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
-    """Create compact evidence packets from document parser output."""
-    packets: List[Dict[str, Any]] = []
+    """Create compact evidence packets from document parser output.
 
+    The document outline and all candidate matches are computed once, so
+    packet building stays linear in document length regardless of
+    ``max_packets``. ``structured_blocks`` (MinerU ``content_list_v2``) adds
+    block titles to the outline.
+    """
     confidence = float(doc_info.get("confidence", 0.75) or 0.75)
+    selected: List[tuple[str, str]] = []
     for field_name, raw_value in doc_info.items():
         if field_name in {"confidence", "raw_text"}:
             continue
-        values = _normalize_items(raw_value)
-        for item in values[:4]:
-            evidence_text, section = _evidence_excerpt(source_text, item, field_name)
-            packets.append(
-                {
-                    "packet_id": f"ep-{len(packets) + 1:03d}",
-                    "field_candidate": field_name,
-                    "value": item[:500],
-                    "evidence_text": evidence_text,
-                    "section": section,
-                    "source_type": source_type,
-                    "confidence": confidence,
-                    "provenance": {
-                        "agent": "DocumentParser",
-                        "strategy": "document_parser_structured_extraction",
-                    },
-                }
-            )
-            if len(packets) >= max_packets:
-                return packets
+        for item in _normalize_items(raw_value)[:4]:
+            selected.append((field_name, item))
+            if len(selected) >= max_packets:
+                break
+        if len(selected) >= max_packets:
+            break
+
+    needles: List[str] = []
+    for field_name, item in selected:
+        needles.extend(_excerpt_candidates(item, field_name))
+    positions = _find_first_occurrences(source_text, needles)
+    outline = DocumentOutline(source_text, structured_blocks) if positions else None
+
+    packets: List[Dict[str, Any]] = []
+    for field_name, item in selected:
+        evidence_text, section = _evidence_excerpt(
+            source_text,
+            item,
+            field_name,
+            outline=outline,
+            positions=positions,
+        )
+        packets.append(
+            {
+                "packet_id": f"ep-{len(packets) + 1:03d}",
+                "field_candidate": field_name,
+                "value": item[:500],
+                "evidence_text": evidence_text,
+                "section": section,
+                "source_type": source_type,
+                "confidence": confidence,
+                "provenance": {
+                    "agent": "DocumentParser",
+                    "strategy": "document_parser_structured_extraction",
+                },
+            }
+        )
 
     return packets
 
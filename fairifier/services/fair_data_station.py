@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Iterable, List, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
 from urllib.parse import quote
 
 try:
@@ -12,9 +15,21 @@ except ImportError:  # pragma: no cover - handled gracefully at runtime
     requests = None  # type: ignore
 
 from .fairds_api_parser import FAIRDSAPIParser
+from .fairds_catalog_cache import (
+    CatalogEntry,
+    CatalogFetch,
+    CatalogFetcher,
+    FAIRDSCatalogCache,
+    get_catalog_cache,
+    response_validators,
+)
+from .fairds_search_index import FieldSearchIndex, TermSearchIndex
+from .fairds_transport import FAIRDSTransport, endpoint_timeout, get_circuit_breaker
 
 logger = logging.getLogger(__name__)
 
+_SHARED_CACHE = object()
+
 
 class FAIRDataStationUnavailable(RuntimeError):
     """Raised when the FAIR Data Station API cannot be reached."""
@@ -63,18 +78,66 @@ class FAIRDataStationClient:
 
     Package ``metadata`` rows may use ``level`` (current) or ``sheetName`` (legacy)
     for the ISA layer; both are handled via :class:`FAIRDSAPIParser`.
+
+    Catalog reads (terms, package list/summaries, package details) go through the
+    process-wide :class:`~fairifier.services.fairds_catalog_cache.FAIRDSCatalogCache`
+    for ``base_url`` unless ``catalog_cache=None`` is passed or
+    ``config.fair_ds_catalog_cache_enabled`` is off. Cached payloads are shared
+    between clients and must be treated as read-only.
+
+    With ``snapshot_path`` (or ``config.fair_ds_snapshot_path``) the client serves
+    the same endpoints from an exported catalog snapshot without any network
+    access; see :mod:`fairifier.services.fairds_snapshot`.
     """
 
-    def __init__(self, base_url: str, timeout: int = 15) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: Optional[float] = None,
+        catalog_cache: Any = _SHARED_CACHE,
+        max_concurrency: Optional[int] = None,
+        snapshot_path: Optional[Union[str, Path]] = None,
+    ) -> None:
         if not requests:
             raise ImportError(
                 "The 'requests' package is required for FAIR Data Station integration."
             )
 
         self._base_url = base_url.rstrip("/")
-        self._timeout = timeout
+        # An explicit timeout applies to every endpoint; otherwise each endpoint
+        # uses its own budget (see fairds_transport.DEFAULT_ENDPOINT_TIMEOUTS).
+        self._explicit_timeout = timeout is not None
+        self._timeout = timeout if timeout is not None else 15
+        from ..config import config
+
+        if max_concurrency is None:
+            max_concurrency = config.fair_ds_max_concurrency
+        if snapshot_path is None:
+            snapshot_path = config.fair_ds_snapshot_path
+        self._max_concurrency = max(1, int(max_concurrency))
         self._session = requests.Session()
         self._session.headers.update({"Accept": "application/json"})
+        # Size the connection pool so bulk fetches reuse one keep-alive
+        # connection per worker instead of reconnecting per request.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self._max_concurrency,
+            pool_maxsize=self._max_concurrency,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._transport = FAIRDSTransport(
+            get_circuit_breaker(self._base_url),
+            retries=config.fair_ds_retries,
+            backoff_seconds=config.fair_ds_retry_backoff_seconds,
+        )
+        self._snapshot_path: Optional[Path] = None
+        if snapshot_path:
+            # Offline mode: every GET is answered in-process from the snapshot.
+            from .fairds_snapshot import SnapshotSession, load_snapshot
+
+            self._snapshot_path = Path(snapshot_path)
+            self._session = SnapshotSession(load_snapshot(self._snapshot_path))
+            catalog_cache = None
         
         # Caches
         self._packages_cache: Optional[List[Dict[str, Any]]] = None
@@ -82,13 +145,76 @@ class FAIRDataStationClient:
         self._available_packages_cache: Optional[List[str]] = None
         self._package_summaries_cache: Optional[List[Dict[str, Any]]] = None
         self._package_detail_cache: Dict[str, Dict[str, Any]] = {}
+        if catalog_cache is _SHARED_CACHE:
+            catalog_cache = get_catalog_cache(self._base_url)
+        self._catalog_cache: Optional[FAIRDSCatalogCache] = catalog_cache
+        # package name -> Future for detail requests currently on the wire
+        self._package_inflight: Dict[str, Future] = {}
+        self._package_inflight_lock = threading.Lock()
+        # Local search indexes over the cached catalog (see fairds_search_index)
+        self._term_index: Optional[TermSearchIndex] = None
+        self._field_indexes: Dict[str, FieldSearchIndex] = {}
+        self._field_index_sources: Dict[str, Dict[str, Any]] = {}
+
+    def _catalog_request(
+        self,
+        path: str,
+        entry: Optional[CatalogEntry] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """GET a catalog endpoint, sending revalidation headers for ``entry``."""
+        kwargs: Dict[str, Any] = {}
+        if params:
+            kwargs["params"] = params
+        if entry is not None:
+            headers = entry.validator_headers()
+            if headers:
+                kwargs["headers"] = headers
+        return self._get(path, **kwargs)
+
+    def _timeout_for(self, path: str) -> float:
+        if self._explicit_timeout:
+            return self._timeout
+        return endpoint_timeout(path, default=self._timeout)
+
+    def _get(self, path: str, **kwargs: Any) -> Any:
+        """GET ``path`` through the retrying, circuit-breaking transport."""
+        kwargs.setdefault("timeout", self._timeout_for(path))
+        url = f"{self._base_url}{path}"
+        return self._transport.send(
+            lambda: self._session.get(url, **kwargs), label=f"GET {path}"
+        )
+
+    @property
+    def circuit_state(self) -> Dict[str, Any]:
+        """Circuit breaker snapshot for this client's base URL."""
+        return self._transport.breaker.snapshot()
+
+    def _load_catalog(
+        self,
+        key: str,
+        fetcher: CatalogFetcher,
+        force_refresh: bool = False,
+    ) -> Optional[Any]:
+        """Read ``key`` through the shared catalog cache (or straight from the API)."""
+        if self._catalog_cache is None:
+            result = fetcher(None)
+            if result is None or result.not_modified:
+                return None
+            return result.payload
+        return self._catalog_cache.load(key, fetcher, force_refresh=force_refresh)
+
+    @staticmethod
+    def _catalog_fetch(response: Any, payload: Any) -> CatalogFetch:
+        return CatalogFetch(payload=payload, **response_validators(response))
 
     def is_available(self) -> bool:
         """Return True if the FAIR Data Station API responds."""
         try:
-            response = self._session.get(
-                f"{self._base_url}/api", timeout=self._timeout
-            )
+            # Skip the probe when another request just succeeded against this URL.
+            if self._transport.breaker.recently_healthy(30.0):
+                return True
+            response = self._get("/api")
             return response.status_code == 200
         except Exception as exc:  # pragma: no cover - network failure path
             logger.debug("FAIR-DS availability check failed: %s", exc)
@@ -107,19 +233,24 @@ class FAIRDataStationClient:
         if self._terms_cache is not None and not force_refresh:
             return self._terms_cache
 
-        try:
-            response = self._session.get(
-                f"{self._base_url}/api/terms", timeout=self._timeout
-            )
-            
+        def fetch(entry: Optional[CatalogEntry]) -> Optional[CatalogFetch]:
+            response = self._catalog_request("/api/terms", entry)
+            if response.status_code == 304:
+                return CatalogFetch(not_modified=True)
             if response.status_code == 200:
                 data = response.json()
                 # API returns {"total": N, "terms": {...}}
                 if isinstance(data, dict) and "terms" in data:
-                    self._terms_cache = _normalize_terms_payload(data["terms"])
-                    logger.info(f"✅ Fetched {data.get('total', len(self._terms_cache))} terms from FAIR-DS API")
-                    return self._terms_cache
-                    
+                    return self._catalog_fetch(response, data)
+            return None
+
+        try:
+            data = self._load_catalog("terms", fetch, force_refresh=force_refresh)
+            if data is not None:
+                self._terms_cache = _normalize_terms_payload(data["terms"])
+                logger.info(f"✅ Fetched {data.get('total', len(self._terms_cache))} terms from FAIR-DS API")
+                return self._terms_cache
+
         except Exception as exc:
             logger.warning("Unable to fetch FAIR-DS terms: %s", exc)
 
@@ -132,7 +263,11 @@ class FAIRDataStationClient:
         label: Optional[str] = None, 
         definition: Optional[str] = None
     ) -> Dict[str, Dict[str, Any]]:
-        """Search terms by label and/or definition using server-side filtering.
+        """Search terms by label and/or definition.
+
+        When the full terms catalog is cached, filters are answered locally as
+        case-insensitive substring matches (``config.fair_ds_local_search_enabled``);
+        otherwise the server-side ``/api/terms`` filters are used.
         
         Args:
             label: Filter terms by label (supports pattern matching, case-insensitive)
@@ -143,7 +278,13 @@ class FAIRDataStationClient:
         """
         if not label and not definition:
             return self.get_terms()
-            
+
+        term_index = self._get_term_index()
+        if term_index is not None:
+            terms = term_index.search(label=label, definition=definition)
+            logger.debug("Found %d cached terms matching filters", len(terms))
+            return terms
+
         try:
             params = {}
             if label:
@@ -151,11 +292,7 @@ class FAIRDataStationClient:
             if definition:
                 params["definition"] = definition
                 
-            response = self._session.get(
-                f"{self._base_url}/api/terms",
-                params=params,
-                timeout=self._timeout
-            )
+            response = self._get("/api/terms", params=params)
             
             if response.status_code == 200:
                 data = response.json()
@@ -169,6 +306,34 @@ class FAIRDataStationClient:
             
         return {}
 
+    def _get_term_index(self) -> Optional[TermSearchIndex]:
+        """Index of the full terms catalog, or ``None`` to search server-side.
+
+        Built once per terms payload; the catalog itself comes from
+        :meth:`get_terms` and therefore from the shared catalog cache.
+        """
+        from ..config import config
+
+        if not config.fair_ds_local_search_enabled:
+            return None
+        terms = self.get_terms()
+        if not terms:
+            return None
+        if self._term_index is None or self._term_index.source is not terms:
+            self._term_index = TermSearchIndex(terms)
+        return self._term_index
+
+    def _get_field_index(
+        self, package_name: str, package: Dict[str, Any]
+    ) -> FieldSearchIndex:
+        """Label index for one package's fields, rebuilt if the package changes."""
+        index = self._field_indexes.get(package_name)
+        if index is None or self._field_index_sources.get(package_name) is not package:
+            index = FieldSearchIndex(package["metadata"])
+            self._field_indexes[package_name] = index
+            self._field_index_sources[package_name] = package
+        return index
+
     def get_term_by_label(self, label: str) -> Optional[Dict[str, Any]]:
         """Get a specific term by its exact label.
         
@@ -208,21 +373,29 @@ class FAIRDataStationClient:
         if self._package_summaries_cache is not None and not force_refresh:
             return self._package_summaries_cache
 
-        try:
-            response = self._session.get(
-                f"{self._base_url}/api/packages", timeout=self._timeout
-            )
+        def fetch(entry: Optional[CatalogEntry]) -> Optional[CatalogFetch]:
+            response = self._catalog_request("/api/packages", entry)
+            if response.status_code == 304:
+                return CatalogFetch(not_modified=True)
             if response.status_code == 200:
                 data = response.json()
                 packages = data.get("packages", []) if isinstance(data, dict) else []
                 if packages and all(isinstance(pkg, dict) for pkg in packages):
-                    self._package_summaries_cache = packages
-                    self._available_packages_cache = [
-                        str(pkg["name"])
-                        for pkg in packages
-                        if pkg.get("name")
-                    ]
-                    return self._package_summaries_cache
+                    return self._catalog_fetch(response, packages)
+            return None
+
+        try:
+            packages = self._load_catalog(
+                "package_summaries", fetch, force_refresh=force_refresh
+            )
+            if packages is not None:
+                self._package_summaries_cache = packages
+                self._available_packages_cache = [
+                    str(pkg["name"])
+                    for pkg in packages
+                    if pkg.get("name")
+                ]
+                return self._package_summaries_cache
         except Exception as exc:
             logger.info("FAIR-DS package summaries unavailable; using legacy list: %s", exc)
 
@@ -264,19 +437,26 @@ class FAIRDataStationClient:
         if self._available_packages_cache is not None and not force_refresh:
             return self._available_packages_cache
 
-        try:
-            response = self._session.get(
-                f"{self._base_url}/api/package", timeout=self._timeout
-            )
-            
+        def fetch(entry: Optional[CatalogEntry]) -> Optional[CatalogFetch]:
+            response = self._catalog_request("/api/package", entry)
+            if response.status_code == 304:
+                return CatalogFetch(not_modified=True)
             if response.status_code == 200:
                 data = response.json()
                 # API returns {"message": "...", "packages": [...], "example": "..."}
                 if isinstance(data, dict) and "packages" in data:
-                    self._available_packages_cache = data["packages"]
-                    logger.info(f"✅ Found {len(self._available_packages_cache)} available packages")
-                    return self._available_packages_cache
-                    
+                    return self._catalog_fetch(response, data["packages"])
+            return None
+
+        try:
+            packages = self._load_catalog(
+                "package_names", fetch, force_refresh=force_refresh
+            )
+            if packages is not None:
+                self._available_packages_cache = packages
+                logger.info(f"✅ Found {len(self._available_packages_cache)} available packages")
+                return self._available_packages_cache
+
         except Exception as exc:
             logger.warning("Unable to fetch FAIR-DS package list: %s", exc)
 
@@ -309,46 +489,129 @@ class FAIRDataStationClient:
         if not force_refresh and package_name in self._package_detail_cache:
             return self._package_detail_cache[package_name]
 
+        # Single-flight: concurrent callers for the same package share one request.
+        with self._package_inflight_lock:
+            future = self._package_inflight.get(package_name)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._package_inflight[package_name] = future
+        if not owner:
+            return future.result()
+
         try:
-            response = self._session.get(
-                f"{self._base_url}/api/packages/{quote(package_name, safe='')}",
-                timeout=self._timeout,
+            package = self._fetch_package(package_name, force_refresh=force_refresh)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(package)
+        finally:
+            with self._package_inflight_lock:
+                self._package_inflight.pop(package_name, None)
+        return package
+
+    def get_packages_bulk(
+        self,
+        package_names: Iterable[str],
+        force_refresh: bool = False,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch several packages concurrently over the pooled session.
+
+        Cached packages are returned without a request; the rest are fetched
+        with up to ``max_concurrency`` requests in flight (default
+        ``config.fair_ds_max_concurrency``). Duplicate names, and names already
+        being fetched by another thread, share a single request. Every fetched
+        package lands in the client package cache, so later :meth:`get_package`
+        calls are free.
+
+        Returns:
+            Mapping of each requested name (first-seen order) to its package
+            data, or ``None`` when the package could not be fetched.
+        """
+        names = list(dict.fromkeys(str(name) for name in package_names if name))
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        pending = []
+        for name in names:
+            if not force_refresh and name in self._package_detail_cache:
+                results[name] = self._package_detail_cache[name]
+            else:
+                pending.append(name)
+
+        workers = min(max_concurrency or self._max_concurrency, len(pending))
+        if workers <= 1:
+            for name in pending:
+                results[name] = self.get_package(name, force_refresh=force_refresh)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="fairds-package"
+            ) as executor:
+                futures = {
+                    name: executor.submit(self.get_package, name, force_refresh)
+                    for name in pending
+                }
+                for name, future in futures.items():
+                    try:
+                        results[name] = future.result()
+                    except Exception as exc:
+                        logger.warning(f"Unable to fetch package '{name}': {exc}")
+                        results[name] = None
+
+        if pending:
+            logger.info(
+                f"✅ Bulk-fetched {sum(1 for n in pending if results.get(n))}/{len(pending)} "
+                f"FAIR-DS packages ({len(names) - len(pending)} cached)"
+            )
+        return {name: results.get(name) for name in names}
+
+    def _fetch_package(
+        self, package_name: str, force_refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Request one package (catalog cache → ``/api/packages/{name}`` → legacy)."""
+        def fetch(entry: Optional[CatalogEntry]) -> Optional[CatalogFetch]:
+            response = self._catalog_request(
+                f"/api/packages/{quote(package_name, safe='')}", entry
             )
+            if response.status_code == 304:
+                return CatalogFetch(not_modified=True)
 
             if response.status_code == 200:
                 data = response.json()
                 if isinstance(data, dict) and "metadata" in data:
-                    self._package_detail_cache[package_name] = data
-                    canonical_name = data.get("packageName")
-                    if canonical_name:
-                        self._package_detail_cache[str(canonical_name)] = data
                     logger.info(
                         f"✅ Fetched package '{package_name}' with "
                         f"{data.get('itemCount', len(data['metadata']))} fields"
                     )
-                    return data
+                    return self._catalog_fetch(response, data)
 
             if response.status_code in {404, 405}:
-                response = self._session.get(
-                    f"{self._base_url}/api/package",
-                    params={"name": package_name},
-                    timeout=self._timeout,
+                response = self._catalog_request(
+                    "/api/package", params={"name": package_name}
                 )
                 if response.status_code == 200:
                     data = response.json()
                     if isinstance(data, dict) and "metadata" in data:
-                        self._package_detail_cache[package_name] = data
-                        canonical_name = data.get("packageName")
-                        if canonical_name:
-                            self._package_detail_cache[str(canonical_name)] = data
                         logger.info(
                             f"✅ Fetched package '{package_name}' via legacy FAIR-DS endpoint with "
                             f"{data.get('itemCount', len(data['metadata']))} fields"
                         )
-                        return data
+                        return self._catalog_fetch(response, data)
 
             if response.status_code == 404:
                 logger.warning(f"⚠️ Package '{package_name}' not found")
+            return None
+
+        try:
+            data = self._load_catalog(
+                f"package:{package_name}", fetch, force_refresh=force_refresh
+            )
+            if data is not None:
+                self._package_detail_cache[package_name] = data
+                canonical_name = data.get("packageName")
+                if canonical_name:
+                    self._package_detail_cache[str(canonical_name)] = data
+                return data
 
         except Exception as exc:
             logger.warning(f"Unable to fetch package '{package_name}': {exc}")
@@ -404,7 +667,8 @@ class FAIRDataStationClient:
         """Search for fields by label across specified packages (client-side filtering).
         
         Note: FAIR-DS API does not support server-side field search in /api/package.
-        This method fetches package data and filters fields client-side.
+        This method fetches package data (concurrently, once) and answers from a
+        cached per-package label index.
         
         Args:
             field_label: Field label to search for (case-insensitive partial match)
@@ -418,17 +682,16 @@ class FAIRDataStationClient:
         
         matching_fields = []
         search_label_lower = field_label.lower()
-        
+        packages = self.get_packages_bulk(package_names)
+
         for pkg_name in package_names:
-            package = self.get_package(pkg_name)
+            package = packages.get(str(pkg_name)) if pkg_name else None
             if not package or "metadata" not in package:
                 continue
-                
-            for field in package["metadata"]:
-                field_label_value = field.get("label", "")
-                # Case-insensitive partial match
-                if search_label_lower in field_label_value.lower():
-                    matching_fields.append(field)
+            # Case-insensitive partial match, served from the per-package label index
+            matching_fields.extend(
+                self._get_field_index(str(pkg_name), package).search(search_label_lower)
+            )
         
         logger.info(f"✅ Found {len(matching_fields)} fields matching '{field_label}' across {len(package_names)} packages")
         return matching_fields
@@ -459,16 +722,20 @@ class FAIRDataStationClient:
         url = f"{self._base_url}/api/isa"
         payload = {"isa_structure": isa_structure}
         try:
-            response = self._session.post(
-                url,
-                json=payload,
-                timeout=max(self._timeout, 60),
-                headers={
-                    "Accept": (
-                        "application/vnd.openxmlformats-officedocument."
-                        "spreadsheetml.sheet, application/octet-stream, */*"
-                    ),
-                },
+            response = self._transport.send(
+                lambda: self._session.post(
+                    url,
+                    json=payload,
+                    timeout=max(self._timeout_for("/api/isa"), 60),
+                    headers={
+                        "Accept": (
+                            "application/vnd.openxmlformats-officedocument."
+                            "spreadsheetml.sheet, application/octet-stream, */*"
+                        ),
+                    },
+                ),
+                idempotent=False,
+                label="POST /api/isa",
             )
         except Exception as exc:
             logger.warning("FAIR-DS POST /api/isa failed: %s", exc)
@@ -708,9 +975,9 @@ class FAIRDataStationClient:
             return None
 
         try:
-            response = self._session.get(
-                f"{self._base_url}/api/skills",
-                timeout=min(self._timeout, 10),
+            response = self._get(
+                "/api/skills",
+                timeout=min(self._timeout_for("/api/skills"), 10),
                 headers={"Accept": "text/markdown"},
             )
             if response.status_code == 200:
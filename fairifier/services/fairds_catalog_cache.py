@@ -0,0 +1,382 @@
+"""Process-wide, SQLite-backed cache for FAIR Data Station catalog responses.
+
+The FAIR-DS catalog (terms, package summaries, package details) changes rarely,
+but every workflow run, tool factory and statistics request used to build a new
+:class:`~fairifier.services.fair_data_station.FAIRDataStationClient` and download
+it again. This module keeps one :class:`FAIRDSCatalogCache` per base URL:
+
+* a memory tier shared by every client in the process;
+* an on-disk SQLite tier (``fair_ds_catalog_cache_path``) shared across processes
+  and restarts;
+* freshness by TTL, with conditional revalidation (``If-None-Match`` /
+  ``If-Modified-Since``) once an entry is stale;
+* stale-while-revalidate: a stale entry is served immediately while a daemon
+  thread refreshes it, and is kept when the API is briefly unreachable.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS catalog_entries (
+    base_url       TEXT NOT NULL,
+    cache_key      TEXT NOT NULL,
+    payload        TEXT NOT NULL,
+    etag           TEXT,
+    last_modified  TEXT,
+    fetched_at     REAL NOT NULL,
+    PRIMARY KEY (base_url, cache_key)
+);
+"""
+
+
+@dataclass
+class CatalogEntry:
+    """One cached catalog response plus its HTTP validators."""
+
+    payload: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        return max(0.0, (time.time() if now is None else now) - self.fetched_at)
+
+    def validator_headers(self) -> Dict[str, str]:
+        """Conditional-request headers for revalidating this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CatalogFetch:
+    """Outcome of one origin request made on behalf of the cache.
+
+    ``not_modified`` means the server answered ``304`` and the cached entry is
+    still current; otherwise ``payload`` holds the new body.
+    """
+
+    payload: Any = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
+
+# ``fetcher(entry)`` performs the HTTP request (sending ``entry``'s validators when
+# present) and returns a :class:`CatalogFetch`, or ``None`` when the origin had no
+# usable answer.
+CatalogFetcher = Callable[[Optional[CatalogEntry]], Optional[CatalogFetch]]
+
+
+def response_validators(response: Any) -> Dict[str, Optional[str]]:
+    """Extract ``ETag`` / ``Last-Modified`` from a ``requests`` response."""
+    headers = getattr(response, "headers", None)
+    validators: Dict[str, Optional[str]] = {"etag": None, "last_modified": None}
+    if headers is None:
+        return validators
+    for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+        try:
+            value = headers.get(header)
+        except Exception:
+            value = None
+        validators[key] = value if isinstance(value, str) and value else None
+    return validators
+
+
+class FAIRDSCatalogCache:
+    """Two-tier (memory + SQLite) catalog cache for one FAIR-DS base URL."""
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        db_path: Optional[Path] = None,
+        ttl_seconds: float = 21600,
+        background_refresh: bool = True,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.ttl_seconds = float(ttl_seconds)
+        self.background_refresh = background_refresh
+        self._lock = threading.Lock()
+        self._memory: Dict[str, CatalogEntry] = {}
+        self._refreshing: Set[str] = set()
+        self._refresh_threads: Dict[str, threading.Thread] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._conn = self._open_db(Path(db_path))
+
+    @staticmethod
+    def _open_db(db_path: Path) -> Optional[sqlite3.Connection]:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute(_CREATE_TABLE)
+            conn.commit()
+            return conn
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(
+                "FAIR-DS catalog cache at %s not usable (%s); using memory only",
+                db_path,
+                exc,
+            )
+            return None
+
+    # ------------------------------------------------------------------
+    # Entry storage
+    # ------------------------------------------------------------------
+
+    def peek(self, key: str) -> Optional[CatalogEntry]:
+        """Return the cached entry for ``key`` (fresh or stale) without fetching."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None or self._conn is None:
+                return entry
+            try:
+                row = self._conn.execute(
+                    "SELECT payload, etag, last_modified, fetched_at "
+                    "FROM catalog_entries WHERE base_url = ? AND cache_key = ?",
+                    (self.base_url, key),
+                ).fetchone()
+            except sqlite3.Error as exc:
+                logger.debug("FAIR-DS catalog cache read failed: %s", exc)
+                return None
+            if row is None:
+                return None
+            try:
+                payload = json.loads(row[0])
+            except ValueError:
+                return None
+            entry = CatalogEntry(
+                payload=payload,
+                etag=row[1],
+                last_modified=row[2],
+                fetched_at=float(row[3]),
+            )
+            self._memory[key] = entry
+            return entry
+
+    def store(
+        self,
+        key: str,
+        payload: Any,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CatalogEntry:
+        entry = CatalogEntry(
+            payload=payload,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time(),
+        )
+        with self._lock:
+            self._memory[key] = entry
+            self._write_row(key, entry)
+        return entry
+
+    def mark_validated(self, key: str, entry: CatalogEntry) -> None:
+        """Record a ``304`` revalidation: same payload, new freshness window."""
+        with self._lock:
+            entry.fetched_at = time.time()
+            self._memory[key] = entry
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "UPDATE catalog_entries SET fetched_at = ? "
+                    "WHERE base_url = ? AND cache_key = ?",
+                    (entry.fetched_at, self.base_url, key),
+                )
+                self._conn.commit()
+            except sqlite3.Error as exc:
+                logger.debug("FAIR-DS catalog cache update failed: %s", exc)
+
+    def _write_row(self, key: str, entry: CatalogEntry) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO catalog_entries "
+                "(base_url, cache_key, payload, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.base_url,
+                    key,
+                    json.dumps(entry.payload, ensure_ascii=False),
+                    entry.etag,
+                    entry.last_modified,
+                    entry.fetched_at,
+                ),
+            )
+            self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            logger.debug("FAIR-DS catalog cache write failed: %s", exc)
+
+    def is_fresh(self, entry: CatalogEntry) -> bool:
+        return entry.age_seconds() < self.ttl_seconds
+
+    def clear(self) -> None:
+        """Drop every entry for this base URL from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "DELETE FROM catalog_entries WHERE base_url = ?", (self.base_url,)
+                )
+                self._conn.commit()
+            except sqlite3.Error as exc:
+                logger.debug("FAIR-DS catalog cache clear failed: %s", exc)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Read-through access
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        key: str,
+        fetcher: CatalogFetcher,
+        *,
+        force_refresh: bool = False,
+    ) -> Optional[Any]:
+        """Return the payload for ``key``, fetching or revalidating as needed.
+
+        Fresh entries are returned without touching the network. Stale entries
+        are returned immediately and refreshed on a daemon thread (or inline
+        when background refresh is disabled). ``force_refresh`` always
+        revalidates inline. Returns ``None`` only when nothing is cached and the
+        origin has no usable answer.
+        """
+        entry = self.peek(key)
+        if entry is not None and not force_refresh:
+            if self.is_fresh(entry):
+                return entry.payload
+            if self.background_refresh:
+                self._schedule_refresh(key, fetcher)
+                return entry.payload
+        return self._revalidate(key, fetcher, entry)
+
+    def _revalidate(
+        self,
+        key: str,
+        fetcher: CatalogFetcher,
+        entry: Optional[CatalogEntry],
+    ) -> Optional[Any]:
+        try:
+            result = fetcher(entry)
+        except Exception as exc:
+            logger.warning("FAIR-DS catalog request for %s failed: %s", key, exc)
+            result = None
+
+        if result is None:
+            if entry is not None:
+                logger.info(
+                    "FAIR-DS unreachable for %s; serving cached copy (%.0fs old)",
+                    key,
+                    entry.age_seconds(),
+                )
+                return entry.payload
+            return None
+        if result.not_modified:
+            if entry is None:
+                return None
+            self.mark_validated(key, entry)
+            return entry.payload
+        self.store(
+            key,
+            result.payload,
+            etag=result.etag,
+            last_modified=result.last_modified,
+        )
+        return result.payload
+
+    def _schedule_refresh(self, key: str, fetcher: CatalogFetcher) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _run() -> None:
+            try:
+                self._revalidate(key, fetcher, self.peek(key))
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+                    self._refresh_threads.pop(key, None)
+
+        thread = threading.Thread(
+            target=_run, name=f"fairds-catalog-refresh:{key}", daemon=True
+        )
+        with self._lock:
+            self._refresh_threads[key] = thread
+        thread.start()
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> None:
+        """Block until in-flight background refreshes finish (tests, shutdown)."""
+        with self._lock:
+            threads = list(self._refresh_threads.values())
+        for thread in threads:
+            thread.join(timeout)
+
+
+_caches: Dict[str, FAIRDSCatalogCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_catalog_cache(base_url: str) -> Optional[FAIRDSCatalogCache]:
+    """Return the process-wide catalog cache for ``base_url`` (``None`` if disabled)."""
+    from ..config import config
+
+    if not getattr(config, "fair_ds_catalog_cache_enabled", False):
+        return None
+    key = base_url.rstrip("/")
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = FAIRDSCatalogCache(
+                key,
+                db_path=config.fair_ds_catalog_cache_path,
+                ttl_seconds=config.fair_ds_catalog_cache_ttl_seconds,
+            )
+            _caches[key] = cache
+        return cache
+
+
+def reset_catalog_caches() -> None:
+    """Close and forget every process-wide catalog cache."""
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
+
+
+__all__ = [
+    "CatalogEntry",
+    "CatalogFetch",
+    "FAIRDSCatalogCache",
+    "get_catalog_cache",
+    "reset_catalog_caches",
+    "response_validators",
+]
@@ -0,0 +1,116 @@
+"""In-memory search indexes over the cached FAIR-DS catalog.
+
+Term and field lookups used to cost one ``/api/terms?label=`` round-trip per
+query, or a lowercase + substring pass over every field label of every package.
+The deep-agent inner loops issue these searches many times per run against a
+catalog that does not change, so this module indexes it once.
+
+All searches keep the original *case-insensitive substring* semantics. The
+:class:`SubstringIndex` narrows candidates through a token inverted index and
+then confirms each candidate with the same ``query in text`` test as before, so
+results are identical to a linear scan and come back in catalog order.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+
+class SubstringIndex:
+    """Exact substring search over a fixed list of lowercased texts.
+
+    A whitespace-free fragment of the query can only occur inside a single
+    whitespace-delimited token of a matching text. Each query fragment is
+    resolved once against the token vocabulary (memoized), the posting lists
+    are intersected, and the survivors are verified with ``query in text``.
+    """
+
+    def __init__(self, texts: Sequence[str]) -> None:
+        self._texts = list(texts)
+        postings: Dict[str, List[int]] = {}
+        for doc_id, text in enumerate(self._texts):
+            for token in set(text.split()):
+                postings.setdefault(token, []).append(doc_id)
+        self._postings = postings
+        self._fragment_cache: Dict[str, FrozenSet[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _docs_for_fragment(self, fragment: str) -> FrozenSet[int]:
+        cached = self._fragment_cache.get(fragment)
+        if cached is not None:
+            return cached
+        docs: set = set()
+        for token, doc_ids in self._postings.items():
+            if fragment in token:
+                docs.update(doc_ids)
+        result = frozenset(docs)
+        self._fragment_cache[fragment] = result
+        return result
+
+    def search(self, query: str) -> List[int]:
+        """Return ids (ascending) of texts containing ``query`` (already lowercased)."""
+        fragments = sorted(set(query.split()), key=len, reverse=True)
+        if not fragments:
+            return [doc_id for doc_id, text in enumerate(self._texts) if query in text]
+        candidates: Optional[FrozenSet[int]] = None
+        for fragment in fragments:
+            docs = self._docs_for_fragment(fragment)
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return []
+        return [doc_id for doc_id in sorted(candidates) if query in self._texts[doc_id]]
+
+
+class TermSearchIndex:
+    """Label and definition indexes over a ``{term_name: term_info}`` catalog."""
+
+    def __init__(self, terms: Dict[str, Dict[str, Any]]) -> None:
+        self.source = terms
+        self._items = list(terms.items())
+        self._labels = SubstringIndex(
+            [str(info.get("label") or name).lower() for name, info in self._items]
+        )
+        self._definitions = SubstringIndex(
+            [str(info.get("definition") or "").lower() for _, info in self._items]
+        )
+
+    def search(
+        self,
+        label: Optional[str] = None,
+        definition: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Terms whose label and/or definition contain the given filters."""
+        selected: Optional[set] = None
+        if label:
+            selected = set(self._labels.search(label.lower()))
+        if definition:
+            by_definition = set(self._definitions.search(definition.lower()))
+            selected = by_definition if selected is None else selected & by_definition
+        if selected is None:
+            return dict(self._items)
+        return {self._items[i][0]: self._items[i][1] for i in sorted(selected)}
+
+
+class FieldSearchIndex:
+    """Substring index over package field rows.
+
+    ``text_for`` maps a field to the lowercased text searched for that field
+    (its label by default).
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[Dict[str, Any]],
+        text_for=None,
+    ) -> None:
+        self._fields = [field for field in fields if isinstance(field, dict)]
+        text_for = text_for or (lambda field: str(field.get("label") or "").lower())
+        self._index = SubstringIndex([text_for(field) for field in self._fields])
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        return [self._fields[i] for i in self._index.search(query)]
+
+
+__all__ = ["FieldSearchIndex", "SubstringIndex", "TermSearchIndex"]
@@ -0,0 +1,329 @@
+"""Versioned offline snapshots of a FAIR Data Station catalog.
+
+A snapshot is one gzip-compressed JSON document holding everything the agents
+read from FAIR-DS: ``/api/terms``, ``/api/packages``, every
+``/api/packages/{name}`` detail and the ``/api/skills`` markdown. It is written
+by ``fairifier fairds snapshot export`` and served back through the same
+endpoint layout in two ways:
+
+* :class:`SnapshotSession` — a drop-in for the client's ``requests.Session``
+  (``FAIR_DS_SNAPSHOT_PATH`` / ``FAIRDataStationClient(snapshot_path=...)``),
+  so catalog reads are in-process with no network at all;
+* :func:`serve_snapshot` — a small threaded HTTP stand-in server
+  (``fairifier fairds snapshot serve``) for tools that expect a FAIR-DS URL.
+
+Snapshots make air-gapped runs possible and keep benchmarks reproducible while
+the live catalog evolves.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .fairds_search_index import TermSearchIndex
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = "fairifier-fairds-snapshot"
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class FAIRDSSnapshot:
+    """In-memory view of one catalog snapshot."""
+
+    terms: Dict[str, Dict[str, Any]]
+    packages: List[Dict[str, Any]]
+    package_details: Dict[str, Dict[str, Any]]
+    skill_markdown: Optional[str] = None
+    source_url: Optional[str] = None
+    created_at: Optional[str] = None
+    digest: str = ""
+    _term_index: Optional[TermSearchIndex] = field(default=None, repr=False)
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "created_at": self.created_at,
+            "source_url": self.source_url,
+            "terms": self.terms,
+            "packages": self.packages,
+            "package_details": self.package_details,
+            "skill_markdown": self.skill_markdown,
+        }
+
+    def search_terms(
+        self, label: Optional[str], definition: Optional[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        if self._term_index is None:
+            self._term_index = TermSearchIndex(self.terms)
+        return self._term_index.search(label=label, definition=definition)
+
+    def find_package(self, name: str) -> Optional[Dict[str, Any]]:
+        package = self.package_details.get(name)
+        if package is not None:
+            return package
+        lowered = name.lower()
+        for key, value in self.package_details.items():
+            if key.lower() == lowered:
+                return value
+        return None
+
+    # ------------------------------------------------------------------
+    # Endpoint routing shared by SnapshotSession and the HTTP stand-in
+    # ------------------------------------------------------------------
+
+    def respond(
+        self,
+        path: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[int, str, bytes]:
+        """Answer ``GET path`` the way a FAIR-DS server would.
+
+        Returns ``(status, content_type, body)``. Catalog endpoints carry the
+        snapshot digest as ``ETag`` semantics: a matching ``If-None-Match``
+        yields ``304`` with an empty body.
+        """
+        params = params or {}
+        path = "/" + path.strip("/")
+        if path != "/api" and (headers or {}).get("If-None-Match") == f'"{self.digest}"':
+            return HTTPStatus.NOT_MODIFIED, "application/json", b""
+
+        if path == "/api":
+            return self._json(
+                {
+                    "message": "FAIR-DS snapshot stand-in",
+                    "snapshot": {
+                        "created_at": self.created_at,
+                        "source_url": self.source_url,
+                        "version": SNAPSHOT_VERSION,
+                    },
+                    "endpoints": [
+                        "/api/terms",
+                        "/api/packages",
+                        "/api/packages/{name}",
+                        "/api/package",
+                        "/api/skills",
+                    ],
+                }
+            )
+        if path == "/api/terms":
+            label = params.get("label") or None
+            definition = params.get("definition") or None
+            terms = (
+                self.search_terms(label, definition)
+                if (label or definition)
+                else self.terms
+            )
+            return self._json({"total": len(terms), "terms": terms})
+        if path == "/api/packages":
+            return self._json({"total": len(self.packages), "packages": self.packages})
+        if path.startswith("/api/packages/"):
+            package = self.find_package(unquote(path[len("/api/packages/"):]))
+            if package is None:
+                return self._json({"error": "package not found"}, HTTPStatus.NOT_FOUND)
+            return self._json(package)
+        if path == "/api/package":
+            name = params.get("name")
+            if not name:
+                return self._json(
+                    {
+                        "message": "Available packages",
+                        "packages": sorted(self.package_details),
+                    }
+                )
+            package = self.find_package(str(name))
+            if package is None:
+                return self._json({"error": "package not found"}, HTTPStatus.NOT_FOUND)
+            return self._json(package)
+        if path == "/api/skills":
+            if not self.skill_markdown:
+                return HTTPStatus.NOT_FOUND, "text/plain", b"no skill in snapshot"
+            return HTTPStatus.OK, "text/markdown", self.skill_markdown.encode("utf-8")
+        return self._json({"error": f"unknown endpoint {path}"}, HTTPStatus.NOT_FOUND)
+
+    @staticmethod
+    def _json(payload: Any, status: int = HTTPStatus.OK) -> Tuple[int, str, bytes]:
+        return int(status), "application/json", json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def write_snapshot(snapshot: FAIRDSSnapshot, path: Path) -> Path:
+    """Write ``snapshot`` as gzip-compressed JSON (atomic rename)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as fh:
+        json.dump(snapshot.to_payload(), fh, ensure_ascii=False)
+    tmp_path.replace(path)
+    return path
+
+
+def export_snapshot(client: Any, path: Path) -> FAIRDSSnapshot:
+    """Download the full catalog through ``client`` and write it to ``path``.
+
+    Raises:
+        RuntimeError: If the server returned no terms and no packages.
+    """
+    terms = client.get_terms(force_refresh=True)
+    packages = client.get_package_summaries(force_refresh=True)
+    names = [str(pkg["name"]) for pkg in packages if pkg.get("name")]
+    details = {
+        name: package
+        for name, package in client.get_packages_bulk(names, force_refresh=True).items()
+        if package
+    }
+    if not terms and not details:
+        raise RuntimeError("FAIR-DS returned no terms or packages; nothing to snapshot")
+    snapshot = FAIRDSSnapshot(
+        terms=terms,
+        packages=packages,
+        package_details=details,
+        skill_markdown=client.fetch_agent_skill_markdown(),
+        source_url=getattr(client, "_base_url", None),
+        created_at=datetime.now(timezone.utc).isoformat(),
+    )
+    write_snapshot(snapshot, path)
+    return snapshot
+
+
+def load_snapshot(path: Path) -> FAIRDSSnapshot:
+    """Load a snapshot file (shared per path and mtime).
+
+    Raises:
+        ValueError: If the file is not a FAIR-DS snapshot or has an unsupported version.
+    """
+    path = Path(path)
+    return _load_snapshot_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_snapshot_cached(path: str, mtime_ns: int) -> FAIRDSSnapshot:
+    raw = Path(path).read_bytes()
+    try:
+        payload = json.loads(gzip.decompress(raw).decode("utf-8"))
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"{path} is not a FAIR-DS snapshot: {exc}") from exc
+    if not isinstance(payload, dict) or payload.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"{path} is not a FAIR-DS snapshot")
+    version = payload.get("version")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported FAIR-DS snapshot version {version!r} (expected {SNAPSHOT_VERSION})"
+        )
+    return FAIRDSSnapshot(
+        terms=dict(payload.get("terms") or {}),
+        packages=list(payload.get("packages") or []),
+        package_details=dict(payload.get("package_details") or {}),
+        skill_markdown=payload.get("skill_markdown"),
+        source_url=payload.get("source_url"),
+        created_at=payload.get("created_at"),
+        digest=hashlib.sha256(raw).hexdigest()[:16],
+    )
+
+
+class SnapshotResponse:
+    """Minimal ``requests.Response`` stand-in returned by :class:`SnapshotSession`."""
+
+    def __init__(self, status_code: int, content_type: str, body: bytes, etag: str) -> None:
+        self.status_code = status_code
+        self.content = body
+        self.headers = {"Content-Type": content_type, "ETag": etag}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.content.decode("utf-8"))
+
+
+class SnapshotSession:
+    """Serve client GETs from a snapshot instead of the network."""
+
+    def __init__(self, snapshot: FAIRDSSnapshot) -> None:
+        self.snapshot = snapshot
+        self.headers: Dict[str, str] = {}
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        **_: Any,
+    ) -> SnapshotResponse:
+        status, content_type, body = self.snapshot.respond(
+            urlsplit(url).path, params=params, headers=headers
+        )
+        return SnapshotResponse(status, content_type, body, f'"{self.snapshot.digest}"')
+
+    def post(self, url: str, **_: Any) -> SnapshotResponse:
+        body = b"FAIR-DS snapshot mode is read-only"
+        return SnapshotResponse(HTTPStatus.SERVICE_UNAVAILABLE, "text/plain", body, "")
+
+    def mount(self, *_: Any) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def make_snapshot_server(
+    snapshot: FAIRDSSnapshot, host: str = "127.0.0.1", port: int = 8083
+) -> ThreadingHTTPServer:
+    """Build (but do not start) an HTTP server answering FAIR-DS GET endpoints."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        server_version = "FAIRDSSnapshot/1"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            parts = urlsplit(self.path)
+            params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+            status, content_type, body = snapshot.respond(
+                parts.path, params=params, headers=dict(self.headers.items())
+            )
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("ETag", f'"{snapshot.digest}"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("snapshot server: " + format, *args)
+
+    return ThreadingHTTPServer((host, port), _Handler)
+
+
+def serve_snapshot(snapshot: FAIRDSSnapshot, host: str = "127.0.0.1", port: int = 8083) -> None:
+    """Serve ``snapshot`` over HTTP until interrupted."""
+    server = make_snapshot_server(snapshot, host, port)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+__all__ = [
+    "FAIRDSSnapshot",
+    "SNAPSHOT_VERSION",
+    "SnapshotSession",
+    "export_snapshot",
+    "load_snapshot",
+    "make_snapshot_server",
+    "serve_snapshot",
+    "write_snapshot",
+]
@@ -0,0 +1,270 @@
+"""Resilient HTTP transport for the FAIR Data Station client.
+
+A slow or dead FAIR-DS instance used to cost a full request timeout on every
+call. This module wraps the client's session calls with:
+
+* per-endpoint timeouts (a quick ``/api`` probe, a generous ``/api/terms``);
+* retries with full jitter for idempotent GETs on connection errors, timeouts,
+  ``429`` and ``502``/``503``/``504``;
+* a circuit breaker per base URL, shared process-wide. After
+  ``failure_threshold`` consecutive failures it opens and calls fail in
+  microseconds with :class:`FAIRDSCircuitOpenError`, so callers fall back to
+  cached catalog data. After ``reset_seconds`` one probe is let through
+  (half-open) and its outcome closes or re-opens the circuit.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+try:
+    import requests
+except ImportError:  # pragma: no cover - handled gracefully at runtime
+    requests = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Path prefix -> seconds. ``/api`` applies to the bare discovery endpoint only.
+DEFAULT_ENDPOINT_TIMEOUTS: Dict[str, float] = {
+    "/api": 3.0,
+    "/api/terms": 30.0,
+    "/api/packages": 15.0,
+    "/api/package": 15.0,
+    "/api/skills": 10.0,
+    "/api/isa": 120.0,
+}
+_RETRY_STATUSES = {429, 502, 503, 504}
+
+
+class FAIRDSCircuitOpenError(RuntimeError):
+    """Raised instead of a request while the FAIR-DS circuit breaker is open."""
+
+
+def endpoint_timeout(
+    path: str,
+    timeouts: Mapping[str, float] = DEFAULT_ENDPOINT_TIMEOUTS,
+    default: float = 15.0,
+) -> float:
+    """Timeout for ``path`` using the longest matching endpoint prefix."""
+    path = "/" + path.strip("/")
+    if path in timeouts:
+        return timeouts[path]
+    for prefix in sorted(timeouts, key=len, reverse=True):
+        if prefix != "/api" and path.startswith(prefix + "/"):
+            return timeouts[prefix]
+    return default
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed → open → half-open)."""
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_seconds = float(reset_seconds)
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_probe = False
+        self._last_success_at: Optional[float] = None
+        self._last_failure_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.reset_seconds:
+            self._state = "half_open"
+            self._half_open_probe = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a request may go out now (claims the half-open probe slot)."""
+        with self._lock:
+            state = self._current_state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._half_open_probe:
+                self._half_open_probe = True
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != "closed":
+                logger.info("FAIR-DS circuit closed after successful probe")
+            self._state = "closed"
+            self._failures = 0
+            self._half_open_probe = False
+            self._last_success_at = time.time()
+
+    def record_failure(self, error: Any = None) -> None:
+        with self._lock:
+            self._failures += 1
+            self._last_failure_at = time.time()
+            self._last_error = str(error) if error is not None else None
+            state = self._current_state()
+            if state == "half_open" or self._failures >= self.failure_threshold:
+                if state != "open":
+                    logger.warning(
+                        "FAIR-DS circuit opened after %d failure(s): %s",
+                        self._failures,
+                        self._last_error,
+                    )
+                self._state = "open"
+                self._opened_at = time.monotonic()
+                self._half_open_probe = False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot whose call ended inconclusively."""
+        with self._lock:
+            self._half_open_probe = False
+
+    def recently_healthy(self, within_seconds: float) -> bool:
+        """True if the circuit is closed and a request succeeded recently."""
+        with self._lock:
+            return (
+                self._current_state() == "closed"
+                and self._last_success_at is not None
+                and time.time() - self._last_success_at < within_seconds
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly breaker state for status endpoints."""
+        with self._lock:
+            state = self._current_state()
+            retry_in = None
+            if state == "open":
+                retry_in = max(0.0, self.reset_seconds - (time.monotonic() - self._opened_at))
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_seconds": self.reset_seconds,
+                "retry_in_seconds": round(retry_in, 1) if retry_in is not None else None,
+                "rejected_calls": self._rejected,
+                "last_success_at": self._last_success_at,
+                "last_failure_at": self._last_failure_at,
+                "last_error": self._last_error,
+            }
+
+
+def _transient_errors() -> tuple:
+    if requests is None:  # pragma: no cover
+        return (ConnectionError, TimeoutError)
+    return (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        ConnectionError,
+        TimeoutError,
+    )
+
+
+class FAIRDSTransport:
+    """Breaker + retry policy applied around a session call."""
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        *,
+        retries: int = 2,
+        backoff_seconds: float = 0.25,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.breaker = breaker
+        self.retries = max(0, int(retries))
+        self.backoff_seconds = max(0.0, float(backoff_seconds))
+        self._sleep = sleep
+
+    def send(self, call: Callable[[], Any], *, idempotent: bool = True, label: str = "") -> Any:
+        """Run ``call`` (one HTTP request) under the breaker and retry policy.
+
+        Only transport errors and 429/502/503/504 responses count as failures;
+        other statuses (including 404) prove the server is alive. Non-transport
+        exceptions propagate unchanged without touching the breaker.
+
+        Raises:
+            FAIRDSCircuitOpenError: If the breaker is open.
+        """
+        if not self.breaker.allow():
+            raise FAIRDSCircuitOpenError(f"FAIR-DS circuit open; skipped {label or 'request'}")
+
+        attempts = (self.retries if idempotent else 0) + 1
+        transient = _transient_errors()
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = call()
+            except transient as exc:
+                if last_attempt:
+                    self.breaker.record_failure(exc)
+                    raise
+                logger.debug("FAIR-DS %s failed (%s); retrying", label, exc)
+            except Exception:
+                self.breaker.release_probe()
+                raise
+            else:
+                status = getattr(response, "status_code", None)
+                if status not in _RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                if last_attempt:
+                    self.breaker.record_failure(f"HTTP {status}")
+                    return response
+                logger.debug("FAIR-DS %s returned HTTP %s; retrying", label, status)
+            # Full jitter keeps concurrent clients from retrying in lockstep.
+            self._sleep(random.uniform(0, self.backoff_seconds * (2 ** attempt)))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(base_url: str) -> CircuitBreaker:
+    """Process-wide breaker for ``base_url`` (created from config on first use)."""
+    from ..config import config
+
+    key = base_url.rstrip("/")
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=config.fair_ds_breaker_failure_threshold,
+                reset_seconds=config.fair_ds_breaker_reset_seconds,
+            )
+            _breakers[key] = breaker
+        return breaker
+
+
+def circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every FAIR-DS breaker in this process, keyed by base URL."""
+    with _breakers_lock:
+        items = list(_breakers.items())
+    return {url: breaker.snapshot() for url, breaker in items}
+
+
+def reset_circuit_breakers() -> None:
+    with _breakers_lock:
+        _breakers.clear()
+
+
+__all__ = [
+    "CircuitBreaker",
+    "DEFAULT_ENDPOINT_TIMEOUTS",
+    "FAIRDSCircuitOpenError",
+    "FAIRDSTransport",
+    "circuit_breaker_states",
+    "endpoint_timeout",
+    "get_circuit_breaker",
+    "reset_circuit_breakers",
+]
@@ -0,0 +1,131 @@
+"""Process-wide registry of local FAIR-DS extension packages.
+
+Local ``*_package.json`` files (``evaluation/config/packages`` plus
+``FAIRIFIER_LOCAL_PACKAGE_PATHS``) used to be parsed per
+``KnowledgeRetrieverAgent`` instance, i.e. once per web run. They are now
+parsed once per ``(path, mtime, size)`` and shared by every agent in the
+process. Each registry snapshot also builds the label/definition field index
+up front, so local field searches never rescan package metadata. Editing,
+adding or removing a package file is picked up on the next lookup.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .fairds_api_parser import FAIRDSAPIParser
+from .fairds_search_index import FieldSearchIndex
+
+logger = logging.getLogger(__name__)
+
+_FileKey = Tuple[str, int, int]
+
+
+def _field_haystack(field: Dict[str, Any]) -> str:
+    term = field.get("term") or {}
+    return " ".join(
+        str(value or "").lower()
+        for value in (
+            field.get("label"),
+            field.get("definition"),
+            term.get("label"),
+            term.get("definition"),
+        )
+    )
+
+
+class LocalPackageRegistry:
+    """Parsed local packages keyed by name, with a field index per package."""
+
+    def __init__(self, packages: Dict[str, Dict[str, Any]]) -> None:
+        self.packages = packages
+        self._field_indexes = {
+            name: FieldSearchIndex(package.get("metadata", []) or [], text_for=_field_haystack)
+            for name, package in packages.items()
+        }
+
+    def field_index(self, package_name: str) -> FieldSearchIndex:
+        return self._field_indexes[package_name]
+
+
+def _parse_package_file(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception as exc:
+        logger.warning("Failed reading local package file %s: %s", path, exc)
+        return None
+    package = FAIRDSAPIParser.parse_package_response(payload)
+    package_name = str(package.get("packageName") or "").strip()
+    if not package_name or not isinstance(package.get("metadata"), list):
+        return None
+    for field in package["metadata"]:
+        if isinstance(field, dict):
+            field["packageName"] = package_name
+    return package
+
+
+_lock = threading.Lock()
+_parsed_files: Dict[str, Tuple[_FileKey, Optional[Dict[str, Any]]]] = {}
+_registry_key: Optional[Tuple[_FileKey, ...]] = None
+_registry: Optional[LocalPackageRegistry] = None
+
+
+def get_local_package_registry(files: Sequence[Path]) -> LocalPackageRegistry:
+    """Shared registry for ``files`` (in order), reparsing only changed files."""
+    global _registry, _registry_key
+
+    keys = []
+    for path in files:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            continue
+        keys.append((str(path), stat.st_mtime_ns, stat.st_size))
+    key = tuple(keys)
+
+    with _lock:
+        if _registry is not None and _registry_key == key:
+            return _registry
+
+        packages: Dict[str, Dict[str, Any]] = {}
+        for file_key in key:
+            cached = _parsed_files.get(file_key[0])
+            if cached is None or cached[0] != file_key:
+                cached = (file_key, _parse_package_file(Path(file_key[0])))
+                _parsed_files[file_key[0]] = cached
+            package = cached[1]
+            if package is not None:
+                packages[package["packageName"]] = package
+        live_paths = {file_key[0] for file_key in key}
+        for stale_path in set(_parsed_files) - live_paths:
+            del _parsed_files[stale_path]
+
+        _registry = LocalPackageRegistry(packages)
+        _registry_key = key
+        return _registry
+
+
+def peek_local_package_registry() -> Optional[LocalPackageRegistry]:
+    """Most recently loaded registry, without checking files for changes."""
+    with _lock:
+        return _registry
+
+
+def reset_local_package_registry() -> None:
+    global _registry, _registry_key
+    with _lock:
+        _parsed_files.clear()
+        _registry = None
+        _registry_key = None
+
+
+__all__ = [
+    "LocalPackageRegistry",
+    "get_local_package_registry",
+    "peek_local_package_registry",
+    "reset_local_package_registry",
+]
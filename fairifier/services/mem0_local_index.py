@@ -0,0 +1,260 @@
+"""Per-run in-process vector index over prefetched mem0 memories.
+
+Every agent attempt used to run :meth:`Mem0Service.search`, which embeds the
+query and queries Qdrant. Retries and sibling agents often use almost the same
+query in one run, so a five-step run made 10-20 embedding calls. A
+:class:`RunMemoryIndex` instead:
+
+* prefetches each memory scope (current run, long-term) once with a single
+  ``get_all`` and reads the stored vectors back from the vector store (memory
+  texts are embedded only if the store cannot return vectors);
+* answers searches locally by cosine similarity;
+* memoizes query embeddings by embedder model and text hash process-wide, so
+  a repeated query costs no embedding call;
+* after a memory write, marks the scope dirty; the next search relists it and
+  fetches vectors only for new memory ids.
+
+If prefetching fails (listing error, a scope too large to list in one call,
+no embedder, unexpected payloads), the index falls back to
+:meth:`Mem0Service.search` for the rest of the run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .mem0_service import MEMORY_LIST_LIMIT
+from .mem0_write_queue import run_stats
+
+logger = logging.getLogger(__name__)
+
+_MAX_MEMO_ENTRIES = 2048
+_MAX_RUN_INDEXES = 16
+
+_memo_lock = threading.Lock()
+_embedding_memo: "OrderedDict[Tuple[Any, ...], Tuple[np.ndarray, Optional[weakref.ref]]]" = OrderedDict()
+
+
+def _embedder_key(embedder: Any) -> Tuple[Any, ...]:
+    """Memo namespace for ``embedder``: its class and configured model name.
+
+    Embedders without a model name are keyed by ``id()``; their memo entries
+    hold a weak reference so a new object that reuses the id cannot hit them.
+    """
+    model = getattr(getattr(embedder, "config", None), "model", None)
+    if isinstance(model, str) and model:
+        cls = type(embedder)
+        return (f"{cls.__module__}.{cls.__qualname__}", model)
+    return ("id", id(embedder))
+
+
+def embed_memoized(service: Any, text: str, action: str = "search", run_id: Optional[str] = None) -> np.ndarray:
+    """Embedding of ``text`` via ``service``'s embedder, memoized by text hash."""
+    embedder = service.memory.embedding_model
+    namespace = _embedder_key(embedder)
+    key = (*namespace, action, hashlib.sha1(text.encode("utf-8")).hexdigest())
+    stats = run_stats(run_id)
+    with _memo_lock:
+        cached = _embedding_memo.get(key)
+        if cached is not None and (cached[1] is None or cached[1]() is embedder):
+            _embedding_memo.move_to_end(key)
+            stats.record(embedding_memo_hits=1)
+            return cached[0]
+    vector = _as_unit_vector(embedder.embed(text, action))
+    stats.record(embedding_calls=1)
+    ref = None
+    if namespace[0] == "id":
+        try:
+            ref = weakref.ref(embedder)
+        except TypeError:
+            return vector
+    with _memo_lock:
+        _embedding_memo[key] = (vector, ref)
+        while len(_embedding_memo) > _MAX_MEMO_ENTRIES:
+            _embedding_memo.popitem(last=False)
+    return vector
+
+
+def _as_unit_vector(raw: Any) -> np.ndarray:
+    vector = np.asarray(raw, dtype=np.float32).reshape(-1)
+    if vector.size == 0 or not np.all(np.isfinite(vector)):
+        raise ValueError("embedding is empty or not numeric")
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+class _ScopeIndex:
+    def __init__(self) -> None:
+        self.memories: List[Dict[str, Any]] = []
+        self.matrix: Optional[np.ndarray] = None
+        self.vectors: Dict[str, np.ndarray] = {}
+        self.dirty = True
+
+
+class RunMemoryIndex:
+    """Prefetched memories of one run, searchable without calling mem0."""
+
+    def __init__(self, service: Any, run_id: Optional[str] = None) -> None:
+        self.service = service
+        self.run_id = run_id
+        self._lock = threading.Lock()
+        self._scopes: Dict[str, _ScopeIndex] = {}
+        self._fallback = False
+
+    @property
+    def uses_fallback(self) -> bool:
+        return self._fallback
+
+    def mark_dirty(self, scope: str) -> None:
+        """Relist ``scope`` on its next search (call after writing to it)."""
+        with self._lock:
+            index = self._scopes.get(scope)
+            if index is not None:
+                index.dirty = True
+
+    def prefetch(self, scopes: Sequence[str]) -> None:
+        """Load every scope in ``scopes`` that is not loaded yet or is dirty.
+
+        Called when a run starts so its first search is already local. Like a
+        failed search refresh, a failure switches the run to mem0 search.
+        """
+        if self._fallback:
+            return
+        try:
+            with self._lock:
+                for scope in scopes:
+                    self._refresh_locked(scope)
+        except Exception as exc:
+            logger.info("Local memory index unavailable (%s); using mem0 search for this run", exc)
+            self._fallback = True
+
+    def search(self, query: str, session_id: str, limit: int = 5, agent_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Same contract as :meth:`Mem0Service.search`, served from the local index."""
+        if self._fallback or agent_id:
+            return self.service.search(query=query, session_id=session_id, agent_id=agent_id, limit=limit)
+        try:
+            with self._lock:
+                index = self._refresh_locked(session_id)
+                memories, matrix = index.memories, index.matrix
+            if not memories:
+                run_stats(self.run_id).record(local_searches=1)
+                return []
+            query_vector = embed_memoized(self.service, query, "search", run_id=self.run_id)
+            scores = matrix @ query_vector
+        except Exception as exc:
+            logger.info("Local memory index unavailable (%s); using mem0 search for this run", exc)
+            self._fallback = True
+            return self.service.search(query=query, session_id=session_id, limit=limit)
+
+        run_stats(self.run_id).record(local_searches=1)
+        order = np.argsort(-scores, kind="stable")
+        results: List[Dict[str, Any]] = []
+        for position in order:
+            memory = memories[int(position)]
+            if not self.service.is_memory_valid(memory):
+                continue
+            results.append({**memory, "score": float(scores[int(position)])})
+            if len(results) >= limit:
+                break
+        return results
+
+    def _refresh_locked(self, scope: str) -> _ScopeIndex:
+        index = self._scopes.setdefault(scope, _ScopeIndex())
+        if not index.dirty:
+            return index
+        # get_all_memories raises instead of returning [], so a failed listing
+        # switches the run to mem0 search rather than caching an empty scope.
+        listed = self.service.get_all_memories(scope, limit=MEMORY_LIST_LIMIT)
+        if not isinstance(listed, list):
+            raise TypeError("get_all_memories did not return a list")
+        if len(listed) >= MEMORY_LIST_LIMIT:
+            raise OverflowError(f"scope {scope!r} has at least {MEMORY_LIST_LIMIT} memories")
+        memories = [m for m in listed if isinstance(m, dict) and m.get("id") and m.get("memory")]
+        run_stats(self.run_id).record(prefetches=1)
+
+        missing = [m for m in memories if str(m["id"]) not in index.vectors]
+        if missing:
+            index.vectors.update(self._load_vectors(missing))
+        live_ids = {str(m["id"]) for m in memories}
+        index.vectors = {key: vec for key, vec in index.vectors.items() if key in live_ids}
+        index.memories = memories
+        index.matrix = (
+            np.vstack([index.vectors[str(m["id"])] for m in memories]) if memories else None
+        )
+        index.dirty = False
+        return index
+
+    def _load_vectors(self, memories: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        vectors = self._stored_vectors([str(m["id"]) for m in memories])
+        for memory in memories:
+            memory_id = str(memory["id"])
+            if memory_id not in vectors:
+                vectors[memory_id] = embed_memoized(
+                    self.service, str(memory["memory"]), "add", run_id=self.run_id
+                )
+        return vectors
+
+    def _stored_vectors(self, ids: List[str]) -> Dict[str, np.ndarray]:
+        """Vectors already in the vector store (one round trip), if it exposes them."""
+        store = getattr(getattr(self.service, "memory", None), "vector_store", None)
+        client = getattr(store, "client", None)
+        collection = getattr(store, "collection_name", None)
+        if client is None or not isinstance(collection, str) or not hasattr(client, "retrieve"):
+            return {}
+        try:
+            points = client.retrieve(collection_name=collection, ids=ids, with_vectors=True)
+        except Exception as exc:
+            logger.debug("Could not read stored memory vectors: %s", exc)
+            return {}
+        vectors: Dict[str, np.ndarray] = {}
+        for point in points or []:
+            raw = getattr(point, "vector", None)
+            if isinstance(raw, dict):  # named vectors
+                raw = next(iter(raw.values()), None)
+            if raw is None:
+                continue
+            try:
+                vectors[str(point.id)] = _as_unit_vector(raw)
+            except (TypeError, ValueError):
+                continue
+        return vectors
+
+
+_indexes_lock = threading.Lock()
+_run_indexes: "OrderedDict[str, RunMemoryIndex]" = OrderedDict()
+
+
+def get_run_memory_index(service: Any, run_id: str) -> RunMemoryIndex:
+    """The memory index for ``run_id`` (rebuilt if the service changed)."""
+    with _indexes_lock:
+        index = _run_indexes.get(run_id)
+        if index is None or index.service is not service:
+            index = RunMemoryIndex(service, run_id)
+            _run_indexes[run_id] = index
+        _run_indexes.move_to_end(run_id)
+        while len(_run_indexes) > _MAX_RUN_INDEXES:
+            _run_indexes.popitem(last=False)
+        return index
+
+
+def reset_memory_indexes() -> None:
+    """Forget run indexes and memoized embeddings (tests, config changes)."""
+    with _indexes_lock:
+        _run_indexes.clear()
+    with _memo_lock:
+        _embedding_memo.clear()
+
+
+__all__ = [
+    "RunMemoryIndex",
+    "embed_memoized",
+    "get_run_memory_index",
+    "reset_memory_indexes",
+]
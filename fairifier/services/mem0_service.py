@@ -6,7 +6,7 @@ across the workflow session. The service performs runtime health checks and
 can auto-configure embedding/model backends when local dependencies are absent.
 """
 
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 import inspect
 import logging
 import hashlib
@@ -34,6 +34,7 @@ MEMORY_SCHEMA_VERSION = "v1"          # Bump to invalidate all stored memories o
 MEMORY_TTL_DAYS_SESSION = 7           # Per-run session memories expire after 7 days
 MEMORY_TTL_DAYS_GLOBAL = 30           # Cross-run global memories expire after 30 days
 GLOBAL_MEMORY_SCOPE = "fairifier-global"  # Canonical ID for cross-session long-term scope
+MEMORY_LIST_LIMIT = 1000              # Max memories returned by one get_all listing
 
 # Custom instructions for mem0 fact-extraction in FAIR metadata workflows.
 # These are passed as `custom_instructions` to mem0's ADDITIVE_EXTRACTION_PROMPT,
@@ -60,7 +61,7 @@ When in doubt, extract — cross-run knowledge is always valuable in this workfl
 
 # Global singleton instance
 _mem0_service: Optional["Mem0Service"] = None
-_LIMIT_PARAM_CACHE: Dict[int, str] = {}
+_LIMIT_PARAM_CACHE: Dict[int, Tuple[Callable[..., Any], str]] = {}
 
 
 def _parse_version_tuple(version: str) -> tuple[int, ...]:
@@ -102,8 +103,11 @@ def _warn_if_mem0_outdated() -> None:
 
 def _memory_limit_kwargs(method: Callable[..., Any], limit: int) -> Dict[str, int]:
     """Return limit/top_k kwargs compatible with installed mem0 Memory API."""
-    cache_key = id(method)
-    param_name = _LIMIT_PARAM_CACHE.get(cache_key)
+    # Bound methods are recreated on every attribute access, so key on the
+    # underlying function and keep it referenced: a bare id() can be reused.
+    func = getattr(method, "__func__", method)
+    cached = _LIMIT_PARAM_CACHE.get(id(func))
+    param_name = cached[1] if cached is not None and cached[0] is func else None
     if param_name is None:
         params = inspect.signature(method).parameters
         if "top_k" in params:
@@ -112,7 +116,7 @@ def _memory_limit_kwargs(method: Callable[..., Any], limit: int) -> Dict[str, in
             param_name = "limit"
         else:
             param_name = "top_k"
-        _LIMIT_PARAM_CACHE[cache_key] = param_name
+        _LIMIT_PARAM_CACHE[id(func)] = (func, param_name)
     return {param_name: limit}
 
 
@@ -310,6 +314,7 @@ class Mem0Service:
 
             result = self.memory.add(**add_kwargs)
             self._seen_message_fingerprints.add(fingerprint)
+            self._index_written(session_id, result, merged_metadata)
             added_count = len(result.get("results", []))
             if added_count > 0:
                 logger.info(
@@ -330,6 +335,38 @@ class Mem0Service:
             )
             return {}
 
+    def _index_written(self, session_id: str, result: Any, metadata: Dict[str, Any]) -> None:
+        """Apply an ``add`` result to the memory aggregate index (best effort)."""
+        from .memory_aggregate_index import get_memory_aggregate_index
+
+        index = get_memory_aggregate_index()
+        if index is None or not isinstance(result, dict):
+            return
+        try:
+            added, deleted = [], []
+            for item in result.get("results", []) or []:
+                if not isinstance(item, dict) or not item.get("id"):
+                    continue
+                if str(item.get("event", "ADD")).upper() == "DELETE":
+                    deleted.append(item["id"])
+                else:
+                    added.append({"id": item["id"], "memory": item.get("memory"), "metadata": metadata})
+            index.record_deleted(deleted)
+            index.record_added(session_id, added)
+        except Exception as exc:
+            logger.debug("Memory aggregate index update failed: %s", exc)
+
+    def _index_deleted(self, memory_ids: List[str]) -> None:
+        from .memory_aggregate_index import get_memory_aggregate_index
+
+        index = get_memory_aggregate_index()
+        if index is None or not memory_ids:
+            return
+        try:
+            index.record_deleted(memory_ids)
+        except Exception as exc:
+            logger.debug("Memory aggregate index update failed: %s", exc)
+
     def _fingerprint_messages(
         self,
         messages: List[Dict[str, str]],
@@ -395,12 +432,34 @@ class Mem0Service:
         except Exception:
             return True
 
-    def purge_expired_memories(self, session_id: str) -> int:
-        """Delete memories past their TTL.  Returns the number purged."""
+    def purge_expired_memories(self, session_id: str, batch_size: int = 256) -> int:
+        """Delete memories past their TTL.  Returns the number purged.
+
+        With Qdrant, expired points are selected and deleted server-side in
+        batches on the ``expires_at`` payload; otherwise the scope is listed
+        and expired memories are deleted one by one.
+        """
         if not self.is_available():
             return 0
-        memories = self.list_memories(session_id=session_id)
+        from .mem0_ttl_sweeper import delete_expired_batch
+
         purged = 0
+        try:
+            offset = None
+            while True:
+                batch = delete_expired_batch(self, batch_size=batch_size, offset=offset, user_id=session_id)
+                if batch is None:
+                    break
+                deleted, offset = batch
+                purged += len(deleted)
+                if offset is None:
+                    if purged:
+                        logger.info("Purged %d expired memories for session=%s", purged, session_id)
+                    return purged
+        except Exception as exc:
+            logger.debug("Bulk TTL purge failed for session=%s, scanning instead: %s", session_id, exc)
+
+        memories = self.list_memories(session_id=session_id)
         for memory in memories:
             if not self.is_memory_valid(memory):
                 memory_id = memory.get("id")
@@ -429,19 +488,37 @@ class Mem0Service:
             return []
         
         try:
-            filters = {"user_id": session_id}
-            if agent_id:
-                filters["agent_id"] = agent_id
-            results = self.memory.get_all(
-                filters=filters,
-                **_memory_limit_kwargs(self.memory.get_all, 1000),
-            )
-            memories = results.get("results", [])
-            logger.debug(f"Listed {len(memories)} memories for session={session_id}, agent={agent_id}")
-            return memories
+            return self.get_all_memories(session_id, agent_id=agent_id)
         except Exception as e:
             logger.warning(f"Memory list failed: {e}")
             return []
+
+    def get_all_memories(
+        self,
+        session_id: str,
+        agent_id: str = None,
+        limit: int = MEMORY_LIST_LIMIT,
+    ) -> List[Dict[str, Any]]:
+        """List up to ``limit`` memories for a session, raising on failure.
+
+        Unlike :meth:`list_memories`, errors propagate, so callers that cache
+        the listing can tell an empty scope from a failed call. A result of
+        exactly ``limit`` memories may be truncated.
+        """
+        if not self.is_available():
+            raise RuntimeError("mem0 memory is not available")
+        filters = {"user_id": session_id}
+        if agent_id:
+            filters["agent_id"] = agent_id
+        results = self.memory.get_all(
+            filters=filters,
+            **_memory_limit_kwargs(self.memory.get_all, limit),
+        )
+        memories = results.get("results") if isinstance(results, dict) else results
+        if not isinstance(memories, list):
+            raise TypeError(f"mem0 get_all returned {type(results).__name__}, expected results list")
+        logger.debug(f"Listed {len(memories)} memories for session={session_id}, agent={agent_id}")
+        return memories
     
     def delete_session_memories(self, session_id: str) -> int:
         """Delete all memories for a session (for re-run with fresh context).
@@ -458,11 +535,16 @@ class Mem0Service:
         try:
             memories = self.list_memories(session_id)
             count = 0
-            for m in memories:
-                memory_id = m.get("id")
-                if memory_id:
-                    self.memory.delete(memory_id)
-                    count += 1
+            deleted_ids = []
+            try:
+                for m in memories:
+                    memory_id = m.get("id")
+                    if memory_id:
+                        self.memory.delete(memory_id)
+                        deleted_ids.append(memory_id)
+                        count += 1
+            finally:
+                self._index_deleted(deleted_ids)
             logger.info(f"Deleted {count} memories for session {session_id}")
             return count
         except Exception as e:
@@ -483,6 +565,7 @@ class Mem0Service:
         
         try:
             self.memory.delete(memory_id)
+            self._index_deleted([memory_id])
             logger.debug(f"Deleted memory {memory_id}")
             return True
         except Exception as e:
@@ -559,10 +642,9 @@ class Mem0Service:
             }
         
         try:
-            # Get all memories for this session
-            memories = self.list_memories(session_id)
+            total, memory_texts, agent_counts, themes = self._overview_aggregates(session_id)
             
-            if not memories:
+            if not total:
                 return {
                     "session_id": session_id,
                     "total_memories": 0,
@@ -572,33 +654,15 @@ class Mem0Service:
                     "themes": []
                 }
             
-            # Extract memory texts and agent info
-            memory_texts = []
-            agent_counts = {}
-            
-            for m in memories:
-                # Get memory text
-                text = m.get("memory", "")
-                if isinstance(text, str) and text.strip():
-                    memory_texts.append(text.strip())
-                
-                # Count by agent
-                metadata = m.get("metadata", {})
-                agent = metadata.get("agent_id", "unknown")
-                agent_counts[agent] = agent_counts.get(agent, 0) + 1
-            
             # Basic statistics
             result = {
                 "session_id": session_id,
-                "total_memories": len(memories),
+                "total_memories": total,
                 "agents": agent_counts,
-                "memory_texts": memory_texts
+                "memory_texts": memory_texts,
+                "themes": themes,
             }
             
-            # Extract themes (simple keyword extraction from memories)
-            themes = self._extract_themes(memory_texts)
-            result["themes"] = themes
-            
             # Generate LLM summary if requested
             if use_llm and memory_texts:
                 try:
@@ -610,7 +674,7 @@ class Mem0Service:
             else:
                 result["summary"] = self._generate_simple_summary(memory_texts, agent_counts, themes)
             
-            logger.info(f"Generated memory overview for session {session_id}: {len(memories)} memories")
+            logger.info(f"Generated memory overview for session {session_id}: {total} memories")
             return result
             
         except Exception as e:
@@ -620,34 +684,51 @@ class Mem0Service:
                 "error": str(e)
             }
     
+    def _overview_aggregates(self, session_id: str) -> tuple:
+        """``(total, memory_texts, agent_counts, themes)`` for one session.
+
+        Served from the memory aggregate index when enabled (the session is
+        loaded from mem0 once, then maintained on write); otherwise computed
+        from a full ``list_memories`` scan.
+        """
+        from .memory_aggregate_index import get_memory_aggregate_index
+
+        index = get_memory_aggregate_index()
+        if index is not None:
+            index.ensure_synced([session_id], self.get_all_memories)
+            overview = index.session_overview(session_id)
+            return (
+                overview["total_memories"],
+                overview["memory_texts"],
+                overview["agents"],
+                overview["themes"],
+            )
+
+        memories = self.list_memories(session_id)
+        memory_texts = []
+        agent_counts: Dict[str, int] = {}
+        for m in memories:
+            # Get memory text
+            text = m.get("memory", "")
+            if isinstance(text, str) and text.strip():
+                memory_texts.append(text.strip())
+            
+            # Count by agent
+            metadata = m.get("metadata", {})
+            agent = metadata.get("agent_id", "unknown")
+            agent_counts[agent] = agent_counts.get(agent, 0) + 1
+        # Extract themes (simple keyword extraction from memories)
+        return len(memories), memory_texts, agent_counts, self._extract_themes(memory_texts)
+
     def _extract_themes(self, memory_texts: List[str], max_themes: int = 5) -> List[str]:
         """Extract key themes from memory texts using simple keyword analysis."""
         if not memory_texts:
             return []
         
-        # Combine all memory texts
-        combined_text = " ".join(memory_texts).lower()
-        
-        # Common domain-related keywords to look for
-        domain_keywords = [
-            "alpine", "grassland", "soil", "metagenomics", "microbiome",
-            "ecology", "biodiversity", "sequencing", "elevation", "climate",
-            "bacteria", "archaea", "fungi", "species", "community",
-            "metadata", "ontology", "package", "field", "FAIR"
-        ]
-        
-        # Count occurrences
-        theme_counts = {}
-        for keyword in domain_keywords:
-            count = combined_text.count(keyword)
-            if count > 0:
-                theme_counts[keyword] = count
-        
-        # Get top themes
-        sorted_themes = sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)
-        themes = [theme for theme, count in sorted_themes[:max_themes]]
-        
-        return themes
+        from .memory_aggregate_index import rank_themes, theme_counts
+
+        # Count keyword occurrences over all memory texts combined
+        return rank_themes(theme_counts(" ".join(memory_texts)), max_themes)
     
     def _generate_simple_summary(
         self, 
@@ -0,0 +1,351 @@
+"""Background TTL sweeper for mem0 memories.
+
+Every memory carries an ``expires_at`` timestamp (see :meth:`Mem0Service.add`),
+but expiry used to be enforced only client-side: ``search`` still fetched
+expired points and dropped them in :meth:`Mem0Service.is_memory_valid`, so
+they took up the ``limit`` budget. ``purge_expired_memories`` was the only
+cleanup, and it ran only when called explicitly, listing a whole scope and
+deleting memories one at a time.
+
+:class:`MemoryTTLSweeper` runs on a daemon thread in the API process and in
+CLI runs:
+
+* with Qdrant, each tick scrolls points whose ``expires_at`` payload is in the
+  past (a server-side datetime range filter) and resumes from a scroll cursor.
+  Each batch is deleted with one filter delete that re-checks ``expires_at``,
+  so a memory refreshed since it was scrolled is kept;
+* with other vector stores, each tick resumes a cursor over the known memory
+  scopes and purges a few scopes through ``purge_expired_memories``;
+* purge counts, batches, errors and timings are exposed through
+  :meth:`MemoryTTLSweeper.stats` (``/system/status`` and
+  ``fairifier memory sweep``).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+ScopeProvider = Callable[[], Sequence[str]]
+
+
+def _qdrant_handle(service: Any) -> Optional[Tuple[Any, str]]:
+    """``(client, collection)`` when ``service`` is backed by a Qdrant store."""
+    store = getattr(getattr(service, "memory", None), "vector_store", None)
+    client = getattr(store, "client", None)
+    collection = getattr(store, "collection_name", None)
+    if client is None or not isinstance(collection, str):
+        return None
+    if not (hasattr(client, "scroll") and hasattr(client, "delete")):
+        return None
+    try:
+        from qdrant_client import models  # noqa: F401
+    except ImportError:
+        return None
+    return client, collection
+
+
+def _expired_filter(now: datetime, *, user_id: Optional[str] = None, ids: Optional[List[Any]] = None):
+    from qdrant_client import models
+
+    must: List[Any] = [
+        models.FieldCondition(key="expires_at", range=models.DatetimeRange(lt=now.isoformat()))
+    ]
+    if user_id is not None:
+        must.append(models.FieldCondition(key="user_id", match=models.MatchValue(value=user_id)))
+    if ids is not None:
+        must.append(models.HasIdCondition(has_id=ids))
+    return models.Filter(must=must)
+
+
+def delete_expired_batch(
+    service: Any,
+    *,
+    batch_size: int = 256,
+    offset: Any = None,
+    user_id: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> Optional[Tuple[List[str], Any]]:
+    """Delete up to ``batch_size`` expired points straight from Qdrant.
+
+    Returns ``(deleted_ids, next_offset)``, where ``next_offset`` is ``None``
+    once the scroll is exhausted. Returns ``None`` if the service is not backed
+    by Qdrant; the caller should then fall back to listing the scope.
+    """
+    handle = _qdrant_handle(service)
+    if handle is None:
+        return None
+    client, collection = handle
+    from qdrant_client import models
+
+    now = now or datetime.now(timezone.utc)
+    points, next_offset = client.scroll(
+        collection_name=collection,
+        scroll_filter=_expired_filter(now, user_id=user_id),
+        limit=max(int(batch_size), 1),
+        offset=offset,
+        with_payload=False,
+        with_vectors=False,
+    )
+    ids = [point.id for point in points or []]
+    if ids:
+        client.delete(
+            collection_name=collection,
+            points_selector=models.FilterSelector(filter=_expired_filter(now, ids=ids)),
+            wait=True,
+        )
+        index_deleted = getattr(service, "_index_deleted", None)
+        if callable(index_deleted):
+            index_deleted([str(point_id) for point_id in ids])
+    return [str(point_id) for point_id in ids], next_offset
+
+
+def known_memory_scopes() -> List[str]:
+    """Scopes the scan fallback walks: the global scope plus every indexed session."""
+    from ..config import config
+    from .mem0_service import GLOBAL_MEMORY_SCOPE
+    from .memory_aggregate_index import get_memory_aggregate_index
+
+    scopes = [GLOBAL_MEMORY_SCOPE]
+    if config.memory_scope_id:
+        scopes.append(config.memory_scope_id)
+    index = get_memory_aggregate_index()
+    if index is not None:
+        scopes.extend(index.synced_sessions())
+    return list(dict.fromkeys(scopes))
+
+
+class MemoryTTLSweeper:
+    """Incrementally purges expired mem0 memories, one bounded tick at a time."""
+
+    def __init__(
+        self,
+        service: Any,
+        *,
+        batch_size: int = 256,
+        max_batches_per_tick: int = 4,
+        interval_seconds: float = 900,
+        scopes: Optional[ScopeProvider] = None,
+    ) -> None:
+        self.service = service
+        self.batch_size = max(int(batch_size), 1)
+        self.max_batches_per_tick = max(int(max_batches_per_tick), 1)
+        self.interval_seconds = float(interval_seconds)
+        self._scopes = scopes or known_memory_scopes
+        self._lock = threading.Lock()
+        self._cursor: Any = None
+        self._scope_cursor = 0
+        self._expiry_indexed = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Dict[str, Any] = {
+            "mode": None,
+            "ticks": 0,
+            "passes": 0,
+            "batches": 0,
+            "purged": 0,
+            "errors": 0,
+            "last_tick_at": None,
+            "last_tick_ms": 0.0,
+            "last_tick_purged": 0,
+            "last_error": None,
+        }
+
+    # ------------------------------------------------------------------
+    # Sweeping
+    # ------------------------------------------------------------------
+
+    def sweep_once(self) -> Dict[str, Any]:
+        """Run one tick; returns ``{"mode", "purged", "batches", "pass_complete"}``."""
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                if _qdrant_handle(self.service) is not None:
+                    tick = self._tick_qdrant()
+                else:
+                    tick = self._tick_scan()
+            except Exception as exc:
+                logger.warning("Memory TTL sweep failed: %s", exc)
+                self._cursor = None
+                self._stats["errors"] += 1
+                self._stats["last_error"] = str(exc)[:200]
+                tick = {"mode": self._stats["mode"], "purged": 0, "batches": 0, "pass_complete": False}
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._stats.update(
+                mode=tick["mode"],
+                ticks=self._stats["ticks"] + 1,
+                passes=self._stats["passes"] + int(tick["pass_complete"]),
+                batches=self._stats["batches"] + tick["batches"],
+                purged=self._stats["purged"] + tick["purged"],
+                last_tick_at=datetime.now(timezone.utc).isoformat(),
+                last_tick_ms=round(elapsed_ms, 1),
+                last_tick_purged=tick["purged"],
+            )
+        if tick["purged"]:
+            logger.info("Memory TTL sweep purged %d expired memories (%s)", tick["purged"], tick["mode"])
+        return tick
+
+    def sweep_all(self, max_ticks: int = 1000) -> int:
+        """Tick until a full pass completes; returns the number purged."""
+        purged = 0
+        for _ in range(max(int(max_ticks), 1)):
+            tick = self.sweep_once()
+            purged += tick["purged"]
+            if tick["pass_complete"] or not tick["batches"]:
+                break
+        return purged
+
+    def _ensure_expiry_index(self) -> None:
+        """Create a datetime payload index on ``expires_at`` once (best effort)."""
+        if self._expiry_indexed:
+            return
+        self._expiry_indexed = True
+        client, collection = _qdrant_handle(self.service)
+        try:
+            from qdrant_client import models
+
+            client.create_payload_index(
+                collection_name=collection,
+                field_name="expires_at",
+                field_schema=models.PayloadSchemaType.DATETIME,
+            )
+        except Exception as exc:
+            logger.debug("Could not index expires_at on %s: %s", collection, exc)
+
+    def _tick_qdrant(self) -> Dict[str, Any]:
+        self._ensure_expiry_index()
+        purged = batches = 0
+        pass_complete = False
+        for _ in range(self.max_batches_per_tick):
+            result = delete_expired_batch(self.service, batch_size=self.batch_size, offset=self._cursor)
+            if result is None:
+                break
+            deleted, self._cursor = result
+            purged += len(deleted)
+            batches += 1
+            if self._cursor is None:
+                pass_complete = True
+                break
+        return {"mode": "qdrant_filter", "purged": purged, "batches": batches, "pass_complete": pass_complete}
+
+    def _tick_scan(self) -> Dict[str, Any]:
+        scopes = list(self._scopes())
+        if not scopes:
+            return {"mode": "scan", "purged": 0, "batches": 0, "pass_complete": True}
+        purged = batches = 0
+        pass_complete = False
+        for _ in range(min(self.max_batches_per_tick, len(scopes))):
+            if self._scope_cursor >= len(scopes):
+                self._scope_cursor = 0
+            purged += self.service.purge_expired_memories(scopes[self._scope_cursor])
+            batches += 1
+            self._scope_cursor += 1
+            if self._scope_cursor >= len(scopes):
+                self._scope_cursor = 0
+                pass_complete = True
+                break
+        return {"mode": "scan", "purged": purged, "batches": batches, "pass_complete": pass_complete}
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Sweep every ``interval_seconds`` on a daemon thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="mem0-ttl-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if self.service.is_available():
+                self.sweep_once()
+            self._stop.wait(self.interval_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "running": self.running,
+                "interval_seconds": self.interval_seconds,
+                "cursor_active": self._cursor is not None or self._scope_cursor > 0,
+            }
+
+
+_sweeper: Optional[MemoryTTLSweeper] = None
+_sweeper_lock = threading.Lock()
+
+
+def get_memory_ttl_sweeper(service: Any) -> MemoryTTLSweeper:
+    """The process-wide sweeper for ``service`` (replaced if the service changed)."""
+    global _sweeper
+    from ..config import config
+
+    with _sweeper_lock:
+        if _sweeper is not None and _sweeper.service is service:
+            return _sweeper
+        if _sweeper is not None:
+            _sweeper.stop(timeout=0)
+        _sweeper = MemoryTTLSweeper(
+            service,
+            batch_size=config.mem0_ttl_sweep_batch_size,
+            max_batches_per_tick=config.mem0_ttl_sweep_max_batches,
+            interval_seconds=config.mem0_ttl_sweep_interval_seconds,
+        )
+        return _sweeper
+
+
+def start_memory_ttl_sweeper(service: Any) -> Optional[MemoryTTLSweeper]:
+    """Start the background sweeper for ``service`` unless the sweep interval is 0."""
+    from ..config import config
+
+    if service is None or config.mem0_ttl_sweep_interval_seconds <= 0:
+        return None
+    sweeper = get_memory_ttl_sweeper(service)
+    sweeper.start()
+    return sweeper
+
+
+def memory_sweeper_stats() -> Optional[Dict[str, Any]]:
+    """Stats of the process-wide sweeper, or ``None`` if none was started."""
+    with _sweeper_lock:
+        sweeper = _sweeper
+    return sweeper.stats() if sweeper is not None else None
+
+
+def reset_memory_ttl_sweeper() -> None:
+    """Stop and forget the process-wide sweeper."""
+    global _sweeper
+    with _sweeper_lock:
+        if _sweeper is not None:
+            _sweeper.stop(timeout=1)
+        _sweeper = None
+
+
+__all__ = [
+    "MemoryTTLSweeper",
+    "delete_expired_batch",
+    "get_memory_ttl_sweeper",
+    "known_memory_scopes",
+    "memory_sweeper_stats",
+    "reset_memory_ttl_sweeper",
+    "start_memory_ttl_sweeper",
+]
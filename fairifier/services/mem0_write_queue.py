@@ -0,0 +1,436 @@
+"""Write-behind queue and latency-budgeted search for the mem0 memory layer.
+
+``OrchestrateNode`` used to call :meth:`Mem0Service.add` inline after every
+accepted step (embedding + Qdrant upsert, seconds each) and
+:meth:`Mem0Service.search` inline before every agent attempt. This module
+takes both off the critical path:
+
+* :class:`MemoryWriteQueue` buffers writes in a bounded queue drained by one
+  daemon thread in batches, retries failed writes with backoff and drops new
+  writes when full. Writes are tagged with their run id, so a run can wait
+  for just its own writes: before searching its session scope, and in
+  ``FinalizeNode`` at the end of the run (an ``atexit`` hook gives every
+  straggler a short grace period);
+* :func:`search_memories` runs a search on a small thread pool and gives up
+  after the remaining latency budget, so the agent proceeds without memories;
+* per-run counters (queue depth, dropped writes, per-call latency) are kept by
+  run id and written to the workflow report.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_MAX_TRACKED_RUNS = 64
+
+
+class _Latency:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "avg_ms": round(self.total_ms / self.calls, 1) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class MemoryRunStats:
+    """Memory I/O counters for one workflow run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.search_latency = _Latency()
+        self.search_timeouts = 0
+        self.write_latency = _Latency()
+        self.writes_enqueued = 0
+        self.writes_completed = 0
+        self.writes_failed = 0
+        self.writes_dropped = 0
+        self.write_retries = 0
+        self.max_queue_depth = 0
+        self.prefetches = 0
+        self.local_searches = 0
+        self.embedding_calls = 0
+        self.embedding_memo_hits = 0
+
+    def record(self, **changes: Any) -> None:
+        """Apply counter increments (``writes_failed=1``) or latency samples."""
+        with self._lock:
+            for name, value in changes.items():
+                if name == "search_ms":
+                    self.search_latency.add(value)
+                elif name == "write_ms":
+                    self.write_latency.add(value)
+                elif name == "queue_depth":
+                    self.max_queue_depth = max(self.max_queue_depth, value)
+                else:
+                    setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "search": {**self.search_latency.as_dict(), "timeouts": self.search_timeouts},
+                "writes": {
+                    **self.write_latency.as_dict(),
+                    "enqueued": self.writes_enqueued,
+                    "completed": self.writes_completed,
+                    "failed": self.writes_failed,
+                    "dropped": self.writes_dropped,
+                    "retries": self.write_retries,
+                },
+                "max_queue_depth": self.max_queue_depth,
+                "local_index": {
+                    "prefetches": self.prefetches,
+                    "searches": self.local_searches,
+                    "embedding_calls": self.embedding_calls,
+                    "embedding_memo_hits": self.embedding_memo_hits,
+                },
+            }
+
+
+_stats_lock = threading.Lock()
+_run_stats: "OrderedDict[str, MemoryRunStats]" = OrderedDict()
+
+
+def run_stats(run_id: Optional[str]) -> MemoryRunStats:
+    """Counters for ``run_id`` (a throwaway instance when there is no run id)."""
+    if not run_id:
+        return MemoryRunStats()
+    with _stats_lock:
+        stats = _run_stats.get(run_id)
+        if stats is None:
+            stats = MemoryRunStats()
+            _run_stats[run_id] = stats
+            while len(_run_stats) > _MAX_TRACKED_RUNS:
+                _run_stats.popitem(last=False)
+        return stats
+
+
+@dataclass
+class _PendingWrite:
+    messages: List[Dict[str, str]]
+    session_id: str
+    agent_id: Optional[str]
+    metadata: Dict[str, Any]
+    stats: MemoryRunStats = field(default_factory=MemoryRunStats)
+    on_complete: Optional[Callable[[Any], None]] = None
+    run_id: Optional[str] = None
+
+
+class MemoryWriteQueue:
+    """Bounded write-behind queue in front of ``service.add``."""
+
+    def __init__(
+        self,
+        service: Any,
+        *,
+        max_size: int = 256,
+        batch_size: int = 8,
+        max_retries: int = 2,
+        retry_backoff_seconds: float = 0.5,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.service = service
+        self.max_size = max(1, int(max_size))
+        self.batch_size = max(1, int(batch_size))
+        self.max_retries = max(0, int(max_retries))
+        self.retry_backoff_seconds = max(0.0, float(retry_backoff_seconds))
+        self._sleep = sleep
+        self._pending: Deque[_PendingWrite] = deque()
+        self._in_flight = 0
+        # run id -> writes queued or being written for that run
+        self._outstanding: Dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def depth(self) -> int:
+        """Writes queued or being written."""
+        with self._cond:
+            return len(self._pending) + self._in_flight
+
+    def submit(
+        self,
+        *,
+        messages: List[Dict[str, str]],
+        session_id: str,
+        agent_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        run_id: Optional[str] = None,
+        on_complete: Optional[Callable[[Any], None]] = None,
+    ) -> bool:
+        """Queue one ``add`` call; returns False if the queue is full and it was dropped.
+
+        ``on_complete(result)`` runs on the writer thread after a successful write.
+        """
+        stats = run_stats(run_id)
+        with self._cond:
+            if self._closed or len(self._pending) + self._in_flight >= self.max_size:
+                stats.record(writes_dropped=1)
+                logger.warning(
+                    "Memory write queue full (%d); dropping write for session=%s agent=%s",
+                    self.max_size,
+                    session_id,
+                    agent_id,
+                )
+                return False
+            self._pending.append(
+                _PendingWrite(
+                    list(messages),
+                    session_id,
+                    agent_id,
+                    dict(metadata or {}),
+                    stats,
+                    on_complete,
+                    run_id,
+                )
+            )
+            if run_id:
+                self._outstanding[run_id] = self._outstanding.get(run_id, 0) + 1
+            stats.record(writes_enqueued=1, queue_depth=len(self._pending) + self._in_flight)
+            self._ensure_worker()
+            self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None, *, run_id: Optional[str] = None) -> bool:
+        """Block until queued writes finished; False if ``timeout`` expired first.
+
+        With ``run_id`` only that run's writes are waited for.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def busy() -> bool:
+            if run_id is not None:
+                return self._outstanding.get(run_id, 0) > 0
+            return bool(self._pending or self._in_flight)
+
+        with self._cond:
+            while busy():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush, then stop the worker; later submissions are dropped."""
+        drained = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        return drained
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="mem0-write-behind", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(self.batch_size, len(self._pending)))
+                ]
+                self._in_flight += len(batch)
+            for item in batch:
+                try:
+                    self._write(item)
+                finally:
+                    with self._cond:
+                        self._in_flight -= 1
+                        if item.run_id:
+                            left = self._outstanding.get(item.run_id, 1) - 1
+                            if left > 0:
+                                self._outstanding[item.run_id] = left
+                            else:
+                                self._outstanding.pop(item.run_id, None)
+                        self._cond.notify_all()
+
+    def _write(self, item: _PendingWrite) -> None:
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                result = self.service.add(
+                    messages=item.messages,
+                    session_id=item.session_id,
+                    agent_id=item.agent_id,
+                    metadata=item.metadata,
+                )
+            except Exception as exc:
+                logger.debug("Queued memory write raised: %s", exc)
+                result = {}
+            item.stats.record(write_ms=(time.perf_counter() - started) * 1000)
+            # Mem0Service.add returns {} on failure and a results dict otherwise.
+            if result:
+                item.stats.record(writes_completed=1)
+                if item.on_complete is not None:
+                    try:
+                        item.on_complete(result)
+                    except Exception as exc:
+                        logger.debug("Memory write callback failed: %s", exc)
+                return
+            if not self._service_available() or attempt == self.max_retries:
+                break
+            item.stats.record(write_retries=1)
+            self._sleep(self.retry_backoff_seconds * (2 ** attempt))
+        item.stats.record(writes_failed=1)
+
+    def _service_available(self) -> bool:
+        try:
+            return bool(self.service.is_available())
+        except Exception:
+            return False
+
+
+_queues: "weakref.WeakKeyDictionary[Any, MemoryWriteQueue]" = weakref.WeakKeyDictionary()
+_queues_lock = threading.Lock()
+_search_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_memory_write_queue(service: Any) -> MemoryWriteQueue:
+    """Process-wide write queue for ``service`` (created from config on first use)."""
+    from ..config import config
+
+    with _queues_lock:
+        queue = _queues.get(service)
+        if queue is None:
+            queue = MemoryWriteQueue(
+                service,
+                max_size=config.mem0_write_queue_size,
+                batch_size=config.mem0_write_batch_size,
+                max_retries=config.mem0_write_max_retries,
+            )
+            _queues[service] = queue
+        return queue
+
+
+def flush_memory_writes(timeout: Optional[float] = None, *, run_id: Optional[str] = None) -> bool:
+    """Flush the process's write queues; False if any did not drain in time.
+
+    With ``run_id`` only that run's writes are waited for, so one run finishing
+    does not block on writes queued by concurrent runs.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with _queues_lock:
+        queues = list(_queues.values())
+    drained = True
+    for queue in queues:
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        drained = queue.flush(remaining, run_id=run_id) and drained
+    return drained
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    global _search_executor
+    with _queues_lock:
+        if _search_executor is None:
+            _search_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mem0-search")
+        return _search_executor
+
+
+def search_memories(
+    service: Any,
+    *,
+    query: str,
+    session_id: str,
+    limit: int,
+    timeout: Optional[float] = None,
+    run_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """``service.search`` bounded by ``timeout`` seconds (``None`` waits inline).
+
+    On timeout the search keeps running on its worker thread but the caller
+    gets ``[]`` immediately.
+    """
+    stats = run_stats(run_id)
+    started = time.perf_counter()
+    try:
+        if timeout is None:
+            return service.search(query=query, session_id=session_id, limit=limit)
+        future = _get_search_executor().submit(
+            service.search, query=query, session_id=session_id, limit=limit
+        )
+        try:
+            return future.result(timeout=max(0.0, timeout))
+        except FutureTimeoutError:
+            stats.record(search_timeouts=1)
+            logger.info(
+                "Memory search for session=%s exceeded %.2fs budget; continuing without it",
+                session_id,
+                timeout,
+            )
+            return []
+    finally:
+        stats.record(search_ms=(time.perf_counter() - started) * 1000)
+
+
+def memory_run_metrics(run_id: Optional[str]) -> Dict[str, Any]:
+    """Report-ready memory counters for ``run_id`` plus current queue depth."""
+    with _queues_lock:
+        depth = sum(queue.depth for queue in _queues.values())
+    return {**run_stats(run_id).as_dict(), "queue_depth": depth}
+
+
+def reset_memory_write_queues() -> None:
+    """Stop every queue and forget per-run counters (tests, config changes)."""
+    global _search_executor
+    with _queues_lock:
+        queues = list(_queues.values())
+        _queues.clear()
+        executor, _search_executor = _search_executor, None
+    for queue in queues:
+        queue.close(timeout=1.0)
+    if executor is not None:
+        executor.shutdown(wait=False)
+    with _stats_lock:
+        _run_stats.clear()
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    try:
+        from ..config import config
+
+        flush_memory_writes(timeout=config.mem0_exit_flush_timeout_seconds)
+    except Exception:  # pragma: no cover - interpreter shutdown
+        pass
+
+
+__all__ = [
+    "MemoryRunStats",
+    "MemoryWriteQueue",
+    "flush_memory_writes",
+    "get_memory_write_queue",
+    "memory_run_metrics",
+    "reset_memory_write_queues",
+    "run_stats",
+    "search_memories",
+]
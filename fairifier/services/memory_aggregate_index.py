@@ -0,0 +1,363 @@
+"""SQLite aggregate index over mem0 memories for the memory dashboards.
+
+``GET /projects/{id}/memory-cloud`` used to call ``list_memories`` once per
+project in the web session (a Qdrant scan with a 1000 limit each), and
+:meth:`Mem0Service.generate_memory_overview` recomputed its themes over every
+memory text per request. :class:`MemoryAggregateIndex` keeps the aggregates
+those views need in SQLite (``memory_index_path``):
+
+* one row per memory (session, agent, cloud category, text);
+* per-session term counts by category, agent counts and theme tallies,
+  incremented and decremented as memories are added or deleted through
+  :class:`~fairifier.services.mem0_service.Mem0Service`;
+* the set of sessions already synced. A session that has never been seen is
+  loaded from mem0 once, on first read, and maintained incrementally after
+  that. A failed load leaves the session unsynced, so the next read retries.
+
+Writes or deletes made outside this process's ``Mem0Service`` are not seen;
+``fairifier memory reindex`` resyncs sessions from mem0.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+STOP_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
+    "has", "have", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "that", "this", "these", "those", "it", "its",
+    "as", "if", "not", "no", "so", "up", "out", "more", "than", "then",
+    "also", "about", "into", "using", "used", "via", "based", "per",
+    "between", "identified", "selected", "requires", "required", "within",
+    "across", "during", "after", "before", "through", "all", "each",
+    "which", "when", "where", "how", "what", "well", "can", "use",
+})
+
+# Keywords counted as overview themes (substring occurrences, lower-cased text).
+THEME_KEYWORDS = (
+    "alpine", "grassland", "soil", "metagenomics", "microbiome",
+    "ecology", "biodiversity", "sequencing", "elevation", "climate",
+    "bacteria", "archaea", "fungi", "species", "community",
+    "metadata", "ontology", "package", "field", "FAIR",
+)
+
+_WORD_RE = re.compile(r"[a-zA-Z]{3,}")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    memory_id   TEXT PRIMARY KEY,
+    session_id  TEXT NOT NULL,
+    agent       TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    text        TEXT NOT NULL,
+    indexed_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS memories_session ON memories (session_id, indexed_at);
+CREATE TABLE IF NOT EXISTS session_terms (
+    session_id  TEXT NOT NULL,
+    term        TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    count       INTEGER NOT NULL,
+    PRIMARY KEY (session_id, term, category)
+);
+CREATE TABLE IF NOT EXISTS session_agents (
+    session_id  TEXT NOT NULL,
+    agent       TEXT NOT NULL,
+    count       INTEGER NOT NULL,
+    PRIMARY KEY (session_id, agent)
+);
+CREATE TABLE IF NOT EXISTS session_themes (
+    session_id  TEXT NOT NULL,
+    theme       TEXT NOT NULL,
+    count       INTEGER NOT NULL,
+    PRIMARY KEY (session_id, theme)
+);
+CREATE TABLE IF NOT EXISTS synced_sessions (
+    session_id  TEXT PRIMARY KEY,
+    synced_at   REAL NOT NULL
+);
+"""
+
+MemoryLoader = Callable[[str], List[Dict[str, Any]]]
+
+
+def memory_terms(text: str) -> List[str]:
+    """Lower-cased words of 3+ letters minus stop words (the memory cloud vocabulary)."""
+    words = (word.lower() for word in _WORD_RE.findall(text or ""))
+    return [word for word in words if word not in STOP_WORDS]
+
+
+def memory_category(memory: Dict[str, Any]) -> str:
+    metadata = memory.get("metadata") or {}
+    return metadata.get("agent_id") or metadata.get("workflow_step") or "unknown"
+
+
+def memory_agent(memory: Dict[str, Any]) -> str:
+    return (memory.get("metadata") or {}).get("agent_id", "unknown")
+
+
+def theme_counts(text: str) -> Dict[str, int]:
+    lowered = (text or "").lower()
+    counts = {keyword: lowered.count(keyword) for keyword in THEME_KEYWORDS}
+    return {keyword: count for keyword, count in counts.items() if count}
+
+
+def rank_themes(counts: Dict[str, int], max_themes: int = 5) -> List[str]:
+    """Top themes by count; ties keep :data:`THEME_KEYWORDS` order."""
+    ordered = [(keyword, counts.get(keyword, 0)) for keyword in THEME_KEYWORDS]
+    ranked = sorted((item for item in ordered if item[1] > 0), key=lambda item: item[1], reverse=True)
+    return [keyword for keyword, _ in ranked[:max_themes]]
+
+
+class MemoryAggregateIndex:
+    """Incrementally maintained memory aggregates backed by SQLite."""
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        self._lock = threading.Lock()
+        self._conn = self._open_db(Path(db_path)) if db_path is not None else None
+        if self._conn is None:
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _open_db(db_path: Path) -> Optional[sqlite3.Connection]:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            return conn
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(
+                "Memory aggregate index at %s not usable (%s); using memory only",
+                db_path,
+                exc,
+            )
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def record_added(self, session_id: str, memories: Iterable[Dict[str, Any]]) -> int:
+        """Index (or re-index) ``memories`` under ``session_id``; returns how many."""
+        added = 0
+        with self._lock, self._conn:
+            for memory in memories:
+                memory_id = str(memory.get("id") or "")
+                text = memory.get("memory")
+                if not memory_id or not isinstance(text, str) or not text.strip():
+                    continue
+                self._remove_locked(memory_id)
+                self._insert_locked(session_id, memory_id, memory, text.strip())
+                added += 1
+        return added
+
+    def record_deleted(self, memory_ids: Iterable[str]) -> int:
+        removed = 0
+        with self._lock, self._conn:
+            for memory_id in memory_ids:
+                removed += self._remove_locked(str(memory_id))
+        return removed
+
+    def resync_session(self, session_id: str, memories: List[Dict[str, Any]]) -> int:
+        """Replace everything indexed for ``session_id`` with ``memories``."""
+        with self._lock, self._conn:
+            for table in ("memories", "session_terms", "session_agents", "session_themes"):
+                self._conn.execute(f"DELETE FROM {table} WHERE session_id = ?", (session_id,))
+            count = 0
+            for memory in memories:
+                memory_id = str(memory.get("id") or "")
+                text = memory.get("memory")
+                if not memory_id or not isinstance(text, str) or not text.strip():
+                    continue
+                # A memory id belongs to one session; drop a copy indexed elsewhere.
+                self._remove_locked(memory_id)
+                self._insert_locked(session_id, memory_id, memory, text.strip())
+                count += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO synced_sessions (session_id, synced_at) VALUES (?, ?)",
+                (session_id, time.time()),
+            )
+        return count
+
+    def ensure_synced(self, session_ids: Sequence[str], loader: MemoryLoader) -> None:
+        """Load sessions never seen before from mem0 (``loader(session_id)``).
+
+        ``loader`` must raise when mem0 cannot be listed. Such a session is
+        left unsynced, so it is retried on the next read instead of being
+        recorded as empty for good.
+        """
+        known = set(self.synced_sessions())
+        for session_id in dict.fromkeys(session_ids):
+            if not session_id or session_id in known:
+                continue
+            try:
+                memories = loader(session_id)
+            except Exception as exc:
+                logger.warning("Could not load memories of session %s for the index: %s", session_id, exc)
+                continue
+            self.resync_session(session_id, memories)
+
+    def _insert_locked(self, session_id: str, memory_id: str, memory: Dict[str, Any], text: str) -> None:
+        agent = memory_agent(memory)
+        category = memory_category(memory)
+        self._conn.execute(
+            "INSERT INTO memories (memory_id, session_id, agent, category, text, indexed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (memory_id, session_id, agent, category, text, time.time()),
+        )
+        self._apply_deltas_locked(session_id, agent, category, text, +1)
+
+    def _remove_locked(self, memory_id: str) -> int:
+        row = self._conn.execute(
+            "SELECT session_id, agent, category, text FROM memories WHERE memory_id = ?",
+            (memory_id,),
+        ).fetchone()
+        if row is None:
+            return 0
+        self._conn.execute("DELETE FROM memories WHERE memory_id = ?", (memory_id,))
+        self._apply_deltas_locked(row[0], row[1], row[2], row[3], -1)
+        return 1
+
+    def _apply_deltas_locked(self, session_id: str, agent: str, category: str, text: str, sign: int) -> None:
+        for term, count in Counter(memory_terms(text)).items():
+            self._bump_locked("session_terms", ("session_id", "term", "category"), (session_id, term, category), sign * count)
+        self._bump_locked("session_agents", ("session_id", "agent"), (session_id, agent), sign)
+        for theme, count in theme_counts(text).items():
+            self._bump_locked("session_themes", ("session_id", "theme"), (session_id, theme), sign * count)
+
+    def _bump_locked(self, table: str, columns: Tuple[str, ...], key: Tuple[str, ...], delta: int) -> None:
+        names = ", ".join(columns)
+        self._conn.execute(
+            f"INSERT INTO {table} ({names}, count) VALUES ({', '.join('?' * len(columns))}, ?) "
+            f"ON CONFLICT ({names}) DO UPDATE SET count = count + excluded.count",
+            (*key, delta),
+        )
+        if delta < 0:
+            where = " AND ".join(f"{column} = ?" for column in columns)
+            self._conn.execute(f"DELETE FROM {table} WHERE {where} AND count <= 0", key)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def synced_sessions(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT session_id FROM synced_sessions ORDER BY session_id").fetchall()
+        return [row[0] for row in rows]
+
+    def memory_count(self, session_ids: Sequence[str]) -> int:
+        if not session_ids:
+            return 0
+        marks = ", ".join("?" * len(session_ids))
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT COUNT(*) FROM memories WHERE session_id IN ({marks})", tuple(session_ids)
+            ).fetchone()
+        return int(row[0])
+
+    def word_frequencies(self, session_ids: Sequence[str], limit: int = 80) -> List[Tuple[str, int, str]]:
+        """``(term, count, dominant_category)`` across ``session_ids``, most frequent first."""
+        if not session_ids:
+            return []
+        marks = ", ".join("?" * len(session_ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT term, category, SUM(count) FROM session_terms "
+                f"WHERE session_id IN ({marks}) GROUP BY term, category",
+                tuple(session_ids),
+            ).fetchall()
+        totals: Counter = Counter()
+        best: Dict[str, Tuple[int, str]] = {}
+        for term, category, count in rows:
+            totals[term] += count
+            current = best.get(term)
+            if current is None or count > current[0] or (count == current[0] and category < current[1]):
+                best[term] = (count, category)
+        ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(term, count, best[term][1]) for term, count in ranked]
+
+    def session_overview(self, session_id: str, max_themes: int = 5) -> Dict[str, Any]:
+        """Total, per-agent counts, memory texts and themes for one session."""
+        with self._lock:
+            texts = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT text FROM memories WHERE session_id = ? ORDER BY indexed_at, rowid",
+                    (session_id,),
+                )
+            ]
+            agents = dict(
+                self._conn.execute(
+                    "SELECT agent, count FROM session_agents WHERE session_id = ? ORDER BY agent",
+                    (session_id,),
+                ).fetchall()
+            )
+            themes = dict(
+                self._conn.execute(
+                    "SELECT theme, count FROM session_themes WHERE session_id = ?", (session_id,)
+                ).fetchall()
+            )
+        return {
+            "total_memories": len(texts),
+            "agents": agents,
+            "memory_texts": texts,
+            "themes": rank_themes(themes, max_themes),
+        }
+
+
+_index: Optional[MemoryAggregateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_memory_aggregate_index() -> Optional[MemoryAggregateIndex]:
+    """Process-wide aggregate index (``None`` if disabled)."""
+    global _index
+    from ..config import config
+
+    if not getattr(config, "memory_index_enabled", False):
+        return None
+    with _index_lock:
+        if _index is None:
+            _index = MemoryAggregateIndex(config.memory_index_path)
+        return _index
+
+
+def reset_memory_aggregate_index() -> None:
+    global _index
+    with _index_lock:
+        if _index is not None:
+            _index.close()
+        _index = None
+
+
+__all__ = [
+    "MemoryAggregateIndex",
+    "STOP_WORDS",
+    "THEME_KEYWORDS",
+    "get_memory_aggregate_index",
+    "memory_category",
+    "memory_terms",
+    "rank_themes",
+    "reset_memory_aggregate_index",
+    "theme_counts",
+]
@@ -7,23 +7,47 @@ with ``.mineru_cache_complete`` after a successful copy.
 Lookup uses **content checksum only** (not the filename). The PDF basename is used only when
 materializing into the run output tree as ``{output_dir}/mineru_<stem>/``; inner MinerU folders
 may still reflect an earlier conversion basename (see ``langgraph_app._find_existing_mineru_result``).
+
+Hits are materialized without copying bytes where the filesystem allows it: each file is
+reflinked (copy-on-write clone), else hardlinked, else copied (e.g. across filesystems).
+Hardlinked cache files are made read-only so an in-place edit in a run directory cannot
+silently change the cached conversion. ``.mineru_cache_index.sqlite3`` in the cache root
+records each entry's size and last access; after every store, least recently used entries
+are evicted until the cache fits ``max_bytes``.
 """
 
 from __future__ import annotations
 
+import errno
 import hashlib
 import logging
 import os
 import shutil
+import sqlite3
+import stat
 import sys
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
 _CACHE_COMPLETE = ".mineru_cache_complete"
+_INDEX_FILE = ".mineru_cache_index.sqlite3"
+_FICLONE = 0x40049409  # Linux ioctl: clone file extents (btrfs, XFS, overlay on those)
+
+MATERIALIZE_MODES = ("auto", "reflink", "hardlink", "copy")
+
+_CREATE_INDEX = """
+CREATE TABLE IF NOT EXISTS entries (
+    digest       TEXT PRIMARY KEY,
+    bytes        INTEGER NOT NULL,
+    stored_at    REAL NOT NULL,
+    last_access  REAL NOT NULL,
+    hits         INTEGER NOT NULL DEFAULT 0
+);
+"""
 
 
 def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
@@ -64,8 +88,236 @@ def cache_entry_ready(entry: Path) -> bool:
     return entry.is_dir() and (entry / _CACHE_COMPLETE).is_file()
 
 
-def _ignore_cache_marker(_dir: str, names: List[str]) -> List[str]:
-    return [n for n in names if n == _CACHE_COMPLETE]
+def _tree_bytes(root: Path) -> int:
+    total = 0
+    for dirpath, _dirs, files in os.walk(root):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Zero-copy materialization
+# ---------------------------------------------------------------------------
+
+
+def _reflink(src: str, dst: str) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink unsupported on this platform")
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.unlink(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+def _clone_tree(src: Path, dest: Path, mode: str = "auto", *, allow_hardlink: bool = True) -> Dict[str, int]:
+    """Recreate ``src`` at ``dest`` file by file, cheapest method first.
+
+    ``mode`` picks the first method to try (``auto`` = reflink, then hardlink);
+    a method that fails once is not retried for the rest of the tree, and
+    every file can fall back to a plain copy. Returns per-method file counts.
+    """
+    order = {
+        "auto": ["reflink", "hardlink"],
+        "reflink": ["reflink"],
+        "hardlink": ["hardlink"],
+        "copy": [],
+    }.get(mode, ["reflink", "hardlink"])
+    if not allow_hardlink:
+        order = [method for method in order if method != "hardlink"]
+    counts = {"reflink": 0, "hardlink": 0, "copy": 0}
+    for dirpath, dirnames, filenames in os.walk(src):
+        rel = os.path.relpath(dirpath, src)
+        target_dir = dest if rel == "." else dest / rel
+        target_dir.mkdir(parents=True, exist_ok=True)
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name == _CACHE_COMPLETE:
+                continue
+            s_path = os.path.join(dirpath, name)
+            d_path = str(target_dir / name)
+            for method in list(order):
+                try:
+                    if method == "reflink":
+                        _reflink(s_path, d_path)
+                    else:
+                        os.link(s_path, d_path)
+                    counts[method] += 1
+                    break
+                except OSError as exc:
+                    logger.debug("MinerU cache %s unavailable (%s); trying next method", method, exc)
+                    order.remove(method)
+            else:
+                shutil.copy2(s_path, d_path)
+                counts["copy"] += 1
+            if os.path.isfile(d_path) and not os.path.samefile(s_path, d_path):
+                # Private clone: writable even though the cached original is read-only.
+                os.chmod(d_path, os.stat(d_path).st_mode | stat.S_IWUSR)
+    return counts
+
+
+def _make_read_only(root: Path) -> None:
+    """Drop write bits on cached files (they may be hardlinked into run outputs)."""
+    for dirpath, _dirs, files in os.walk(root):
+        for name in files:
+            path = os.path.join(dirpath, name)
+            try:
+                mode = os.lstat(path).st_mode
+                os.chmod(path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+            except OSError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Last-access index and LRU eviction
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _index(cache_root: Path) -> Iterator[Optional[sqlite3.Connection]]:
+    """Open the cache's last-access index (``None`` if it is not usable)."""
+    try:
+        cache_root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(cache_root / _INDEX_FILE), timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute(_CREATE_INDEX)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("MinerU cache index at %s not usable: %s", cache_root, exc)
+        yield None
+        return
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def _record_access(cache_root: Path, digest: str, *, size: Optional[int] = None, hit: bool = False) -> None:
+    now = time.time()
+    try:
+        with _index(cache_root) as conn:
+            if conn is None:
+                return
+            if size is not None:
+                conn.execute(
+                    "INSERT INTO entries (digest, bytes, stored_at, last_access, hits) VALUES (?, ?, ?, ?, 0) "
+                    "ON CONFLICT (digest) DO UPDATE SET bytes = excluded.bytes, last_access = excluded.last_access",
+                    (digest, size, now, now),
+                )
+            else:
+                updated = conn.execute(
+                    "UPDATE entries SET last_access = ?, hits = hits + ? WHERE digest = ?",
+                    (now, int(hit), digest),
+                ).rowcount
+                if not updated:
+                    # Entry stored before the index existed.
+                    conn.execute(
+                        "INSERT INTO entries (digest, bytes, stored_at, last_access, hits) VALUES (?, ?, ?, ?, ?)",
+                        (digest, _tree_bytes(_entry_dir(cache_root, digest)), now, now, int(hit)),
+                    )
+    except sqlite3.Error as exc:
+        logger.debug("MinerU cache index update failed: %s", exc)
+
+
+def _reconcile_index(cache_root: Path, conn: sqlite3.Connection) -> None:
+    """Add complete entries missing from the index and drop rows without an entry."""
+    on_disk = {
+        path.name: path
+        for path in cache_root.iterdir()
+        if path.is_dir() and len(path.name) == 64 and cache_entry_ready(path)
+    } if cache_root.is_dir() else {}
+    indexed = {row[0] for row in conn.execute("SELECT digest FROM entries")}
+    for digest in indexed - on_disk.keys():
+        conn.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+    for digest in on_disk.keys() - indexed:
+        path = on_disk[digest]
+        marker_time = (path / _CACHE_COMPLETE).stat().st_mtime
+        conn.execute(
+            "INSERT INTO entries (digest, bytes, stored_at, last_access, hits) VALUES (?, ?, ?, ?, 0)",
+            (digest, _tree_bytes(path), marker_time, marker_time),
+        )
+
+
+def cache_stats(cache_root: Path) -> Dict[str, Any]:
+    """Entry count, total bytes and access range of the cache (index reconciled first)."""
+    with _index(cache_root) as conn:
+        if conn is None:
+            return {"entries": 0, "bytes": 0, "hits": 0, "oldest_access": None, "newest_access": None}
+        _reconcile_index(cache_root, conn)
+        count, total, hits, oldest, newest = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(bytes), 0), COALESCE(SUM(hits), 0), "
+            "MIN(last_access), MAX(last_access) FROM entries"
+        ).fetchone()
+    return {
+        "entries": int(count),
+        "bytes": int(total),
+        "hits": int(hits),
+        "oldest_access": oldest,
+        "newest_access": newest,
+    }
+
+
+def prune_cache(
+    cache_root: Path,
+    max_bytes: int,
+    *,
+    keep: Optional[str] = None,
+    dry_run: bool = False,
+) -> List[Dict[str, Any]]:
+    """Evict least recently used entries until the cache fits ``max_bytes``.
+
+    ``keep`` (a digest) is never evicted. Returns the evicted (or, with
+    ``dry_run``, the would-be evicted) entries as ``{"digest", "bytes", "last_access"}``.
+    """
+    with _index(cache_root) as conn:
+        if conn is None:
+            return []
+        _reconcile_index(cache_root, conn)
+        total = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM entries").fetchone()[0]
+        candidates = conn.execute(
+            "SELECT digest, bytes, last_access FROM entries ORDER BY last_access ASC"
+        ).fetchall()
+
+    evicted: List[Dict[str, Any]] = []
+    for digest, size, last_access in candidates:
+        if total <= max_bytes:
+            break
+        if digest == keep:
+            continue
+        if not dry_run:
+            with _digest_lock(cache_root, digest):
+                shutil.rmtree(_entry_dir(cache_root, digest), ignore_errors=True)
+                with _index(cache_root) as conn:
+                    if conn is not None:
+                        conn.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+            try:
+                (cache_root / f"{digest}.lock").unlink()
+            except OSError:
+                pass
+        total -= size
+        evicted.append({"digest": digest, "bytes": int(size), "last_access": last_access})
+    if evicted and not dry_run:
+        logger.info(
+            "MinerU cache evicted %d entries (%d bytes) to fit %d bytes",
+            len(evicted),
+            sum(e["bytes"] for e in evicted),
+            max_bytes,
+        )
+    return evicted
+
+
+# ---------------------------------------------------------------------------
+# Lookup and store
+# ---------------------------------------------------------------------------
 
 
 def try_get_cached_mineru_tree(
@@ -73,8 +325,12 @@ def try_get_cached_mineru_tree(
     digest: str,
     project_output_dir: Path,
     doc_stem: str,
+    materialize: str = "auto",
 ) -> Optional[Path]:
-    """If cache hit, copy cached MinerU tree into the project output dir.
+    """If cache hit, materialize the cached MinerU tree into the project output dir.
+
+    Files are reflinked or hardlinked where possible and copied otherwise
+    (``materialize`` is one of :data:`MATERIALIZE_MODES`).
 
     Returns the path to ``project_output_dir / f"mineru_{doc_stem}"`` on success,
     or ``None`` if there is no complete cache entry.
@@ -89,12 +345,16 @@ def try_get_cached_mineru_tree(
             return None
         if dest.exists():
             shutil.rmtree(dest, ignore_errors=True)
-        shutil.copytree(entry, dest, ignore=_ignore_cache_marker)
+        started = time.perf_counter()
+        counts = _clone_tree(entry, dest, materialize)
         logger.info(
-            "MinerU cache HIT: sha256=%s… → %s",
+            "MinerU cache HIT: sha256=%s… → %s (%s; %.0f ms)",
             digest[:16],
             dest,
+            ", ".join(f"{n} {m}" for m, n in counts.items() if n) or "empty",
+            (time.perf_counter() - started) * 1000,
         )
+    _record_access(cache_root, digest, hit=True)
     return dest
 
 
@@ -102,8 +362,14 @@ def store_mineru_output_after_success(
     cache_root: Path,
     digest: str,
     mineru_output_dir: Path,
+    max_bytes: Optional[int] = None,
 ) -> None:
-    """Persist a successful MinerU output directory into the shared cache."""
+    """Persist a successful MinerU output directory into the shared cache.
+
+    The tree is reflinked or copied (never hardlinked: the run may still edit
+    its own output). With ``max_bytes``, least recently used entries are then
+    evicted until the cache fits.
+    """
     src = mineru_output_dir.resolve()
     if not src.is_dir():
         logger.warning("MinerU cache store skipped: not a directory: %s", src)
@@ -118,7 +384,8 @@ def store_mineru_output_after_success(
         try:
             if tmp.exists():
                 shutil.rmtree(tmp, ignore_errors=True)
-            shutil.copytree(src, tmp, dirs_exist_ok=True)
+            _clone_tree(src, tmp, allow_hardlink=False)
+            _make_read_only(tmp)
             (tmp / _CACHE_COMPLETE).write_text(
                 f"sha256={digest}\nsource={src}\n",
                 encoding="utf-8",
@@ -127,11 +394,16 @@ def store_mineru_output_after_success(
                 shutil.rmtree(entry, ignore_errors=True)
             # Atomic rename on same volume; shutil.move falls back if needed (e.g. Windows).
             shutil.move(str(tmp), str(entry))
+            size = _tree_bytes(entry)
             logger.info(
-                "MinerU cache STORE: sha256=%s… bytes from %s",
+                "MinerU cache STORE: sha256=%s… %d bytes from %s",
                 digest[:16],
+                size,
                 src,
             )
         finally:
             if tmp.exists() and tmp != entry:
                 shutil.rmtree(tmp, ignore_errors=True)
+    _record_access(cache_root, digest, size=size)
+    if max_bytes:
+        prune_cache(cache_root, max_bytes, keep=digest)
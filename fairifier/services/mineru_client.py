@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass, field
@@ -15,6 +16,7 @@ from .mineru_paths import (
     find_markdown_in_tree,
     load_content_list_v2,
 )
+from .mineru_process import run_mineru_process_blocking
 
 
 logger = logging.getLogger(__name__)
@@ -64,6 +66,10 @@ class MinerUConversionError(RuntimeError):
     """Raised when MinerU conversion fails."""
 
 
+class MinerUCancelledError(MinerUConversionError):
+    """Raised when the run was stopped while MinerU was converting."""
+
+
 @dataclass
 class MinerUConversionResult:
     """Structured result returned after running MinerU conversion."""
@@ -132,11 +138,22 @@ def mineru_client_from_config(config: Any) -> "MinerUClient":
         api_url=getattr(config, "mineru_api_url", None),
         backend=config.mineru_backend,
         timeout_seconds=config.mineru_timeout_seconds,
+        idle_timeout_seconds=getattr(config, "mineru_idle_timeout_seconds", 0),
         effort=getattr(config, "mineru_effort", None),
         image_analysis=getattr(config, "mineru_image_analysis", None),
         structured_output_enabled=getattr(
             config, "mineru_structured_output_enabled", True
         ),
+        page_chunk_size=getattr(config, "mineru_page_chunk_size", 0),
+        page_chunk_workers=getattr(config, "mineru_page_chunk_workers", 2),
+        page_chunk_min_pages=getattr(config, "mineru_page_chunk_min_pages", 60),
+        chunk_cache_root=(
+            Path(config.mineru_cache_dir)
+            if getattr(config, "mineru_cache_enabled", False)
+            else None
+        ),
+        chunk_cache_max_bytes=int(getattr(config, "mineru_cache_max_gb", 0) * 1024**3) or None,
+        chunk_cache_materialize=getattr(config, "mineru_cache_materialize", "auto"),
     )
 
 
@@ -153,15 +170,33 @@ class MinerUClient:
         effort: Optional[str] = None,
         image_analysis: Optional[bool] = None,
         structured_output_enabled: bool = True,
+        page_chunk_size: int = 0,
+        page_chunk_workers: int = 2,
+        page_chunk_min_pages: int = 60,
+        chunk_cache_root: Optional[Path] = None,
+        idle_timeout_seconds: int = 0,
+        chunk_cache_max_bytes: Optional[int] = None,
+        chunk_cache_materialize: str = "auto",
     ):
         self.cli_path = cli_path
         self.server_url = server_url
         self.api_url = api_url
         self.backend = backend
         self.timeout_seconds = timeout_seconds
+        # Kill MinerU when it prints nothing for this long (0 = total timeout only)
+        self.idle_timeout_seconds = idle_timeout_seconds
         self.effort = effort
         self.image_analysis = image_analysis
         self.structured_output_enabled = structured_output_enabled
+        # Split PDFs with >= page_chunk_min_pages pages into page_chunk_size-page
+        # ranges converted by up to page_chunk_workers MinerU processes (0 = off).
+        self.page_chunk_size = page_chunk_size
+        self.page_chunk_workers = page_chunk_workers
+        self.page_chunk_min_pages = page_chunk_min_pages
+        # Range outputs share the MinerU cache, its size cap and hit materialization.
+        self.chunk_cache_root = chunk_cache_root
+        self.chunk_cache_max_bytes = chunk_cache_max_bytes
+        self.chunk_cache_materialize = chunk_cache_materialize
 
     def is_available(self) -> bool:
         """Return True if CLI is installed (VLM URL required for http-client backends)."""
@@ -239,17 +274,35 @@ class MinerUClient:
             out_dir = Path(output_dir).expanduser().resolve()
             out_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.page_chunk_size > 0 and src_path.suffix.lower() == ".pdf":
+            from .mineru_pool import convert_in_page_ranges, pdf_page_count
+
+            page_count = pdf_page_count(src_path)
+            if page_count and page_count >= max(self.page_chunk_min_pages, self.page_chunk_size + 1):
+                return convert_in_page_ranges(self, src_path, out_dir, page_count)
+
+        return self.convert_single(src_path, out_dir)
+
+    def convert_single(self, src_path: Path, out_dir: Path) -> MinerUConversionResult:
+        """Run one MinerU process for ``src_path`` and collect its artifacts."""
         cmd = self.build_command(src_path, out_dir)
         logger.info("Running MinerU conversion: %s", " ".join(cmd))
 
+        # Imported here: fairifier.config imports this module at load time.
+        from ..utils.run_control import current_run_id, report_run_progress, run_stop_requested
+
+        run_id = current_run_id()
+
+        def _report(progress: Dict[str, Any]) -> None:
+            report_run_progress(run_id, {"stage": "mineru", "document": src_path.name, **progress})
+
         try:
-            completed = subprocess.run(
+            completed = run_mineru_process_blocking(
                 cmd,
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=self.timeout_seconds,
+                timeout_seconds=self.timeout_seconds,
+                idle_timeout_seconds=self.idle_timeout_seconds,
+                should_cancel=lambda: run_stop_requested(run_id),
+                on_progress=_report,
             )
         except FileNotFoundError as exc:
             message = (
@@ -257,19 +310,26 @@ class MinerUClient:
                 "Ensure it is installed and on PATH."
             )
             raise MinerUConversionError(message) from exc
-        except subprocess.TimeoutExpired as exc:
-            message = (
+
+        if not completed.completed:
+            self._discard_partial_output(out_dir, src_path.stem)
+        if completed.outcome == "cancelled":
+            raise MinerUCancelledError(f"MinerU conversion of {src_path.name} was cancelled.")
+        if completed.outcome == "timeout":
+            raise MinerUConversionError(
                 "MinerU conversion timed out after "
                 f"{self.timeout_seconds} seconds."
             )
-            raise MinerUConversionError(message) from exc
-        except subprocess.CalledProcessError as exc:
-            stderr = exc.stderr or ""
-            message = (
+        if completed.outcome == "idle_timeout":
+            raise MinerUConversionError(
+                "MinerU conversion stalled: no output for "
+                f"{self.idle_timeout_seconds} seconds."
+            )
+        if completed.returncode != 0:
+            raise MinerUConversionError(
                 "MinerU conversion failed with exit code "
-                f"{exc.returncode}: {stderr.strip()}"
+                f"{completed.returncode}: {completed.stderr.strip()}"
             )
-            raise MinerUConversionError(message) from exc
 
         if completed.stdout:
             logger.debug("MinerU stdout: %s", completed.stdout.strip())
@@ -342,6 +402,15 @@ class MinerUClient:
             other_files=other_files,
         )
 
+    @staticmethod
+    def _discard_partial_output(out_dir: Path, doc_stem: str) -> None:
+        """Remove what a stopped MinerU process left under ``out_dir``."""
+        shutil.rmtree(out_dir / doc_stem, ignore_errors=True)
+        try:
+            out_dir.rmdir()
+        except OSError:
+            pass
+
     @staticmethod
     def _collect_other_files(
         output_dir: Path, markdown_path: Path, images_dir: Optional[Path]
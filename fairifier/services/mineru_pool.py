@@ -0,0 +1,340 @@
+"""Page-range parallel MinerU conversion.
+
+:meth:`MinerUClient.convert_document` runs one MinerU process per document, so
+a 200-page supplementary PDF converts serially under a single timeout. With
+``MINERU_PAGE_CHUNK_SIZE`` set, large PDFs are instead:
+
+1. split with pypdf into page ranges (``{stem}__p0001-0020.pdf``, ...);
+2. converted by a bounded pool of MinerU processes, one per range. Each range
+   is cached in the shared MinerU cache under a key derived from the source
+   SHA-256 and the range, so a re-run with a warm cache only converts ranges
+   it has not seen before;
+3. merged into the usual ``{output}/{stem}/{parse_dir}/{stem}.md`` layout. Image
+   files get a ``p0001_`` range prefix (references are rewritten to match), and
+   ``page_idx`` values in ``content_list`` / ``content_list_v2`` are shifted by
+   the range's first page.
+
+``*_middle.json`` and ``*_model.json`` stay per range and are not merged.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import logging
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .mineru_paths import discover_structured_artifacts, find_markdown_in_tree, load_content_list_v2
+
+if TYPE_CHECKING:
+    from .mineru_client import MinerUClient, MinerUConversionResult
+
+logger = logging.getLogger(__name__)
+
+_IMAGE_REF_RE = re.compile(r"(\]\(|src=[\"'])images/")
+_CONTENT_LISTS = ("content_list_v2", "content_list")
+
+
+def pdf_page_count(path: Path) -> Optional[int]:
+    """Number of pages in ``path`` (``None`` if pypdf is missing or the PDF is unreadable)."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        logger.debug("pypdf not installed; page-range MinerU conversion disabled")
+        return None
+    try:
+        return len(PdfReader(str(path)).pages)
+    except Exception as exc:
+        logger.debug("Could not count pages of %s: %s", path, exc)
+        return None
+
+
+def plan_page_ranges(page_count: int, chunk_pages: int) -> List[Tuple[int, int]]:
+    """Half-open ``(start, end)`` 0-based page ranges of at most ``chunk_pages`` pages."""
+    chunk_pages = max(int(chunk_pages), 1)
+    return [(start, min(start + chunk_pages, page_count)) for start in range(0, page_count, chunk_pages)]
+
+
+def split_pdf(src: Path, ranges: List[Tuple[int, int]], out_dir: Path, stem: str) -> List[Path]:
+    """Write one PDF per page range into ``out_dir``; returns their paths in order."""
+    from pypdf import PdfReader, PdfWriter
+
+    reader = PdfReader(str(src))
+    paths: List[Path] = []
+    for start, end in ranges:
+        writer = PdfWriter()
+        for index in range(start, end):
+            writer.add_page(reader.pages[index])
+        path = out_dir / f"{range_stem(stem, start, end)}.pdf"
+        with open(path, "wb") as handle:
+            writer.write(handle)
+        paths.append(path)
+    return paths
+
+
+def range_stem(stem: str, start: int, end: int) -> str:
+    return f"{stem}__p{start + 1:04d}-{end:04d}"
+
+
+def range_cache_key(source_sha256: str, start: int, end: int, backend: str) -> str:
+    """Shared-cache digest for one converted page range."""
+    return hashlib.sha256(f"{source_sha256}:pages:{start}-{end}:{backend}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _RangeOutput:
+    start: int
+    end: int
+    markdown_path: Path
+    images_dir: Optional[Path]
+    artifacts: Dict[str, Path]
+    cache_hit: bool = False
+
+
+def _locate_range_output(root: Path, stem: str, start: int, end: int, cache_hit: bool) -> Optional[_RangeOutput]:
+    located = find_markdown_in_tree(root, stem)
+    if not located:
+        return None
+    markdown_path, images_dir = located
+    return _RangeOutput(
+        start=start,
+        end=end,
+        markdown_path=markdown_path,
+        images_dir=images_dir,
+        # Cached trees keep the stem of the upload that filled the cache.
+        artifacts=discover_structured_artifacts(markdown_path.parent, markdown_path.stem),
+        cache_hit=cache_hit,
+    )
+
+
+def _shift_pages(value: Any, offset: int, image_prefix: str) -> Any:
+    """Copy of a content-list structure with page indexes and image paths rebased."""
+    if isinstance(value, list):
+        return [_shift_pages(item, offset, image_prefix) for item in value]
+    if not isinstance(value, dict):
+        return value
+    shifted: Dict[str, Any] = {}
+    for key, item in value.items():
+        if key == "page_idx" and isinstance(item, int):
+            shifted[key] = item + offset
+        elif isinstance(item, str) and item.startswith("images/"):
+            shifted[key] = f"images/{image_prefix}{item[len('images/'):]}"
+        else:
+            shifted[key] = _shift_pages(item, offset, image_prefix)
+    return shifted
+
+
+def _merge_content_lists(parts: List[Any]) -> Any:
+    """Concatenate per-range content lists (flat block lists or per-page lists)."""
+    if all(isinstance(part, list) for part in parts):
+        return [item for part in parts for item in part]
+    merged: Dict[str, Any] = {}
+    for part in parts:
+        if not isinstance(part, dict):
+            continue
+        for key, item in part.items():
+            if isinstance(item, list):
+                merged.setdefault(key, []).extend(item)
+            else:
+                merged.setdefault(key, item)
+    return merged
+
+
+def merge_range_outputs(
+    outputs: List[_RangeOutput],
+    out_dir: Path,
+    stem: str,
+    *,
+    input_path: Optional[Path] = None,
+    structured_output_enabled: bool = True,
+) -> "MinerUConversionResult":
+    """Merge converted page ranges into ``out_dir/{stem}/{parse_dir}/``."""
+    from .mineru_client import MinerUConversionResult
+
+    outputs = sorted(outputs, key=lambda output: output.start)
+    parse_name = outputs[0].markdown_path.parent.name if outputs else "vlm"
+    parse_dir = out_dir / stem / parse_name
+    if parse_dir.exists():
+        shutil.rmtree(parse_dir)
+    images_dir = parse_dir / "images"
+    images_dir.mkdir(parents=True)
+
+    sections: List[str] = []
+    content_parts: Dict[str, List[Any]] = {name: [] for name in _CONTENT_LISTS}
+    for output in outputs:
+        prefix = f"p{output.start + 1:04d}_"
+        try:
+            text = output.markdown_path.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            text = output.markdown_path.read_text(encoding="utf-8", errors="ignore")
+        sections.append(_IMAGE_REF_RE.sub(lambda m: f"{m.group(1)}images/{prefix}", text).strip())
+        if output.images_dir is not None:
+            for image in sorted(output.images_dir.iterdir()):
+                if image.is_file():
+                    shutil.move(str(image), str(images_dir / f"{prefix}{image.name}"))
+        for name in _CONTENT_LISTS:
+            path = output.artifacts.get(name)
+            if path is None:
+                continue
+            try:
+                raw = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as exc:
+                logger.warning("Skipping unreadable %s for pages %d-%d: %s", name, output.start + 1, output.end, exc)
+                continue
+            content_parts[name].append(_shift_pages(raw, output.start, prefix))
+
+    markdown_path = parse_dir / f"{stem}.md"
+    markdown_text = "\n\n".join(section for section in sections if section) + "\n"
+    markdown_path.write_text(markdown_text, encoding="utf-8")
+
+    written: Dict[str, Path] = {}
+    for name, parts in content_parts.items():
+        if not parts:
+            continue
+        path = parse_dir / f"{stem}_{name}.json"
+        path.write_text(json.dumps(_merge_content_lists(parts), ensure_ascii=False), encoding="utf-8")
+        written[name] = path
+
+    structured_blocks: List[Dict[str, Any]] = []
+    if structured_output_enabled and "content_list_v2" in written:
+        structured_blocks = load_content_list_v2(written["content_list_v2"])
+
+    return MinerUConversionResult(
+        input_path=input_path or out_dir,
+        output_dir=out_dir,
+        markdown_path=markdown_path,
+        markdown_text=markdown_text,
+        images_dir=images_dir if any(images_dir.iterdir()) else None,
+        parse_dir=parse_dir,
+        content_list_v2_path=written.get("content_list_v2"),
+        content_list_path=written.get("content_list"),
+        structured_blocks=structured_blocks,
+    )
+
+
+def convert_in_page_ranges(
+    client: "MinerUClient",
+    src_path: Path,
+    out_dir: Path,
+    page_count: int,
+) -> "MinerUConversionResult":
+    """Convert ``src_path`` range by range with a bounded MinerU process pool.
+
+    Raises:
+        MinerUConversionError: When any page range fails to convert.
+    """
+    from . import mineru_cache
+    from .mineru_client import MinerUCancelledError, MinerUConversionError
+
+    stem = src_path.stem
+    ranges = plan_page_ranges(page_count, client.page_chunk_size)
+    cache_root = client.chunk_cache_root
+    source_sha256 = mineru_cache.sha256_file(src_path) if cache_root is not None else None
+    logger.info(
+        "MinerU page-range conversion: %s (%d pages) in %d ranges, up to %d workers",
+        src_path.name,
+        page_count,
+        len(ranges),
+        client.page_chunk_workers,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="mineru_ranges_") as work:
+        work_dir = Path(work)
+        outputs: List[_RangeOutput] = []
+        pending: List[Tuple[int, int]] = []
+        for start, end in ranges:
+            sub_stem = range_stem(stem, start, end)
+            hit = None
+            if source_sha256 is not None:
+                key = range_cache_key(source_sha256, start, end, client.backend)
+                hit = mineru_cache.try_get_cached_mineru_tree(
+                    cache_root,
+                    key,
+                    work_dir,
+                    sub_stem,
+                    materialize=client.chunk_cache_materialize,
+                )
+            located = _locate_range_output(hit, sub_stem, start, end, True) if hit else None
+            if located is not None:
+                outputs.append(located)
+            else:
+                pending.append((start, end))
+
+        def _convert(start: int, end: int, range_pdf: Path) -> _RangeOutput:
+            range_out = work_dir / f"mineru_{range_pdf.stem}"
+            result = client.convert_single(range_pdf, range_out)
+            if source_sha256 is not None:
+                try:
+                    mineru_cache.store_mineru_output_after_success(
+                        cache_root,
+                        range_cache_key(source_sha256, start, end, client.backend),
+                        range_out,
+                        max_bytes=client.chunk_cache_max_bytes,
+                    )
+                except OSError as exc:
+                    logger.warning("MinerU range cache store failed: %s", exc)
+            return _RangeOutput(
+                start=start,
+                end=end,
+                markdown_path=result.markdown_path,
+                images_dir=result.images_dir,
+                artifacts=discover_structured_artifacts(result.markdown_path.parent, result.markdown_path.stem),
+            )
+
+        errors: List[str] = []
+        cancelled = False
+        if pending:
+            range_pdfs = split_pdf(src_path, pending, work_dir, stem)
+            workers = max(1, min(int(client.page_chunk_workers), len(pending)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mineru-range") as pool:
+                # Each range runs in a copy of this context so it sees the bound
+                # run (stop flag, progress listeners).
+                futures = [
+                    pool.submit(contextvars.copy_context().run, _convert, start, end, pdf)
+                    for (start, end), pdf in zip(pending, range_pdfs)
+                ]
+                for (start, end), future in zip(pending, futures):
+                    try:
+                        outputs.append(future.result())
+                    except MinerUCancelledError:
+                        cancelled = True
+                    except Exception as exc:
+                        errors.append(f"pages {start + 1}-{end}: {exc}")
+        if cancelled:
+            raise MinerUCancelledError(f"MinerU conversion of {src_path.name} was cancelled.")
+        if errors:
+            raise MinerUConversionError(
+                f"MinerU failed on {len(errors)}/{len(ranges)} page ranges: " + "; ".join(errors[:3])
+            )
+
+        result = merge_range_outputs(
+            outputs,
+            out_dir,
+            stem,
+            input_path=src_path,
+            structured_output_enabled=client.structured_output_enabled,
+        )
+    logger.info(
+        "MinerU page-range conversion done: %d ranges (%d from cache) → %s",
+        len(ranges),
+        len(ranges) - len(pending),
+        result.markdown_path,
+    )
+    return result
+
+
+__all__ = [
+    "convert_in_page_ranges",
+    "merge_range_outputs",
+    "pdf_page_count",
+    "plan_page_ranges",
+    "range_cache_key",
+    "split_pdf",
+]
@@ -0,0 +1,248 @@
+"""Cancellable MinerU subprocess with streamed progress.
+
+:meth:`MinerUClient.convert_single` used a blocking ``subprocess.run`` with a
+single 30-minute timeout. A web run could not be stopped during conversion,
+page progress never reached the SSE stream, and a hung MinerU held a worker
+thread until the timeout expired. :func:`run_mineru_process` instead:
+
+* starts MinerU with ``asyncio.create_subprocess_exec`` in its own session,
+  so MinerU and every worker it forks share one process group;
+* reads stdout/stderr incrementally (tqdm redraws with ``\\r``) and turns
+  progress-bar lines such as ``Processing pages:  45%|###  | 9/20`` into
+  throttled progress callbacks;
+* polls a cancel callback (the run's stop flag), a total deadline and an
+  idle-output watchdog. When one of them fires, it sends SIGTERM to the whole
+  process group, then SIGKILL after a grace period.
+
+Callers that are not async use :func:`run_mineru_process_blocking`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import signal
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+_PROGRESS_RE = re.compile(
+    r"(?:(?P<step>[^|\r\n]*?):\s*)?(?P<percent>\d{1,3})%\|[^|]*\|\s*(?P<current>\d+)/(?P<total>\d+)"
+)
+_TAIL_LINES = 400
+
+
+@dataclass
+class MinerUProcessResult:
+    """Outcome of one MinerU subprocess run."""
+
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    # completed | cancelled | timeout | idle_timeout
+    outcome: str = "completed"
+    elapsed_seconds: float = 0.0
+
+    @property
+    def completed(self) -> bool:
+        return self.outcome == "completed"
+
+
+def parse_progress_line(line: str) -> Optional[Dict[str, Any]]:
+    """``{"step", "current", "total", "percent"}`` for a tqdm line, else ``None``."""
+    match = _PROGRESS_RE.search(line)
+    if not match:
+        return None
+    total = int(match.group("total"))
+    if total <= 0:
+        return None
+    return {
+        "step": (match.group("step") or "").strip(),
+        "current": int(match.group("current")),
+        "total": total,
+        "percent": min(int(match.group("percent")), 100),
+    }
+
+
+class _OutputMonitor:
+    """Line splitting, bounded tails and throttled progress for both streams."""
+
+    def __init__(self, on_progress: Optional[ProgressCallback], progress_interval: float) -> None:
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.last_output = time.monotonic()
+        self.tails: Dict[str, Deque[str]] = {
+            "stdout": deque(maxlen=_TAIL_LINES),
+            "stderr": deque(maxlen=_TAIL_LINES),
+        }
+        self._last_progress_key: Optional[tuple] = None
+        self._last_progress_at = 0.0
+
+    def feed_line(self, name: str, line: str) -> None:
+        line = line.strip()
+        if not line:
+            return
+        progress = parse_progress_line(line)
+        if progress is None:
+            self.tails[name].append(line)
+            return
+        self._emit(progress)
+
+    def _emit(self, progress: Dict[str, Any]) -> None:
+        if self.on_progress is None:
+            return
+        key = (progress["step"], progress["current"], progress["total"])
+        if key == self._last_progress_key:
+            return
+        now = time.monotonic()
+        finished = progress["current"] >= progress["total"]
+        if not finished and now - self._last_progress_at < self.progress_interval:
+            return
+        self._last_progress_key = key
+        self._last_progress_at = now
+        try:
+            self.on_progress(progress)
+        except Exception as exc:  # pragma: no cover - callbacks must not kill the run
+            logger.debug("MinerU progress callback failed: %s", exc)
+
+    async def pump(self, name: str, stream: Optional[asyncio.StreamReader]) -> None:
+        if stream is None:
+            return
+        pending = ""
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                break
+            self.last_output = time.monotonic()
+            pending += chunk.decode("utf-8", errors="replace")
+            *lines, pending = re.split(r"[\r\n]", pending)
+            for line in lines:
+                self.feed_line(name, line)
+        self.feed_line(name, pending)
+
+
+def _signal_group(process: asyncio.subprocess.Process, sig: int) -> None:
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, sig)
+        elif sig == signal.SIGTERM:
+            process.terminate()
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _terminate_group(process: asyncio.subprocess.Process, grace_seconds: float) -> None:
+    """SIGTERM the process group, then SIGKILL whatever is left after ``grace_seconds``."""
+    _signal_group(process, signal.SIGTERM)
+    try:
+        await asyncio.wait_for(process.wait(), timeout=grace_seconds)
+    except asyncio.TimeoutError:
+        pass
+    # Workers forked by MinerU may outlive the leader; the group id stays valid
+    # while any member is alive.
+    _signal_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+    await process.wait()
+
+
+async def run_mineru_process(
+    cmd: Sequence[str],
+    *,
+    timeout_seconds: float = 0,
+    idle_timeout_seconds: float = 0,
+    should_cancel: Optional[Callable[[], bool]] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    poll_interval: float = 0.5,
+    kill_grace_seconds: float = 5.0,
+    progress_interval: float = 1.0,
+) -> MinerUProcessResult:
+    """Run ``cmd`` and watch it until it exits, is cancelled, times out or goes idle.
+
+    ``timeout_seconds`` and ``idle_timeout_seconds`` of 0 disable the
+    corresponding limit. Raises ``FileNotFoundError`` if the executable is
+    missing, like ``subprocess.run``.
+    """
+    if should_cancel is not None and should_cancel():
+        return MinerUProcessResult(returncode=None, stdout="", stderr="", outcome="cancelled")
+
+    started = time.monotonic()
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=os.name == "posix",
+    )
+    monitor = _OutputMonitor(on_progress, progress_interval)
+    readers: List[asyncio.Task] = [
+        asyncio.ensure_future(monitor.pump("stdout", process.stdout)),
+        asyncio.ensure_future(monitor.pump("stderr", process.stderr)),
+    ]
+    waiter = asyncio.ensure_future(process.wait())
+    outcome = "completed"
+    try:
+        while True:
+            done, _ = await asyncio.wait({waiter}, timeout=poll_interval)
+            if done:
+                break
+            now = time.monotonic()
+            if should_cancel is not None and should_cancel():
+                outcome = "cancelled"
+            elif timeout_seconds and now - started > timeout_seconds:
+                outcome = "timeout"
+            elif idle_timeout_seconds and now - monitor.last_output > idle_timeout_seconds:
+                outcome = "idle_timeout"
+            if outcome != "completed":
+                logger.warning("Stopping MinerU (pid %s): %s", process.pid, outcome)
+                await _terminate_group(process, kill_grace_seconds)
+                break
+    except asyncio.CancelledError:
+        await asyncio.shield(_terminate_group(process, kill_grace_seconds))
+        raise
+    finally:
+        # Readers hit EOF once every process holding the pipes is gone; a
+        # detached grandchild could keep them open, so do not wait forever.
+        _, still_reading = await asyncio.wait(readers, timeout=kill_grace_seconds)
+        for task in still_reading:
+            task.cancel()
+        if not waiter.done():
+            waiter.cancel()
+
+    return MinerUProcessResult(
+        returncode=process.returncode,
+        stdout="\n".join(monitor.tails["stdout"]),
+        stderr="\n".join(monitor.tails["stderr"]),
+        outcome=outcome,
+        elapsed_seconds=round(time.monotonic() - started, 2),
+    )
+
+
+def run_mineru_process_blocking(cmd: Sequence[str], **kwargs: Any) -> MinerUProcessResult:
+    """Synchronous :func:`run_mineru_process`, usable from inside a running event loop.
+
+    Workflow nodes are coroutines that call the MinerU tool synchronously, so
+    when this thread already runs a loop the subprocess gets its own loop on a
+    helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_mineru_process(cmd, **kwargs))
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mineru-process") as pool:
+        return pool.submit(asyncio.run, run_mineru_process(cmd, **kwargs)).result()
+
+
+__all__ = [
+    "MinerUProcessResult",
+    "parse_progress_line",
+    "run_mineru_process",
+    "run_mineru_process_blocking",
+]
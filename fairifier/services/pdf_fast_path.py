@@ -0,0 +1,303 @@
+"""Fast-path text extraction for born-digital PDFs.
+
+Every PDF used to go through MinerU, including born-digital journal papers
+whose embedded text layer is already usable, and on CPU-only hosts the
+layout models take minutes per paper. Before MinerU runs, the document reader
+now:
+
+1. samples up to ``pdf_fast_path_sample_pages`` evenly spaced pages with pypdf
+   and classifies each one from its text density, font resources, image
+   XObjects and the share of printable word characters (:func:`assess_pdf`);
+2. when the share of text pages among the decisive ones (text, scanned,
+   garbled) reaches ``pdf_fast_path_min_confidence``, extracts every page in a
+   process pool and turns lines set noticeably larger than the body font into
+   Markdown headings (:func:`extract_pdf_markdown`);
+3. otherwise hands the PDF to MinerU as before.
+
+The decision is returned as a route dict (``route``, ``confidence``,
+``page_kinds``, ...) and recorded in the source manifest. The fast path only
+produces Markdown text; images and ``content_list_v2`` blocks remain MinerU-only.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import Counter
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .process_pool import process_pool
+
+logger = logging.getLogger(__name__)
+
+MIN_TEXT_CHARS_PER_PAGE = 200
+MIN_WORD_CHAR_RATIO = 0.85
+HEADING_SIZE_RATIO = 1.15
+MAX_HEADING_CHARS = 150
+# Pages per pool task; a PDF that fits in one task is extracted in-process.
+_PAGES_PER_TASK = 8
+_WORD_PUNCTUATION = set(".,;:!?()[]{}-–—%/'\"+=<>°±×·•*&#@_")
+
+PageLines = List[Tuple[str, float]]
+
+
+@dataclass
+class PdfTextLayerAssessment:
+    """Sampled verdict on whether a PDF's own text layer can replace MinerU."""
+
+    page_count: int
+    sampled_pages: List[int] = field(default_factory=list)
+    page_kinds: Dict[str, int] = field(default_factory=dict)
+    confidence: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["sampled_pages"] = len(self.sampled_pages)
+        if data["error"] is None:
+            data.pop("error")
+        return data
+
+
+def _sample_indexes(page_count: int, sample_pages: int) -> List[int]:
+    count = max(1, min(int(sample_pages), page_count))
+    if count >= page_count:
+        return list(range(page_count))
+    step = page_count / count
+    return sorted({int(step * i + step / 2) for i in range(count)})
+
+
+def _word_char_ratio(text: str) -> float:
+    stripped = [ch for ch in text if not ch.isspace()]
+    if not stripped:
+        return 0.0
+    good = sum(1 for ch in stripped if ch.isalnum() or ch in _WORD_PUNCTUATION)
+    return good / len(stripped)
+
+
+def _resource_counts(page: Any) -> Tuple[int, int]:
+    """``(font_count, image_xobject_count)`` from the page's own resources."""
+    try:
+        resources = page.get("/Resources")
+        resources = resources.get_object() if resources is not None else {}
+        fonts = resources.get("/Font")
+        font_count = len(fonts.get_object()) if fonts is not None else 0
+        xobjects = resources.get("/XObject")
+        image_count = 0
+        if xobjects is not None:
+            xobjects = xobjects.get_object()
+            for name in xobjects:
+                if xobjects[name].get_object().get("/Subtype") == "/Image":
+                    image_count += 1
+        return font_count, image_count
+    except Exception:
+        return 0, 0
+
+
+def classify_page(page: Any) -> Tuple[str, Dict[str, Any]]:
+    """Kind of one page: ``text``, ``scanned``, ``garbled`` or ``sparse``."""
+    text = page.extract_text() or ""
+    chars = len(text.strip())
+    font_count, image_count = _resource_counts(page)
+    ratio = _word_char_ratio(text)
+    if chars >= MIN_TEXT_CHARS_PER_PAGE:
+        kind = "text" if font_count and ratio >= MIN_WORD_CHAR_RATIO else "garbled"
+    elif image_count:
+        kind = "scanned"
+    else:
+        kind = "sparse"
+    return kind, {"chars": chars, "fonts": font_count, "images": image_count, "word_ratio": round(ratio, 3)}
+
+
+def assess_pdf(path: Path, sample_pages: int = 8) -> PdfTextLayerAssessment:
+    """Sample pages of ``path`` and score how usable its text layer is (0-1).
+
+    Sparse pages (blank, vector figures) are ignored; the confidence is the
+    share of text pages among text, scanned and garbled pages, and 0 when
+    fewer than half of the sampled pages carry text.
+    """
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(str(path))
+        page_count = len(reader.pages)
+    except Exception as exc:
+        return PdfTextLayerAssessment(page_count=0, error=f"{type(exc).__name__}: {exc}")
+    assessment = PdfTextLayerAssessment(page_count=page_count)
+    if not page_count:
+        return assessment
+    kinds: Counter = Counter()
+    for index in _sample_indexes(page_count, sample_pages):
+        try:
+            kind, _ = classify_page(reader.pages[index])
+        except Exception as exc:
+            logger.debug("Could not classify page %d of %s: %s", index + 1, path, exc)
+            kind = "garbled"
+        kinds[kind] += 1
+        assessment.sampled_pages.append(index)
+    decisive = kinds["text"] + kinds["scanned"] + kinds["garbled"]
+    sampled = len(assessment.sampled_pages)
+    if decisive and kinds["text"] * 2 >= sampled:
+        assessment.confidence = round(kinds["text"] / decisive, 3)
+    assessment.page_kinds = dict(kinds)
+    return assessment
+
+
+def _page_lines(page: Any) -> PageLines:
+    """Text lines of one page with the largest effective font size on each line."""
+    lines: PageLines = []
+    parts: List[str] = []
+    size = 0.0
+
+    def flush() -> None:
+        nonlocal parts, size
+        line = " ".join("".join(parts).split())
+        if line:
+            lines.append((line, round(size, 1)))
+        parts, size = [], 0.0
+
+    def visit(text: str, cm: List[float], tm: List[float], font: Any, font_size: float) -> None:
+        nonlocal size
+        pieces = text.split("\n")
+        for position, piece in enumerate(pieces):
+            if position:
+                flush()
+            if not piece:
+                continue
+            parts.append(piece)
+            if font and piece.strip():
+                scale = (math.hypot(tm[2], tm[3]) or 1.0) * (math.hypot(cm[2], cm[3]) or 1.0)
+                size = max(size, float(font_size) * scale)
+
+    page.extract_text(visitor_text=visit)
+    flush()
+    return lines
+
+
+def _extract_page_range(path: str, start: int, end: int) -> List[PageLines]:
+    """Process-pool entry point: lines for pages ``start`` to ``end`` (exclusive)."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    return [_page_lines(reader.pages[index]) for index in range(start, end)]
+
+
+def _body_font_size(pages: List[PageLines]) -> float:
+    weights: Counter = Counter()
+    for lines in pages:
+        for text, size in lines:
+            weights[size] += len(text)
+    return weights.most_common(1)[0][0] if weights else 0.0
+
+
+def render_markdown(pages: List[PageLines]) -> Tuple[str, int]:
+    """Markdown for extracted pages; returns ``(markdown, heading_count)``.
+
+    Short lines at least ``HEADING_SIZE_RATIO`` times the body font size become
+    headings. The largest size maps to ``#``, the next to ``##`` and smaller
+    ones to ``###``. Consecutive heading lines of one size are joined, since
+    they are usually a wrapped title.
+    """
+    body = _body_font_size(pages)
+    heading_sizes = sorted(
+        {
+            size
+            for lines in pages
+            for text, size in lines
+            if body and size >= body * HEADING_SIZE_RATIO and len(text) <= MAX_HEADING_CHARS
+        },
+        reverse=True,
+    )
+    levels = {size: "#" * min(rank + 1, 3) for rank, size in enumerate(heading_sizes)}
+
+    def heading_size(line: Tuple[str, float]) -> Optional[float]:
+        text, size = line
+        return size if size in levels and len(text) <= MAX_HEADING_CHARS else None
+
+    blocks: List[str] = []
+    headings = 0
+    for lines in pages:
+        for size, group in groupby(lines, key=heading_size):
+            texts = [text for text, _ in group]
+            if size is None:
+                blocks.append("\n".join(texts))
+            else:
+                blocks.append(f"{levels[size]} {' '.join(texts)}")
+                headings += 1
+    return "\n\n".join(blocks) + "\n", headings
+
+
+def extract_pdf_markdown(path: Path, page_count: int, workers: int = 4) -> Tuple[str, int]:
+    """Extract all pages of ``path`` page-parallel; returns ``(markdown, heading_count)``."""
+    tasks = [
+        (start, min(start + _PAGES_PER_TASK, page_count))
+        for start in range(0, page_count, _PAGES_PER_TASK)
+    ]
+    workers = max(0, min(int(workers), len(tasks)))
+    pages: List[PageLines] = []
+    if workers > 1:
+        try:
+            with process_pool(workers) as pool:
+                futures = [pool.submit(_extract_page_range, str(path), start, end) for start, end in tasks]
+                for future in futures:
+                    pages.extend(future.result())
+            return render_markdown(pages)
+        except (BrokenProcessPool, OSError) as exc:
+            logger.warning("PDF fast-path pool unavailable (%s); extracting sequentially.", exc)
+            pages = []
+    for start, end in tasks:
+        pages.extend(_extract_page_range(str(path), start, end))
+    return render_markdown(pages)
+
+
+def route_pdf(
+    path: Path,
+    *,
+    min_confidence: float = 0.9,
+    sample_pages: int = 8,
+    workers: int = 4,
+) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Choose between the fast path and MinerU for ``path``.
+
+    Returns ``(markdown, route)``. ``markdown`` is ``None`` when the PDF should
+    go to MinerU; ``route`` records the decision for the source manifest.
+    """
+    started = time.perf_counter()
+    assessment = assess_pdf(path, sample_pages=sample_pages)
+    route: Dict[str, Any] = {
+        "route": "mineru",
+        "min_confidence": min_confidence,
+        **assessment.to_dict(),
+    }
+    if assessment.error or not assessment.page_count or assessment.confidence < min_confidence:
+        route["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return None, route
+
+    try:
+        markdown, heading_count = extract_pdf_markdown(path, assessment.page_count, workers=workers)
+    except Exception as exc:
+        logger.warning("PDF fast-path extraction failed for %s: %s", path, exc)
+        route["error"] = f"{type(exc).__name__}: {exc}"
+        route["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return None, route
+    route.update(
+        route="fast_path",
+        heading_count=heading_count,
+        elapsed_seconds=round(time.perf_counter() - started, 3),
+    )
+    return markdown, route
+
+
+__all__ = [
+    "PdfTextLayerAssessment",
+    "assess_pdf",
+    "classify_page",
+    "extract_pdf_markdown",
+    "render_markdown",
+    "route_pdf",
+]
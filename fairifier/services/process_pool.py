@@ -0,0 +1,34 @@
+"""Process pools that are safe to start from a multi-threaded server.
+
+The API process runs uvicorn, the workflow runner, mem0 write queues and
+other background threads. ``ProcessPoolExecutor`` defaults to ``fork`` on
+Linux, which copies only the calling thread: a lock held by any other thread
+at fork time (logging, SQLite, HTTP clients) stays locked forever in the
+child and the worker deadlocks. Pools created through :func:`process_pool`
+start their workers from a clean interpreter instead (``forkserver`` where
+available, otherwise ``spawn``). Worker entry points, initializers and their
+arguments must therefore be importable module-level callables and picklable
+values.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any
+
+
+def process_pool_context() -> BaseContext:
+    """Start-method context for worker pools: ``forkserver`` if supported, else ``spawn``."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def process_pool(max_workers: int, **kwargs: Any) -> ProcessPoolExecutor:
+    """``ProcessPoolExecutor`` whose workers never inherit the parent's threads."""
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=process_pool_context(), **kwargs)
+
+
+__all__ = ["process_pool", "process_pool_context"]
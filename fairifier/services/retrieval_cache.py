@@ -1,11 +1,202 @@
-"""Helpers for per-run retrieval cache state."""
+"""Two-tier cache for retrieval tool results.
+
+Tool results (FAIR-DS package details, science API payloads, table searches)
+are cached in two tiers that share the keys built by :func:`make_cache_key`:
+
+* a **per-run tier** holding frozen, read-only values that are returned
+  without copying. A value stays available for the whole run;
+* a **process-level LRU** shared across runs, bounded by the estimated JSON
+  size of its entries (``FAIRIFIER_RETRIEVAL_CACHE_MAX_MB``) and by age
+  (``FAIRIFIER_RETRIEVAL_CACHE_TTL_SECONDS``). Only successful results are
+  shared; failures stay in the run tier.
+
+The bucket dict stored in ``FAIRifierState["retrieval_cache"]`` carries only
+keys (``key -> True``) plus a run token, so checkpoints stay small. After a
+resume in a new process, marked keys simply miss and are recomputed.
+
+Cached values are :class:`FrozenDict` / :class:`FrozenList` trees. They
+behave like ``dict`` / ``list`` for reading and JSON encoding, raise
+``TypeError`` on mutation, and ``copy.deepcopy`` or pickle to plain mutable
+containers.
+"""
 
 from __future__ import annotations
 
 import copy
 import hashlib
 import json
-from typing import Any, Dict, MutableMapping
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+RUN_TOKEN_KEY = "__run__"
+_MAX_RUN_TIERS = 32
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"cached {type(self).__name__} is read-only; copy it before mutating")
+
+
+class FrozenDict(dict):
+    """Read-only ``dict`` used for cached values."""
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only ``list`` used for cached values."""
+
+    __setitem__ = __delitem__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+    __iadd__ = __imul__ = _readonly
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only deep view of JSON-like ``value`` (already frozen parts are reused)."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        frozen = [freeze(item) for item in value]
+        return FrozenList(frozen) if isinstance(value, list) else tuple(frozen)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _estimate_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class ProcessLRUCache:
+    """Thread-safe LRU bounded by total estimated bytes and entry age."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: Optional[float] = None) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.counters = _Counters()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds is not None:
+                if time.monotonic() - entry[2] > self.ttl_seconds:
+                    self._drop(key)
+                    self.counters.evictions += 1
+                    entry = None
+            if entry is None:
+                self.counters.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counters.hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any, size: int) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size, time.monotonic())
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.counters.evictions += 1
+
+    def _drop(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.counters.as_dict(),
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_lock = threading.Lock()
+_run_tiers: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_run_counters = _Counters()
+_process_cache: Optional[ProcessLRUCache] = None
+
+
+def _get_process_cache() -> ProcessLRUCache:
+    global _process_cache
+    from ..config import config
+
+    with _lock:
+        if _process_cache is None:
+            _process_cache = ProcessLRUCache(
+                max_bytes=int(config.retrieval_cache_max_mb) * 1024 * 1024,
+                ttl_seconds=config.retrieval_cache_ttl_seconds,
+            )
+        return _process_cache
+
+
+def _run_tier(cache_bucket: Dict[str, Any]) -> Dict[str, Any]:
+    token = cache_bucket.get(RUN_TOKEN_KEY)
+    if not isinstance(token, str):
+        token = uuid.uuid4().hex
+        cache_bucket[RUN_TOKEN_KEY] = token
+    with _lock:
+        tier = _run_tiers.get(token)
+        if tier is None:
+            tier = {}
+            _run_tiers[token] = tier
+            while len(_run_tiers) > _MAX_RUN_TIERS:
+                _, evicted = _run_tiers.popitem(last=False)
+                _run_counters.evictions += len(evicted)
+        else:
+            _run_tiers.move_to_end(token)
+        return tier
 
 
 def ensure_retrieval_cache(state: MutableMapping[str, Any]) -> Dict[str, Any]:
@@ -38,13 +229,63 @@ def make_cache_key(namespace: str, payload: Dict[str, Any]) -> str:
 
 
 def get_cached_value(cache_bucket: Dict[str, Any], cache_key: str) -> Any:
-    """Return a defensive copy of a cached value if present."""
-    if cache_key not in cache_bucket:
+    """Return the frozen cached value for ``cache_key`` (run tier, then process LRU)."""
+    tier = _run_tier(cache_bucket)
+    value = tier.get(cache_key)
+    if value is not None:
+        _run_counters.hits += 1
+        return value
+    _run_counters.misses += 1
+
+    marker = cache_bucket.get(cache_key)
+    if marker is not None and marker is not True:
+        # Bucket restored from a checkpoint written before keys-only buckets.
+        value = freeze(marker)
+    else:
+        value = _get_process_cache().get(cache_key)
+    if value is None:
         return None
-    return copy.deepcopy(cache_bucket[cache_key])
+    tier[cache_key] = value
+    cache_bucket[cache_key] = True
+    return value
+
+
+def store_cached_value(
+    cache_bucket: Dict[str, Any],
+    cache_key: str,
+    value: Any,
+    *,
+    shared: bool = True,
+) -> Any:
+    """Cache ``value`` and return its frozen form.
+
+    ``shared=False`` keeps the value in the run tier only. Callers use it for
+    failures, so one transient error is not replayed to later runs for the
+    whole process TTL.
+    """
+    frozen = freeze(value)
+    _run_tier(cache_bucket)[cache_key] = frozen
+    cache_bucket[cache_key] = True
+    if shared:
+        _get_process_cache().put(cache_key, frozen, _estimate_size(frozen))
+    return frozen
+
+
+def retrieval_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/eviction counters for both tiers."""
+    with _lock:
+        run_stats = {
+            **_run_counters.as_dict(),
+            "runs": len(_run_tiers),
+            "entries": sum(len(tier) for tier in _run_tiers.values()),
+        }
+    return {"run": run_stats, "process": _get_process_cache().stats()}
 
 
-def store_cached_value(cache_bucket: Dict[str, Any], cache_key: str, value: Any) -> Any:
-    """Store and return a defensive copy of the cached value."""
-    cache_bucket[cache_key] = copy.deepcopy(value)
-    return copy.deepcopy(value)
+def reset_retrieval_caches() -> None:
+    """Drop both tiers and their counters (tests, config changes)."""
+    global _process_cache, _run_counters
+    with _lock:
+        _run_tiers.clear()
+        _run_counters = _Counters()
+        _process_cache = None
@@ -0,0 +1,417 @@
+"""Persistent HTTP response cache for the science enrichment tools.
+
+``search_ontology_term``, ``resolve_doi_metadata`` and friends call OLS4,
+Crossref, Europe PMC and OpenAlex. The per-run ``cache_store`` only dedupes
+calls inside one workflow run, so every new run repeated the same GO/EFO
+lookups and DOI resolutions. :class:`ScienceHTTPCache` sits behind that tier:
+
+* responses are stored in SQLite (``science_http_cache_path``) and shared by
+  every process and run. Lookups always read SQLite, so rows written by other
+  processes are seen immediately; only when the database cannot be opened
+  does a bounded in-memory LRU stand in for it;
+* freshness is per host (optionally host + path prefix), e.g. ontology
+  lookups for 30 days and literature searches for a day;
+* failures are cached too, with a short negative TTL, so an API outage is not
+  re-probed by every tool call; a stale success is preferred over an error;
+* the table is pruned when opened and every few hundred writes: expired
+  failures are dropped, expired successes are kept for one more default TTL
+  as stale fallbacks, and the oldest rows beyond ``max_rows`` are evicted;
+* concurrent identical lookups are coalesced into one request;
+* offline mode answers only from the cache (stale entries included) or from a
+  recorded fixture directory, and never touches the network.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS http_responses (
+    cache_key   TEXT PRIMARY KEY,
+    url         TEXT NOT NULL,
+    host        TEXT NOT NULL,
+    ok          INTEGER NOT NULL,
+    payload     TEXT,
+    error       TEXT,
+    fetched_at  REAL NOT NULL,
+    expires_at  REAL NOT NULL
+);
+"""
+
+_PRUNE_EVERY_WRITES = 256
+
+class ScienceCacheError(RuntimeError):
+    """Raised for a cached failure or an offline cache miss."""
+
+
+def parse_host_ttls(spec: str) -> Dict[str, float]:
+    """Parse ``"host[/path]=seconds,..."`` into a rule mapping (bad items are skipped).
+
+    The default rules live in ``config.science_http_cache_host_ttls``.
+    """
+    rules: Dict[str, float] = {}
+    for item in (spec or "").split(","):
+        rule, sep, seconds = item.strip().partition("=")
+        if not sep or not rule.strip():
+            continue
+        try:
+            rules[rule.strip().lower().rstrip("/")] = float(seconds)
+        except ValueError:
+            logger.warning("Ignoring invalid science cache TTL rule %r", item)
+    return rules
+
+
+def request_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Stable key for a GET request (URL plus sorted query parameters)."""
+    normalized = json.dumps(
+        {"url": url, "params": dict(params or {})},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+class ScienceHTTPCache:
+    """SQLite-backed GET/JSON cache with per-host TTLs and request coalescing."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        *,
+        default_ttl_seconds: float = 604800,
+        host_ttls: Optional[Mapping[str, float]] = None,
+        negative_ttl_seconds: float = 300,
+        offline: bool = False,
+        fixtures_dir: Optional[Path] = None,
+        record_fixtures: bool = False,
+        memory_max_entries: int = 2048,
+        max_rows: int = 50000,
+    ) -> None:
+        self.default_ttl_seconds = float(default_ttl_seconds)
+        # ``host[/path-prefix]`` -> seconds; the longest matching rule wins.
+        self.host_ttls = dict(host_ttls or {})
+        self.negative_ttl_seconds = float(negative_ttl_seconds)
+        self.offline = offline
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir is not None else None
+        self.record_fixtures = record_fixtures
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        # Stand-in for SQLite when no database is usable; bounded LRU.
+        self._memory: "OrderedDict[str, Tuple[bool, Any, Optional[str], float]]" = OrderedDict()
+        self.memory_max_entries = max(1, int(memory_max_entries))
+        self.max_rows = max(1, int(max_rows))
+        self._writes_since_prune = 0
+        self._counters = {"hits": 0, "negative_hits": 0, "misses": 0, "coalesced": 0, "stale_served": 0}
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._conn = self._open_db(Path(db_path))
+        if self._conn is not None and not offline:
+            with self._lock:
+                self._prune_locked()
+
+    @staticmethod
+    def _open_db(db_path: Path) -> Optional[sqlite3.Connection]:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute(_CREATE_TABLE)
+            conn.commit()
+            return conn
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(
+                "Science HTTP cache at %s not usable (%s); using memory only",
+                db_path,
+                exc,
+            )
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
+
+    def ttl_for(self, url: str) -> float:
+        """TTL for ``url`` from the longest matching ``host[/path]`` rule."""
+        parts = urlsplit(url)
+        target = f"{parts.netloc.lower()}{parts.path}".rstrip("/")
+        best_rule, best_ttl = "", self.default_ttl_seconds
+        for rule, ttl in self.host_ttls.items():
+            if (target == rule or target.startswith(rule + "/")) and len(rule) > len(best_rule):
+                best_rule, best_ttl = rule, ttl
+        return best_ttl
+
+    # ------------------------------------------------------------------
+    # Entry storage
+    # ------------------------------------------------------------------
+
+    def _read(self, key: str) -> Optional[Tuple[bool, Any, Optional[str], float]]:
+        with self._lock:
+            if self._conn is None:
+                entry = self._memory.get(key)
+                if entry is not None:
+                    self._memory.move_to_end(key)
+                return entry
+            try:
+                row = self._conn.execute(
+                    "SELECT ok, payload, error, expires_at FROM http_responses WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+            except sqlite3.Error as exc:
+                logger.debug("Science HTTP cache read failed: %s", exc)
+                return None
+            if row is None:
+                return None
+            try:
+                payload = json.loads(row[1]) if row[1] is not None else None
+            except ValueError:
+                return None
+            return (bool(row[0]), payload, row[2], float(row[3]))
+
+    def _write(self, key: str, url: str, ok: bool, payload: Any, error: Optional[str], ttl: float) -> None:
+        now = time.time()
+        entry = (ok, payload, error, now + ttl)
+        with self._lock:
+            if self._conn is None:
+                self._memory[key] = entry
+                self._memory.move_to_end(key)
+                while len(self._memory) > self.memory_max_entries:
+                    self._memory.popitem(last=False)
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO http_responses "
+                    "(cache_key, url, host, ok, payload, error, fetched_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        url,
+                        urlsplit(url).netloc.lower(),
+                        int(ok),
+                        json.dumps(payload, ensure_ascii=False) if ok else None,
+                        error,
+                        now,
+                        entry[3],
+                    ),
+                )
+                self._conn.commit()
+            except (sqlite3.Error, TypeError, ValueError) as exc:
+                logger.debug("Science HTTP cache write failed: %s", exc)
+                return
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= _PRUNE_EVERY_WRITES:
+                self._prune_locked()
+
+    def prune(self) -> int:
+        """Drop expired rows and evict the oldest beyond ``max_rows``; returns rows deleted."""
+        with self._lock:
+            return self._prune_locked()
+
+    def _prune_locked(self) -> int:
+        self._writes_since_prune = 0
+        if self._conn is None:
+            return 0
+        now = time.time()
+        try:
+            deleted = self._conn.execute(
+                "DELETE FROM http_responses WHERE (ok = 0 AND expires_at <= ?) OR expires_at <= ?",
+                (now, now - self.default_ttl_seconds),
+            ).rowcount
+            excess = self._conn.execute("SELECT COUNT(*) FROM http_responses").fetchone()[0] - self.max_rows
+            if excess > 0:
+                deleted += self._conn.execute(
+                    "DELETE FROM http_responses WHERE cache_key IN "
+                    "(SELECT cache_key FROM http_responses ORDER BY fetched_at, rowid LIMIT ?)",
+                    (excess,),
+                ).rowcount
+            self._conn.commit()
+        except sqlite3.Error as exc:
+            logger.debug("Science HTTP cache prune failed: %s", exc)
+            return 0
+        if deleted:
+            logger.debug("Science HTTP cache pruned %d rows", deleted)
+        return deleted
+
+    def _fixture_path(self, key: str) -> Optional[Path]:
+        return self.fixtures_dir / f"{key}.json" if self.fixtures_dir is not None else None
+
+    def _read_fixture(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._fixture_path(key)
+        if path is None or not path.is_file():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Unreadable science API fixture %s: %s", path, exc)
+            return None
+
+    def _record_fixture(self, key: str, url: str, params: Optional[Mapping[str, Any]], payload: Any) -> None:
+        path = self._fixture_path(key)
+        if path is None or not self.record_fixtures:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps(
+                    {"url": url, "params": dict(params or {}), "payload": payload},
+                    ensure_ascii=False,
+                    indent=2,
+                ),
+                encoding="utf-8",
+            )
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("Could not record science API fixture %s: %s", path, exc)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get_json(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        fetch: Callable[[], Any],
+    ) -> Any:
+        """Return the JSON body for ``url``/``params``, calling ``fetch`` only on a miss.
+
+        Raises:
+            ScienceCacheError: For a cached failure or an offline miss.
+            Exception: Whatever ``fetch`` raised, when no stale entry can be served.
+        """
+        key = request_key(url, params)
+        entry = self._read(key)
+        if entry is not None and (self.offline or entry[3] > time.time()):
+            return self._serve(entry)
+
+        if self.offline:
+            fixture = self._read_fixture(key)
+            if fixture is not None:
+                if "error" in fixture:
+                    raise ScienceCacheError(str(fixture["error"]))
+                return fixture.get("payload")
+            self._count("misses")
+            raise ScienceCacheError(f"offline: no cached response for {url}")
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = Future()
+                self._inflight[key] = pending
+            else:
+                self._counters["coalesced"] += 1
+        if not leader:
+            return pending.result()
+
+        self._count("misses")
+        try:
+            result = self._fetch_and_store(key, url, params, fetch, stale=entry)
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        else:
+            pending.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _fetch_and_store(
+        self,
+        key: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        fetch: Callable[[], Any],
+        *,
+        stale: Optional[Tuple[bool, Any, Optional[str], float]],
+    ) -> Any:
+        try:
+            payload = fetch()
+        except Exception as exc:
+            if stale is not None and stale[0]:
+                logger.info("Science API request failed (%s); serving stale cache for %s", exc, url)
+                self._count("stale_served")
+                return stale[1]
+            self._write(key, url, False, None, str(exc), self.negative_ttl_seconds)
+            raise
+        self._write(key, url, True, payload, None, self.ttl_for(url))
+        self._record_fixture(key, url, params, payload)
+        return payload
+
+    def _serve(self, entry: Tuple[bool, Any, Optional[str], float]) -> Any:
+        ok, payload, error, _ = entry
+        if ok:
+            self._count("hits")
+            return payload
+        self._count("negative_hits")
+        raise ScienceCacheError(error or "cached failure")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._counters, "memory_entries": len(self._memory), "offline": self.offline}
+
+
+_cache: Optional[ScienceHTTPCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_science_http_cache() -> Optional[ScienceHTTPCache]:
+    """Return the process-wide science HTTP cache (``None`` if disabled)."""
+    global _cache
+    from ..config import config
+
+    if not getattr(config, "science_http_cache_enabled", False):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ScienceHTTPCache(
+                config.science_http_cache_path,
+                default_ttl_seconds=config.science_http_cache_ttl_seconds,
+                host_ttls=parse_host_ttls(config.science_http_cache_host_ttls),
+                negative_ttl_seconds=config.science_http_cache_negative_ttl_seconds,
+                offline=config.science_http_offline,
+                fixtures_dir=config.science_http_fixtures_dir,
+                record_fixtures=config.science_http_record_fixtures,
+                max_rows=config.science_http_cache_max_rows,
+            )
+        return _cache
+
+
+def reset_science_http_cache() -> None:
+    """Close and forget the process-wide science HTTP cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+
+
+__all__ = [
+    "ScienceCacheError",
+    "ScienceHTTPCache",
+    "get_science_http_cache",
+    "parse_host_ttls",
+    "request_key",
+    "reset_science_http_cache",
+]
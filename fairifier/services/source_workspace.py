@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import json
 import re
+import shutil
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..config import config
 
@@ -24,6 +26,8 @@ class SourceRecord:
     source_role: str = "unknown"
     relevance_score: float = 1.0
     tables: List[Dict[str, Any]] = field(default_factory=list)
+    # How the text was obtained, e.g. the PDF fast-path vs MinerU routing decision
+    extraction: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -88,6 +92,131 @@ def _json_safe_value(value: Any) -> Any:
     return str(value)
 
 
+def offset_index_path(source_path: Path) -> Path:
+    """Sidecar char-to-byte offset index for a workspace source file.
+
+    The file is hidden so ``rg``-based workspace tools skip it by default.
+    """
+    source_path = Path(source_path)
+    return source_path.with_name(f".{source_path.name}.offsets.json")
+
+
+def write_offset_index(source_path: Path, text: str, *, stride: Optional[int] = None) -> Optional[Path]:
+    """Record the UTF-8 byte offset of every ``stride``-th character of ``text``.
+
+    ``text`` must be exactly what was written to ``source_path``; the source's
+    size and ``st_mtime_ns`` are recorded so a later rewrite invalidates the
+    index even when the size is unchanged. Text containing
+    ``\r`` is skipped: ``read_text`` translates those newlines, so byte offsets
+    would no longer line up with the character offsets agents see.
+    """
+    step = max(1, int(config.source_offset_index_stride if stride is None else stride))
+    index_path = offset_index_path(source_path)
+    if "\r" in text:
+        index_path.unlink(missing_ok=True)
+        return None
+    offsets = [0]
+    position = 0
+    for chunk_start in range(0, len(text), step):
+        position += len(text[chunk_start:chunk_start + step].encode("utf-8"))
+        offsets.append(position)
+    offsets.pop()  # the final entry is the file size, stored separately
+    index = {
+        "version": 2,
+        "stride": step,
+        "chars": len(text),
+        "bytes": position,
+        "mtime_ns": Path(source_path).stat().st_mtime_ns,
+        "offsets": offsets,
+    }
+    index_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    return index_path
+
+
+@lru_cache(maxsize=256)
+def _load_offset_index(index_path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    try:
+        with open(index_path, "r", encoding="utf-8") as fh:
+            index = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != 2:
+        return None
+    return index
+
+
+def read_text_span(path: Path, start: int, end: int) -> Tuple[str, int]:
+    """Return ``(text[start:end], len(text))`` for a source file.
+
+    With a valid sidecar offset index the read seeks to the nearest checkpoint
+    and decodes only the requested window (O(span)); otherwise the whole file
+    is read as before.
+    """
+    path = Path(path)
+    index_path = offset_index_path(path)
+    index = None
+    try:
+        index = _load_offset_index(str(index_path), index_path.stat().st_mtime_ns)
+        if index is not None:
+            stat = path.stat()
+            if int(index["bytes"]) != stat.st_size or int(index["mtime_ns"]) != stat.st_mtime_ns:
+                index = None  # source rewritten after the index; do not trust it
+    except OSError:
+        index = None
+
+    if index is None:
+        text = path.read_text(encoding="utf-8")
+        return text[start:end], len(text)
+
+    total_chars = int(index["chars"])
+    stride = int(index["stride"])
+    offsets: List[int] = index["offsets"]
+    start = min(max(0, start), total_chars)
+    end = min(max(start, end), total_chars)
+    if start == end:
+        return "", total_chars
+    first = start // stride
+    last = -(-end // stride)  # ceil
+    byte_start = offsets[first]
+    byte_end = offsets[last] if last < len(offsets) else int(index["bytes"])
+    with path.open("rb") as fh:
+        fh.seek(byte_start)
+        window = fh.read(byte_end - byte_start).decode("utf-8")
+    base = first * stride
+    return window[start - base:end - base], total_chars
+
+
+def table_spool_dir(
+    output_dir: Path,
+    *,
+    workspace_dir_name: Optional[str] = None,
+) -> Path:
+    """Directory where streamed table rows are spooled before workspace assembly.
+
+    It lives under the workspace ``tables`` directory so the final move in
+    :func:`build_source_workspace` is a same-filesystem rename.
+    """
+    workspace_name = workspace_dir_name or config.source_workspace_dir_name
+    return Path(output_dir) / workspace_name / "tables" / ".spool"
+
+
+def _materialize_table(table: Dict[str, Any], table_path: Path) -> int:
+    """Write one table to ``table_path`` and return its row count.
+
+    Tables streamed by ``tabular_ingest`` carry a ``rows_path`` spool file that
+    is moved into place; legacy in-memory tables carry ``rows``.
+    """
+    rows_path = table.get("rows_path")
+    if rows_path:
+        shutil.move(str(rows_path), str(table_path))
+        return int(table.get("row_count") or 0)
+    rows = table.get("rows") or []
+    with table_path.open("w", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps(_json_safe_value(row), ensure_ascii=False) + "\n")
+    return len(rows)
+
+
 def build_source_workspace(
     records: Iterable[SourceRecord],
     output_dir: Path,
@@ -115,25 +244,24 @@ def build_source_workspace(
 
         source_path = sources_dir / _safe_source_filename(source_id)
         source_path.write_text(record.content, encoding="utf-8")
+        write_offset_index(source_path, record.content)
         source_paths[source_id] = source_path
 
         table_refs: List[Dict[str, Any]] = []
         for table_index, table in enumerate(record.tables or [], start=1):
             table_name = str(table.get("name") or f"table_{table_index}")
-            rows = table.get("rows") or []
             table_path = tables_dir / f"{source_id}_{table_index:02d}.jsonl"
-            with table_path.open("w", encoding="utf-8") as fh:
-                for row in rows:
-                    fh.write(json.dumps(_json_safe_value(row), ensure_ascii=False) + "\n")
+            row_count = _materialize_table(table, table_path)
             table_key = f"{source_id}:{table_name}"
             table_paths[table_key] = table_path
-            table_refs.append(
-                {
-                    "name": table_name,
-                    "path": str(table_path.relative_to(root_dir)),
-                    "rows": len(rows),
-                }
-            )
+            table_ref = {
+                "name": table_name,
+                "path": str(table_path.relative_to(root_dir)),
+                "rows": row_count,
+            }
+            if table.get("columns"):
+                table_ref["columns"] = list(table["columns"])
+            table_refs.append(table_ref)
 
         entry = {
             "source_id": source_id,
@@ -146,6 +274,8 @@ def build_source_workspace(
             "workspace_path": str(source_path.relative_to(root_dir)),
             "tables": table_refs,
         }
+        if record.extraction:
+            entry["extraction"] = record.extraction
         manifest_sources.append(entry)
         summary_lines.extend(
             [
@@ -160,6 +290,10 @@ def build_source_workspace(
             ]
         )
 
+    spool_dir = tables_dir / ".spool"
+    if spool_dir.is_dir():
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
     manifest = {
         "version": 1,
         "source_count": len(manifest_sources),
@@ -285,20 +419,25 @@ def read_source_span(
     *,
     max_chars: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Read a bounded source span by character offset."""
+    """Read a bounded source span by character offset.
+
+    Uses the sidecar offset index written by :func:`build_source_workspace`
+    so only the requested window is decoded.
+    """
     path = workspace.source_paths[source_id]
-    text = path.read_text(encoding="utf-8")
     start = max(0, int(start))
     effective_max = config.source_read_max_chars if max_chars is None else max_chars
     if end is None:
         end = start + effective_max
-    end = min(len(text), int(end), start + effective_max)
+    end = min(int(end), start + effective_max)
+    text, total_chars = read_text_span(path, start, end)
+    end = min(total_chars, end)
     return {
         "source_id": source_id,
         "start": start,
         "end": end,
-        "text": text[start:end],
-        "truncated": end < len(text),
+        "text": text,
+        "truncated": end < total_chars,
     }
 
 
@@ -0,0 +1,298 @@
+"""Single-pass streaming ingestion for CSV/TSV/Excel inputs.
+
+Tabular inputs used to be read twice: once into a Python list to render the
+LLM preview and once more into a list of dicts for the source workspace. For
+large sample sheets that doubled ingest time and held every row in memory.
+
+``scan_tabular_file`` walks each sheet exactly once. It keeps only the first
+``preview_rows`` rows for the text preview and streams every row straight to a
+JSONL spool file that ``build_source_workspace`` later moves into place. Peak
+memory is bounded by the preview size, not the row count.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from .source_workspace import _json_safe_value
+
+TABULAR_SUFFIXES = {".csv", ".tsv", ".xlsx", ".xls"}
+GZIP_TABULAR_SUFFIXES = (".csv.gz", ".tsv.gz")
+MAX_PREVIEW_SHEETS = 6
+
+
+def tabular_kind(path: Path) -> str:
+    """Return the tabular suffix of ``path``, looking through a ``.gz`` layer."""
+    name = Path(path).name.lower()
+    if name.endswith(GZIP_TABULAR_SUFFIXES):
+        return Path(name[: -len(".gz")]).suffix
+    return Path(name).suffix
+
+
+def _table_stem(path: Path) -> str:
+    name = Path(path).name
+    if name.lower().endswith(".gz"):
+        name = name[: -len(".gz")]
+    return Path(name).stem
+
+
+@dataclass
+class TableScan:
+    """Result of streaming one table (CSV file or Excel sheet)."""
+
+    name: str
+    headers: List[str]
+    preview_rows: List[List[Any]] = field(default_factory=list)
+    total_rows: int = 0
+    non_empty_counts: List[int] = field(default_factory=list)
+    rows_path: Optional[Path] = None
+
+    def to_table_entry(self) -> Dict[str, Any]:
+        """Serialize into the ``tables`` entry shape consumed by the workspace."""
+        entry: Dict[str, Any] = {
+            "name": self.name,
+            "columns": list(self.headers),
+            "row_count": self.total_rows,
+        }
+        if self.rows_path is not None:
+            entry["rows_path"] = str(self.rows_path)
+        return entry
+
+
+def _excel_cell_value(value: Any) -> Any:
+    """Normalize openpyxl cell values the way the pandas reader used to."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%dT%H:%M:%S")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+def _dedupe_headers(raw_headers: Sequence[Any]) -> List[str]:
+    """Mirror pandas header naming for blank and duplicate column labels."""
+    headers: List[str] = []
+    seen: Dict[str, int] = {}
+    for index, raw in enumerate(raw_headers):
+        name = "" if raw is None else str(raw)
+        if not name:
+            name = f"Unnamed: {index}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        headers.append(name)
+    return headers
+
+
+def _iter_csv_tables(path: Path) -> Iterator[Tuple[str, List[str], Iterable[Dict[str, Any]]]]:
+    delimiter = "," if tabular_kind(path) == ".csv" else "\t"
+    if path.name.lower().endswith(".gz"):
+        # Decompress on the fly; the inflated text never touches disk.
+        fh = gzip.open(path, "rt", encoding="utf-8", newline="")
+    else:
+        fh = open(path, "r", encoding="utf-8", newline="")
+    with fh:
+        # csv.DictReader would merge duplicate headers and file overflow cells
+        # under a ``None`` key; zip rows with pandas-style deduplicated names.
+        reader = csv.reader(fh, delimiter=delimiter)
+        headers = _dedupe_headers(next(reader, []))
+
+        def rows(reader=reader, headers=headers) -> Iterator[Dict[str, Any]]:
+            for values in reader:
+                if not values:
+                    continue
+                padded = values[: len(headers)]
+                padded.extend([""] * (len(headers) - len(padded)))
+                yield dict(zip(headers, padded))
+
+        yield _table_stem(path), headers, rows()
+
+
+def _iter_xlsx_tables(path: Path) -> Iterator[Tuple[str, List[str], Iterable[Dict[str, Any]]]]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for worksheet in workbook.worksheets:
+            row_iter = worksheet.iter_rows(values_only=True)
+            header_row = next(row_iter, None)
+            if header_row is None:
+                yield str(worksheet.title), [], iter(())
+                continue
+            headers = _dedupe_headers(header_row)
+
+            def rows(row_iter=row_iter, headers=headers) -> Iterator[Dict[str, Any]]:
+                for values in row_iter:
+                    if values is None or all(v is None for v in values):
+                        continue
+                    padded = list(values[: len(headers)])
+                    padded.extend([None] * (len(headers) - len(padded)))
+                    yield {
+                        header: _excel_cell_value(value)
+                        for header, value in zip(headers, padded)
+                    }
+
+            yield str(worksheet.title), headers, rows()
+    finally:
+        workbook.close()
+
+
+def _iter_xls_tables(path: Path) -> Iterator[Tuple[str, List[str], Iterable[Dict[str, Any]]]]:
+    # Legacy .xls has no streaming reader; parse each sheet once via pandas/xlrd.
+    import pandas as pd
+
+    workbook = pd.ExcelFile(path)
+    for sheet_name in workbook.sheet_names:
+        df = workbook.parse(sheet_name)
+        for col in df.select_dtypes(include=["datetime64", "datetime64[ns]", "datetimetz"]).columns:
+            ser = df[col]
+            df[col] = ser.dt.strftime("%Y-%m-%dT%H:%M:%S").where(ser.notna(), "")
+        headers = [str(col) for col in df.columns]
+        rows = (
+            dict(zip(headers, values))
+            for values in df.fillna("").itertuples(index=False, name=None)
+        )
+        yield str(sheet_name), headers, rows
+
+
+def iter_tables(path: Path) -> Iterator[Tuple[str, List[str], Iterable[Dict[str, Any]]]]:
+    """Yield ``(name, headers, row_iterator)`` per table without materializing rows."""
+    suffix = tabular_kind(path)
+    if suffix in {".csv", ".tsv"}:
+        return _iter_csv_tables(path)
+    if suffix == ".xlsx":
+        return _iter_xlsx_tables(path)
+    return _iter_xls_tables(path)
+
+
+def _is_empty_cell(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _consume_rows(
+    scan: TableScan,
+    rows: Iterable[Dict[str, Any]],
+    *,
+    preview_rows: int,
+    sink: Optional[TextIO],
+) -> None:
+    counts = [0] * len(scan.headers)
+    for row in rows:
+        scan.total_rows += 1
+        values = list(row.values())
+        if len(scan.preview_rows) < preview_rows:
+            scan.preview_rows.append(values)
+        for index, value in enumerate(values[: len(counts)]):
+            if not _is_empty_cell(value):
+                counts[index] += 1
+        if sink is not None:
+            sink.write(json.dumps(_json_safe_value(row), ensure_ascii=False) + "\n")
+    scan.non_empty_counts = counts
+
+
+def scan_tabular_file(
+    path: Path,
+    *,
+    preview_rows: int,
+    spool_dir: Optional[Path] = None,
+) -> List[TableScan]:
+    """Stream every table in ``path`` once.
+
+    Args:
+        path: CSV/TSV/XLSX/XLS file.
+        preview_rows: Number of leading rows retained in memory for the preview.
+        spool_dir: When set, full rows are written to one JSONL file per table
+            under this directory (``TableScan.rows_path``). When ``None`` only
+            the preview and row counts are collected.
+
+    Raises:
+        ValueError: If an Excel workbook cannot be opened.
+    """
+    path = Path(path)
+    is_excel = tabular_kind(path) in {".xlsx", ".xls"}
+    if spool_dir is not None:
+        spool_dir.mkdir(parents=True, exist_ok=True)
+    token = uuid.uuid4().hex[:12]
+    scans: List[TableScan] = []
+    try:
+        for table_index, (name, headers, rows) in enumerate(iter_tables(path), start=1):
+            scan = TableScan(name=name, headers=headers)
+            if spool_dir is not None:
+                scan.rows_path = spool_dir / f"{token}_{table_index:02d}.jsonl"
+                with scan.rows_path.open("w", encoding="utf-8") as sink:
+                    _consume_rows(scan, rows, preview_rows=preview_rows, sink=sink)
+            else:
+                _consume_rows(scan, rows, preview_rows=preview_rows, sink=None)
+            scans.append(scan)
+    except Exception as exc:
+        for scan in scans:
+            if scan.rows_path is not None:
+                scan.rows_path.unlink(missing_ok=True)
+        if is_excel:
+            raise ValueError(
+                f"Failed to parse Excel file '{path.name}'. "
+                "Ensure openpyxl (for .xlsx) / xlrd (for .xls) is installed."
+            ) from exc
+        raise
+    return scans
+
+
+def render_table_preview(
+    file_name: str,
+    scan: TableScan,
+    *,
+    max_rows: int,
+    max_cols: int,
+) -> str:
+    """Render a streamed table into the concise text view used for LLM parsing."""
+    headers = scan.headers
+    clipped_headers = headers[:max_cols]
+    shown = scan.preview_rows[:max_rows]
+    lines = [
+        f"Table file: {file_name}",
+        f"Columns ({len(headers)}): {', '.join(clipped_headers)}",
+        f"Preview rows: {len(shown)} / {scan.total_rows}",
+        "Rows (tab-separated):",
+        "\t".join(clipped_headers),
+    ]
+    for row in shown:
+        lines.append("\t".join("" if cell is None else str(cell) for cell in row[:max_cols]))
+    if scan.total_rows > max_rows:
+        lines.append(f"... ({scan.total_rows - max_rows} more rows omitted)")
+    if len(headers) > max_cols:
+        lines.append(f"... ({len(headers) - max_cols} more columns omitted)")
+    return "\n".join(lines)
+
+
+def render_tabular_file(
+    path: Path,
+    scans: List[TableScan],
+    *,
+    max_rows: int,
+    max_cols: int,
+) -> str:
+    """Render all streamed tables of a file, matching the historic preview layout."""
+    path = Path(path)
+    if tabular_kind(path) in {".csv", ".tsv"}:
+        scan = scans[0] if scans else None
+        if scan is None or not scan.headers:
+            return f"Table file: {path.name}\n(empty)"
+        return render_table_preview(path.name, scan, max_rows=max_rows, max_cols=max_cols)
+
+    blocks: List[str] = []
+    for scan in scans[:MAX_PREVIEW_SHEETS]:
+        block = render_table_preview(path.name, scan, max_rows=max_rows, max_cols=max_cols)
+        blocks.append(f"[Sheet: {scan.name}]\n{block}")
+    if len(scans) > MAX_PREVIEW_SHEETS:
+        blocks.append(f"... ({len(scans) - MAX_PREVIEW_SHEETS} more sheets omitted)")
+    return "\n\n".join(blocks)
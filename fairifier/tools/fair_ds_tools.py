@@ -55,14 +55,17 @@ def create_fair_ds_tools(client=None, cache_store: Optional[Dict[str, Any]] = No
     def _cached_tool_result(namespace: str, payload: Dict[str, Any], compute):
         cache_key = None
         if cache_store is not None:
-            cache_key = make_cache_key(namespace, payload)
+            # Cached entries are shared across runs, so scope them to the FAIR-DS instance.
+            source = getattr(_client, "_base_url", None)
+            cache_key = make_cache_key(namespace, {**payload, "_source": source})
             cached = get_cached_value(cache_store, cache_key)
             if cached is not None:
                 return cached
 
         result = compute()
         if cache_store is not None and cache_key is not None:
-            store_cached_value(cache_store, cache_key, result)
+            succeeded = isinstance(result, dict) and result.get("success") is True
+            return store_cached_value(cache_store, cache_key, result, shared=succeeded)
         return result
     
     @tool
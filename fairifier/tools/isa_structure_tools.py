@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 
 from langchain_core.tools import tool
 
+from ..services.source_workspace import read_text_span
+
 
 def _workspace_root(source_workspace: Dict[str, Any]) -> Path:
     root_dir = source_workspace.get("root_dir")
@@ -261,9 +263,9 @@ def create_isa_structure_tools(source_workspace: Optional[Dict[str, Any]] = None
         path = _resolve_source_path(workspace, source_id)
         if not path or not path.exists():
             return {"success": False, "data": None, "error": f"Unknown source_id: {source_id}"}
-        text = path.read_text(encoding="utf-8")
         safe_start = max(0, int(start))
-        safe_end = min(len(text), safe_start + max(1, int(max_chars)))
+        text, total_chars = read_text_span(path, safe_start, safe_start + max(1, int(max_chars)))
+        safe_end = min(total_chars, safe_start + max(1, int(max_chars)))
         return {
             "success": True,
             "data": {
@@ -271,8 +273,8 @@ def create_isa_structure_tools(source_workspace: Optional[Dict[str, Any]] = None
                 "path": str(path),
                 "start": safe_start,
                 "end": safe_end,
-                "text": text[safe_start:safe_end],
-                "truncated": safe_end < len(text),
+                "text": text,
+                "truncated": safe_end < total_chars,
             },
             "error": None,
         }
@@ -10,6 +10,7 @@ from typing import Any, Dict, Optional
 from langchain_core.tools import tool
 
 from ..services.mineru_client import (
+    MinerUCancelledError,
     MinerUClient,
     MinerUConversionError,
     mineru_client_from_config,
@@ -99,6 +100,18 @@ def create_mineru_convert_tool(client=None):
             )
             return _result_payload(result)
 
+        except MinerUCancelledError as exc:
+            logger.info("MinerU conversion cancelled for %s", input_path)
+            return {
+                "success": False,
+                "cancelled": True,
+                "markdown_text": None,
+                "markdown_path": None,
+                "output_dir": None,
+                "images_dir": None,
+                "method": "mineru",
+                "error": str(exc),
+            }
         except MinerUConversionError as exc:
             logger.warning("MinerU conversion failed for %s: %s", input_path, exc)
             return {
@@ -10,11 +10,18 @@ from langchain_core.tools import tool
 
 from ..config import config
 from ..services.retrieval_cache import get_cached_value, make_cache_key, store_cached_value
+from ..services.science_http_cache import get_science_http_cache
 
 logger = logging.getLogger(__name__)
 _SCIENCE_FAILURE_SENTINEL = "__science_error__"
 
 
+def _request_json(url: str, params: Dict[str, Any] | None, timeout: int) -> Any:
+    response = requests.get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
 def _safe_get_json(
     url: str,
     *,
@@ -22,7 +29,11 @@ def _safe_get_json(
     timeout: int = 8,
     cache_store: Dict[str, Any] | None = None,
 ):
-    """Fetch JSON from an external API with predictable failure semantics."""
+    """Fetch JSON from an external API with predictable failure semantics.
+
+    Lookups go through the per-run ``cache_store`` first, then the shared
+    on-disk science HTTP cache (when enabled), and only then the network.
+    """
     cache_key = None
     if cache_store is not None:
         cache_key = make_cache_key("http_get_json", {"url": url, "params": params or {}})
@@ -33,11 +44,15 @@ def _safe_get_json(
             return True, cached, None
 
     try:
-        response = requests.get(url, params=params, timeout=timeout)
-        response.raise_for_status()
-        payload = response.json()
+        http_cache = get_science_http_cache()
+        if http_cache is not None:
+            payload = http_cache.get_json(
+                url, params, lambda: _request_json(url, params, timeout)
+            )
+        else:
+            payload = _request_json(url, params, timeout)
         if cache_store is not None and cache_key is not None:
-            store_cached_value(cache_store, cache_key, payload)
+            payload = store_cached_value(cache_store, cache_key, payload)
         return True, payload, None
     except Exception as exc:  # pragma: no cover - network dependent
         logger.warning("Science API request failed: %s", exc)
@@ -46,6 +61,7 @@ def _safe_get_json(
                 cache_store,
                 cache_key,
                 {_SCIENCE_FAILURE_SENTINEL: str(exc)},
+                shared=False,
             )
         return False, None, str(exc)
 
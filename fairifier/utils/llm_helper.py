@@ -5,10 +5,13 @@ Provides a unified interface for working with different LLM providers
 (Ollama, OpenAI, Qwen, Gemini, Anthropic) and common LLM operations.
 """
 
+import asyncio
 import json
 import hashlib
 import logging
 import re
+import weakref
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -44,6 +47,23 @@ logger = logging.getLogger(__name__)
 
 QWEN_MAX_TOKENS_LIMIT = 65536
 
+# asyncio.Semaphore is bound to one event loop; the API runs each workflow on its own.
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@asynccontextmanager
+async def llm_call_slot():
+    """Hold one of ``config.llm_max_concurrency`` LLM call slots on the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, int(config.llm_max_concurrency)))
+        _llm_semaphores[loop] = semaphore
+    async with semaphore:
+        yield
+
 
 def estimate_tokens(text: str) -> int:
     """
@@ -766,6 +786,23 @@ class LLMHelper:
         *,
         json_mode: bool = False,
         max_tokens: Optional[int] = None,
+    ):
+        """Call the LLM under the shared concurrency limit (see :func:`llm_call_slot`)."""
+        async with llm_call_slot():
+            return await self._invoke_llm(
+                messages,
+                operation_name,
+                json_mode=json_mode,
+                max_tokens=max_tokens,
+            )
+
+    async def _invoke_llm(
+        self,
+        messages,
+        operation_name="LLM Call",
+        *,
+        json_mode: bool = False,
+        max_tokens: Optional[int] = None,
     ):
         """Helper method to call LLM with proper parameters.
 
@@ -3,7 +3,16 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Iterable, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:  # pragma: no cover - dense numpy fallback
+    sparse = None
 
 PACKAGE_STOP_TOKENS = {
     "checklist",
@@ -122,14 +131,132 @@ def score_package_relevance(match_text: str, package: Dict[str, Any]) -> int:
     return score
 
 
+# Field weights used by score_package_relevance, applied per distinct token.
+_NAME_WEIGHT = 3
+_DESCRIPTION_WEIGHT = 2
+_SHEET_WEIGHT = 1
+_INDEX_CACHE_SIZE = 8
+
+
+def _package_sheets_text(package: Dict[str, Any]) -> str:
+    return " ".join(package.get("sheets") or package.get("levels") or [])
+
+
+class PackageRankingIndex:
+    """Precomputed token weights for a package catalog.
+
+    Rows are packages, columns are catalog tokens; a cell holds the summed
+    name/description/sheet weights of that token for that package. Scoring a
+    document is one matrix-vector product against its token indicator vector,
+    plus a second product for the long-description-token substring bonus, so
+    the result equals :func:`score_package_relevance` for every package.
+    """
+
+    def __init__(self, packages: Sequence[Dict[str, Any]]) -> None:
+        vocabulary: Dict[str, int] = {}
+        bonus_vocabulary: Dict[str, int] = {}
+        cells: Dict[Tuple[int, int], int] = {}
+        bonus_cells: set[Tuple[int, int]] = set()
+
+        for row, package in enumerate(packages):
+            description = package.get("description", "")
+            fields = (
+                (_tokenize_for_matching(package.get("name", "")), _NAME_WEIGHT),
+                (_tokenize_for_matching(description), _DESCRIPTION_WEIGHT),
+                (_tokenize_for_matching(_package_sheets_text(package)), _SHEET_WEIGHT),
+            )
+            for tokens, weight in fields:
+                for token in tokens:
+                    column = vocabulary.setdefault(token, len(vocabulary))
+                    cells[(row, column)] = cells.get((row, column), 0) + weight
+            if len(str(description).lower()) >= 12:
+                for token in fields[1][0]:
+                    if len(token) >= 6:
+                        column = bonus_vocabulary.setdefault(token, len(bonus_vocabulary))
+                        bonus_cells.add((row, column))
+
+        self.size = len(packages)
+        self.vocabulary = vocabulary
+        self._bonus_tokens = list(bonus_vocabulary)
+        self._weights = _build_matrix(cells, (self.size, len(vocabulary)))
+        self._bonus = _build_matrix(
+            {cell: 1 for cell in bonus_cells}, (self.size, len(bonus_vocabulary))
+        )
+
+    def scores(self, match_text: str) -> np.ndarray:
+        """Integer relevance score of every package (catalog order)."""
+        doc_tokens = _tokenize_for_matching(match_text)
+        if not doc_tokens or not self.size:
+            return np.zeros(self.size, dtype=np.int64)
+        indicator = np.zeros(len(self.vocabulary), dtype=np.int64)
+        columns = [self.vocabulary[token] for token in doc_tokens if token in self.vocabulary]
+        indicator[columns] = 1
+        match_lower = match_text.lower()
+        bonus_hits = np.fromiter(
+            (token in match_lower for token in self._bonus_tokens),
+            dtype=np.int64,
+            count=len(self._bonus_tokens),
+        )
+        return np.asarray(self._weights @ indicator + self._bonus @ bonus_hits).ravel()
+
+
+def _build_matrix(cells: Dict[Tuple[int, int], int], shape: Tuple[int, int]):
+    if sparse is None:
+        matrix = np.zeros(shape, dtype=np.int64)
+        for (row, column), value in cells.items():
+            matrix[row, column] = value
+        return matrix
+    rows = [row for row, _ in cells]
+    columns = [column for _, column in cells]
+    return sparse.csr_matrix(
+        (list(cells.values()), (rows, columns)), shape=shape, dtype=np.int64
+    )
+
+
+_index_cache: "OrderedDict[tuple, PackageRankingIndex]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_package_ranking_index(packages: Sequence[Dict[str, Any]]) -> PackageRankingIndex:
+    """Ranking index for ``packages``, reused while the catalog content is unchanged."""
+    key = tuple(
+        (
+            str(package.get("name", "")),
+            str(package.get("description", "")),
+            tuple(str(sheet) for sheet in package.get("sheets") or package.get("levels") or []),
+        )
+        for package in packages
+    )
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+    index = PackageRankingIndex(packages)
+    with _index_cache_lock:
+        _index_cache[key] = index
+        while len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+
+def score_packages_by_document(
+    packages: List[Dict[str, Any]],
+    match_text: str,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Return ``(score, package)`` pairs sorted by relevance (highest first)."""
+    scores = get_package_ranking_index(packages).scores(match_text)
+    scored = [(int(score), package) for score, package in zip(scores, packages)]
+    scored.sort(key=lambda item: (-item[0], str(item[1].get("name", "")).lower()))
+    return scored
+
+
 def rank_packages_by_document(
     packages: List[Dict[str, Any]],
     match_text: str,
 ) -> List[Dict[str, Any]]:
     """Return packages sorted by relevance score (highest first)."""
-    scored = [(score_package_relevance(match_text, package), package) for package in packages]
-    scored.sort(key=lambda item: (-item[0], str(item[1].get("name", "")).lower()))
-    return [package for _, package in scored]
+    return [package for _, package in score_packages_by_document(packages, match_text)]
 
 
 def top_relevant_package_names(
@@ -140,13 +267,12 @@ def top_relevant_package_names(
     min_score: int = 2,
 ) -> List[str]:
     """Return the highest-scoring package names above ``min_score``."""
-    ranked = rank_packages_by_document(packages, match_text)
     selected: List[str] = []
-    for package in ranked:
+    for score, package in score_packages_by_document(packages, match_text):
         name = package.get("name")
         if not name:
             continue
-        if score_package_relevance(match_text, package) < min_score:
+        if score < min_score:
             break
         if name not in selected:
             selected.append(str(name))
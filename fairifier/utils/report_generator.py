@@ -74,6 +74,7 @@ class WorkflowReportGenerator:
             "steps_requiring_retry": summary.get("steps_requiring_retry", 0),
             "needs_human_review": summary.get("needs_human_review", False),
             "agents_executed": agents_executed,
+            "memory": summary.get("memory"),
             "processing_start": state.get("processing_start"),
             "processing_end": state.get("processing_end")
         }
@@ -378,6 +379,35 @@ class WorkflowReportGenerator:
         lines.append(f"Steps Requiring Retry: {exec_summary.get('steps_requiring_retry', 0)}")
         lines.append(f"Needs Human Review: {exec_summary.get('needs_human_review', False)}")
         lines.append("")
+
+        # Memory I/O
+        memory = exec_summary.get("memory")
+        if memory:
+            search = memory.get("search", {})
+            writes = memory.get("writes", {})
+            lines.append("MEMORY I/O")
+            lines.append("-" * 80)
+            lines.append(
+                f"Searches: {search.get('calls', 0)} "
+                f"(avg {search.get('avg_ms', 0.0):.0f} ms, max {search.get('max_ms', 0.0):.0f} ms, "
+                f"{search.get('timeouts', 0)} over budget)"
+            )
+            lines.append(
+                f"Writes: {writes.get('completed', 0)}/{writes.get('enqueued', 0)} completed, "
+                f"{writes.get('failed', 0)} failed, {writes.get('dropped', 0)} dropped "
+                f"(avg {writes.get('avg_ms', 0.0):.0f} ms)"
+            )
+            lines.append(
+                f"Queue depth: {memory.get('queue_depth', 0)} now, {memory.get('max_queue_depth', 0)} max"
+            )
+            local_index = memory.get("local_index") or {}
+            if local_index.get("searches"):
+                lines.append(
+                    f"Local index: {local_index.get('searches', 0)} searches, "
+                    f"{local_index.get('embedding_calls', 0)} embedding calls, "
+                    f"{local_index.get('embedding_memo_hits', 0)} memo hits"
+                )
+            lines.append("")
         
         # Quality Metrics
         quality = report.get("quality_metrics", {})
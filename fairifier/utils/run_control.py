@@ -1,12 +1,23 @@
 """Thread-safe run control for interrupting long-running workflows."""
 
+import contextvars
+import logging
 import threading
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
 
 _lock = threading.Lock()
 _global_stop_requested = False
 _run_stop_requests: dict[str, bool] = {}
 
+ProgressListener = Callable[[Dict[str, Any]], None]
+_progress_listeners: Dict[str, List[ProgressListener]] = {}
+_current_run_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "fairifier_run_id", default=None
+)
+
 
 def run_stop_requested(run_id: Optional[str] = None) -> bool:
     """Return True if the current run should stop."""
@@ -36,3 +47,52 @@ def set_run_stop_requested(
 def reset_run_stop_requested(run_id: Optional[str] = None) -> None:
     """Reset the stop flag before starting a new run."""
     set_run_stop_requested(False, run_id=run_id)
+
+
+@contextmanager
+def bind_run(run_id: Optional[str]) -> Iterator[None]:
+    """Make ``run_id`` the current run for code that has no workflow state.
+
+    Services deep below a node (e.g. the MinerU subprocess) use
+    :func:`current_run_id` to poll the stop flag and report progress. Worker
+    threads only see the binding when submitted via ``contextvars.copy_context``.
+    """
+    token = _current_run_id.set(run_id)
+    try:
+        yield
+    finally:
+        _current_run_id.reset(token)
+
+
+def current_run_id() -> Optional[str]:
+    """The run bound by :func:`bind_run` in this context, if any."""
+    return _current_run_id.get()
+
+
+@contextmanager
+def run_progress_listener(run_id: str, listener: ProgressListener) -> Iterator[None]:
+    """Receive :func:`report_run_progress` payloads for ``run_id`` while active."""
+    with _lock:
+        _progress_listeners.setdefault(run_id, []).append(listener)
+    try:
+        yield
+    finally:
+        with _lock:
+            listeners = [item for item in _progress_listeners.get(run_id, []) if item is not listener]
+            if listeners:
+                _progress_listeners[run_id] = listeners
+            else:
+                _progress_listeners.pop(run_id, None)
+
+
+def report_run_progress(run_id: Optional[str], payload: Dict[str, Any]) -> None:
+    """Hand a progress payload to the listeners of ``run_id`` (no-op without any)."""
+    if run_id is None:
+        return
+    with _lock:
+        listeners = list(_progress_listeners.get(run_id, ()))
+    for listener in listeners:
+        try:
+            listener(payload)
+        except Exception as exc:  # pragma: no cover - listener bugs must not break a run
+            logger.debug("Run progress listener failed for %s: %s", run_id, exc)
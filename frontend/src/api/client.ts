@@ -170,6 +170,8 @@ export interface FAIRDSStatisticsResponse {
   package_leaderboard: FAIRDSPackageStatistics[];
   top_terms: FAIRDSTermStatistics[];
   term_quality: FAIRDSTermQuality;
+  snapshot_age_seconds?: number | null;
+  refreshing?: boolean;
 }
 
 export interface ResourceLoad {
@@ -355,7 +357,7 @@ export const api = {
         /* skip malformed */
       }
     };
-    for (const t of ['log', 'progress', 'stage_change', 'completed', 'stopped', 'stop_requested', 'error']) {
+    for (const t of ['log', 'progress', 'conversion_progress', 'stage_change', 'completed', 'stopped', 'stop_requested', 'error']) {
       source.addEventListener(t, handleEvent);
     }
     if (onError) source.onerror = onError;
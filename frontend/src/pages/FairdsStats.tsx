@@ -300,7 +300,10 @@ export default function FairdsStats() {
                   <span className={`stats-status-badge ${stats.available ? 'is-ready' : 'is-down'}`}>
                     {stats.available ? 'Available' : 'Unavailable'}
                   </span>
-                  <span className="stats-status-time">{formatDateTime(stats.generated_at)}</span>
+                  <span className="stats-status-time">
+                    {formatDateTime(stats.generated_at)}
+                    {stats.refreshing ? ' · refreshing' : ''}
+                  </span>
                 </div>
                 <p className="page-card__body">{stats.api_url || 'No API URL configured'}</p>
               </article>
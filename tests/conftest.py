@@ -1,6 +1,7 @@
 """Pytest configuration and shared fixtures for FAIRiAgent tests."""
 
 # Load test LLM env (Qwen API, qwen-flash) before any fairifier config import
+import importlib
 import os
 from pathlib import Path
 try:
@@ -88,6 +89,46 @@ def _disable_langsmith_traceable_wrappers() -> None:
         pass
 
 
+# Features that share state on disk or across runs are off by default in
+# tests; tests for those features enable them with monkeypatch.setattr.
+_TEST_CONFIG_OVERRIDES = {
+    "fair_ds_catalog_cache_enabled": False,
+    "science_http_cache_enabled": False,
+    "memory_index_enabled": False,
+    "mem0_ttl_sweep_interval_seconds": 0,
+}
+
+# Process-wide caches and workers, reset around every test.
+_PROCESS_STATE_RESETS = (
+    ("fairifier.services.fairds_catalog_cache", "reset_catalog_caches"),
+    ("fairifier.services.fairds_transport", "reset_circuit_breakers"),
+    ("fairifier.services.retrieval_cache", "reset_retrieval_caches"),
+    ("fairifier.services.science_http_cache", "reset_science_http_cache"),
+    ("fairifier.services.mem0_write_queue", "reset_memory_write_queues"),
+    ("fairifier.services.mem0_local_index", "reset_memory_indexes"),
+    ("fairifier.services.memory_aggregate_index", "reset_memory_aggregate_index"),
+    ("fairifier.services.mem0_ttl_sweeper", "reset_memory_ttl_sweeper"),
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_process_state(monkeypatch):
+    """Keep config overrides and process-wide state from leaking between tests."""
+    from fairifier.config import config as fairifier_config
+
+    for name, value in _TEST_CONFIG_OVERRIDES.items():
+        monkeypatch.setattr(fairifier_config, name, value)
+    resets = [
+        getattr(importlib.import_module(module), func)
+        for module, func in _PROCESS_STATE_RESETS
+    ]
+    for reset in resets:
+        reset()
+    yield
+    for reset in resets:
+        reset()
+
+
 def pytest_configure(config):
     """Register custom markers."""
     _disable_langsmith_traceable_wrappers()
@@ -1,4 +1,5 @@
 from fairifier.apps.api.routers import v1 as v1_router
+from fairifier.apps.api.services.fairds_statistics import FAIRDSStatisticsCache
 
 
 class _FakeFAIRDSClient:
@@ -146,3 +147,95 @@ def test_fairds_statistics_endpoint_handles_unavailable_api(
     assert payload["totals"]["fields"] == 0
     assert payload["totals"]["packages"] == 0
     assert "unreachable" in payload["message"].lower()
+
+
+def _counting_builder(monkeypatch, client_cls=_FakeFAIRDSClient):
+    monkeypatch.setattr(
+        "fairifier.config.config.fair_ds_api_url",
+        "http://fake-fairds.local",
+        raising=False,
+    )
+    monkeypatch.setattr(
+        "fairifier.services.fair_data_station.FAIRDataStationClient",
+        client_cls,
+    )
+    calls = []
+
+    def build(force_refresh: bool):
+        calls.append(force_refresh)
+        return v1_router._build_fairds_statistics(
+            force_refresh=force_refresh,
+            top_terms_limit=30,
+            package_limit=40,
+        )
+
+    return build, calls
+
+
+def test_fairds_statistics_cache_serves_sliced_snapshot(monkeypatch):
+    build, calls = _counting_builder(monkeypatch)
+    cache = FAIRDSStatisticsCache(build, max_age_seconds=900)
+
+    first = cache.get(
+        top_terms_limit=3,
+        package_limit=1,
+        api_url="http://fake-fairds.local",
+    )
+    second = cache.get(
+        top_terms_limit=30,
+        package_limit=40,
+        api_url="http://fake-fairds.local",
+    )
+
+    assert calls == [False]
+    assert [p.package_name for p in first.package_leaderboard] == ["soil"]
+    assert len(second.package_leaderboard) == 2
+    assert second.top_terms[: len(first.top_terms)] == first.top_terms
+    assert second.snapshot_age_seconds is not None
+    assert second.refreshing is False
+
+
+def test_fairds_statistics_cache_refreshes_stale_snapshot_in_background(
+    monkeypatch,
+):
+    build, calls = _counting_builder(monkeypatch)
+    cache = FAIRDSStatisticsCache(build, max_age_seconds=0)
+    url = "http://fake-fairds.local"
+
+    cache.get(top_terms_limit=12, package_limit=15, api_url=url)
+    stale = cache.get(top_terms_limit=12, package_limit=15, api_url=url)
+    cache.wait_for_refresh(timeout=5)
+
+    assert stale.available is True
+    assert calls == [False, False]
+
+    cache.get(
+        top_terms_limit=12,
+        package_limit=15,
+        api_url=url,
+        force_refresh=True,
+    )
+    assert calls[-1] is True
+
+
+def test_fairds_statistics_cache_rebuilds_for_new_api_url(monkeypatch):
+    build, calls = _counting_builder(monkeypatch)
+    cache = FAIRDSStatisticsCache(build, max_age_seconds=900)
+
+    cache.get(
+        top_terms_limit=12,
+        package_limit=15,
+        api_url="http://fake-fairds.local",
+    )
+    monkeypatch.setattr(
+        "fairifier.config.config.fair_ds_api_url",
+        "http://other-fairds.local",
+    )
+    payload = cache.get(
+        top_terms_limit=12,
+        package_limit=15,
+        api_url="http://other-fairds.local",
+    )
+
+    assert len(calls) == 2
+    assert payload.api_url == "http://other-fairds.local"
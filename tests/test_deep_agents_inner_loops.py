@@ -758,6 +758,90 @@ async def test_knowledge_retriever_searches_required_terms_across_all_packages(m
     assert "alpha diversity" not in result["api_capabilities"]["uncovered_required_metadata_terms"]
 
 
+@pytest.mark.anyio
+async def test_knowledge_retriever_selects_sheet_fields_concurrently(monkeypatch):
+    import asyncio
+
+    agent = KnowledgeRetrieverAgent()
+    monkeypatch.setattr(agent, "_load_local_package_registry", lambda: {})
+
+    def field(sheet, label, requirement="OPTIONAL"):
+        return {
+            "sheetName": sheet,
+            "packageName": "default",
+            "requirement": requirement,
+            "label": label,
+            "term": {"definition": label, "url": f"http://example.org/{label.replace(' ', '-')}"},
+        }
+
+    metadata = [
+        field("Investigation", "investigation identifier", "MANDATORY"),
+        field("Investigation", "investigation funding"),
+        field("Study", "study design"),
+        field("Sample", "sample depth"),
+    ]
+    agent.tools = {
+        "get_available_packages": StubTool(
+            "get_available_packages",
+            lambda _payload: {"success": True, "data": ["default"], "error": None},
+        ),
+        "get_package": StubTool(
+            "get_package",
+            lambda _payload: {
+                "success": True,
+                "data": {"packageName": "default", "metadata": metadata},
+                "error": None,
+            },
+        ),
+        "get_terms": StubTool("get_terms", lambda _payload: {"success": True, "data": {}, "error": None}),
+        "search_terms_for_fields": StubTool("search_terms_for_fields", lambda _payload: {"success": True, "data": [], "error": None}),
+        "search_fields_in_packages": StubTool("search_fields_in_packages", lambda _payload: {"success": True, "data": [], "error": None}),
+    }
+    agent.fair_ds_client = object()
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_select_packages(*args, **kwargs):
+        return ["default"]
+
+    async def fake_select_fields(_llm, _doc, sheet, _name, _mandatory, optional, _feedback=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Earlier sheets finish last so merge order cannot follow completion order.
+        await asyncio.sleep({"investigation": 0.03, "study": 0.02}.get(sheet, 0.01))
+        in_flight -= 1
+        if sheet == "study":
+            raise ValueError("malformed JSON")
+        return {"selected_fields": list(optional), "terms_to_search": []}
+
+    monkeypatch.setattr(config, "enable_deep_agents", False)
+    monkeypatch.setattr(
+        "fairifier.agents.knowledge_retriever_llm_methods.llm_select_relevant_packages",
+        fake_select_packages,
+    )
+    monkeypatch.setattr(
+        "fairifier.agents.knowledge_retriever_llm_methods.llm_select_fields_from_package",
+        fake_select_fields,
+    )
+
+    state = {
+        "document_info": {"title": "Soil depth survey"},
+        "context": {},
+        "confidence_scores": {},
+        "errors": [],
+        "evidence_packets": [],
+    }
+
+    result = await agent.execute(state)
+    labels = [item["metadata"]["label"] for item in result["retrieved_knowledge"]]
+
+    assert peak == 3
+    assert labels.index("investigation funding") < labels.index("sample depth")
+    assert "investigation identifier" in labels
+
+
 @pytest.mark.anyio
 @pytest.mark.skip(reason="Flaky in mixed anyio backends; covered by integration runs.")
 async def test_knowledge_retriever_fetches_metadata_for_guided_selected_packages(monkeypatch):
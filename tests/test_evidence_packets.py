@@ -44,3 +44,68 @@ def test_build_evidence_context_renders_compact_summary():
 
     assert "Evidence packets:" in context
     assert "methodology: RNA-seq" in context
+
+
+def test_build_evidence_packets_uses_mineru_title_blocks_and_shared_scan():
+    text = (
+        "Materials and methods\n"
+        "Samples were collected at the Wadden Sea.\n"
+        "Results\n"
+        "Diversity increased with RNA-seq depth.\n"
+    )
+    blocks = [
+        {"type": "title", "text": "Materials and methods"},
+        {"type": "text", "text": "Samples were collected at the Wadden Sea."},
+        {"type": "title", "text": "Results"},
+    ]
+    doc_info = {"location": "Wadden Sea", "methodology": "RNA-seq", "missing": "absent value"}
+
+    packets = build_evidence_packets(
+        doc_info, text, source_type="mineru_markdown", structured_blocks=blocks
+    )
+
+    sections = {packet["field_candidate"]: packet["section"] for packet in packets}
+    assert sections == {
+        "location": "Materials and methods",
+        "methodology": "Results",
+        "missing": None,
+    }
+
+
+def test_document_outline_matches_prefix_heading_scan():
+    from fairifier.services.evidence_packets import DocumentOutline
+
+    text = "# Intro\nplain\nMETHODS\nbody ## not heading\n## Results here\ntail"
+    outline = DocumentOutline(text)
+
+    def prefix_scan(pos):
+        heading = None
+        for raw in text[:pos].splitlines():
+            line = raw.strip()
+            if line.startswith("#"):
+                heading = line.lstrip("# ").strip()
+            elif line and len(line) < 120 and line.isupper():
+                heading = line
+        return heading
+
+    assert [outline.heading_at(pos) for pos in range(len(text) + 1)] == [
+        prefix_scan(pos) for pos in range(len(text) + 1)
+    ]
+
+
+def test_find_first_occurrences_matches_per_needle_search():
+    import re
+
+    from fairifier.services.evidence_packets import _find_first_occurrences
+
+    text = "Soil RNA-seq; soil samples; RNA extraction from SOIL cores"
+    needles = ["soil", "Soil samples", "rna", "RNA-seq", "cores", "absent", ""]
+
+    expected = {
+        needle: match.start()
+        for needle in needles
+        if needle
+        for match in [re.search(re.escape(needle), text, re.IGNORECASE)]
+        if match
+    }
+    assert _find_first_occurrences(text, needles) == expected
@@ -4,6 +4,9 @@ These tests verify that the FAIR-DS API client can actually connect to
 the API and retrieve data from the database.
 """
 
+import threading
+import time
+
 import pytest
 from unittest.mock import MagicMock
 from unittest.mock import call
@@ -11,6 +14,7 @@ from fairifier.services.fair_data_station import (
     FAIRDataStationClient,
     FAIRDataStationUnavailable,
 )
+from fairifier.services.fairds_catalog_cache import FAIRDSCatalogCache
 from fairifier.config import config
 
 
@@ -324,6 +328,165 @@ class TestFAIRDataStationPackageAPI:
         )
 
 
+def _json_response(payload, status_code=200, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload
+    return response
+
+
+_SOIL_PACKAGE = {
+    "packageName": "soil",
+    "itemCount": 1,
+    "metadata": [{"label": "soil type"}],
+}
+
+
+class TestFAIRDataStationCatalogCache:
+    """Shared catalog cache across clients, processes and outages."""
+
+    def test_clients_share_cached_package_across_instances_and_processes(self, tmp_path):
+        db_path = tmp_path / "catalog.sqlite3"
+        cache = FAIRDSCatalogCache("http://example.test", db_path=db_path)
+        first = FAIRDataStationClient("http://example.test", timeout=2, catalog_cache=cache)
+        first._session = MagicMock()
+        first._session.get.return_value = _json_response(
+            _SOIL_PACKAGE, headers={"ETag": '"v1"'}
+        )
+        assert first.get_package("soil")["packageName"] == "soil"
+
+        second = FAIRDataStationClient("http://example.test", timeout=2, catalog_cache=cache)
+        second._session = MagicMock()
+        assert second.get_package("soil")["metadata"] == [{"label": "soil type"}]
+        second._session.get.assert_not_called()
+
+        cache.close()
+        reopened = FAIRDSCatalogCache("http://example.test", db_path=db_path)
+        third = FAIRDataStationClient("http://example.test", timeout=2, catalog_cache=reopened)
+        third._session = MagicMock()
+        assert third.get_package("soil")["packageName"] == "soil"
+        third._session.get.assert_not_called()
+        assert reopened.peek("package:soil").etag == '"v1"'
+        reopened.close()
+
+    def test_default_clients_use_the_configured_shared_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "fair_ds_catalog_cache_enabled", True)
+        monkeypatch.setattr(config, "fair_ds_catalog_cache_path", tmp_path / "catalog.sqlite3")
+        first = FAIRDataStationClient("http://example.test", timeout=2)
+        first._session = MagicMock()
+        first._session.get.return_value = _json_response(_SOIL_PACKAGE)
+        assert first.get_package("soil")["packageName"] == "soil"
+
+        second = FAIRDataStationClient("http://example.test/", timeout=2)
+        second._session = MagicMock()
+        assert second.get_package("soil")["packageName"] == "soil"
+        second._session.get.assert_not_called()
+        assert (tmp_path / "catalog.sqlite3").exists()
+
+    def test_stale_entry_revalidates_with_etag(self, tmp_path):
+        cache = FAIRDSCatalogCache(
+            "http://example.test", ttl_seconds=0, background_refresh=False
+        )
+        cache.store("package:soil", _SOIL_PACKAGE, etag='"v1"')
+        client = FAIRDataStationClient("http://example.test", timeout=2, catalog_cache=cache)
+        client._session = MagicMock()
+        client._session.get.return_value = _json_response(None, status_code=304)
+
+        package = client.get_package("soil")
+
+        assert package == _SOIL_PACKAGE
+        client._session.get.assert_called_once_with(
+            "http://example.test/api/packages/soil",
+            timeout=2,
+            headers={"If-None-Match": '"v1"'},
+        )
+
+    def test_stale_entry_served_when_api_unreachable(self):
+        cache = FAIRDSCatalogCache(
+            "http://example.test", ttl_seconds=0, background_refresh=False
+        )
+        cache.store("terms", {"total": 1, "terms": {"depth": {"label": "depth"}}})
+        client = FAIRDataStationClient("http://example.test", timeout=2, catalog_cache=cache)
+        client._session = MagicMock()
+        client._session.get.side_effect = RuntimeError("connection refused")
+
+        terms = client.get_terms()
+
+        assert terms == {"depth": {"label": "depth"}}
+
+    def test_stale_entry_is_refreshed_in_background(self):
+        cache = FAIRDSCatalogCache("http://example.test", ttl_seconds=0)
+        cache.store("package_summaries", [{"name": "soil"}])
+        client = FAIRDataStationClient("http://example.test", timeout=2, catalog_cache=cache)
+        client._session = MagicMock()
+        client._session.get.return_value = _json_response(
+            {"packages": [{"name": "soil"}, {"name": "water"}]}
+        )
+
+        assert client.get_available_packages() == ["soil"]
+        cache.wait_for_refreshes(timeout=5)
+
+        assert cache.peek("package_summaries").payload == [
+            {"name": "soil"},
+            {"name": "water"},
+        ]
+
+
+class TestFAIRDataStationBulkPackages:
+    """Concurrent package detail fetching."""
+
+    def test_get_packages_bulk_fetches_concurrently_and_fills_cache(self):
+        client = FAIRDataStationClient(
+            "http://example.test", timeout=2, max_concurrency=8
+        )
+
+        def slow_get(url, **kwargs):
+            time.sleep(0.2)
+            name = url.rsplit("/", 1)[-1]
+            return _json_response({"packageName": name, "metadata": [{"label": name}]})
+
+        client._session = MagicMock()
+        client._session.get.side_effect = slow_get
+        names = [f"pkg{i}" for i in range(8)]
+
+        started = time.perf_counter()
+        packages = client.get_packages_bulk(names + ["pkg0"])
+        elapsed = time.perf_counter() - started
+
+        assert list(packages) == names
+        assert all(packages[name]["packageName"] == name for name in names)
+        assert client._session.get.call_count == len(names)
+        assert elapsed < 0.2 * len(names) / 2
+        assert set(names) <= set(client._package_detail_cache)
+
+    def test_concurrent_get_package_calls_share_one_request(self):
+        client = FAIRDataStationClient("http://example.test", timeout=2)
+        release = threading.Event()
+        requested = threading.Event()
+
+        def blocking_get(url, **kwargs):
+            requested.set()
+            release.wait(5)
+            return _json_response(_SOIL_PACKAGE)
+
+        client._session = MagicMock()
+        client._session.get.side_effect = blocking_get
+        results = []
+        first = threading.Thread(target=lambda: results.append(client.get_package("soil")))
+        first.start()
+        assert requested.wait(5)
+        second = threading.Thread(target=lambda: results.append(client.get_package("soil")))
+        second.start()
+        time.sleep(0.05)
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        assert results == [_SOIL_PACKAGE, _SOIL_PACKAGE]
+        client._session.get.assert_called_once()
+
+
 class TestFAIRDataStationDataIntegrity:
     """Test data integrity and structure from FAIR-DS API."""
 
@@ -0,0 +1,90 @@
+"""Tests for the local FAIR-DS catalog search indexes."""
+
+import random
+from unittest.mock import MagicMock
+
+from fairifier.services.fair_data_station import FAIRDataStationClient
+from fairifier.services.fairds_search_index import (
+    FieldSearchIndex,
+    SubstringIndex,
+    TermSearchIndex,
+)
+
+
+def _response(payload):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {}
+    response.json.return_value = payload
+    return response
+
+
+def test_substring_index_matches_linear_scan():
+    rng = random.Random(7)
+    words = ["soil", "type", "sample", "ph", "depth", "water", "temp", "air", "s", "  "]
+    texts = [
+        " ".join(rng.choice(words) for _ in range(rng.randint(0, 5))).lower()
+        for _ in range(300)
+    ]
+    index = SubstringIndex(texts)
+    queries = ["", " ", "soil", "il ty", "oil type", "p", "ph ", " de", "xyz", "e s", "  s"]
+    queries += [text[i:j] for text in texts[:40] for i, j in [(1, 6), (0, 3)]]
+
+    for query in queries:
+        expected = [doc_id for doc_id, text in enumerate(texts) if query in text]
+        assert index.search(query) == expected, query
+
+
+def test_term_index_filters_label_and_definition_in_catalog_order():
+    terms = {
+        "air temperature": {"label": "air temperature", "definition": "Temperature of air"},
+        "depth": {"label": "depth", "definition": "Sampling depth below surface"},
+        "water temperature": {"label": "Water Temperature", "definition": "Water temp"},
+    }
+    index = TermSearchIndex(terms)
+
+    assert list(index.search(label="TEMPERATURE")) == ["air temperature", "water temperature"]
+    assert list(index.search(definition="depth")) == ["depth"]
+    assert list(index.search(label="temperature", definition="air")) == ["air temperature"]
+
+
+def test_field_index_skips_non_dict_rows():
+    index = FieldSearchIndex([{"label": "soil type"}, None, {"label": None}, {"label": "Soil pH"}])
+
+    assert [field["label"] for field in index.search("soil")] == ["soil type", "Soil pH"]
+
+
+def test_client_searches_answer_from_cached_catalog():
+    client = FAIRDataStationClient("http://example.test", timeout=2)
+    packages = {
+        "soil": {"packageName": "soil", "metadata": [{"label": "soil type"}, {"label": "depth"}]},
+        "water": {"packageName": "water", "metadata": [{"label": "water depth"}]},
+    }
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/api/terms"):
+            return _response(
+                {
+                    "total": 2,
+                    "terms": {
+                        "depth": {"label": "depth", "definition": "Depth below surface"},
+                        "soil type": {"label": "soil type", "definition": "Soil class"},
+                    },
+                }
+            )
+        return _response(packages[url.rsplit("/", 1)[-1]])
+
+    client._session = MagicMock()
+    client._session.get.side_effect = fake_get
+
+    assert [t["term_name"] for t in client.search_terms_for_fields("DEP")] == ["depth"]
+    assert [t["term_name"] for t in client.search_terms_for_fields("soil")] == ["soil type"]
+    assert client.search_terms(label="type", definition="depth") == {}
+    fields = client.search_fields_in_packages("depth", ["soil", "water"])
+    again = client.search_fields_in_packages("depth", ["soil", "water"])
+
+    assert [f["label"] for f in fields] == ["depth", "water depth"]
+    assert again == fields
+    requested = [c.args[0] for c in client._session.get.call_args_list]
+    assert requested.count("http://example.test/api/terms") == 1
+    assert len(requested) == 3
@@ -0,0 +1,123 @@
+"""Tests for offline FAIR-DS catalog snapshots."""
+
+import gzip
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from fairifier.services.fair_data_station import FAIRDataStationClient
+from fairifier.services.fairds_snapshot import (
+    export_snapshot,
+    load_snapshot,
+    make_snapshot_server,
+)
+
+_TERMS = {
+    "depth": {"label": "depth", "definition": "Depth below surface"},
+    "soil type": {"label": "soil type", "definition": "Soil class"},
+}
+_PACKAGES = {
+    "soil": {
+        "packageName": "soil",
+        "itemCount": 1,
+        "metadata": [{"label": "soil type", "level": "Sample", "requirement": "MANDATORY"}],
+    },
+    "default": {
+        "packageName": "default",
+        "itemCount": 1,
+        "metadata": [{"label": "investigation title", "level": "Investigation"}],
+    },
+}
+
+
+def _response(payload=None, status_code=200, text=""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.json.return_value = payload
+    response.text = text
+    return response
+
+
+def _live_client():
+    client = FAIRDataStationClient("http://live.test", timeout=2, catalog_cache=None)
+
+    def fake_get(url, **kwargs):
+        path = url[len("http://live.test"):]
+        if path == "/api/terms":
+            return _response({"total": len(_TERMS), "terms": _TERMS})
+        if path == "/api/packages":
+            return _response(
+                {"packages": [{"name": name, "description": ""} for name in _PACKAGES]}
+            )
+        if path.startswith("/api/packages/"):
+            return _response(_PACKAGES[path.rsplit("/", 1)[-1]])
+        if path == "/api/skills":
+            return _response(text="# FAIR-DS skill")
+        return _response(status_code=404)
+
+    client._session = MagicMock()
+    client._session.get.side_effect = fake_get
+    return client
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    path = tmp_path / "fairds_snapshot.json.gz"
+    export_snapshot(_live_client(), path)
+    return path
+
+
+def test_snapshot_client_serves_catalog_without_network(snapshot_file):
+    payload = json.loads(gzip.decompress(snapshot_file.read_bytes()))
+    assert payload["format"] == "fairifier-fairds-snapshot"
+    assert payload["version"] == 1
+
+    client = FAIRDataStationClient("http://offline.invalid", snapshot_path=snapshot_file)
+
+    assert client.is_available() is True
+    assert client.get_available_packages() == ["soil", "default"]
+    assert client.get_package("soil") == _PACKAGES["soil"]
+    assert client.get_package("missing") is None
+    assert set(client.get_terms()) == set(_TERMS)
+    assert [t["term_name"] for t in client.search_terms_for_fields("soil")] == ["soil type"]
+    assert client.fetch_agent_skill_markdown() == "# FAIR-DS skill"
+    with pytest.raises(RuntimeError):
+        client.generate_excel_from_isa_structure({})
+
+
+def test_load_snapshot_rejects_unknown_version(tmp_path):
+    path = tmp_path / "future.json.gz"
+    path.write_bytes(
+        gzip.compress(json.dumps({"format": "fairifier-fairds-snapshot", "version": 99}).encode())
+    )
+
+    with pytest.raises(ValueError, match="version"):
+        load_snapshot(path)
+
+
+def test_snapshot_http_stand_in_serves_endpoints_and_etags(snapshot_file):
+    snapshot = load_snapshot(snapshot_file)
+    server = make_snapshot_server(snapshot, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        client = FAIRDataStationClient(base_url, timeout=5, catalog_cache=None)
+        assert client.get_package("default")["packageName"] == "default"
+        assert list(client.search_terms(label="DEP")) == ["depth"]
+
+        first = requests.get(f"{base_url}/api/packages", timeout=5)
+        revalidated = requests.get(
+            f"{base_url}/api/packages",
+            headers={"If-None-Match": first.headers["ETag"]},
+            timeout=5,
+        )
+        assert first.status_code == 200
+        assert revalidated.status_code == 304
+    finally:
+        server.shutdown()
+        server.server_close()
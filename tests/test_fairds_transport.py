@@ -0,0 +1,107 @@
+"""Tests for the FAIR-DS retrying, circuit-breaking transport."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from fairifier.config import config
+from fairifier.services.fair_data_station import FAIRDataStationClient
+from fairifier.services.fairds_catalog_cache import FAIRDSCatalogCache
+from fairifier.services.fairds_transport import (
+    CircuitBreaker,
+    FAIRDSCircuitOpenError,
+    FAIRDSTransport,
+    circuit_breaker_states,
+    endpoint_timeout,
+)
+
+
+def _ok(status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+def test_endpoint_timeouts_use_longest_prefix():
+    assert endpoint_timeout("/api") == 3.0
+    assert endpoint_timeout("/api/terms") == 30.0
+    assert endpoint_timeout("/api/packages/soil") == 15.0
+    assert endpoint_timeout("/api/skills/catalog") == 10.0
+    assert endpoint_timeout("/api/unknown", default=7) == 7
+
+
+def test_transport_retries_transient_errors_with_jitter():
+    sleeps = []
+    transport = FAIRDSTransport(CircuitBreaker(), retries=2, backoff_seconds=0.1, sleep=sleeps.append)
+    call = MagicMock(side_effect=[requests.ConnectionError("reset"), _ok(503), _ok(200)])
+
+    response = transport.send(call)
+
+    assert response.status_code == 200
+    assert call.call_count == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.1 and 0 <= sleeps[1] <= 0.2
+    assert transport.breaker.state == "closed"
+
+
+def test_non_idempotent_calls_are_not_retried():
+    transport = FAIRDSTransport(CircuitBreaker(), retries=3, sleep=lambda _s: None)
+    call = MagicMock(side_effect=requests.Timeout("slow"))
+
+    with pytest.raises(requests.Timeout):
+        transport.send(call, idempotent=False)
+    assert call.call_count == 1
+
+
+def test_breaker_opens_fails_fast_and_recovers_after_probe():
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0.05)
+    transport = FAIRDSTransport(breaker, retries=0)
+    failing = MagicMock(side_effect=requests.ConnectionError("down"))
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            transport.send(failing)
+    assert breaker.state == "open"
+
+    started = time.perf_counter()
+    with pytest.raises(FAIRDSCircuitOpenError):
+        transport.send(failing)
+    assert time.perf_counter() - started < 0.01
+    assert failing.call_count == 2
+
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    assert transport.send(MagicMock(return_value=_ok(404))).status_code == 404
+    assert breaker.snapshot()["state"] == "closed"
+
+
+def test_client_serves_cached_catalog_while_circuit_is_open(monkeypatch):
+    monkeypatch.setattr(config, "fair_ds_retries", 0)
+    monkeypatch.setattr(config, "fair_ds_breaker_failure_threshold", 1)
+    cache = FAIRDSCatalogCache("http://down.test", ttl_seconds=0, background_refresh=False)
+    cache.store("package:soil", {"packageName": "soil", "metadata": []})
+    client = FAIRDataStationClient("http://down.test", timeout=2, catalog_cache=cache)
+    client._session = MagicMock()
+    client._session.get.side_effect = requests.ConnectionError("refused")
+
+    assert client.get_package("soil", force_refresh=True)["packageName"] == "soil"
+    assert client.circuit_state["state"] == "open"
+    assert client.get_package("soil", force_refresh=True)["packageName"] == "soil"
+    assert client.is_available() is False
+    assert client._session.get.call_count == 1
+    assert circuit_breaker_states()["http://down.test"]["rejected_calls"] == 2
+
+
+def test_default_client_timeout_is_per_endpoint():
+    client = FAIRDataStationClient("http://example.test", catalog_cache=None)
+    client._session = MagicMock()
+    client._session.get.return_value = _ok(200)
+    client._session.get.return_value.json.return_value = {"total": 0, "terms": {}}
+
+    client.is_available()
+    client.get_terms()
+
+    timeouts = [c.kwargs["timeout"] for c in client._session.get.call_args_list]
+    assert timeouts == [3.0, 30.0]
@@ -197,3 +197,31 @@ def test_select_best_field_definition_accepts_specific_subset_match():
 
     match = agent._select_best_field_definition("study design type", selected_fields)
     assert match == {"name": "study design"}
+
+
+def test_field_label_index_matches_linear_scoring():
+    import random
+
+    agent = JSONGeneratorAgent()
+    rng = random.Random(5)
+    words = ["soil", "air", "temperature", "study", "design", "type", "sample", "ph", "depth"]
+    candidates = [
+        {"name": rng.choice(["_", " ", "-", "/"]).join(rng.sample(words, rng.randint(1, 3)))}
+        for _ in range(60)
+    ]
+    candidates += [{"name": ""}, {"name": "  "}, {"name": None}, {"name": 7}]
+    queries = [" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(80)]
+    queries += ["", "soil_temperature", "SoilTemperature", "soil-temperature"]
+    index = agent._build_field_label_index(candidates, ("name", "label"))
+
+    for query in queries:
+        linear = []
+        for item in candidates:
+            label = item["name"] if isinstance(item["name"], str) and item["name"].strip() else ""
+            score = agent._score_field_name_match(query, label)
+            if score > 0:
+                linear.append((score, item))
+        linear.sort(key=lambda pair: pair[0], reverse=True)
+        assert [(score, id(item)) for score, item in index.score(query)] == [
+            (score, id(item)) for score, item in linear
+        ], query
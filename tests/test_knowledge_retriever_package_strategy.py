@@ -120,3 +120,73 @@ def test_deduplicate_local_fields_preserves_same_label_on_different_sheets():
     ]
 
     assert len(KnowledgeRetrieverAgent._deduplicate_package_fields(fields)) == 2
+
+
+def test_local_package_registry_is_shared_and_reloads_changed_files(tmp_path, monkeypatch):
+    import json
+    import os
+
+    from fairifier.services.local_package_registry import reset_local_package_registry
+
+    package_file = tmp_path / "ext_package.json"
+
+    def write(label: str, mtime: int) -> None:
+        package_file.write_text(
+            json.dumps(
+                {
+                    "packageName": "ext",
+                    "metadata": [
+                        {"label": label, "sheetName": "Sample", "requirement": "OPTIONAL"}
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.utime(package_file, ns=(mtime, mtime))
+
+    write("soil moisture", 1_000_000_000)
+    reset_local_package_registry()
+    first, second = _make_kr_without_init(), _make_kr_without_init()
+    for kr in (first, second):
+        monkeypatch.setattr(kr, "_local_package_files", lambda: [package_file])
+
+    assert first._load_local_package_registry() is second._load_local_package_registry()
+    assert [f["label"] for f in second._search_local_package_fields("moisture")] == [
+        "soil moisture"
+    ]
+
+    write("leaf wetness", 2_000_000_000)
+
+    assert first._search_local_package_fields("moisture") == []
+    assert [f["label"] for f in first._search_local_package_fields("wetness")] == ["leaf wetness"]
+    assert first._load_local_package_registry()["ext"]["metadata"][0]["packageName"] == "ext"
+    reset_local_package_registry()
+
+
+def test_local_package_files_follow_a_changed_path_env_var(tmp_path, monkeypatch):
+    import fairifier.config as config_module
+    from fairifier.config import config
+
+    monkeypatch.setattr(config, "local_package_paths", config.local_package_paths)
+    monkeypatch.setattr(
+        config_module,
+        "_applied_local_package_paths_env",
+        config_module._applied_local_package_paths_env,
+    )
+    first_dir, second_dir = tmp_path / "first", tmp_path / "second"
+    for directory in (first_dir, second_dir):
+        directory.mkdir()
+        (directory / f"{directory.name}_package.json").write_text("{}", encoding="utf-8")
+    kr = _make_kr_without_init()
+
+    monkeypatch.setenv("FAIRIFIER_LOCAL_PACKAGE_PATHS", str(first_dir))
+    assert first_dir / "first_package.json" in kr._local_package_files()
+
+    monkeypatch.setenv("FAIRIFIER_LOCAL_PACKAGE_PATHS", str(second_dir))
+    files = kr._local_package_files()
+    assert second_dir / "second_package.json" in files
+    assert first_dir / "first_package.json" not in files
+
+    # An unchanged variable keeps paths set in code.
+    config.local_package_paths = (first_dir,)
+    assert first_dir / "first_package.json" in kr._local_package_files()
@@ -0,0 +1,164 @@
+"""Tests for the per-run local mem0 index."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from fairifier.graph.nodes import OrchestrateNode
+from fairifier.services.mem0_local_index import RunMemoryIndex, embed_memoized
+from fairifier.services.mem0_write_queue import memory_run_metrics
+
+
+class _FakePoint:
+    def __init__(self, point_id, vector):
+        self.id = point_id
+        self.vector = vector
+
+
+class _FakeMemoryService:
+    """Mem0Service stand-in with a vector store that can return stored vectors."""
+
+    VECTORS = {"soil": [1.0, 0.0, 0.0], "ontology": [0.0, 1.0, 0.0], "retry": [0.0, 0.0, 1.0]}
+
+    def __init__(self, memories):
+        self.memories = memories
+        self.list_calls = []
+        self.retrieved_ids = []
+        self.embedded = []
+        self.memory = MagicMock()
+        self.memory.embedding_model.embed.side_effect = self._embed
+        self.memory.vector_store.collection_name = "memories"
+        self.memory.vector_store.client.retrieve.side_effect = self._retrieve
+        self.search = MagicMock(return_value=[])
+
+    def _vector_for(self, text):
+        return next(vec for key, vec in self.VECTORS.items() if key in text)
+
+    def _embed(self, text, action):
+        self.embedded.append((text, action))
+        return self._vector_for(text)
+
+    def _retrieve(self, collection_name, ids, with_vectors):
+        self.retrieved_ids.extend(ids)
+        by_id = {m["id"]: m for m in self.memories}
+        return [_FakePoint(i, self._vector_for(by_id[i]["memory"])) for i in ids]
+
+    def get_all_memories(self, session_id, agent_id=None, limit=1000):
+        self.list_calls.append(session_id)
+        return [dict(m) for m in self.memories][:limit]
+
+    def is_memory_valid(self, memory):
+        return True
+
+
+def test_run_index_serves_searches_locally_with_memoized_query_embeddings():
+    service = _FakeMemoryService(
+        [{"id": "a", "memory": "soil package MIxS"}, {"id": "b", "memory": "ontology ENVO terms"}]
+    )
+    index = RunMemoryIndex(service, run_id="run-4")
+
+    for _ in range(3):
+        results = index.search("which ontology for soil samples", session_id="run-4", limit=2)
+    assert [m["id"] for m in results][0] == "a"
+    assert index.search("ontology prefixes", session_id="run-4", limit=1)[0]["id"] == "b"
+
+    assert service.list_calls == ["run-4"]
+    assert service.embedded == [("which ontology for soil samples", "search"), ("ontology prefixes", "search")]
+    service.search.assert_not_called()
+
+    service.memories.append({"id": "c", "memory": "retry after critic rejection"})
+    index.mark_dirty("run-4")
+    assert index.search("retry", session_id="run-4", limit=1)[0]["id"] == "c"
+    assert service.retrieved_ids == ["a", "b", "c"]
+    local = memory_run_metrics("run-4")["local_index"]
+    assert local == {"prefetches": 2, "searches": 5, "embedding_calls": 3, "embedding_memo_hits": 2}
+
+
+def test_run_index_falls_back_to_mem0_search_when_prefetch_fails():
+    service = MagicMock()
+    service.get_all_memories.side_effect = RuntimeError("qdrant down")
+    service.search.return_value = [{"id": "x", "memory": "remote"}]
+    index = RunMemoryIndex(service, run_id="run-5")
+
+    assert index.search("q", session_id="run-5", limit=3) == [{"id": "x", "memory": "remote"}]
+    assert index.uses_fallback
+    assert index.search("q", session_id="run-5", limit=3)[0]["id"] == "x"
+    assert service.get_all_memories.call_count == 1
+
+
+def test_run_index_falls_back_when_the_listing_may_be_truncated(monkeypatch):
+    from fairifier.services import mem0_local_index
+
+    monkeypatch.setattr(mem0_local_index, "MEMORY_LIST_LIMIT", 2)
+    service = _FakeMemoryService(
+        [{"id": str(i), "memory": f"soil note {i}"} for i in range(3)]
+    )
+    service.search.return_value = [{"id": "2", "memory": "soil note 2"}]
+    index = RunMemoryIndex(service, run_id="run-7")
+
+    assert index.search("soil", session_id="run-7", limit=1) == [{"id": "2", "memory": "soil note 2"}]
+    assert index.uses_fallback
+
+
+def test_planning_prefetches_the_run_scopes_before_the_first_search():
+    service = _FakeMemoryService(
+        [{"id": "a", "memory": "soil package MIxS"}, {"id": "b", "memory": "ontology ENVO terms"}]
+    )
+    service.is_cold_start = MagicMock(return_value=False)
+    llm_helper = MagicMock()
+    llm_helper._call_llm = AsyncMock(side_effect=RuntimeError("offline"))
+    node = OrchestrateNode(llm_helper=llm_helper, mem0_service=service)
+    state = {"session_id": "run-8", "memory_scope_id": "user-1", "document_info": {}}
+    events = []
+    list_memories, embed = service.get_all_memories, service._embed
+    service.get_all_memories = lambda scope, **kw: events.append(scope) or list_memories(scope, **kw)
+    service.memory.embedding_model.embed.side_effect = lambda text, action: events.append(action) or embed(text, action)
+
+    asyncio.run(node._plan_workflow_node(state))
+
+    assert events == ["run-8", "user-1", "search"]
+    service.search.assert_not_called()
+    assert memory_run_metrics("run-8")["local_index"]["prefetches"] == 2
+
+
+def test_failed_prefetch_switches_the_run_to_mem0_search():
+    service = MagicMock()
+    service.get_all_memories.side_effect = RuntimeError("qdrant down")
+    service.search.return_value = [{"id": "x", "memory": "remote"}]
+    index = RunMemoryIndex(service, run_id="run-9")
+
+    index.prefetch(["run-9", "user-1"])
+
+    assert index.uses_fallback
+    assert index.search("q", session_id="run-9", limit=3)[0]["id"] == "x"
+    assert service.get_all_memories.call_count == 1
+
+
+class _Embedder:
+    def __init__(self, model=None):
+        self.config = SimpleNamespace(model=model)
+        self.calls = 0
+
+    def embed(self, text, action):
+        self.calls += 1
+        return [1.0, 0.0]
+
+
+def test_embedding_memo_is_keyed_by_embedder_model_not_service_identity(monkeypatch):
+    from fairifier.services import mem0_local_index
+
+    first, second = _Embedder("nomic-embed-text"), _Embedder("nomic-embed-text")
+    for embedder in (first, second):
+        embed_memoized(SimpleNamespace(memory=SimpleNamespace(embedding_model=embedder)), "soil")
+    assert (first.calls, second.calls) == (1, 0)
+
+    other_model = _Embedder("bge-m3")
+    embed_memoized(SimpleNamespace(memory=SimpleNamespace(embedding_model=other_model)), "soil")
+    assert other_model.calls == 1
+
+    # Unnamed embedders are keyed by id(); simulate a new object reusing one.
+    monkeypatch.setattr(mem0_local_index, "_embedder_key", lambda _embedder: ("id", 1))
+    old, new = _Embedder(), _Embedder()
+    for embedder in (old, new):
+        embed_memoized(SimpleNamespace(memory=SimpleNamespace(embedding_model=embedder)), "ontology")
+    assert (old.calls, new.calls) == (1, 1)
@@ -312,6 +312,23 @@ class TestMem0Service:
             top_k=1000
         )
 
+    @patch('mem0.Memory')
+    def test_get_all_memories_raises_where_list_memories_returns_empty(self, mock_memory):
+        """Callers that cache listings must be able to tell failures from empty scopes."""
+        try:
+            from fairifier.services.mem0_service import Mem0Service
+        except ImportError:
+            pytest.skip("mem0 not installed")
+
+        mock_mem = MagicMock()
+        mock_mem.get_all.side_effect = RuntimeError("qdrant timeout")
+        mock_memory.from_config.return_value = mock_mem
+
+        service = Mem0Service({"test": "config"})
+        assert service.list_memories("session_123") == []
+        with pytest.raises(RuntimeError, match="qdrant timeout"):
+            service.get_all_memories("session_123")
+
     @patch("mem0.Memory")
     def test_list_memories_limit_only_api(self, mock_memory):
         """Use limit= when mem0.get_all does not accept top_k."""
@@ -0,0 +1,105 @@
+"""Tests for the background mem0 TTL sweeper."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from fairifier.services.mem0_service import Mem0Service
+from fairifier.services.mem0_ttl_sweeper import MemoryTTLSweeper
+
+qdrant_client = pytest.importorskip("qdrant_client")
+models = pytest.importorskip("qdrant_client.models")
+
+pytestmark = pytest.mark.filterwarnings("ignore:Payload indexes have no effect")
+
+
+def _qdrant_service(days_by_scope):
+    client = qdrant_client.QdrantClient(":memory:")
+    client.create_collection(
+        "memories", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE)
+    )
+    now = datetime.now(timezone.utc)
+    client.upsert(
+        "memories",
+        [
+            models.PointStruct(
+                id=str(uuid.uuid4()),
+                vector=[1.0, 0.0],
+                payload={"user_id": scope, "expires_at": (now + timedelta(days=days)).isoformat()},
+            )
+            for scope, days in days_by_scope
+        ],
+    )
+    service = Mem0Service.__new__(Mem0Service)
+    service.enabled = True
+    service.memory = SimpleNamespace(vector_store=SimpleNamespace(client=client, collection_name="memories"))
+    service._index_deleted = MagicMock()
+    service.list_memories = MagicMock(side_effect=AssertionError("Qdrant path must not list scopes"))
+    return service, client
+
+
+def _remaining(client):
+    points, _ = client.scroll("memories", limit=100, with_payload=True)
+    return sorted(p.payload["user_id"] for p in points)
+
+
+def test_sweeper_deletes_expired_points_in_batches_with_a_cursor():
+    service, client = _qdrant_service(
+        [("run-a", -2), ("run-a", -1), ("run-b", -5), ("run-b", 3), ("global", 20)]
+    )
+    sweeper = MemoryTTLSweeper(service, batch_size=2, max_batches_per_tick=1)
+
+    first = sweeper.sweep_once()
+    assert first == {"mode": "qdrant_filter", "purged": 2, "batches": 1, "pass_complete": False}
+    assert sweeper.stats()["cursor_active"]
+
+    assert sweeper.sweep_all() == 1
+    assert _remaining(client) == ["global", "run-b"]
+    stats = sweeper.stats()
+    assert stats["purged"] == 3 and stats["passes"] == 1 and stats["errors"] == 0
+    assert sum(len(c.args[0]) for c in service._index_deleted.call_args_list) == 3
+
+
+def test_purge_expired_memories_bulk_deletes_one_scope():
+    service, client = _qdrant_service([("run-a", -2), ("run-b", -1), ("run-a", 4)])
+
+    assert service.purge_expired_memories("run-a", batch_size=1) == 1
+    assert _remaining(client) == ["run-a", "run-b"]
+
+
+def test_sweeper_walks_scopes_without_qdrant():
+    service = SimpleNamespace(
+        memory=SimpleNamespace(vector_store=SimpleNamespace()),
+        purge_expired_memories=MagicMock(side_effect=[1, 0, 2, 5, 0]),
+        is_available=lambda: True,
+    )
+    sweeper = MemoryTTLSweeper(
+        service, max_batches_per_tick=2, scopes=lambda: ["global", "run-a", "run-b"]
+    )
+
+    assert sweeper.sweep_once() == {"mode": "scan", "purged": 1, "batches": 2, "pass_complete": False}
+    assert sweeper.sweep_once()["pass_complete"]
+    assert sweeper.sweep_once()["purged"] == 5
+    assert [c.args[0] for c in service.purge_expired_memories.call_args_list] == [
+        "global", "run-a", "run-b", "global", "run-a",
+    ]
+
+
+def test_configured_sweeper_starts_only_with_an_interval(monkeypatch):
+    from fairifier.config import config
+    from fairifier.services.mem0_ttl_sweeper import memory_sweeper_stats, start_memory_ttl_sweeper
+
+    service = SimpleNamespace(
+        memory=SimpleNamespace(vector_store=SimpleNamespace()),
+        purge_expired_memories=MagicMock(return_value=0),
+        is_available=lambda: True,
+    )
+    assert start_memory_ttl_sweeper(service) is None
+
+    monkeypatch.setattr(config, "mem0_ttl_sweep_interval_seconds", 3600)
+    sweeper = start_memory_ttl_sweeper(service)
+    assert sweeper is not None and sweeper.running
+    assert memory_sweeper_stats()["interval_seconds"] == 3600
@@ -0,0 +1,145 @@
+"""Tests for the mem0 write-behind queue and search budget."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from fairifier.config import config
+from fairifier.graph.nodes import OrchestrateNode
+from fairifier.services.mem0_write_queue import (
+    MemoryWriteQueue,
+    flush_memory_writes,
+    memory_run_metrics,
+    search_memories,
+)
+from fairifier.utils.report_generator import WorkflowReportGenerator
+
+
+def _write(queue, text, run_id="run-1"):
+    return queue.submit(
+        messages=[{"role": "assistant", "content": text}],
+        session_id="scope",
+        agent_id="JSONGenerator",
+        metadata={"k": "v"},
+        run_id=run_id,
+    )
+
+
+def test_queue_writes_in_background_and_retries_failures():
+    service = MagicMock()
+    service.is_available.return_value = True
+    service.add.side_effect = [{}, {"results": [{"id": "a"}]}, {"results": [{"id": "b"}]}]
+    sleeps = []
+    queue = MemoryWriteQueue(service, max_retries=2, sleep=sleeps.append)
+
+    assert _write(queue, "first") and _write(queue, "second")
+    assert queue.flush(timeout=2)
+
+    assert service.add.call_count == 3
+    assert service.add.call_args.kwargs["metadata"] == {"k": "v"}
+    assert len(sleeps) == 1
+    writes = memory_run_metrics("run-1")["writes"]
+    assert writes["enqueued"] == 2 and writes["completed"] == 2
+    assert writes["retries"] == 1 and writes["failed"] == 0
+    queue.close(timeout=1)
+
+
+def test_full_queue_drops_writes_without_blocking():
+    release = threading.Event()
+    service = MagicMock()
+    service.add.side_effect = lambda **_kw: release.wait(2) or {"results": []}
+    queue = MemoryWriteQueue(service, max_size=2)
+
+    started = time.perf_counter()
+    outcomes = [_write(queue, f"insight {i}") for i in range(4)]
+    assert time.perf_counter() - started < 0.5
+
+    assert outcomes == [True, True, False, False]
+    release.set()
+    assert queue.flush(timeout=2)
+    metrics = memory_run_metrics("run-1")
+    assert metrics["writes"]["dropped"] == 2
+    assert metrics["max_queue_depth"] == 2
+    queue.close(timeout=1)
+
+
+def test_search_gives_up_after_budget():
+    service = MagicMock()
+    service.search.side_effect = lambda **_kw: time.sleep(0.5) or [{"id": "late"}]
+
+    started = time.perf_counter()
+    assert search_memories(service, query="q", session_id="s", limit=5, timeout=0.05, run_id="run-2") == []
+    assert time.perf_counter() - started < 0.4
+    assert memory_run_metrics("run-2")["search"]["timeouts"] == 1
+
+
+def test_orchestrator_queues_memory_writes_and_reports_metrics(monkeypatch):
+    monkeypatch.setattr(config, "mem0_async_writes", True)
+    service = MagicMock()
+    service.add.return_value = {"results": [{"id": "m"}]}
+    service.search.return_value = [{"id": "m1", "memory": "use MIxS soil"}]
+    node = OrchestrateNode(mem0_service=service)
+    state = {"session_id": "run-3", "document_info": {"research_domain": "soil"}}
+
+    node._store_memory_insight(
+        state=state,
+        session_id="run-3",
+        agent_id="KnowledgeRetriever",
+        insight="soil studies prefer MIxS fields",
+        metadata={},
+    )
+    memories = node._retrieve_relevant_memories("JSONGenerator", state, "run-3", top_k=3)
+    assert flush_memory_writes(timeout=2)
+
+    assert memories == [{"id": "m1", "memory": "use MIxS soil"}]
+    assert service.add.call_args.kwargs["session_id"] == "run-3"
+    metrics = memory_run_metrics("run-3")
+    assert metrics["writes"]["completed"] == 1
+    assert metrics["search"]["calls"] == 1
+
+    text = WorkflowReportGenerator().generate_text_report(
+        {"execution_summary": {"memory": metrics}, "quality_metrics": {}, "field_analysis": {"error": "x"}}
+    )
+    assert "MEMORY I/O" in text and "1/1 completed" in text
+
+
+def test_flush_for_one_run_ignores_other_runs_writes():
+    release = threading.Event()
+    service = MagicMock()
+    service.add.side_effect = (
+        lambda **kw: (release.wait(5) if kw["messages"][0]["content"] == "slow" else None)
+        or {"results": []}
+    )
+    queue = MemoryWriteQueue(service, batch_size=1)
+
+    _write(queue, "slow", run_id="run-other")
+    _write(queue, "mine", run_id="run-mine")
+    assert not queue.flush(timeout=0.1, run_id="run-mine")
+    release.set()
+    assert queue.flush(timeout=2, run_id="run-mine")
+    assert queue.flush(timeout=2)
+    queue.close(timeout=1)
+
+
+def test_next_step_search_waits_for_this_runs_queued_insight(monkeypatch):
+    monkeypatch.setattr(config, "mem0_async_writes", True)
+    monkeypatch.setattr(config, "mem0_search_budget_seconds", 5.0)
+    stored = []
+    service = MagicMock()
+    service.add.side_effect = lambda **kw: time.sleep(0.2) or stored.append(kw) or {"results": [{"id": "m"}]}
+    service.search.side_effect = lambda **kw: (
+        [{"id": "m", "memory": "soil studies prefer MIxS fields"}] if stored else []
+    )
+    node = OrchestrateNode(mem0_service=service)
+    state = {"session_id": "run-6", "document_info": {"research_domain": "soil"}}
+
+    node._store_memory_insight(
+        state=state,
+        session_id="run-6",
+        agent_id="KnowledgeRetriever",
+        insight="soil studies prefer MIxS fields",
+        metadata={},
+    )
+    memories = node._retrieve_relevant_memories("JSONGenerator", state, "run-6", top_k=3)
+
+    assert [m["id"] for m in memories] == ["m"]
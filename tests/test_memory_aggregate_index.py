@@ -0,0 +1,89 @@
+"""Tests for the incremental memory aggregate index behind the memory cloud and overview."""
+
+from collections import Counter
+from unittest.mock import MagicMock
+
+from fairifier.apps.api.routers.v1 import _build_word_entries, _tokenize_memories
+from fairifier.config import config
+from fairifier.services.mem0_service import Mem0Service
+from fairifier.services.memory_aggregate_index import MemoryAggregateIndex
+
+MEMORIES = [
+    {"id": "m1", "memory": "soil studies prefer MIxS soil fields", "metadata": {"agent_id": "JSONGenerator"}},
+    {"id": "m2", "memory": "earthworm soil ontology ENVO", "metadata": {"agent_id": "KnowledgeRetriever"}},
+    {"id": "m3", "memory": "alpine grassland metagenomics", "metadata": {"workflow_step": "parsing"}},
+    {"id": "m4", "memory": "   ", "metadata": {"agent_id": "JSONGenerator"}},
+]
+
+
+def test_index_matches_legacy_word_counts_and_tracks_deletes(tmp_path):
+    index = MemoryAggregateIndex(tmp_path / "aggregates.sqlite3")
+    assert index.record_added("run-a", MEMORIES[:2]) == 2
+    index.record_added("run-b", MEMORIES[2:])
+
+    legacy = _build_word_entries(_tokenize_memories(MEMORIES))
+    indexed = index.word_frequencies(["run-a", "run-b"])
+    assert Counter({e.text: e.value for e in legacy}) == Counter({t: c for t, c, _ in indexed})
+    assert indexed[0] == ("soil", 3, "JSONGenerator")
+    assert index.memory_count(["run-a", "run-b"]) == 3
+
+    index.record_deleted(["m1"])
+    assert dict((t, c) for t, c, _ in index.word_frequencies(["run-a"])) == {
+        "earthworm": 1, "soil": 1, "ontology": 1, "envo": 1,
+    }
+    assert index.session_overview("run-a")["agents"] == {"KnowledgeRetriever": 1}
+
+    # Survives a reopen, so counts are not recomputed per request.
+    index.close()
+    reopened = MemoryAggregateIndex(tmp_path / "aggregates.sqlite3")
+    assert reopened.memory_count(["run-a", "run-b"]) == 2
+
+
+def test_ensure_synced_loads_each_session_once():
+    index = MemoryAggregateIndex()
+    loader = MagicMock(return_value=MEMORIES[:2])
+
+    index.ensure_synced(["run-a", "run-a"], loader)
+    index.ensure_synced(["run-a"], loader)
+    assert loader.call_count == 1
+    assert index.synced_sessions() == ["run-a"]
+
+    assert index.resync_session("run-a", MEMORIES[2:3]) == 1
+    assert index.session_overview("run-a")["memory_texts"] == ["alpine grassland metagenomics"]
+
+
+def test_ensure_synced_retries_sessions_whose_listing_failed():
+    index = MemoryAggregateIndex()
+    loader = MagicMock(side_effect=[RuntimeError("qdrant timeout"), MEMORIES[:2]])
+
+    index.ensure_synced(["run-a"], loader)
+    assert index.synced_sessions() == []
+
+    index.ensure_synced(["run-a"], loader)
+    assert index.synced_sessions() == ["run-a"]
+    assert index.session_overview("run-a")["total_memories"] == 2
+
+
+def test_overview_is_served_from_index_and_maintained_on_write(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "memory_index_enabled", True)
+    monkeypatch.setattr(config, "memory_index_path", tmp_path / "aggregates.sqlite3")
+    service = Mem0Service.__new__(Mem0Service)
+    service.memory = MagicMock()
+    service.get_all_memories = MagicMock(return_value=MEMORIES[:2])
+
+    total, texts, agents, themes = service._overview_aggregates("run-a")
+    assert total == 2 and agents == {"JSONGenerator": 1, "KnowledgeRetriever": 1}
+    assert themes == service._extract_themes(texts)
+
+    service._index_written(
+        "run-a",
+        {"results": [{"id": "m5", "memory": "soil microbiome sequencing", "event": "ADD"}]},
+        {"agent_id": "JSONGenerator"},
+    )
+    service._index_deleted(["m2"])
+    total, texts, agents, themes = service._overview_aggregates("run-a")
+
+    assert service.get_all_memories.call_count == 1
+    assert total == 2 and agents == {"JSONGenerator": 2}
+    assert texts[-1] == "soil microbiome sequencing"
+    assert themes[0] == "soil"
@@ -1,6 +1,8 @@
 """Tests for MinerU checksum cache."""
 
+import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import Mock
@@ -9,6 +11,8 @@ from fairifier.config import config
 from fairifier.graph.langgraph_app import FAIRifierLangGraphApp
 from fairifier.services.mineru_cache import (
     cache_entry_ready,
+    cache_stats,
+    prune_cache,
     sha256_file,
     store_mineru_output_after_success,
     try_get_cached_mineru_tree,
@@ -74,6 +78,54 @@ class TestMinerUCache(unittest.TestCase):
             try_get_cached_mineru_tree(cache_root, digest_lookup, proj, "doc")
         )
 
+    def _store(self, cache_root, proj, digest, size):
+        mo = proj / f"mineru_{digest[:4]}"
+        (mo / "images").mkdir(parents=True)
+        (mo / "doc.md").write_text("# t", encoding="utf-8")
+        (mo / "images" / "fig.png").write_bytes(b"x" * size)
+        store_mineru_output_after_success(cache_root, digest, mo)
+
+    def test_hit_hardlinks_read_only_files_or_copies_writable_ones(self):
+        base = Path(tempfile.mkdtemp())
+        cache_root = base / "cache"
+        digest = "f" * 64
+        proj = base / "proj"
+        self._store(cache_root, proj, digest, 10)
+        cached_png = cache_root / digest / "images" / "fig.png"
+
+        linked = try_get_cached_mineru_tree(cache_root, digest, base / "run1", "doc", materialize="hardlink")
+        self.assertTrue(os.path.samefile(linked / "images" / "fig.png", cached_png))
+        self.assertFalse(os.stat(cached_png).st_mode & 0o222)
+        self.assertFalse((linked / ".mineru_cache_complete").exists())
+
+        copied = try_get_cached_mineru_tree(cache_root, digest, base / "run2", "doc", materialize="copy")
+        self.assertFalse(os.path.samefile(copied / "images" / "fig.png", cached_png))
+        self.assertTrue(os.stat(copied / "doc.md").st_mode & 0o200)
+        self.assertEqual(cache_stats(cache_root)["hits"], 2)
+
+    def test_store_evicts_least_recently_used_entries_beyond_cap(self):
+        base = Path(tempfile.mkdtemp())
+        cache_root = base / "cache"
+        proj = base / "proj"
+        old, used, new = "1" * 64, "2" * 64, "3" * 64
+        self._store(cache_root, proj, old, 1000)
+        self._store(cache_root, proj, used, 1000)
+        time.sleep(0.01)
+        try_get_cached_mineru_tree(cache_root, used, base / "run", "doc")
+
+        self.assertEqual(
+            [e["digest"] for e in prune_cache(cache_root, 1500, dry_run=True)], [old]
+        )
+        self.assertTrue(cache_entry_ready(cache_root / old))
+
+        store_mineru_output_after_success(cache_root, new, proj / "mineru_1111", max_bytes=2500)
+        self.assertFalse((cache_root / old).exists())
+        self.assertTrue(cache_entry_ready(cache_root / used))
+        self.assertTrue(cache_entry_ready(cache_root / new))
+        stats = cache_stats(cache_root)
+        self.assertEqual(stats["entries"], 2)
+        self.assertLessEqual(stats["bytes"], 2500)
+
     def test_langgraph_single_pdf_path_stores_then_hits_shared_cache(self):
         base = Path(tempfile.mkdtemp())
         cache_root = base / "cache"
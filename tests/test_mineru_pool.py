@@ -0,0 +1,137 @@
+"""Tests for page-range parallel MinerU conversion."""
+
+import json
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from fairifier.services.mineru_client import MinerUClient, MinerUConversionError, MinerUConversionResult
+from fairifier.services.mineru_pool import plan_page_ranges, range_cache_key
+from fairifier.services.mineru_cache import sha256_file
+
+pypdf = pytest.importorskip("pypdf")
+
+
+def _make_pdf(path: Path, pages: int) -> Path:
+    writer = pypdf.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=200, height=200)
+    with open(path, "wb") as handle:
+        writer.write(handle)
+    return path
+
+
+class _FakeMinerU:
+    """Stands in for ``MinerUClient.convert_single`` and writes a MinerU-like tree."""
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+
+    def __call__(self, src_path, out_dir):
+        pages = len(pypdf.PdfReader(str(src_path)).pages)
+        with self.lock:
+            self.calls.append(src_path.stem)
+        if self.fail_on and self.fail_on in src_path.stem:
+            raise MinerUConversionError("boom")
+        parse_dir = out_dir / src_path.stem / "auto"
+        (parse_dir / "images").mkdir(parents=True)
+        (parse_dir / "images" / "fig.jpg").write_bytes(src_path.stem.encode())
+        (parse_dir / f"{src_path.stem}.md").write_text(
+            f"# {src_path.stem}\n\n![](images/fig.jpg)\n", encoding="utf-8"
+        )
+        blocks = [{"type": "text", "text": f"p{i}", "page_idx": i} for i in range(pages)]
+        blocks.append({"type": "image", "img_path": "images/fig.jpg", "page_idx": 0})
+        (parse_dir / f"{src_path.stem}_content_list_v2.json").write_text(json.dumps(blocks), encoding="utf-8")
+        return _collect(src_path, out_dir)
+
+
+def _collect(src_path, out_dir):
+    parse_dir = out_dir / src_path.stem / "auto"
+    md = parse_dir / f"{src_path.stem}.md"
+    return MinerUConversionResult(
+        input_path=src_path,
+        output_dir=out_dir,
+        markdown_path=md,
+        markdown_text=md.read_text(encoding="utf-8"),
+        images_dir=parse_dir / "images",
+        parse_dir=parse_dir,
+    )
+
+
+def _client(tmp_path, **overrides):
+    options = dict(page_chunk_size=3, page_chunk_workers=2, page_chunk_min_pages=5, chunk_cache_root=tmp_path / "cache")
+    options.update(overrides)
+    client = MinerUClient(cli_path="mineru", server_url="", backend="pipeline", **options)
+    fake = _FakeMinerU()
+    client.convert_single = fake
+    return client, fake
+
+
+def test_plan_page_ranges_covers_every_page_once():
+    assert plan_page_ranges(7, 3) == [(0, 3), (3, 6), (6, 7)]
+    assert plan_page_ranges(3, 10) == [(0, 3)]
+
+
+def test_large_pdf_is_converted_in_ranges_and_merged_with_page_offsets(tmp_path):
+    pdf = _make_pdf(tmp_path / "supp.pdf", 7)
+    client, fake = _client(tmp_path)
+
+    result = client.convert_document(pdf, output_dir=tmp_path / "out")
+
+    assert sorted(fake.calls) == ["supp__p0001-0003", "supp__p0004-0006", "supp__p0007-0007"]
+    assert result.markdown_path == tmp_path / "out" / "supp" / "auto" / "supp.md"
+    text = result.markdown_text
+    assert text.index("supp__p0001-0003") < text.index("supp__p0004-0006") < text.index("supp__p0007-0007")
+    assert "](images/p0004_fig.jpg)" in text
+    assert (result.images_dir / "p0004_fig.jpg").read_bytes() == b"supp__p0004-0006"
+
+    blocks = json.loads(result.content_list_v2_path.read_text(encoding="utf-8"))
+    assert [b["page_idx"] for b in blocks if b["type"] == "text"] == list(range(7))
+    assert {b["img_path"] for b in blocks if b["type"] == "image"} == {
+        "images/p0001_fig.jpg", "images/p0004_fig.jpg", "images/p0007_fig.jpg",
+    }
+    assert result.structured_blocks[0]["page_idx"] == 0
+
+
+def test_cached_ranges_are_reused_and_only_missing_ranges_convert(tmp_path):
+    pdf = _make_pdf(tmp_path / "supp.pdf", 7)
+    client, fake = _client(tmp_path)
+    client.convert_document(pdf, output_dir=tmp_path / "run1")
+
+    digest = sha256_file(pdf)
+    shutil.rmtree(tmp_path / "cache" / range_cache_key(digest, 3, 6, "pipeline"))
+    fake.calls.clear()
+    result = client.convert_document(pdf, output_dir=tmp_path / "run2")
+
+    assert fake.calls == ["supp__p0004-0006"]
+    assert "supp__p0001-0003" in result.markdown_text and "supp__p0007-0007" in result.markdown_text
+
+
+def test_range_stores_evict_beyond_the_cache_cap(tmp_path):
+    pdf = _make_pdf(tmp_path / "supp.pdf", 7)
+    client, fake = _client(tmp_path, page_chunk_workers=1, chunk_cache_max_bytes=1)
+
+    result = client.convert_document(pdf, output_dir=tmp_path / "out")
+
+    assert len(fake.calls) == 3
+    assert "supp__p0001-0003" in result.markdown_text
+    digest = sha256_file(pdf)
+    keys = [range_cache_key(digest, start, end, "pipeline") for start, end in plan_page_ranges(7, 3)]
+    assert sum((tmp_path / "cache" / key).is_dir() for key in keys) == 1
+
+
+def test_small_pdf_and_failed_ranges(tmp_path):
+    small = _make_pdf(tmp_path / "short.pdf", 4)
+    client, fake = _client(tmp_path)
+    client.convert_document(small, output_dir=tmp_path / "short_out")
+    assert fake.calls == ["short"]
+
+    big = _make_pdf(tmp_path / "big.pdf", 6)
+    client, fake = _client(tmp_path, chunk_cache_root=None)
+    fake.fail_on = "p0004"
+    with pytest.raises(MinerUConversionError, match="1/2 page ranges"):
+        client.convert_document(big, output_dir=tmp_path / "big_out")
@@ -0,0 +1,126 @@
+"""Tests for the cancellable MinerU subprocess runner."""
+
+import os
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from fairifier.services.mineru_client import MinerUCancelledError, MinerUClient, MinerUConversionError
+from fairifier.services.mineru_process import parse_progress_line
+from fairifier.utils.run_control import (
+    bind_run,
+    reset_run_stop_requested,
+    run_progress_listener,
+    set_run_stop_requested,
+)
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="stub MinerU CLI is a POSIX script")
+
+_STUB = '''#!{python}
+import os, subprocess, sys, time
+from pathlib import Path
+
+args = sys.argv[1:]
+src = Path(args[args.index("-p") + 1])
+out = Path(args[args.index("-o") + 1])
+mode = os.environ["STUB_MODE"]
+parse_dir = out / src.stem / "auto"
+parse_dir.mkdir(parents=True, exist_ok=True)
+if mode == "idle":
+    time.sleep(30)
+for page in range(1, 4):
+    sys.stderr.write("\\rProcessing pages: %3d%%|###| %d/3 [00:01<00:00]" % (page * 100 // 3, page))
+    sys.stderr.flush()
+    time.sleep(0.05)
+sys.stderr.write("\\n")
+if mode == "hang":
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    Path(os.environ["STUB_CHILD_PID"]).write_text(str(child.pid))
+    while True:
+        print("still working", flush=True)
+        time.sleep(0.2)
+(parse_dir / (src.stem + ".md")).write_text("# converted", encoding="utf-8")
+'''
+
+
+@pytest.fixture
+def stub_client(tmp_path, monkeypatch):
+    cli = tmp_path / "mineru"
+    cli.write_text(_STUB.format(python=sys.executable), encoding="utf-8")
+    cli.chmod(cli.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("STUB_CHILD_PID", str(tmp_path / "child.pid"))
+    src = tmp_path / "paper.pdf"
+    src.write_bytes(b"%PDF-1.4\n")
+
+    def build(mode, **kwargs):
+        monkeypatch.setenv("STUB_MODE", mode)
+        return MinerUClient(cli_path=str(cli), server_url="", backend="pipeline", **kwargs), src
+
+    yield build
+    reset_run_stop_requested("run-1")
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_parse_progress_line_reads_tqdm_bars():
+    assert parse_progress_line("Processing pages:  45%|####5     | 9/20 [00:03<00:04,  2.50it/s]") == {
+        "step": "Processing pages", "current": 9, "total": 20, "percent": 45,
+    }
+    assert parse_progress_line("2025-01-01 | INFO | loading model") is None
+
+
+def test_conversion_reports_page_progress_to_the_bound_run(stub_client, tmp_path):
+    client, src = stub_client("ok", timeout_seconds=30)
+    events = []
+
+    with run_progress_listener("run-1", events.append), bind_run("run-1"):
+        result = client.convert_document(src, output_dir=tmp_path / "out")
+
+    assert result.markdown_text == "# converted"
+    assert events and events[-1]["current"] == events[-1]["total"] == 3
+    assert {e["document"] for e in events} == {"paper.pdf"}
+    assert all(e["stage"] == "mineru" for e in events)
+
+
+def test_stop_request_kills_process_group_and_removes_partial_output(stub_client, tmp_path):
+    client, src = stub_client("hang", timeout_seconds=60)
+    out = tmp_path / "out"
+    child_pid_file = tmp_path / "child.pid"
+
+    def stop_when_child_started():
+        deadline = time.monotonic() + 20
+        while not child_pid_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        set_run_stop_requested(True, run_id="run-1")
+
+    threading.Thread(target=stop_when_child_started, daemon=True).start()
+    started = time.monotonic()
+    with bind_run("run-1"), pytest.raises(MinerUCancelledError):
+        client.convert_document(src, output_dir=out)
+
+    assert time.monotonic() - started < 20
+    assert not out.exists()
+    child_pid = int(child_pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while _pid_alive(child_pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _pid_alive(child_pid)
+
+
+def test_idle_watchdog_fires_before_the_total_timeout(stub_client, tmp_path):
+    client, src = stub_client("idle", timeout_seconds=60, idle_timeout_seconds=1)
+
+    started = time.monotonic()
+    with pytest.raises(MinerUConversionError, match="no output for 1 seconds"):
+        client.convert_document(src, output_dir=tmp_path / "out")
+    assert time.monotonic() - started < 15
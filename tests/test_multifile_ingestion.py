@@ -6,6 +6,7 @@ import pandas as pd
 
 from fairifier.config import config
 from fairifier.graph.langgraph_app import FAIRifierLangGraphApp
+from fairifier.graph.nodes import ReadFileNode
 
 
 def _make_app_without_init() -> FAIRifierLangGraphApp:
@@ -366,3 +367,219 @@ def test_directory_bundle_collects_bio_file_paths(tmp_path: Path):
     bio_docs = [d for d in info["input_documents"] if d.get("content_type") == "bio_binary"]
     assert len(bio_docs) == 1
     assert Path(bio_docs[0]["host_path"]).resolve() == bam.resolve()
+
+
+def test_read_tabular_csv_streams_rows_into_workspace_once(tmp_path: Path, monkeypatch):
+    app = _make_app_without_init()
+    monkeypatch.setattr(config, "table_preview_max_rows", 2)
+    csv_path = tmp_path / "big.csv"
+    output_dir = tmp_path / "out"
+    lines = ["sample_id,organism"] + [f"S{i},none" for i in range(500)]
+    lines.append("S500,Eisenia fetida")
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    text, info = app._read_document_content(str(csv_path), output_dir=str(output_dir))
+
+    assert "Preview rows: 2 / 501" in text
+    assert "... (499 more rows omitted)" in text
+    assert info["tables"] == [
+        {
+            "name": "big",
+            "columns": ["sample_id", "organism"],
+            "row_count": 501,
+            "rows_path": info["tables"][0]["rows_path"],
+        }
+    ]
+    workspace = info["source_workspace"]
+    table_path = Path(next(iter(workspace["table_paths"].values())))
+    rows = table_path.read_text(encoding="utf-8").splitlines()
+    assert len(rows) == 501
+    assert json.loads(rows[-1]) == {"sample_id": "S500", "organism": "Eisenia fetida"}
+    assert not (table_path.parent / ".spool").exists()
+    manifest_table = workspace["manifest"]["sources"][0]["tables"][0]
+    assert manifest_table["rows"] == 501
+    assert manifest_table["columns"] == ["sample_id", "organism"]
+
+
+def test_read_tabular_csv_keeps_duplicate_headers_and_ragged_rows(tmp_path: Path):
+    app = _make_app_without_init()
+    csv_path = tmp_path / "ragged.csv"
+    csv_path.write_text("id,value,value,\nS1,1,2,x,overflow\nS2,3\n", encoding="utf-8")
+
+    _, info = app._read_document_content(str(csv_path), output_dir=str(tmp_path / "out"))
+
+    assert info["tables"][0]["columns"] == ["id", "value", "value.1", "Unnamed: 3"]
+    table_path = Path(next(iter(info["source_workspace"]["table_paths"].values())))
+    rows = [json.loads(line) for line in table_path.read_text(encoding="utf-8").splitlines()]
+    assert rows == [
+        {"id": "S1", "value": "1", "value.1": "2", "Unnamed: 3": "x"},
+        {"id": "S2", "value": "3", "value.1": "", "Unnamed: 3": ""},
+    ]
+
+
+def test_read_tabular_xlsx_streams_every_sheet(tmp_path: Path):
+    app = _make_app_without_init()
+    output_dir = tmp_path / "out"
+    xlsx_path = tmp_path / "workbook.xlsx"
+    with pd.ExcelWriter(xlsx_path) as writer:
+        pd.DataFrame([{"sample_id": "S1", "depth": 3}]).to_excel(
+            writer, sheet_name="samples", index=False
+        )
+        pd.DataFrame([{"assay": "16S", "platform": None}]).to_excel(
+            writer, sheet_name="assays", index=False
+        )
+
+    text, info = app._read_document_content(str(xlsx_path), output_dir=str(output_dir))
+
+    assert "[Sheet: samples]" in text
+    assert "[Sheet: assays]" in text
+    table_paths = info["source_workspace"]["table_paths"]
+    assert set(table_paths) == {"source_001:samples", "source_001:assays"}
+    assay_row = json.loads(
+        Path(table_paths["source_001:assays"]).read_text(encoding="utf-8").splitlines()[0]
+    )
+    assert assay_row == {"assay": "16S", "platform": ""}
+
+
+def test_read_tabular_without_workspace_does_not_spool_rows(tmp_path: Path):
+    app = _make_app_without_init()
+    csv_path = tmp_path / "rows.tsv"
+    csv_path.write_text("a\tb\n1\t2\n", encoding="utf-8")
+
+    text, info = app._read_single_document_content(str(csv_path), output_dir=None)
+
+    assert "1\t2" in text
+    assert info["tables"] == [{"name": "rows", "columns": ["a", "b"], "row_count": 1}]
+
+
+def test_read_directory_bundle_process_pool_keeps_priority_order_and_failures(
+    tmp_path: Path, monkeypatch
+):
+    app = _make_app_without_init()
+    monkeypatch.setattr(config, "multi_file_max_inputs", 8)
+    monkeypatch.setattr(config, "bundle_read_workers", 3)
+    monkeypatch.setattr(config, "bundle_read_pool_min_files", 2)
+
+    (tmp_path / "00_readme.txt").write_text("readme", encoding="utf-8")
+    (tmp_path / "main_paper.md").write_text("# Main\n\nstudy", encoding="utf-8")
+    (tmp_path / "sample_metadata.tsv").write_text("id\tsite\nS1\tWadden Sea\n", encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    node = ReadFileNode(app)
+    files = node._prioritize_bundle_files(sorted(p for p in tmp_path.iterdir()))
+    assert node._bundle_read_worker_count(files) == 3
+
+    text, info = app._read_multi_file_bundle(
+        root_dir=tmp_path,
+        output_dir=str(tmp_path / "out"),
+        source_method="directory_bundle",
+    )
+
+    assert [source["path"] for source in info["sources"]] == [
+        "sample_metadata.tsv",
+        "main_paper.md",
+        "00_readme.txt",
+    ]
+    assert text.index("sample_metadata.tsv") < text.index("main_paper.md")
+    assert [failed["path"] for failed in info["failed_sources"]] == ["broken.json"]
+    table_path = Path(next(iter(info["source_workspace"]["table_paths"].values())))
+    assert "Wadden Sea" in table_path.read_text(encoding="utf-8")
+
+
+def test_bundle_read_stays_sequential_for_injected_readers(tmp_path: Path, monkeypatch):
+    app = _make_app_without_init()
+    monkeypatch.setattr(config, "bundle_read_workers", 4)
+    monkeypatch.setattr(config, "bundle_read_pool_min_files", 2)
+    files = [tmp_path / "a.txt", tmp_path / "b.txt"]
+
+    assert ReadFileNode(app)._bundle_read_worker_count(files) == 2
+
+    monkeypatch.setattr(app, "_read_single_document_content", lambda path, output_dir=None: ("", {}))
+    assert ReadFileNode(app)._bundle_read_worker_count(files) == 0
+
+    monkeypatch.setattr(config, "bundle_read_workers", 1)
+    assert ReadFileNode()._bundle_read_worker_count(files) == 0
+
+
+def test_bundle_read_pool_only_starts_for_many_or_large_files(tmp_path: Path, monkeypatch):
+    app = _make_app_without_init()
+    monkeypatch.setattr(config, "bundle_read_workers", 4)
+    monkeypatch.setattr(config, "bundle_read_pool_min_files", 4)
+    monkeypatch.setattr(config, "bundle_read_pool_min_bytes", 1024)
+    files = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        files.append(tmp_path / name)
+        files[-1].write_text("small", encoding="utf-8")
+    node = ReadFileNode(app)
+
+    assert node._bundle_read_worker_count(files) == 0
+    assert node._bundle_read_worker_count(files + [tmp_path / "d.txt"]) == 4
+    files[0].write_text("x" * 2048, encoding="utf-8")
+    assert node._bundle_read_worker_count(files) == 3
+
+
+def test_read_gzipped_tsv_streams_into_table_without_sidecar_file(tmp_path: Path):
+    import gzip
+
+    app = _make_app_without_init()
+    gz_path = tmp_path / "counts.tsv.gz"
+    with gzip.open(gz_path, "wt", encoding="utf-8") as fh:
+        fh.write("gene\tcount\n")
+        for i in range(300):
+            fh.write(f"g{i}\t{i}\n")
+
+    text, info = app._read_document_content(str(gz_path), output_dir=str(tmp_path / "out"))
+
+    assert info["method"] == "tabular_tsv_gz"
+    assert "Table file: counts.tsv.gz" in text
+    assert "Columns (2): gene, count" in text
+    assert not (tmp_path / "counts.tsv").exists()
+    table_path = Path(next(iter(info["source_workspace"]["table_paths"].values())))
+    assert len(table_path.read_text(encoding="utf-8").splitlines()) == 300
+
+
+def test_read_gzipped_text_is_capped_by_context_budget(tmp_path: Path, monkeypatch):
+    import gzip
+
+    app = _make_app_without_init()
+    monkeypatch.setattr(config, "max_doc_context_text", 50)
+    gz_path = tmp_path / "regions.bed.gz"
+    with gzip.open(gz_path, "wt", encoding="utf-8") as fh:
+        fh.write("chr1\t100\t200\n" * 1000)
+
+    text, info = app._read_single_document_content(str(gz_path), output_dir=None)
+
+    assert info["method"] == "decompressed_gzip"
+    assert info["truncated"] is True
+    assert text.startswith("chr1\t100\t200")
+    assert "truncated at 50 chars" in text
+    assert not (tmp_path / "regions.bed").exists()
+
+
+def test_read_tar_gz_lists_members_without_extracting(tmp_path: Path, monkeypatch):
+    import tarfile
+
+    app = _make_app_without_init()
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "README.txt").write_text("sampling site: Wadden Sea", encoding="utf-8")
+    (src / "reads.bam").write_bytes(b"\x00" * 64)
+    tar_path = tmp_path / "bundle.tar.gz"
+    with tarfile.open(tar_path, "w:gz") as tf:
+        tf.add(src / "README.txt", arcname="README.txt")
+        tf.add(src / "reads.bam", arcname="reads.bam")
+
+    def fail_extract(*args, **kwargs):
+        raise AssertionError("archive members must not be extracted to disk")
+
+    monkeypatch.setattr(tarfile.TarFile, "extractall", fail_extract)
+    monkeypatch.setattr(tarfile.TarFile, "extract", fail_extract)
+
+    text, info = app._read_single_document_content(str(tar_path), output_dir=None)
+
+    assert info["method"] == "archive_listed"
+    assert info["member_count"] == 2
+    assert {m["name"] for m in info["members"]} == {"README.txt", "reads.bam"}
+    assert info["parsed_members"] == ["README.txt"]
+    assert "reads.bam (64 bytes)" in text
+    assert "sampling site: Wadden Sea" in text
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import random
+
 from fairifier.agents.knowledge_retriever import KnowledgeRetrieverAgent
 from fairifier.utils.package_selection import (
     build_document_match_text,
+    get_package_ranking_index,
     rank_packages_by_document,
     score_package_relevance,
     summary_to_package_record,
@@ -217,3 +220,29 @@ def test_build_candidate_package_names_padding_includes_local_packages():
     )
 
     assert "petase_enzyme_engineering" in candidates
+
+
+def test_package_ranking_index_matches_per_package_scores():
+    rng = random.Random(11)
+    words = [
+        "soil", "sediment", "illumina", "sequencing", "terrestrial", "microbiome",
+        "earthworm", "assay", "sample", "human", "oral", "environmental", "metagenome",
+    ]
+    packages = [
+        {
+            "name": " ".join(rng.sample(words, 2)),
+            "description": " ".join(rng.choice(words) for _ in range(rng.randint(0, 8))),
+            "sheets": rng.sample(["Sample", "Assay", "Study", "ObservationUnit"], 2),
+        }
+        for _ in range(40)
+    ]
+    packages.append({"name": "levels only", "levels": ["Assay"]})
+
+    for _ in range(20):
+        match_text = " ".join(rng.choice(words + ["the", "rna-seq"]) for _ in range(12))
+        scores = get_package_ranking_index(packages).scores(match_text)
+        assert list(scores) == [score_package_relevance(match_text, pkg) for pkg in packages]
+
+    assert get_package_ranking_index(packages) is get_package_ranking_index(
+        [dict(pkg) for pkg in packages]
+    )
@@ -0,0 +1,112 @@
+"""Tests for the born-digital PDF fast path ahead of MinerU."""
+
+import json
+import textwrap
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fairifier.config import config
+from fairifier.graph.langgraph_app import FAIRifierLangGraphApp
+from fairifier.services.pdf_fast_path import assess_pdf, render_markdown, route_pdf
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("pypdf")
+
+_BODY = textwrap.fill(
+    "Soil samples were collected along an elevation gradient and sequenced for "
+    "metagenomic analysis of microbial community composition. " * 4,
+    90,
+)
+
+
+def _paper_pdf(path: Path, pages: int = 20) -> Path:
+    doc = fitz.open()
+    for index in range(pages):
+        page = doc.new_page()
+        if index == 0:
+            page.insert_text((72, 60), "Earthworm genomes across", fontsize=20)
+            page.insert_text((72, 84), "a tetraploid lineage", fontsize=20)
+        page.insert_text((72, 120), f"{index + 1}. Methods part {index + 1}", fontsize=13)
+        page.insert_text((72, 150), _BODY, fontsize=9)
+    doc.save(str(path))
+    return path
+
+
+def _scanned_pdf(path: Path, pages: int = 4) -> Path:
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 40), 0)
+        page.insert_image(page.rect, pixmap=pixmap)
+    doc.save(str(path))
+    return path
+
+
+def _reader_app(tmp_path):
+    markdown_path = tmp_path / "mineru" / "scan.md"
+    markdown_path.parent.mkdir()
+    markdown_path.write_text("OCR text", encoding="utf-8")
+    app = object.__new__(FAIRifierLangGraphApp)
+    app.mineru_client = None
+    app.mineru_tool = MagicMock()
+    app.mineru_tool.invoke.return_value = {
+        "success": True,
+        "markdown_text": "OCR text",
+        "markdown_path": str(markdown_path),
+        "output_dir": str(markdown_path.parent),
+        "images_dir": None,
+        "method": "mineru",
+    }
+    return app
+
+
+@pytest.fixture
+def fast_path_config(monkeypatch):
+    monkeypatch.setattr(config, "pdf_fast_path_enabled", True)
+    monkeypatch.setattr(config, "pdf_fast_path_workers", 2)
+    monkeypatch.setattr(config, "mineru_cache_enabled", False)
+    monkeypatch.setattr(config, "source_workspace_enabled", True)
+
+
+def test_assessment_separates_born_digital_from_scanned(tmp_path):
+    paper = assess_pdf(_paper_pdf(tmp_path / "paper.pdf"), sample_pages=5)
+    assert paper.confidence == 1.0 and paper.page_kinds == {"text": 5}
+
+    scan = assess_pdf(_scanned_pdf(tmp_path / "scan.pdf"))
+    assert scan.confidence == 0.0 and scan.page_kinds == {"scanned": 4}
+
+
+def test_route_extracts_markdown_with_headings_page_parallel(tmp_path):
+    markdown, route = route_pdf(_paper_pdf(tmp_path / "paper.pdf"), workers=2)
+
+    assert route["route"] == "fast_path" and route["page_count"] == 20
+    assert markdown.startswith("# Earthworm genomes across a tetraploid lineage\n\n## 1. Methods part 1\n")
+    assert markdown.index("## 9. Methods part 9") < markdown.index("## 10. Methods part 10")
+    assert route["heading_count"] == 21
+
+
+def test_render_markdown_keeps_long_large_lines_as_body():
+    long_line = "x" * 200
+    body = "body text " * 40
+    markdown, headings = render_markdown([[("Title", 14.0), (long_line, 14.0), (body, 10.0)]])
+    assert markdown == f"# Title\n\n{long_line}\n{body}\n" and headings == 1
+
+
+def test_reader_records_chosen_path_in_source_manifest(tmp_path, fast_path_config):
+    app = _reader_app(tmp_path)
+    out = tmp_path / "out"
+
+    text, info = app._read_document_content(str(_paper_pdf(tmp_path / "paper.pdf")), str(out))
+    assert info["method"] == "pdf_fast_path" and "## 3. Methods part 3" in text
+    app.mineru_tool.invoke.assert_not_called()
+    manifest = json.loads(Path(info["source_workspace"]["manifest_path"]).read_text(encoding="utf-8"))
+    assert manifest["sources"][0]["extraction"]["route"] == "fast_path"
+
+    text, info = app._read_document_content(str(_scanned_pdf(tmp_path / "scan.pdf")), str(out))
+    app.mineru_tool.invoke.assert_called_once()
+    assert text == "OCR text" and info["method"] == "mineru"
+    assert info["pdf_route"]["route"] == "mineru"
+    manifest = json.loads(Path(info["source_workspace"]["manifest_path"]).read_text(encoding="utf-8"))
+    assert manifest["sources"][0]["extraction"]["page_kinds"] == {"scanned": 4}
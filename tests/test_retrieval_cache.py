@@ -0,0 +1,95 @@
+"""Tests for the two-tier retrieval tool cache."""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from fairifier.services.retrieval_cache import (
+    ProcessLRUCache,
+    get_cache_bucket,
+    get_cached_value,
+    make_cache_key,
+    retrieval_cache_stats,
+    store_cached_value,
+)
+
+
+def test_cached_values_are_frozen_and_returned_without_copying():
+    state = {"retrieval_cache": {}}
+    bucket = get_cache_bucket(state, "fairds_tools")
+    key = make_cache_key("get_package", {"package_name": "soil"})
+
+    stored = store_cached_value(bucket, key, {"data": {"metadata": [{"label": "depth"}]}})
+    hit = get_cached_value(bucket, key)
+
+    assert hit is stored
+    with pytest.raises(TypeError):
+        hit["data"]["metadata"].append({"label": "ph"})
+    with pytest.raises(TypeError):
+        hit["data"]["extra"] = 1
+    assert json.loads(json.dumps(hit)) == {"data": {"metadata": [{"label": "depth"}]}}
+    mutable = copy.deepcopy(hit)
+    mutable["data"]["metadata"].append({"label": "ph"})
+    assert type(pickle.loads(pickle.dumps(hit))) is dict
+    assert bucket[key] is True
+
+
+def test_process_tier_is_shared_across_runs():
+    key = make_cache_key("http_get_json", {"url": "https://example.org"})
+    first_run = get_cache_bucket({}, "science_tools")
+    second_run = get_cache_bucket({}, "science_tools")
+
+    store_cached_value(first_run, key, {"ok": True})
+
+    assert get_cached_value(second_run, key) == {"ok": True}
+    stats = retrieval_cache_stats()
+    assert stats["process"]["hits"] == 1
+    assert stats["run"]["misses"] == 1
+    assert first_run["__run__"] != second_run["__run__"]
+
+
+def test_legacy_bucket_payloads_are_migrated_to_keys():
+    key = make_cache_key("get_terms", {})
+    bucket = {key: {"terms": ["depth"]}}
+
+    assert get_cached_value(bucket, key) == {"terms": ["depth"]}
+    assert bucket[key] is True
+
+
+def test_process_lru_evicts_by_bytes():
+    cache = ProcessLRUCache(max_bytes=10)
+    cache.put("a", "a", 4)
+    cache.put("b", "b", 4)
+    assert cache.get("a") == "a"
+    cache.put("c", "c", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    cache.put("huge", "x", 11)
+    assert cache.get("huge") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 8
+
+
+def test_failures_stay_in_the_run_tier(monkeypatch):
+    from fairifier.tools import science_tools
+
+    calls = []
+
+    def flaky_request(url, params, timeout):
+        calls.append(url)
+        if len(calls) == 1:
+            raise RuntimeError("503")
+        return {"ok": True}
+
+    monkeypatch.setattr(science_tools, "_request_json", flaky_request)
+    first_run = get_cache_bucket({}, "science_tools")
+
+    assert science_tools._safe_get_json("https://example.org/x", cache_store=first_run) == (False, None, "503")
+    assert science_tools._safe_get_json("https://example.org/x", cache_store=first_run) == (False, None, "503")
+    assert len(calls) == 1
+
+    ok, payload, _ = science_tools._safe_get_json("https://example.org/x", cache_store={})
+    assert ok and payload == {"ok": True} and len(calls) == 2
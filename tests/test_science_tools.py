@@ -1,7 +1,17 @@
 """Tests for external science API tools."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 import requests
 
+from fairifier.config import config
+from fairifier.services.science_http_cache import (
+    ScienceCacheError,
+    ScienceHTTPCache,
+    reset_science_http_cache,
+)
 from fairifier.tools.science_tools import create_science_tools
 
 
@@ -117,3 +127,159 @@ def test_science_tools_cache_failed_requests(monkeypatch):
     assert result1["success"] is False
     assert result2["success"] is False
     assert calls["count"] == 1
+
+
+def test_science_http_cache_persists_and_applies_host_ttls(tmp_path):
+    db_path = tmp_path / "http.sqlite3"
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"response": {"docs": []}}
+
+    ols = "https://www.ebi.ac.uk/ols4/api/search"
+    first = ScienceHTTPCache(db_path, host_ttls={"www.ebi.ac.uk/ols4": 60, "www.ebi.ac.uk": 0})
+    assert first.get_json(ols, {"q": "leaf"}, fetch) == {"response": {"docs": []}}
+    first.close()
+
+    second = ScienceHTTPCache(db_path, host_ttls={"www.ebi.ac.uk/ols4": 60, "www.ebi.ac.uk": 0})
+    assert second.get_json(ols, {"q": "leaf"}, fetch) == {"response": {"docs": []}}
+    assert len(calls) == 1
+    assert second.ttl_for("https://www.ebi.ac.uk/europepmc/webservices/rest/search") == 0
+    second.get_json("https://www.ebi.ac.uk/europepmc/webservices/rest/search", None, fetch)
+    second.get_json("https://www.ebi.ac.uk/europepmc/webservices/rest/search", None, fetch)
+    assert len(calls) == 3
+
+
+def test_science_http_cache_reads_rows_written_by_other_processes(tmp_path):
+    db_path = tmp_path / "http.sqlite3"
+    url = "https://api.openalex.org/works"
+    first = ScienceHTTPCache(db_path, default_ttl_seconds=0, host_ttls={})
+    second = ScienceHTTPCache(db_path, default_ttl_seconds=3600, host_ttls={})
+
+    assert first.get_json(url, None, lambda: {"v": 1}) == {"v": 1}
+    assert second.get_json(url, None, lambda: {"v": 2}) == {"v": 2}
+    assert first.get_json(url, None, lambda: pytest.fail("fresh row in SQLite")) == {"v": 2}
+    assert first.stats()["memory_entries"] == 0
+
+
+def test_science_http_cache_prunes_expired_rows_and_caps_the_table(tmp_path, monkeypatch):
+    import sqlite3
+
+    from fairifier.services import science_http_cache
+
+    db_path = tmp_path / "http.sqlite3"
+    cache = ScienceHTTPCache(db_path, default_ttl_seconds=3600, negative_ttl_seconds=0, host_ttls={})
+    cache.get_json("https://api.openalex.org/works/old", None, lambda: {"v": "old"})
+    with pytest.raises(requests.RequestException):
+        cache.get_json("https://api.openalex.org/works/down", None, _raise_request_error)
+    cache.close()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE http_responses SET expires_at = expires_at - 5400 WHERE url LIKE '%/old'")
+
+    def cached_urls():
+        with sqlite3.connect(db_path) as conn:
+            return [row[0] for row in conn.execute("SELECT url FROM http_responses ORDER BY fetched_at, rowid")]
+
+    # Opening prunes the failure at once; the success stays one more TTL as a stale fallback.
+    ScienceHTTPCache(db_path, default_ttl_seconds=3600, host_ttls={}).close()
+    assert cached_urls() == ["https://api.openalex.org/works/old"]
+    ScienceHTTPCache(db_path, default_ttl_seconds=1200, host_ttls={}).close()
+    assert cached_urls() == []
+
+    monkeypatch.setattr(science_http_cache, "_PRUNE_EVERY_WRITES", 2)
+    cache = ScienceHTTPCache(db_path, default_ttl_seconds=3600, host_ttls={}, max_rows=2)
+    for index in range(4):
+        cache.get_json(f"https://api.openalex.org/works/{index}", None, lambda: {"ok": True})
+    cache.close()
+    assert cached_urls() == ["https://api.openalex.org/works/2", "https://api.openalex.org/works/3"]
+
+
+def _raise_request_error():
+    raise requests.RequestException("offline")
+
+
+def test_science_http_cache_memory_fallback_is_bounded():
+    cache = ScienceHTTPCache(None, memory_max_entries=2)
+    for index in range(3):
+        cache.get_json(f"https://api.crossref.org/works/{index}", None, lambda: {"ok": True})
+
+    assert cache.stats()["memory_entries"] == 2
+    calls = []
+    cache.get_json("https://api.crossref.org/works/0", None, lambda: calls.append(1) or {"ok": True})
+    assert calls == [1]
+
+
+def test_science_http_cache_negative_ttl_and_stale_fallback(tmp_path):
+    cache = ScienceHTTPCache(tmp_path / "http.sqlite3", default_ttl_seconds=0, negative_ttl_seconds=60)
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise requests.RequestException("offline")
+
+    with pytest.raises(requests.RequestException):
+        cache.get_json("https://api.crossref.org/works/x", None, failing)
+    with pytest.raises(ScienceCacheError):
+        cache.get_json("https://api.crossref.org/works/x", None, failing)
+    assert len(calls) == 1
+
+    cache.host_ttls = {}
+    cache.get_json("https://api.openalex.org/works", None, lambda: {"results": [1]})
+    assert cache.get_json("https://api.openalex.org/works", None, failing) == {"results": [1]}
+    assert cache.stats()["stale_served"] == 1
+
+
+def test_science_http_cache_coalesces_concurrent_lookups(tmp_path):
+    cache = ScienceHTTPCache(tmp_path / "http.sqlite3")
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(2)
+        return {"ok": True}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(cache.get_json, "https://api.openalex.org/works", {"search": "soil"}, slow_fetch)
+            for _ in range(4)
+        ]
+        while cache.stats()["coalesced"] < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [{"ok": True}] * 4
+    assert len(calls) == 1
+
+
+def test_offline_science_tools_serve_recorded_fixtures(tmp_path, monkeypatch):
+    fixtures = tmp_path / "fixtures"
+    monkeypatch.setattr(config, "science_http_cache_enabled", True)
+    monkeypatch.setattr(config, "science_http_cache_path", tmp_path / "http.sqlite3")
+    monkeypatch.setattr(config, "science_http_fixtures_dir", fixtures)
+    monkeypatch.setattr(config, "science_http_record_fixtures", True)
+
+    def fake_get(url, params=None, timeout=0):
+        return _FakeResponse({"response": {"docs": [{"label": "leaf", "ontology_name": "po"}]}})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    tools = {tool.name: tool for tool in create_science_tools()}
+    assert tools["search_ontology_term"].invoke({"term": "leaf"})["success"] is True
+    assert len(list(fixtures.glob("*.json"))) == 1
+
+    reset_science_http_cache()
+    monkeypatch.setattr(config, "science_http_cache_path", tmp_path / "fresh.sqlite3")
+    monkeypatch.setattr(config, "science_http_offline", True)
+
+    def no_network(url, params=None, timeout=0):
+        raise AssertionError("offline mode must not hit the network")
+
+    monkeypatch.setattr(requests, "get", no_network)
+    tools = {tool.name: tool for tool in create_science_tools()}
+
+    result = tools["search_ontology_term"].invoke({"term": "leaf"})
+    assert result["data"][0]["label"] == "leaf"
+    missing = tools["search_ontology_term"].invoke({"term": "root"})
+    assert missing["success"] is False and "offline" in missing["error"]
@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 from fairifier.services.source_workspace import (
@@ -116,3 +117,55 @@ def test_load_source_workspace_from_serialized_metadata(tmp_path: Path):
     matches = grep_sources(loaded, "Wadden Sea", max_results=1)
 
     assert matches[0]["source_id"] == "source_001"
+
+
+def test_read_source_span_uses_offset_index_for_multibyte_text(tmp_path: Path, monkeypatch):
+    from fairifier.config import config
+    from fairifier.services.source_workspace import offset_index_path
+
+    monkeypatch.setattr(config, "source_offset_index_stride", 7)
+    content = "".join(f"µ-line {i} — Wädden Sea 🌊\n" for i in range(300))
+    workspace = build_source_workspace(
+        [SourceRecord(source_id="source_001", path="main.md", method="direct_read", content=content)],
+        tmp_path,
+    )
+    source_path = workspace.source_paths["source_001"]
+    index = json.loads(offset_index_path(source_path).read_text(encoding="utf-8"))
+    assert index["chars"] == len(content)
+    assert index["bytes"] == source_path.stat().st_size
+
+    def fail_read_text(self, *args, **kwargs):
+        raise AssertionError("span reads must not load the whole source")
+
+    monkeypatch.setattr(Path, "read_text", fail_read_text)
+    for start, end in [(0, 5), (3, 50), (1000, 1234), (len(content) - 9, len(content) + 40)]:
+        span = read_source_span(workspace, "source_001", start, end, max_chars=10_000)
+        assert span["text"] == content[start:end]
+        assert span["truncated"] is (min(end, len(content)) < len(content))
+
+
+def test_read_source_span_ignores_stale_offset_index(tmp_path: Path):
+    workspace = build_source_workspace(
+        [SourceRecord(source_id="source_001", path="main.md", method="direct_read", content="old text")],
+        tmp_path,
+    )
+    workspace.source_paths["source_001"].write_text("replaced source text", encoding="utf-8")
+
+    span = read_source_span(workspace, "source_001", 0, 8)
+
+    assert span["text"] == "replaced"
+
+
+def test_read_source_span_ignores_same_size_rewrite(tmp_path: Path):
+    workspace = build_source_workspace(
+        [SourceRecord(source_id="source_001", path="main.md", method="direct_read", content="éééé")],
+        tmp_path,
+    )
+    source_path = workspace.source_paths["source_001"]  # 8 bytes, like the rewrite
+    mtime_ns = source_path.stat().st_mtime_ns
+    source_path.write_text("new data", encoding="utf-8")
+    os.utime(source_path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+
+    span = read_source_span(workspace, "source_001", 0, 8)
+
+    assert span["text"] == "new data"